@@ -0,0 +1,376 @@
+"""
+Derlenmiş alias eşleştirme motoru.
+
+Ham hesap adlarını standart kalemlere eşlerken her satır için her alias'ı
+tek tek aramak (satır x alias) yerine, tüm alias'lar bir kez Aho-Corasick
+otomatına derlenir ve her etiket tek geçişte taranır. Alias yalnızca tam
+kelimeler olarak eşleşir ("net debt" içindeki "ebt" sayılmaz). Birden fazla
+alias eşleşirse en uzun (en özgül) olan seçilir. Hiç eşleşme yoksa kelime
+kökü indeksi üzerinden bulanık eşleştirme denenir.
+
+Banka ve ticari şemalar aynı otomata derlenmez (``schema_groups(is_banka=...)``);
+ticari firmanın "Kasa" hesabı banka bilançosu kalemine eşlenmez.
+
+Eşleştirme sırası:
+    1. Kullanıcı eşleştirmesi (user_mapping)
+    2. Alias tam kelime eşleşmesi (Aho-Corasick)
+    3. Kelime kökü indeksi ile bulanık eşleşme
+"""
+
+import hashlib
+import json
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import pandas as pd
+
+# ==========================================
+# NORMALİZASYON
+# ==========================================
+# Türkçe karakterler ASCII karşılıklarına indirgenir (ı/i, ş/s, ğ/g ...)
+_KATLAMA = str.maketrans({
+    'ç': 'c', 'ğ': 'g', 'ı': 'i', 'ö': 'o', 'ş': 's', 'ü': 'u',
+    'â': 'a', 'î': 'i', 'û': 'u', 'é': 'e',
+})
+_AYRAC = str.maketrans({c: ' ' for c in '.,;:/\\()[]{}-_&+*%\'"!?#|<>='})
+
+# Bulanık eşleşmede kelimelerin karşılaştırılan kök uzunluğu (Türkçe ekleri tolere eder)
+KOK_UZUNLUGU = 5
+# Bulanık eşleşme için alias köklerinin en az bu oranı etikette bulunmalı
+BULANIK_ESIK = 0.67
+
+# TMS_UFRS_ESLESTIRME kategorilerinin grup adları
+TMS_GRUP_ADLARI = {
+    'gelir_tablosu': 'Gelir Tablosu',
+    'bilanco_varliklar': 'Bilanço - Varlıklar',
+    'bilanco_kaynaklar': 'Bilanço - Kaynaklar',
+    'nakit_akis': 'Nakit Akış Tablosu',
+}
+
+YONTEM_KULLANICI = 'kullanici'
+YONTEM_ALIAS = 'alias'
+YONTEM_BULANIK = 'bulanik'
+
+
+def normalize_label(metin: Any) -> str:
+    """
+    Etiketi eşleştirme için normalize eder.
+
+    Türkçe büyük/küçük harf kuralı uygulanır (İ->i, I->ı), aksanlar
+    kaldırılır, noktalama boşluğa çevrilir ve boşluklar sadeleştirilir.
+
+    Args:
+        metin: Ham etiket
+
+    Returns:
+        str: Normalize etiket (metin değilse boş)
+    """
+    if not isinstance(metin, str):
+        return ''
+    metin = metin.replace('İ', 'i').replace('I', 'ı').lower()
+    metin = metin.translate(_KATLAMA).translate(_AYRAC)
+    return ' '.join(metin.split())
+
+
+def _kokler(metin: str) -> List[str]:
+    """Normalize metnin kelime kökleri (2 harften kısa kelimeler atlanır)"""
+    return [k[:KOK_UZUNLUGU] for k in metin.split() if len(k) > 2]
+
+
+@dataclass(frozen=True)
+class AliasMatch:
+    """Bir etiketin eşleştirme sonucu"""
+    grup: str
+    standart_kalem: str
+    alias: str
+    yontem: str
+
+
+# ==========================================
+# AHO-CORASICK OTOMATI
+# ==========================================
+class _Otomat:
+    """Karakter bazlı Aho-Corasick otomatı"""
+
+    def __init__(self, desenler: Sequence[str]):
+        self.uzunluk: List[int] = [len(d) for d in desenler]
+        self.gecis: List[Dict[str, int]] = [{}]
+        self.hata: List[int] = [0]
+        self.cikti: List[Tuple[int, ...]] = [()]
+
+        for no, desen in enumerate(desenler):
+            durum = 0
+            for karakter in desen:
+                sonraki = self.gecis[durum].get(karakter)
+                if sonraki is None:
+                    sonraki = len(self.gecis)
+                    self.gecis.append({})
+                    self.hata.append(0)
+                    self.cikti.append(())
+                    self.gecis[durum][karakter] = sonraki
+                durum = sonraki
+            self.cikti[durum] = self.cikti[durum] + (no,)
+
+        kuyruk = deque(self.gecis[0].values())
+        while kuyruk:
+            durum = kuyruk.popleft()
+            for karakter, sonraki in self.gecis[durum].items():
+                kuyruk.append(sonraki)
+                geri = self.hata[durum]
+                while geri and karakter not in self.gecis[geri]:
+                    geri = self.hata[geri]
+                hedef = self.gecis[geri].get(karakter, 0)
+                self.hata[sonraki] = hedef if hedef != sonraki else 0
+                self.cikti[sonraki] = self.cikti[sonraki] + self.cikti[self.hata[sonraki]]
+
+    def ara(self, metin: str, kelime_siniri: bool = True) -> Iterable[int]:
+        """
+        Metinde geçen desen numaralarını döndürür.
+
+        kelime_siniri True ise yalnızca kelime başında başlayıp kelime sonunda
+        biten (tam kelime) eşleşmeler döner; metin normalize edilmiş olmalıdır
+        (kelimeler tek boşlukla ayrılmış).
+        """
+        gecis, hata, cikti, uzunluk = self.gecis, self.hata, self.cikti, self.uzunluk
+        son = len(metin) - 1
+        durum = 0
+        for i, karakter in enumerate(metin):
+            while durum and karakter not in gecis[durum]:
+                durum = hata[durum]
+            durum = gecis[durum].get(karakter, 0)
+            if not cikti[durum]:
+                continue
+            if not kelime_siniri:
+                yield from cikti[durum]
+            elif i == son or metin[i + 1] == ' ':
+                for no in cikti[durum]:
+                    bas = i - uzunluk[no] + 1
+                    if bas == 0 or metin[bas - 1] == ' ':
+                        yield no
+
+
+# ==========================================
+# EŞLEŞTİRİCİ
+# ==========================================
+def _alias_listesi(deger: Any) -> List[str]:
+    """Şema değerinden alias listesi çıkarır (liste veya TMS sözlüğü)"""
+    if isinstance(deger, Mapping):
+        deger = deger.get('alternatif_isimler', [])
+    if isinstance(deger, str):
+        return [deger]
+    return [a for a in (deger or []) if isinstance(a, str)]
+
+
+class AliasMatcher:
+    """
+    Şemalardan derlenen alias eşleştirici.
+
+    Örnek:
+        matcher = AliasMatcher.from_schemas({
+            "Banka Gelir Tablosu": SEMA_BANKA_GELIR,
+            "Banka Bilanço": SEMA_BANKA_BILANCO,
+        })
+        sonuc = matcher.match("Kredilerden Alınan Faizler")
+    """
+
+    def __init__(self, kayitlar: Sequence[Tuple[str, str, str]]):
+        """
+        Args:
+            kayitlar: (grup, standart_kalem, alias) üçlüleri; sıra öncelik sırasıdır
+        """
+        self._hedefler: List[Tuple[str, str, str]] = []
+        goruldu = set()
+        for grup, standart, alias in kayitlar:
+            anahtar = normalize_label(alias)
+            if not anahtar or anahtar in goruldu:
+                continue
+            goruldu.add(anahtar)
+            self._hedefler.append((grup, standart, anahtar))
+
+        self._otomat = _Otomat([h[2] for h in self._hedefler])
+
+        # Standart kalem -> grup (kullanıcı eşleştirmesi yalnızca kalem verdiğinde)
+        self._kalem_grubu: Dict[str, str] = {}
+        for grup, standart, _ in self._hedefler:
+            self._kalem_grubu.setdefault(standart, grup)
+
+        # Bulanık eşleşme için kök -> alias numaraları
+        self._kok_indeksi: Dict[str, List[int]] = {}
+        self._alias_kokleri: List[frozenset] = []
+        for no, (_, _, alias) in enumerate(self._hedefler):
+            kokler = frozenset(_kokler(alias))
+            self._alias_kokleri.append(kokler)
+            for kok in kokler:
+                self._kok_indeksi.setdefault(kok, []).append(no)
+
+        self.version = hashlib.sha1(
+            json.dumps(self._hedefler, ensure_ascii=False).encode('utf-8')
+        ).hexdigest()[:16]
+
+    @classmethod
+    def from_schemas(cls, gruplar) -> 'AliasMatcher':
+        """
+        {grup: {standart_kalem: alias listesi | TMS bilgi sözlüğü}} yapısından
+        veya (grup, şema) çiftlerinden derler.
+
+        Standart kalem adının kendisi de alias olarak eklenir.
+        """
+        if isinstance(gruplar, Mapping):
+            gruplar = gruplar.items()
+        kayitlar = []
+        for grup, sema in gruplar:
+            for standart, deger in (sema or {}).items():
+                kayitlar.append((grup, standart, standart))
+                for alias in _alias_listesi(deger):
+                    kayitlar.append((grup, standart, alias))
+        return cls(kayitlar)
+
+    def __len__(self) -> int:
+        return len(self._hedefler)
+
+    def _user_match(self, etiket: str, normal: str, user_mapping: Mapping) -> Optional[AliasMatch]:
+        """Kullanıcı eşleştirmesi: {ham etiket: standart kalem | (grup, kalem) | {...}}"""
+        hedef = user_mapping.get(etiket)
+        if hedef is None:
+            hedef = user_mapping.get(normal)
+        if hedef is None:
+            return None
+        if isinstance(hedef, Mapping):
+            standart = hedef.get('Standart_Kalem') or hedef.get('standart_kalem')
+            grup = hedef.get('Grup') or hedef.get('grup') or self._kalem_grubu.get(standart, 'Diğer')
+        elif isinstance(hedef, (list, tuple)) and len(hedef) == 2:
+            grup, standart = hedef
+        else:
+            standart = str(hedef)
+            grup = self._kalem_grubu.get(standart, 'Diğer')
+        if not standart:
+            return None
+        return AliasMatch(grup, standart, etiket, YONTEM_KULLANICI)
+
+    def _fuzzy_match(self, normal: str) -> Optional[AliasMatch]:
+        """Kelime kökü örtüşmesine göre en iyi alias"""
+        kokler = set(_kokler(normal))
+        if not kokler:
+            return None
+        adaylar = {no for kok in kokler for no in self._kok_indeksi.get(kok, ())}
+        en_iyi, en_iyi_puan = None, 0.0
+        for no in sorted(adaylar):
+            alias_kokleri = self._alias_kokleri[no]
+            puan = len(alias_kokleri & kokler) / len(alias_kokleri)
+            if puan > en_iyi_puan or (puan == en_iyi_puan and en_iyi is not None
+                                      and len(self._hedefler[no][2]) > len(self._hedefler[en_iyi][2])):
+                en_iyi, en_iyi_puan = no, puan
+        if en_iyi is None or en_iyi_puan < BULANIK_ESIK:
+            return None
+        grup, standart, alias = self._hedefler[en_iyi]
+        return AliasMatch(grup, standart, alias, YONTEM_BULANIK)
+
+    def match(self, etiket: Any, user_mapping: Optional[Mapping] = None, fuzzy: bool = True) -> Optional[AliasMatch]:
+        """
+        Tek bir etiketi eşleştirir.
+
+        Args:
+            etiket: Ham hesap adı
+            user_mapping: Kullanıcı eşleştirmesi (öncelikli)
+            fuzzy: Alias bulunamazsa bulanık eşleşme denensin mi
+
+        Returns:
+            AliasMatch veya None
+        """
+        normal = normalize_label(etiket)
+        if user_mapping:
+            kullanici = self._user_match(etiket, normal, user_mapping)
+            if kullanici is not None:
+                return kullanici
+        if not normal:
+            return None
+
+        en_iyi = None
+        for no in self._otomat.ara(normal):
+            if en_iyi is None or len(self._hedefler[no][2]) > len(self._hedefler[en_iyi][2]) \
+                    or (len(self._hedefler[no][2]) == len(self._hedefler[en_iyi][2]) and no < en_iyi):
+                en_iyi = no
+        if en_iyi is not None:
+            grup, standart, alias = self._hedefler[en_iyi]
+            return AliasMatch(grup, standart, alias, YONTEM_ALIAS)
+
+        return self._fuzzy_match(normal) if fuzzy else None
+
+    def match_many(
+        self,
+        etiketler: Iterable[Any],
+        user_mapping: Optional[Mapping] = None,
+        fuzzy: bool = True
+    ) -> List[Optional[AliasMatch]]:
+        """Etiket listesini eşleştirir; tekrar eden etiketler bir kez hesaplanır"""
+        seri = pd.Series(list(etiketler), dtype=object)
+        kodlar, benzersiz = pd.factorize(seri, use_na_sentinel=True)
+        sonuclar = [self.match(e, user_mapping, fuzzy) for e in benzersiz]
+        return [sonuclar[k] if k >= 0 else None for k in kodlar]
+
+
+def schema_groups(
+    sema_gelir: Optional[Mapping] = None,
+    sema_bilanco: Optional[Mapping] = None,
+    sema_nakit: Optional[Mapping] = None,
+    tms_ufrs: Optional[Mapping] = None,
+    banka_gelir: Optional[Mapping] = None,
+    banka_bilanco: Optional[Mapping] = None,
+    is_banka: bool = False
+) -> List[Tuple[str, Mapping]]:
+    """
+    Firma türünün şemalarını öncelik sırasıyla (grup, şema) çiftlerine çevirir.
+
+    Ticari firma: ticari şemalar (converters), ardından TMS/UFRS kategorileri.
+    Banka: yalnızca banka şemaları. İki küme birlikte derlenmez; aksi halde
+    "kasa", "vergi" gibi genel alias'lar diğer firma türünün kalemine düşer.
+    """
+    if is_banka:
+        gruplar = [
+            ('Banka Gelir Tablosu', banka_gelir),
+            ('Banka Bilanço', banka_bilanco),
+        ]
+    else:
+        gruplar = [
+            ('Gelir Tablosu', sema_gelir),
+            ('Bilanço', sema_bilanco),
+            ('Nakit Akış Tablosu', sema_nakit),
+        ]
+        for kategori, kalemler in (tms_ufrs or {}).items():
+            gruplar.append((TMS_GRUP_ADLARI.get(kategori, kategori), kalemler))
+    return [(grup, sema) for grup, sema in gruplar if sema]
+
+
+def apply_compiled_mapping(
+    df: pd.DataFrame,
+    item_col: str,
+    user_mapping: Optional[Mapping],
+    matcher: AliasMatcher,
+    fuzzy: bool = True,
+    varsayilan_grup: str = 'Diğer'
+) -> pd.DataFrame:
+    """
+    df'ye Grup ve Standart_Kalem sütunlarını ekler.
+
+    Eşleşmeyen satırlarda Grup ``varsayilan_grup``, Standart_Kalem ham etiket olur.
+
+    Args:
+        df: Ham veri
+        item_col: Hesap adı sütunu
+        user_mapping: Kullanıcı eşleştirmesi
+        matcher: Derlenmiş eşleştirici
+        fuzzy: Bulanık eşleşme açık mı
+        varsayilan_grup: Eşleşmeyen satırların grubu
+
+    Returns:
+        pd.DataFrame: Grup ve Standart_Kalem eklenmiş df
+    """
+    sonuclar = matcher.match_many(df[item_col], user_mapping, fuzzy)
+    df = df.copy(deep=False)
+    df['Grup'] = [s.grup if s else varsayilan_grup for s in sonuclar]
+    df['Standart_Kalem'] = [
+        s.standart_kalem if s else (str(e).strip() if pd.notna(e) else '')
+        for s, e in zip(sonuclar, df[item_col])
+    ]
+    return df
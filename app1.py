@@ -1,5 +1,6 @@
 import streamlit as st
 import os
+import sqlite3
 
 # ==========================================
 # ENVIRONMENT VARIABLES (.env dosyası)
@@ -22,6 +23,13 @@ try:
     if is_database_configured():
         init_database()
         DB_AVAILABLE = True
+        # Süreç başına tek havuzlu motor (rerun başına yeni bağlantı açılmaz).
+        # Kurulamazsa DAL kendi bağlantısıyla çalışır; hata sidebar'da gösterilir.
+        try:
+            from db_pool import init_engine
+            init_engine()
+        except Exception as e:
+            st.sidebar.warning(f"⚠️ Veritabanı bağlantı havuzu kurulamadı: {e}")
     else:
         DB_AVAILABLE = False
 except Exception as e:
@@ -79,6 +87,14 @@ except ImportError:
     TMS_UFRS_COMPLIANCE_AVAILABLE = False
     st.warning("⚠️ tms_ufrs_compliance.py bulunamadı. TMS/UFRS uyumluluk kontrolü devre dışı.")
 
+# ==========================================
+# BANKA ŞEMALARI VE TMS/UFRS EŞLEŞTİRME IMPORT
+# ==========================================
+# Standartlaştırmada kullanılan alias listeleri
+from schemas import SEMA_BANKA_GELIR, SEMA_BANKA_BILANCO
+if not TMS_UFRS_COMPLIANCE_AVAILABLE:
+    from schemas import TMS_UFRS_ESLESTIRME
+
 # ==========================================
 # UTILS IMPORT
 # ==========================================
@@ -100,6 +116,102 @@ except ImportError:
     UTILS_AVAILABLE = False
     st.warning("⚠️ utils.py bulunamadı. Bazı export fonksiyonları devre dışı.")
 
+# ==========================================
+# VEKTÖREL SAYI AYRIŞTIRICI IMPORT
+# ==========================================
+# Sayısal sütunları hücre hücre değil, sütun bazında temizler
+try:
+    from number_parser import clean_turkish_float_series
+    NUMBER_PARSER_AVAILABLE = True
+except ImportError:
+    NUMBER_PARSER_AVAILABLE = False
+
+    def clean_turkish_float_series(seri, decimal="auto"):
+        """Fallback: hücre bazlı clean_turkish_float"""
+        return seri.apply(clean_turkish_float)
+
+# ==========================================
+# OTURUM VERİ DEPOSU IMPORT
+# ==========================================
+# Yüklenen veri tek kanonik çerçevede tutulur; eski anahtarlara kopya yerine
+# copy-on-write tutamaçlar yazılır
+from session_data_store import SessionDataStore, CANONICAL_FRAME_KEYS, ORIGINAL_FRAME_KEY, enable_copy_on_write
+# pandas 2.x'te copy-on-write süreç geneli bir ayardır; yalnızca açıkça istenirse açılır
+# (kapalıyken anahtarlar ayrı kopya tutar, eski modüllerin davranışı değişmez)
+if os.environ.get('DIGICFO_COPY_ON_WRITE', '').lower() in ('1', 'true', 'evet'):
+    enable_copy_on_write()
+
+# ==========================================
+# FİNANSAL TABLO AYRIŞTIRMA IMPORT
+# ==========================================
+# Satırları gelir tablosu / bilanço / nakit akış olarak ayırır (üç kopya yerine)
+from statement_partition import (
+    DIGER,
+    STATEMENT_STATE_KEYS,
+    build_statement_lookup,
+    partition_statements
+)
+
+# ==========================================
+# KALEM İNDEKSİ IMPORT
+# ==========================================
+# get_asc için Kalem -> dönem değerleri indeksi (tam tablo taraması yerine)
+from line_item_index import get_kalem_index, scale_factor
+
+# ==========================================
+# VEKTÖREL RASYO MOTORU IMPORT
+# ==========================================
+# Rasyo düzeyinde önbellek: kalem özetleri + formül seti sürümü, ölçekten bağımsız saklama
+from ratio_cache import RatioCache
+# Türetilmiş tablolar (toplamlar, rasyolar, Sankey, DuPont) için kalem düzeyinde artımsal hesaplama;
+# rasyo düğümü derlenmiş formüllerle (ratio_engine) tüm dönemleri tek geçişte hesaplar
+from recompute_graph import get_recompute_graph
+
+# ==========================================
+# DERLENMİŞ ALIAS EŞLEŞTİRME IMPORT
+# ==========================================
+# Hesap adlarını tüm alias'lar yerine tek geçişte eşleyen Aho-Corasick otomatı
+from alias_matcher import AliasMatcher, apply_compiled_mapping, schema_groups
+# Hesap adı -> (Grup, Standart_Kalem) sonuçlarının kalıcı (SQLite) önbelleği
+from mapping_cache import MappingCache, apply_cached_mapping, mapping_fingerprint
+
+# ==========================================
+# PARÇA PARÇA VERİ ALIMI IMPORT
+# ==========================================
+# Büyük CSV / xlsx yüklemeleri parçalar halinde okunur, temizlenir ve eşleştirilir
+from streaming_ingest import BellekSiniriAsildi, ingest_streaming, read_upload_frame, streaming_uygun
+# Yükleme hattı Streamlit'in her yeniden çalıştırmasında değil, dosya başına bir kez çalışır
+from ingest_state import HATA, HAZIR, IngestState, upload_identity
+# Aynı dosyanın yeniden yüklenmesinde işlenmiş sonucu (veya yeni dönemleri) yeniden kullanır
+from upload_cache import (
+    ARTIMSAL,
+    ProcessedUpload,
+    UploadCache,
+    content_hash,
+    process_upload,
+    upload_key
+)
+# Excel yüklemeleri bir kez Arrow'a çevrilir; diğer işçi süreçler ve yeniden başlatmalar Excel'i yeniden ayrıştırmaz
+from columnar_cache import read_upload_cached
+
+# ==========================================
+# VERİTABANI HAVUZU IMPORT
+# ==========================================
+# Firma listesi / özetleri için TTL önbelleği ve havuz istatistikleri
+from db_pool import cached_companies, cached_company_summary, invalidate_company_cache, pool_stats
+# Firma verisi: uzun tablodan float64 geniş tabloya pivot (temizleme adımı gerekmez)
+from db_pivot import load_company_frame
+
+# ==========================================
+# TREND GRAFİKLERİ IMPORT
+# ==========================================
+# Grafikler sekmesi: tek seferlik dönüşüm, sayfalama ve grafik önbelleği
+from trend_charts import SAYFA_BOYUTLARI, TrendCharts
+# İndirilebilir HTML raporu: tembel kurulum, paylaşımlı grafik yükü, çevrimdışı plotly.js
+from html_report import lazy_report
+# Büyük tablolar: sunucu tarafı sayfalama, sıralama ve filtre
+from paged_table import show_paged_table
+
 # ==========================================
 # MAPPING IMPORT
 # ==========================================
@@ -175,6 +287,35 @@ except ImportError:
     DATA_LOADER_AVAILABLE = False
     st.warning("⚠️ data_loader.py bulunamadı. Veri yükleme fonksiyonları devre dışı.")
 
+# ==========================================
+# BIST İNDEKSİ IMPORT
+# ==========================================
+# Firma bilgileri ekranının kod / sektör aramaları (kaynak dosya sürümü başına bir kez kurulur)
+from bist_index import BistIndex, BOS_FIRMA, BOS_SEKTOR_ORT, source_version
+
+
+@st.cache_resource(max_entries=2)
+def _bist_indeksi_kur(kaynak_surumu):
+    """BIST indeksini kurar (kaynak_surumu yalnızca önbellek anahtarıdır)"""
+    return BistIndex.from_bist_data(yukle_bist_sektor_verileri())
+
+
+def get_bist_index():
+    """BistTumSektorHissesort.xlsx sürümüne ait BIST indeksi"""
+    return _bist_indeksi_kur(source_version())
+
+# ==========================================
+# MAKRO VERİ SERVİSİ IMPORT
+# ==========================================
+# TCMB kurları ve TÜİK TÜFE arka planda TTL ile yenilenir, son değer beklemeden döner
+from macro_data import MacroDataService, TCMB_KURLAR, TUIK_TUFE, default_source, staleness_label
+
+
+@st.cache_resource
+def get_macro_service():
+    """Tüm oturumların paylaştığı makro veri servisi (DIGICFO_MACRO_SOURCE ile yerel kaynak)"""
+    return MacroDataService(default_source())
+
 # ==========================================
 # SESSION MANAGER IMPORT
 # ==========================================
@@ -236,20 +377,16 @@ from views import (
     show_file_upload_section,
     show_company_info_form,
     show_main_dashboard,
-    show_reports_section,
     get_tab_index
 )
-from views.ham_veri import show_ham_veri_section
-from views.finansal_analiz_pro import show_finansal_analiz_pro_section
-from views.sektor import show_sektor_section
-from views.gelir_tablosu import show_gelir_tablosu_section
-from views.bilanco import show_bilanco_section
-from views.nakit_akis import show_nakit_akis_section
-from views.buyuk_veri import show_buyuk_veri_section
-from views.rasyo_oran import show_rasyo_oran_section
-from views.veri_onay import show_veri_onay_section
-from views.ileri_analiz import show_ileri_analiz_section
-from views.veri_kontrol import show_veri_kontrol_section
+# Menü bölümlerinin view modülleri ilk seçildiklerinde yüklenir (view_registry.py)
+from view_registry import ViewRegistry
+
+
+@st.cache_resource
+def get_view_registry():
+    """Menü yönlendiricisi (view fonksiyonları ve süre istatistikleri süreç boyunca saklanır)"""
+    return ViewRegistry()
 
 # ==========================================
 # PERFORMANS OPTİMİZASYONU - LAZY IMPORT
@@ -271,19 +408,10 @@ def get_plotly():
     import plotly.graph_objects as go
     return go
 
-# FPDF - PDF oluşturma için
-from fpdf import FPDF
-
-# Requests ve XML her zaman lazım
-import requests
-import xml.etree.ElementTree as ET
-
-# Yahoo Finance için yfinance kütüphanesi
-try:
-    import yfinance as yf
-    YFINANCE_AVAILABLE = True
-except ImportError:
-    YFINANCE_AVAILABLE = False
+# FPDF, requests, xml.etree ve yfinance bu dosyada kullanılmıyor; ihtiyaç
+# duyan modüller kendileri import eder. yfinance yalnızca varlığı için kontrol edilir.
+import importlib.util
+YFINANCE_AVAILABLE = importlib.util.find_spec("yfinance") is not None
 
 # Global plotly referansı
 go = get_plotly()
@@ -308,6 +436,7 @@ go = get_plotly()
 # ==========================================
 # Bu fonksiyonlar artık data_loader.py modülünde
 # Import edildi: from data_loader import get_tcmb_doviz_kurlari, get_tuik_tufe_yillik, ...
+# Firma bilgileri ekranı kurları ve TÜFE'yi macro_data.py servisinden okur
 
 # ==========================================
 # TFRS ÇEVİRİ FONKSİYONLARI
@@ -486,6 +615,90 @@ else:
     if 'ekran_durumu' not in st.session_state:
         st.session_state['ekran_durumu'] = 'veri_merkezi'
 
+# --- OTURUM VERİ DEPOSU ---
+# df_ham ve türevleri tek kanonik çerçeveyi paylaşır (session_data_store.py)
+veri_deposu = SessionDataStore(st.session_state)
+
+# Kalem adı -> finansal tablo sözlüğü (converters şemaları + TMS/UFRS alternatif isimleri)
+TABLO_ESLESTIRME = build_statement_lookup(
+    SEMA_GELIR_TABLOSU if CONVERTERS_AVAILABLE else None,
+    SEMA_BILANCO if CONVERTERS_AVAILABLE else None,
+    SEMA_NAKIT_AKIS if CONVERTERS_AVAILABLE else None,
+    TMS_UFRS_ESLESTIRME
+)
+
+
+@st.cache_resource
+def get_alias_matcher(is_banka=False):
+    """Firma türünün şemalarından alias otomatını bir kez derle (tüm oturumlar paylaşır)"""
+    return AliasMatcher.from_schemas(schema_groups(
+        sema_gelir=SEMA_GELIR_TABLOSU if CONVERTERS_AVAILABLE else None,
+        sema_bilanco=SEMA_BILANCO if CONVERTERS_AVAILABLE else None,
+        sema_nakit=SEMA_NAKIT_AKIS if CONVERTERS_AVAILABLE else None,
+        tms_ufrs=TMS_UFRS_ESLESTIRME,
+        banka_gelir=SEMA_BANKA_GELIR,
+        banka_bilanco=SEMA_BANKA_BILANCO,
+        is_banka=is_banka
+    ))
+
+
+@st.cache_resource
+def get_mapping_cache():
+    """Oturumlar arasında paylaşılan eşleştirme önbelleği (disk yazılamıyorsa None)"""
+    try:
+        return MappingCache()
+    except Exception:
+        return None
+
+
+def standartlastir(df, item_col, user_mapping):
+    """Ham hesap adlarını Grup / Standart_Kalem sütunlarına eşler (banka / ticari şema seti is_banka'ya göre)"""
+    eslestirici = get_alias_matcher(st.session_state.get('is_banka', False))
+    onbellek = get_mapping_cache()
+    if onbellek is None:
+        return apply_compiled_mapping(df, item_col, user_mapping, eslestirici)
+    return apply_cached_mapping(df, item_col, user_mapping, eslestirici, onbellek)
+
+
+@st.cache_resource
+def get_upload_cache():
+    """İşlenmiş yüklemelerin süreç içi önbelleği (oturumlar paylaşır)"""
+    return UploadCache()
+
+
+@st.cache_resource
+def get_ratio_cache():
+    """Rasyo satırlarının süreç içi önbelleği (oturumlar paylaşır, anahtar içerik özetidir)"""
+    return RatioCache()
+
+
+def eslestirme_baglami(user_mapping):
+    """Yükleme önbelleği için eşleştirme bağlamı (kullanıcı eşleştirmesi + şema sürümü)"""
+    return mapping_fingerprint(user_mapping, get_alias_matcher(st.session_state.get('is_banka', False)).version)
+
+
+def veri_setini_yayinla(df, item_col):
+    """
+    İşlenmiş veriyi oturuma yazar.
+
+    df_ham / df_veri_merkezi tüm veriyi, df_*_raw ve df_*_ham_veri anahtarları
+    ise yalnızca ilgili finansal tablonun satırlarını (kopyasız dilim) gösterir.
+    Hiçbir satır bir tabloya atanamazsa eski davranış korunur: üç anahtar da
+    tüm veriyi gösterir.
+    """
+    veri_deposu.publish(df, keys=CANONICAL_FRAME_KEYS)
+    tablolar = veri_deposu.derived(
+        'finansal_tablolar',
+        lambda f: partition_statements(f, item_col, TABLO_ESLESTIRME)
+    )
+    gorunumler = {}
+    for tablo, anahtarlar in STATEMENT_STATE_KEYS.items():
+        gorunum = tablolar.get(tablo) if tablolar.is_partitioned else veri_deposu.frame
+        for anahtar in anahtarlar:
+            gorunumler[anahtar] = gorunum
+    veri_deposu.publish_views(gorunumler)
+    return tablolar
+
 # --- AUTHENTICATION KONTROLÜ ---
 if not st.session_state.get('authenticated', False):
     # Login sayfasını göster (auth.py'den)
@@ -549,8 +762,6 @@ if st.session_state.get('ekran_durumu') != 'menu':
 # appHi.py - ANA UYGULAMA AKIŞI
 # ==========================================
 
-import plotly.express as px
-
 # Ekran durumu kontrolü
 if 'ekran_durumu' not in st.session_state:
     st.session_state['ekran_durumu'] = 'veri_merkezi'  # veri_merkezi -> firma_bilgileri -> menu
@@ -582,10 +793,13 @@ if st.session_state['ekran_durumu'] == 'veri_merkezi':
     if data_source == "📊 Veritabanından Seç":
         if DB_AVAILABLE:
             try:
-                from dal.demo_dal import get_companies, get_company_by_id
-                from dal.data_loader_db import load_company_data_from_db, get_company_financial_summary
+                from dal.demo_dal import get_company_by_id
+                from dal.data_loader_db import load_company_data_from_db
                 
-                companies = get_companies()
+                # Firma listesi ve özetleri TTL süresince önbellekten gelir
+                if st.sidebar.button("↻ Firma listesini yenile", key="db_firma_yenile"):
+                    invalidate_company_cache()
+                companies = cached_companies()
                 
                 if companies:
                     # Firma seçimi - Sadece firma adı göster (temizlenmiş)
@@ -611,7 +825,7 @@ if st.session_state['ekran_durumu'] == 'veri_merkezi':
                         selected_company_id = company_options[selected_company_name]
                         
                         # Özet bilgileri göster
-                        summary = get_company_financial_summary(selected_company_id)
+                        summary = cached_company_summary(selected_company_id)
                         if summary:
                             st.sidebar.info(f"""
                             **Firma Özeti:**
@@ -624,7 +838,7 @@ if st.session_state['ekran_durumu'] == 'veri_merkezi':
                         # Verileri yükle butonu
                         if st.sidebar.button("🔄 Verileri Yükle", type="primary", key="load_from_db_btn"):
                             with st.spinner("📊 Veritabanından veriler yükleniyor..."):
-                                df = load_company_data_from_db(selected_company_id)
+                                df = load_company_frame(selected_company_id, fallback=load_company_data_from_db)
                                 
                                 if df is not None and not df.empty:
                                     # Firma bilgilerini session state'e kaydet
@@ -640,7 +854,7 @@ if st.session_state['ekran_durumu'] == 'veri_merkezi':
                                     # VERİ İŞLEME (Manuel yükleme ile aynı)
                                     # ==========================================
                                     # Orijinal veriyi kaydet
-                                    st.session_state['df_orijinal_yuklenen'] = df.copy()
+                                    veri_deposu.publish_original(df)
                                     
                                     # Veritabanından gelen veri: account_name, period1, period2, ...
                                     # Manuel yükleme formatına uyarla: Kalem -> account_name
@@ -651,18 +865,18 @@ if st.session_state['ekran_durumu'] == 'veri_merkezi':
                                     numeric_cols = [col for col in df.columns if col != 'Kalem']
                                     item_col = 'Kalem' if 'Kalem' in df.columns else df.columns[0]
                                     
-                                    # Sayısal sütunları temizle
+                                    # Dönem sütunları load_company_frame'den float64 gelir; yalnızca
+                                    # beklenmedik metin sütunları temizlenir
                                     for col in numeric_cols:
                                         if col in df.columns:
                                             if not pd.api.types.is_numeric_dtype(df[col]):
-                                                df[col] = df[col].apply(clean_turkish_float)
+                                                df[col] = clean_turkish_float_series(df[col])
                                     
                                     # Standartlaştırma - Mapping entegrasyonu
                                     user_mapping = st.session_state.get('user_mapping', {})
-                                    df = apply_user_mapping_to_df(df, item_col, user_mapping)
+                                    df = standartlastir(df, item_col, user_mapping)
                                     
                                     # Session state'e kaydet
-                                    st.session_state['df_ham'] = df.copy()
                                     st.session_state['data_source'] = 'database'
                                     st.session_state['selected_company_id'] = selected_company_id
                                     
@@ -673,18 +887,10 @@ if st.session_state['ekran_durumu'] == 'veri_merkezi':
                                     st.session_state['date_cols'] = numeric_cols
                                     st.session_state['is_banka'] = False
                                     
-                                    # Ham veriyi doğrudan kullan (manuel yükleme ile aynı)
-                                    st.session_state['df_gelir_raw'] = df.copy()
-                                    st.session_state['df_bilanco_raw'] = df.copy()
-                                    st.session_state['df_nakit_raw'] = df.copy()
-                                    
-                                    # Alternatif anahtarlar (bazı modüller bunları kullanıyor)
-                                    st.session_state['df_gelir_ham_veri'] = df.copy()
-                                    st.session_state['df_bilanco_ham_veri'] = df.copy()
-                                    st.session_state['df_nakit_ham_veri'] = df.copy()
-                                    
-                                    # Veri Merkezi için de kaydet
-                                    st.session_state['df_veri_merkezi'] = df.copy()
+                                    # Ham veriyi tablolara ayırarak kullan (manuel yükleme ile aynı)
+                                    # df_ham ve df_veri_merkezi tüm veriyi, df_*_raw ve
+                                    # df_*_ham_veri ilgili tablonun dilimini paylaşır
+                                    veri_setini_yayinla(df, item_col)
                                     st.session_state['numeric_cols_vm'] = numeric_cols
                                     
                                     st.success(f"✅ {company_info['firma_adi']} verileri başarıyla yüklendi ve işlendi!")
@@ -696,6 +902,22 @@ if st.session_state['ekran_durumu'] == 'veri_merkezi':
                     st.sidebar.warning("⚠️ Veritabanında firma bulunamadı.")
             except Exception as e:
                 st.sidebar.error(f"❌ Veritabanı hatası: {str(e)}")
+
+            # Havuz ve sorgu önbelleği durumu (izleme)
+            with st.sidebar.expander("🔌 Veritabanı Havuzu", expanded=False):
+                havuz = pool_stats()
+                if havuz['hata']:
+                    st.warning(f"Havuz kurulamadı, DAL kendi bağlantısını kullanıyor: {havuz['hata']}")
+                if havuz.get('havuz_sinifi') == 'QueuePool':
+                    st.caption(
+                        f"Havuz: {havuz['kullanimda']} kullanımda / {havuz['bosta']} boşta "
+                        f"(boyut {havuz['boyut']}, taşma {max(havuz['tasma'], 0)})"
+                    )
+                st.caption(f"Açılan bağlantı: {havuz['acilan_baglanti']}, ödünç alma: {havuz['odunc_alma']}")
+                st.caption(
+                    f"Sorgu önbelleği: {havuz['onbellek']['kayit_sayisi']} kayıt, "
+                    f"isabet %{havuz['onbellek']['isabet_orani'] * 100:.0f}"
+                )
         else:
             st.sidebar.warning("⚠️ Veritabanı bağlantısı yapılandırılmamış. Manuel dosya yükleme kullanın.")
         
@@ -714,51 +936,114 @@ if st.session_state['ekran_durumu'] == 'veri_merkezi':
     elif data_source == "📁 Manuel Dosya Yükle":
         uploaded_file = st.sidebar.file_uploader("Excel veya CSV Dosyası Yükleyin", type=["xlsx", "xls", "csv"], key="manual_file_uploader")
         
-        if uploaded_file is not None:
-            try:
-                # Dosyayı Oku
-                if uploaded_file.name.endswith('.csv'):
-                    df = pd.read_csv(uploaded_file)
-                else:
-                    df = pd.read_excel(uploaded_file)
-                
-                # ==========================================
-                # ORİJİNAL VERİYİ KAYDET (İşlenmeden önce!)
-                # ==========================================
-                # Orijinal veriyi session_state'e kaydet (Veri Kontrol için)
-                st.session_state['df_orijinal_yuklenen'] = df.copy()
-                st.session_state['df_ham'] = df.copy()
-                st.session_state['data_source'] = 'manual'
-                
-                # Eğer session state'de company_id varsa temizle
-                if 'selected_company_id' in st.session_state:
-                    del st.session_state['selected_company_id']
+        # Yükleme hattı dosya başına bir kez çalışır; diğer çalıştırmalar yalnızca gösterim yapar
+        yukleme_durumu = IngestState(st.session_state)
+        if uploaded_file is None:
+            yukleme_durumu.reset()
+        else:
+            user_mapping = st.session_state.get('user_mapping', {})
+            baglam = eslestirme_baglami(user_mapping)
+            yukleme_kimligi = upload_identity(uploaded_file, baglam)
+
+            if yukleme_durumu.needs_ingest(yukleme_kimligi):
+                yukleme_durumu.begin(yukleme_kimligi)
+                mesajlar = []
+                try:
+                    akis_modu = streaming_uygun(uploaded_file.name, uploaded_file.size)
+
+                    # Aynı içerik + aynı eşleştirme daha önce işlendiyse sonuç yeniden kullanılır
+                    yukleme_onbellegi = get_upload_cache()
+                    yukleme_ozeti = content_hash(uploaded_file.getvalue())
+                    onbellek_anahtari = upload_key(yukleme_ozeti, uploaded_file.name, baglam)
+                    kayit = yukleme_onbellegi.get(onbellek_anahtari)
+
+                    if kayit is not None:
+                        mesajlar.append("♻️ Bu dosya daha önce işlendi; önbellekteki sonuç kullanıldı.")
+                    elif akis_modu:
+                        # Büyük dosya: parça parça oku, her parçayı temizle ve eşleştir
+                        ilerleme = st.progress(0.0, text="📥 Büyük dosya parça parça işleniyor...")
+                        sonuc = ingest_streaming(
+                            uploaded_file,
+                            uploaded_file.name,
+                            map_func=lambda parca, kalem_sutunu: standartlastir(parca, kalem_sutunu, user_mapping),
+                            progress=lambda oran, mesaj: ilerleme.progress(oran, text=mesaj)
+                        )
+                        ilerleme.empty()
+                        mesajlar.append(f"📦 {sonuc.satir:,} satır, {sonuc.parca} parça, {sonuc.bellek_mb:,.0f} MB")
+                        kayit = ProcessedUpload(sonuc.frame, sonuc.original, sonuc.item_col, baglam)
+                        yukleme_onbellegi.put(onbellek_anahtari, kayit)
+                    else:
+                        # Dosyayı Oku (parça parça alımla aynı ayarlar: sayılar tür tahminiyle değil temizleyiciyle çözülür)
+                        df_yuklenen = read_upload_frame(
+                            uploaded_file,
+                            uploaded_file.name,
+                            excel_reader=lambda dosya, **ayarlar: read_upload_cached(
+                                dosya.getvalue(), uploaded_file.name, ozet=yukleme_ozeti, **ayarlar
+                            )
+                        )
+
+                        # --- Veri İşleme ---
+                        # İlk sütun kalem adı; diğer sütunlar temizlenir, kalemler eşleştirilir.
+                        # Önbellekteki bir yüklemeye yalnızca yeni dönemler eklendiyse sadece onlar işlenir.
+                        kayit, durum, yeni_sutunlar = process_upload(
+                            df_yuklenen,
+                            clean_turkish_float_series,
+                            lambda veri, kalem_sutunu: standartlastir(veri, kalem_sutunu, user_mapping),
+                            yukleme_onbellegi,
+                            baglam
+                        )
+                        if durum == ARTIMSAL:
+                            mesajlar.append(f"➕ Önceki yükleme bulundu; yalnızca {len(yeni_sutunlar)} yeni dönem sütunu işlendi.")
+                        yukleme_onbellegi.put(onbellek_anahtari, kayit)
+
+                    # Önbellekteki çerçeve paylaşılır; copy-on-write tutamaç ile yayınlanır
+                    df = kayit.frame.copy(deep=False)
+
+                    # ==========================================
+                    # ORİJİNAL VERİYİ KAYDET (Veri Kontrol için)
+                    # ==========================================
+                    # Parça parça alınan büyük dosyalarda yalnızca bellek sınırına sığıyorsa saklanır
+                    if kayit.original is not None:
+                        veri_deposu.publish_original(kayit.original)
+                    else:
+                        st.session_state.pop(ORIGINAL_FRAME_KEY, None)
+                        mesajlar.append("ℹ️ Dosya büyük olduğu için işlenmemiş kopya saklanmadı (Veri Kontrol devre dışı).")
+                    st.session_state['data_source'] = 'manual'
+
+                    # Eğer session state'de company_id varsa temizle
+                    if 'selected_company_id' in st.session_state:
+                        del st.session_state['selected_company_id']
+
+                    # Session state'e kaydet
+                    veri_deposu.publish(df, keys=('df_ham',))
+                    yukleme_durumu.done({'mesajlar': mesajlar})
+                except BellekSiniriAsildi as e:
+                    yukleme_durumu.fail(
+                        f"Dosya bellek sınırını aşıyor: {e} "
+                        "Sınırı DIGICFO_UPLOAD_BELLEK_MB ortam değişkeniyle artırabilir veya dosyayı bölebilirsiniz."
+                    )
+                except Exception as e:
+                    yukleme_durumu.fail(f"Dosya okunurken hata: {str(e)}")
+                    import traceback
+                    st.code(traceback.format_exc())
 
+            # --- Gösterim (her çalıştırmada) ---
+            if yukleme_durumu.status == HAZIR:
                 st.success("✅ Dosya başarıyla yüklendi!")
                 data_loaded = True
-                
+                for mesaj in yukleme_durumu.summary.get('mesajlar', []):
+                    st.caption(mesaj)
+
                 # Ham veriyi göster
                 with st.expander("Ham Veriyi Görüntüle"):
-                    st.dataframe(df.head())
-
-                # --- Veri İşleme ---
-                # Sayısal sütunları temizle
-                numeric_cols = df.columns[1:] # İlk sütun hariç diğerleri
-                item_col = df.columns[0]      # İlk sütun (Kalem Adı)
-
-                for col in numeric_cols:
-                    df[col] = df[col].apply(clean_turkish_float)
-
-                # Standartlaştırma - Mapping entegrasyonu
-                user_mapping = st.session_state.get('user_mapping', {})
-                df = apply_user_mapping_to_df(df, item_col, user_mapping)
-                
-                # Session state'e kaydet
-                st.session_state['df_ham'] = df.copy()
-            except Exception as e:
-                st.error(f"❌ Dosya okunurken hata: {str(e)}")
-                import traceback
-                st.code(traceback.format_exc())
+                    # handle() anahtar yoksa işlenmiş çerçeveye düşer; ham veri başlığı altında
+                    # yalnızca gerçekten saklanan işlenmemiş kopya gösterilir
+                    if ORIGINAL_FRAME_KEY in st.session_state:
+                        show_paged_table(veri_deposu.handle(ORIGINAL_FRAME_KEY), key="ham_veri_tablo")
+                    else:
+                        st.info("ℹ️ Dosya büyük olduğu için işlenmemiş kopya saklanmadı; ham veri gösterilemiyor.")
+            elif yukleme_durumu.status == HATA:
+                st.error(f"❌ {yukleme_durumu.error}")
         
         st.sidebar.markdown("---")
         
@@ -773,7 +1058,7 @@ if st.session_state['ekran_durumu'] == 'veri_merkezi':
     # VERİ İŞLEME VE GÖSTERİM (Her iki kaynak için)
     # ==========================================
     if 'df_ham' in st.session_state and st.session_state['df_ham'] is not None:
-        df = st.session_state['df_ham'].copy()
+        df = veri_deposu.handle('df_ham')
         
         if not df.empty:
             # Veri işleme (eğer daha önce işlenmemişse)
@@ -785,14 +1070,14 @@ if st.session_state['ekran_durumu'] == 'veri_merkezi':
                 for col in numeric_cols:
                     if pd.api.types.is_numeric_dtype(df[col]):
                         continue  # Zaten sayısal
-                    df[col] = df[col].apply(clean_turkish_float)
+                    df[col] = clean_turkish_float_series(df[col])
 
                 # Standartlaştırma - Mapping entegrasyonu
                 user_mapping = st.session_state.get('user_mapping', {})
-                df = apply_user_mapping_to_df(df, item_col, user_mapping)
+                df = standartlastir(df, item_col, user_mapping)
                 
                 # Session state'e kaydet
-                st.session_state['df_ham'] = df.copy()
+                veri_deposu.publish(df, keys=('df_ham',))
             else:
                 # Zaten işlenmiş, sadece sütunları al
                 numeric_cols = [col for col in df.columns if col not in ['Grup', 'Standart_Kalem', df.columns[0]]]
@@ -814,52 +1099,44 @@ if st.session_state['ekran_durumu'] == 'veri_merkezi':
                 else:
                     display_df = df
                 
-                st.dataframe(display_df, use_container_width=True)
+                # Yalnızca görünen sayfa gönderilir; sıralama / filtre sunucuda
+                show_paged_table(display_df, key="veri_merkezi_tablo")
 
             with tab2:
                 st.subheader("Trend Analizi")
                 
                 if len(numeric_cols) > 0:
                     # 1. Grafikleri Oluştur ve 2'li Izgara (Grid) Halinde Göster
-                    # Standart_Kalem yoksa account_name kullan
-                    item_col_name = 'Standart_Kalem' if 'Standart_Kalem' in display_df.columns else display_df.columns[0]
-                    unique_items = display_df[item_col_name].unique()
-                    all_figures = [] # PDF çıktısı için grafikleri sakla
+                    # Tablo bir kez dönüştürülür; yalnızca görünen sayfanın grafikleri kurulur
+                    # ve (veri, grup, kalem) başına saklanır
+                    grafikler = TrendCharts.for_session(st.session_state, df, numeric_cols)
+                    kalem_sayisi = len(grafikler.items(selected_group))
+
+                    sayfa_col1, sayfa_col2 = st.columns([1, 1])
+                    with sayfa_col1:
+                        sayfa_boyutu = st.selectbox(
+                            "Sayfa başına grafik:", SAYFA_BOYUTLARI, index=1, key="trend_sayfa_boyutu"
+                        )
+                    sayfa_sayisi = grafikler.page_count(selected_group, sayfa_boyutu)
+                    # Grup / sayfa boyutu değişince eski sayfa numarası aralık dışında kalabilir
+                    if st.session_state.get("trend_sayfa", 1) > sayfa_sayisi:
+                        st.session_state["trend_sayfa"] = sayfa_sayisi
+                    with sayfa_col2:
+                        sayfa = st.number_input(
+                            "Sayfa:", min_value=1, max_value=sayfa_sayisi, step=1, key="trend_sayfa"
+                        ) if sayfa_sayisi > 1 else 1
+                    baslangic = (int(sayfa) - 1) * sayfa_boyutu
+                    gorunen = grafikler.figures(selected_group, baslangic, baslangic + sayfa_boyutu)
+                    st.caption(
+                        f"Kalem {baslangic + 1 if gorunen else 0}–{baslangic + len(gorunen)} / {kalem_sayisi} "
+                        f"(sayfa {int(sayfa)} / {sayfa_sayisi})"
+                    )
 
                     # Her 2 grafikte bir yeni satır
-                    for i in range(0, len(unique_items), 2):
+                    for i in range(0, len(gorunen), 2):
                         cols = st.columns(2)
-                        
-                        # --- Grafik 1 ---
-                        item1 = unique_items[i]
-                        row1 = display_df[display_df[item_col_name] == item1]
-                        if not row1.empty:
-                            df_melt1 = row1.melt(id_vars=[item_col_name], value_vars=numeric_cols, var_name='Dönem', value_name='Değer')
-                            fig1 = px.bar(
-                                df_melt1, 
-                                x='Dönem', 
-                                y='Değer', 
-                                color='Standart_Kalem', 
-                                title=item1
-                            )
-                            cols[0].plotly_chart(fig1, use_container_width=True)
-                            all_figures.append(fig1)
-
-                        # --- Grafik 2 (Varsa) ---
-                        if i + 1 < len(unique_items):
-                            item2 = unique_items[i+1]
-                            row2 = display_df[display_df[item_col_name] == item2]
-                            if not row2.empty:
-                                df_melt2 = row2.melt(id_vars=[item_col_name], value_vars=numeric_cols, var_name='Dönem', value_name='Değer')
-                                fig2 = px.bar(
-                                    df_melt2, 
-                                    x='Dönem', 
-                                    y='Değer', 
-                                    color='Standart_Kalem', 
-                                    title=item2
-                                )
-                                cols[1].plotly_chart(fig2, use_container_width=True)
-                                all_figures.append(fig2)
+                        for col, fig in zip(cols, gorunen[i:i + 2]):
+                            col.plotly_chart(fig, use_container_width=True)
 
                     st.markdown("---")
                     
@@ -867,47 +1144,20 @@ if st.session_state['ekran_durumu'] == 'veri_merkezi':
                     st.write("### 📥 Rapor Çıktısı")
                     st.info("Aşağıdaki butona tıklayarak grafikleri içeren raporu indirebilir, açılan sayfada **'Yazdır' (Ctrl+P)** diyerek **PDF olarak kaydedebilirsiniz.**")
 
-                    # HTML İçeriği Hazırla
-                    html_string = f"""
-                    <html>
-                    <head>
-                        <title>Finansal Analiz Raporu - {selected_group}</title>
-                        <style>
-                            body {{ font-family: Arial, sans-serif; margin: 40px; }}
-                            .chart-container {{ page-break-inside: avoid; margin-bottom: 50px; text-align: center; }}
-                            h1 {{ text-align: center; color: #333; }}
-                            table {{ width: 100%; border-collapse: collapse; margin-bottom: 20px; }}
-                            th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-                            th {{ background-color: #f2f2f2; }}
-                            @media print {{
-                                .no-print {{ display: none; }}
-                            }}
-                        </style>
-                    </head>
-                    <body>
-                        <h1>Finansal Analiz Raporu</h1>
-                        <h3>Grup: {selected_group}</h3>
-                        <p>Rapor Tarihi: {pd.Timestamp.now().strftime('%d-%m-%Y %H:%M')}</p>
-                        <hr>
-                        <h4>Veri Tablosu</h4>
-                        {display_df.to_html(index=False)}
-                        <hr>
-                        <h4>Grafikler</h4>
-                    """
-
-                    # Grafikleri HTML'e ekle
-                    for fig in all_figures:
-                        fig_html = fig.to_html(full_html=False, include_plotlyjs='cdn')
-                        html_string += f"<div class='chart-container'>{fig_html}</div>"
-
-                    html_string += """
-                    </body>
-                    </html>
-                    """
-
+                    # Rapor yalnızca düğmeye basıldığında kurulur (grafikler tek JSON yükü olarak)
+                    cevrimdisi_rapor = st.checkbox(
+                        "Çevrimdışı rapor (plotly.js dosyaya gömülür, ~5 MB)",
+                        key="rapor_cevrimdisi",
+                        help="İnternet erişimi olmayan bilgisayarlarda açılabilen rapor"
+                    )
                     st.download_button(
                         label="📄 Tüm Grafikleri Rapor Olarak İndir (PDF İçin)",
-                        data=html_string,
+                        data=lazy_report(
+                            lambda g=selected_group: grafikler.figures(g),
+                            tablo=display_df,
+                            grup=selected_group,
+                            offline=cevrimdisi_rapor
+                        ),
                         file_name=f"Finansal_Rapor_{selected_group}.html",
                         mime="text/html"
                     )
@@ -916,9 +1166,7 @@ if st.session_state['ekran_durumu'] == 'veri_merkezi':
                     st.warning("Grafik çizmek için yeterli sayısal sütun bulunamadı.")
 
             # Veriyi session_state'e kaydet
-            st.session_state['df_veri_merkezi'] = df
             st.session_state['numeric_cols_vm'] = list(numeric_cols)
-            st.session_state['df_ham'] = df.copy()
             
             # ==========================================
             # FİNANSAL TABLOLARI OLUŞTUR (MENU İÇİN)
@@ -927,18 +1175,41 @@ if st.session_state['ekran_durumu'] == 'veri_merkezi':
             st.session_state['date_cols'] = list(numeric_cols)
             st.session_state['is_banka'] = False
             
-            # Ham veriyi doğrudan kullan
-            st.session_state['df_gelir_raw'] = df.copy()
-            st.session_state['df_bilanco_raw'] = df.copy()
-            st.session_state['df_nakit_raw'] = df.copy()
-            
-            # Alternatif anahtarlar (bazı modüller bunları kullanıyor)
-            st.session_state['df_gelir_ham_veri'] = df.copy()
-            st.session_state['df_bilanco_ham_veri'] = df.copy()
-            st.session_state['df_nakit_ham_veri'] = df.copy()
+            # Ham veriyi tablolara ayırarak kullan: df_ham ve df_veri_merkezi tüm
+            # veriyi, df_*_raw ve df_*_ham_veri ilgili tablonun dilimini paylaşır
+            # (veri değişmediyse yeniden yazılmaz)
+            veri_setini_yayinla(df, item_col)
             
             st.success("✅ Veriler başarıyla yüklendi!")
             
+            bellek = veri_deposu.memory_report()
+            st.sidebar.caption(
+                f"💾 Oturum verisi: {bellek['gercek_mb']:.1f} MB "
+                f"(kopyalı saklansaydı {bellek['nominal_mb']:.1f} MB)"
+            )
+            eslestirme_onbellegi = get_mapping_cache()
+            if eslestirme_onbellegi is not None:
+                try:
+                    onbellek_durumu = eslestirme_onbellegi.stats()
+                except sqlite3.Error as e:
+                    # Kilitli / bozuk önbellek dosyası ekranı durdurmaz; eşleştirme önbelleksiz devam eder
+                    st.sidebar.caption(f"🗂️ Eşleştirme önbelleği okunamadı: {e}")
+                else:
+                    st.sidebar.caption(
+                        f"🗂️ Eşleştirme önbelleği: {onbellek_durumu['kayit_sayisi']:,} kayıt, "
+                        f"isabet %{onbellek_durumu['isabet_orani'] * 100:.0f}"
+                    )
+            yukleme_onbellek_durumu = get_upload_cache().stats()
+            if yukleme_onbellek_durumu['kayit_sayisi']:
+                st.sidebar.caption(
+                    f"♻️ Yükleme önbelleği: {yukleme_onbellek_durumu['kayit_sayisi']} dosya "
+                    f"({yukleme_onbellek_durumu['bellek_mb']:.1f} MB), isabet {yukleme_onbellek_durumu['isabet']}, "
+                    f"artımsal {yukleme_onbellek_durumu['artimsal']}"
+                )
+            yukleme_hatti = IngestState(st.session_state)
+            if yukleme_hatti.run_count:
+                st.sidebar.caption(f"🔁 Yükleme hattı bu oturumda {yukleme_hatti.run_count} kez çalıştı")
+            
             # Sonraki Adım Butonu
             st.markdown("---")
             col1, col2, col3 = st.columns([1, 2, 1])
@@ -970,11 +1241,10 @@ elif st.session_state['ekran_durumu'] == 'firma_bilgileri':
     
     # BIST Sektör verilerini merkezi fonksiyondan al (cache'li - sadece 1 kez yüklenir)
     bist_data = yukle_bist_sektor_verileri()
-    df_bist = bist_data["df_bist"]
-    df_sektor_ort = bist_data["df_sektor_ort"]
     bist_kodlari = bist_data["bist_kodlari"]
     sektor_listesi = bist_data["sektor_listesi"]
     bist_verisi_var = bist_data["bist_verisi_var"]
+    bist_indeksi = get_bist_index()
     
     # Firma seçimi (form dışında - dinamik güncelleme için)
     st.markdown("### 🔍 Firma Seçimi")
@@ -994,62 +1264,18 @@ elif st.session_state['ekran_durumu'] == 'firma_bilgileri':
             disabled=not bist_verisi_var
         )
     
-    # Seçilen firmaya göre varsayılan değerleri belirle
-    default_vals = {
-        "ad": "", "sektor": "", "sermaye": 0.0, "hisse": 0, "halka_aciklik": 0.0,
-        "fiyat": 0.0, "fk": 0.0, "fd_favok": 0.0, "fd_satis": 0.0, "pd_dd": 0.0,
-        "piyasa_degeri": 0.0, "piyasa_degeri_usd": 0.0, "ozkaynaklar": 0.0, "dd_hisse": 0.0
-    }
-    sektor_ort_vals = {"fk": 0.0, "fd_favok": 0.0, "fd_satis": 0.0, "pd_dd": 0.0}
+    # Seçilen firmaya göre varsayılan değerleri belirle (tipli değerler bist_index.py'de hazır)
+    default_vals = dict(BOS_FIRMA)
+    sektor_ort_vals = dict(BOS_SEKTOR_ORT)
     
-    if secilen_kod != "-- Manuel Giriş --" and df_bist is not None:
-        firma_row = df_bist[df_bist['Borsa Kodu'] == secilen_kod]
-        if not firma_row.empty:
-            row = firma_row.iloc[0]
-            default_vals["ad"] = str(row.get('Hisse Adı', ''))
-            default_vals["sektor"] = str(row.get('Sektör', ''))
-            # Sermaye mn TL olarak geliyor, 1.000.000 ile çarp (TL'ye çevir)
-            default_vals["sermaye"] = float(row.get('Sermaye(mn TL)', 0) or 0) * 1000000
-            default_vals["halka_aciklik"] = float(row.get('Halka AçıklıkOranı (%)', 0) or 0)
-            default_vals["fiyat"] = float(row.get('Kapanış(TL)', 0) or 0)
-            # Piyasa değeri mn TL olarak geliyor, 1.000.000 ile çarp (TL'ye çevir)
-            default_vals["piyasa_degeri"] = float(row.get('Piyasa Değeri(mn TL)', 0) or 0) * 1000000
-            # Piyasa değeri $ (mn $ olarak geliyor)
-            default_vals["piyasa_degeri_usd"] = float(row.get('Piyasa Değeri(mn $)', 0) or 0) * 1000000
-            # Hisse sayısını hesapla: Piyasa Değeri / Fiyat
-            if default_vals["fiyat"] > 0:
-                default_vals["hisse"] = int(default_vals["piyasa_degeri"] / default_vals["fiyat"])
-            
-            # F/K, FD/FAVÖK vb. değerleri al
-            for key, col in [("fk", "F/K"), ("fd_favok", "FD/FAVÖK"), ("fd_satis", "FD/Satışlar"), ("pd_dd", "PD/DD")]:
-                val = row.get(col, 0)
-                if val != 'A/D' and pd.notna(val):
-                    try:
-                        default_vals[key] = float(val)
-                    except:
-                        default_vals[key] = 0.0
-            
-            # DD (Defter Değeri / Özkaynaklar) hesapla: DD = PD / (PD/DD)
-            if default_vals["piyasa_degeri"] > 0 and default_vals["pd_dd"] > 0:
-                default_vals["ozkaynaklar"] = default_vals["piyasa_degeri"] / default_vals["pd_dd"]
-            else:
-                default_vals["ozkaynaklar"] = 0.0
-            
-            # DD per share (Hisse başına defter değeri) = Özkaynaklar / Hisse Sayısı
-            if default_vals["ozkaynaklar"] > 0 and default_vals["hisse"] > 0:
-                default_vals["dd_hisse"] = default_vals["ozkaynaklar"] / default_vals["hisse"]
-            else:
-                default_vals["dd_hisse"] = 0.0
+    if secilen_kod != "-- Manuel Giriş --" and bist_verisi_var:
+        firma_kaydi = bist_indeksi.company(secilen_kod)
+        if firma_kaydi is not None:
+            default_vals.update(firma_kaydi)
             
             # Sektör ortalamalarını al
-            if df_sektor_ort is not None and default_vals["sektor"]:
-                sektor_row = df_sektor_ort[df_sektor_ort['Sektör'] == default_vals["sektor"]]
-                if not sektor_row.empty:
-                    s_row = sektor_row.iloc[0]
-                    sektor_ort_vals["fk"] = float(s_row.get('F/K', 0) or 0) if pd.notna(s_row.get('F/K', 0)) else 0.0
-                    sektor_ort_vals["fd_favok"] = float(s_row.get('FD/FAVÖK', 0) or 0) if pd.notna(s_row.get('FD/FAVÖK', 0)) else 0.0
-                    sektor_ort_vals["fd_satis"] = float(s_row.get('FD/Satışlar', 0) or 0) if pd.notna(s_row.get('FD/Satışlar', 0)) else 0.0
-                    sektor_ort_vals["pd_dd"] = float(s_row.get('PD/DD', 0) or 0) if pd.notna(s_row.get('PD/DD', 0)) else 0.0
+            if default_vals["sektor"]:
+                sektor_ort_vals.update(bist_indeksi.sector_averages(default_vals["sektor"]) or {})
     
     with col_sec2:
         if secilen_kod != "-- Manuel Giriş --":
@@ -1065,15 +1291,11 @@ elif st.session_state['ekran_durumu'] == 'firma_bilgileri':
                     key="manuel_sektor_sec",
                     help="Sektör seçtiğinizde o sektörün ortalama çarpanları görünecek"
                 )
-                if secilen_sektor_manuel != "-- Sektör Seçiniz --" and df_sektor_ort is not None:
+                if secilen_sektor_manuel != "-- Sektör Seçiniz --":
                     default_vals["sektor"] = secilen_sektor_manuel
-                    sektor_row = df_sektor_ort[df_sektor_ort['Sektör'] == secilen_sektor_manuel]
-                    if not sektor_row.empty:
-                        s_row = sektor_row.iloc[0]
-                        sektor_ort_vals["fk"] = float(s_row.get('F/K', 0) or 0) if pd.notna(s_row.get('F/K', 0)) else 0.0
-                        sektor_ort_vals["fd_favok"] = float(s_row.get('FD/FAVÖK', 0) or 0) if pd.notna(s_row.get('FD/FAVÖK', 0)) else 0.0
-                        sektor_ort_vals["fd_satis"] = float(s_row.get('FD/Satışlar', 0) or 0) if pd.notna(s_row.get('FD/Satışlar', 0)) else 0.0
-                        sektor_ort_vals["pd_dd"] = float(s_row.get('PD/DD', 0) or 0) if pd.notna(s_row.get('PD/DD', 0)) else 0.0
+                    sektor_ortalamasi = bist_indeksi.sector_averages(secilen_sektor_manuel)
+                    if sektor_ortalamasi is not None:
+                        sektor_ort_vals.update(sektor_ortalamasi)
                         st.success(f"✅ Sektör seçildi: **{secilen_sektor_manuel}**")
             else:
                 st.warning("⚠️ Sektör listesi yüklenemedi. Excel dosyasının aynı klasörde olduğundan emin olun.")
@@ -1093,34 +1315,20 @@ elif st.session_state['ekran_durumu'] == 'firma_bilgileri':
             st.metric("Sektör Ort. PD/DD", f"{sektor_ort_vals['pd_dd']:.2f}" if sektor_ort_vals['pd_dd'] > 0 else "-")
         
         # Sektördeki Tüm BIST Firmalarının Listesi
-        if df_bist is not None and default_vals['sektor']:
+        if bist_verisi_var and default_vals['sektor']:
             with st.expander(f"📋 {default_vals['sektor']} Sektöründeki BIST Firmaları", expanded=False):
-                # Seçilen sektördeki firmaları filtrele
-                df_sektor_firmalar = df_bist[df_bist['Sektör'] == default_vals['sektor']].copy()
+                # Sektör tablosu indeks kurulurken hazırlanır ('A/D' -> '-', Arrow uyumlu)
+                df_sektor_goster = bist_indeksi.sector_table(default_vals['sektor'])
+                firma_sayisi = bist_indeksi.sector_company_count(default_vals['sektor'])
                 
-                if not df_sektor_firmalar.empty:
-                    # Gösterilecek sütunları seç
-                    gosterilecek_sutunlar = ['Borsa Kodu', 'Hisse Adı', 'Kapanış(TL)', 'Piyasa Değeri(mn TL)', 'F/K', 'FD/FAVÖK', 'FD/Satışlar', 'PD/DD']
-                    mevcut_sutunlar = [col for col in gosterilecek_sutunlar if col in df_sektor_firmalar.columns]
-                    
-                    df_sektor_goster = df_sektor_firmalar[mevcut_sutunlar].copy()
-                    
-                    # Sayısal sütunları dönüştür (A/D değerlerini - olarak göster)
-                    for col in ['F/K', 'FD/FAVÖK', 'FD/Satışlar', 'PD/DD']:
-                        if col in df_sektor_goster.columns:
-                            df_sektor_goster[col] = df_sektor_goster[col].replace('A/D', '-').astype(str)
-                    
-                    # Tüm sütunları Arrow uyumlu yap
-                    for col in df_sektor_goster.columns:
-                        df_sektor_goster[col] = df_sektor_goster[col].fillna('-').astype(str)
-                    
-                    st.markdown(f"**Toplam {len(df_sektor_goster)} firma** bu sektörde BIST'te işlem görmektedir.")
+                if df_sektor_goster is not None and firma_sayisi:
+                    st.markdown(f"**Toplam {firma_sayisi} firma** bu sektörde BIST'te işlem görmektedir.")
                     
                     # Tablo gösterimi
                     st.dataframe(
                         df_sektor_goster,
                         use_container_width=True,
-                        height=min(400, len(df_sektor_goster) * 35 + 40)
+                        height=min(400, firma_sayisi * 35 + 40)
                     )
                 else:
                     st.warning("Bu sektörde BIST'te işlem gören firma bulunamadı.")
@@ -1149,13 +1357,16 @@ elif st.session_state['ekran_durumu'] == 'firma_bilgileri':
             st.markdown("---")
             st.markdown("#### 💱 Döviz Kurları (TCMB Alış)")
             
-            # TCMB'den otomatik kur çek
-            tcmb_kurlar = get_tcmb_doviz_kurlari()
+            # TCMB kurları (makro veri servisinin son başarılı değeri; beklemeden döner)
+            kur_durumu = get_macro_service().get(TCMB_KURLAR, wait=3.0)
+            tcmb_kurlar = kur_durumu.deger
             default_usd = tcmb_kurlar["USD"] if tcmb_kurlar["USD"] else 0.0
             default_eur = tcmb_kurlar["EUR"] if tcmb_kurlar["EUR"] else 0.0
             
             if tcmb_kurlar["tarih"]:
-                st.caption(f"📅 TCMB Kur Tarihi: {tcmb_kurlar['tarih']}")
+                st.caption(f"📅 TCMB Kur Tarihi: {tcmb_kurlar['tarih']} · {staleness_label(kur_durumu)}")
+            else:
+                st.caption(f"📅 TCMB kurları: {staleness_label(kur_durumu)}")
             
             f_usd_kur = st.number_input("Dolar (USD)", min_value=0.0, step=0.0001, format="%.4f", value=default_usd)
             f_eur_kur = st.number_input("Euro (EUR)", min_value=0.0, step=0.0001, format="%.4f", value=default_eur)
@@ -1163,12 +1374,15 @@ elif st.session_state['ekran_durumu'] == 'firma_bilgileri':
             st.markdown("---")
             st.markdown("#### 📈 TÜFE Oranı (Yıllık %)")
             
-            # TÜİK'ten otomatik TÜFE çek
-            tufe_data = get_tuik_tufe_yillik()
+            # TÜİK TÜFE (makro veri servisinin son başarılı değeri)
+            tufe_durumu = get_macro_service().get(TUIK_TUFE, wait=3.0)
+            tufe_data = tufe_durumu.deger
             default_tufe = tufe_data["tufe_yillik"] if tufe_data["tufe_yillik"] else 0.0
             
             if tufe_data["donem"]:
-                st.caption(f"📅 TÜFE Dönemi: {tufe_data['donem']}")
+                st.caption(f"📅 TÜFE Dönemi: {tufe_data['donem']} · {staleness_label(tufe_durumu)}")
+            else:
+                st.caption(f"📅 TÜFE: {staleness_label(tufe_durumu)}")
             
             f_tufe_yillik = st.number_input("Yıllık TÜFE (%)", min_value=0.0, step=0.1, format="%.2f", value=default_tufe)
 
@@ -1229,16 +1443,14 @@ elif st.session_state['ekran_durumu'] == 'firma_bilgileri':
             
             # Veri Merkezi'nden gelen verileri kontrol et ve finansal tabloları oluştur
             if 'df_veri_merkezi' in st.session_state and not st.session_state['df_veri_merkezi'].empty:
-                df_vm = st.session_state['df_veri_merkezi'].copy()
-                st.session_state['df_ham'] = df_vm
+                df_vm = veri_deposu.handle('df_veri_merkezi')
+                veri_deposu.publish(df_vm, keys=('df_ham',))
                 
                 # Finansal tabloları oluştur (ham veriyi kullan)
                 if 'df_gelir_raw' not in st.session_state or st.session_state.get('df_gelir_raw', pd.DataFrame()).empty:
                     st.session_state['date_cols'] = list(df_vm.select_dtypes(include=[np.number]).columns)
                     st.session_state['is_banka'] = False
-                    st.session_state['df_gelir_raw'] = df_vm.copy()
-                    st.session_state['df_bilanco_raw'] = df_vm.copy()
-                    st.session_state['df_nakit_raw'] = df_vm.copy()
+                    veri_setini_yayinla(df_vm, df_vm.columns[0])
             
             st.session_state['ekran_durumu'] = 'menu'
             st.rerun()
@@ -1250,16 +1462,14 @@ elif st.session_state['ekran_durumu'] == 'firma_bilgileri':
             
             # Veri Merkezi'nden gelen verileri kontrol et ve finansal tabloları oluştur
             if 'df_veri_merkezi' in st.session_state and not st.session_state['df_veri_merkezi'].empty:
-                df_vm = st.session_state['df_veri_merkezi'].copy()
-                st.session_state['df_ham'] = df_vm
+                df_vm = veri_deposu.handle('df_veri_merkezi')
+                veri_deposu.publish(df_vm, keys=('df_ham',))
                 
                 # Finansal tabloları oluştur (ham veriyi kullan)
                 if 'df_gelir_raw' not in st.session_state or st.session_state.get('df_gelir_raw', pd.DataFrame()).empty:
                     st.session_state['date_cols'] = list(df_vm.select_dtypes(include=[np.number]).columns)
                     st.session_state['is_banka'] = False
-                    st.session_state['df_gelir_raw'] = df_vm.copy()
-                    st.session_state['df_bilanco_raw'] = df_vm.copy()
-                    st.session_state['df_nakit_raw'] = df_vm.copy()
+                    veri_setini_yayinla(df_vm, df_vm.columns[0])
             
             st.session_state['ekran_durumu'] = 'menu'
             st.rerun()
@@ -1293,7 +1503,11 @@ elif st.session_state['ekran_durumu'] == 'menu':
         # scale_option dashboard.py'de session state'e kaydediliyor
         
         # Veri kontrolü ve hazırlık
-        veri_yuklu = 'df_gelir_raw' in st.session_state and not st.session_state.get('df_gelir_raw', pd.DataFrame()).empty
+        # Tablolar ayrıştırıldığından herhangi birinde satır olması yeterli
+        veri_yuklu = any(
+            not st.session_state.get(k, pd.DataFrame()).empty
+            for k in ('df_gelir_raw', 'df_bilanco_raw', 'df_nakit_raw')
+        )
         
         if not veri_yuklu:
             st.warning("⚠️ Henüz finansal veri yüklenmemiş. Bazı sekmeler boş görünecektir.")
@@ -1321,14 +1535,29 @@ elif st.session_state['ekran_durumu'] == 'menu':
         df_bilanco_view = scale_df(df_bilanco_raw, scale, date_cols)
         df_nakit_view = scale_df(df_nakit_raw, scale, date_cols)
         
-        df_full_raw = pd.concat([df_gelir_raw, df_bilanco_raw, df_nakit_raw], ignore_index=True)
+        # Birleşik görünüm: her satır bir kez (üç tablonun kopyalarını birleştirmek yerine)
+        finansal_tablolar = veri_deposu.get_derived('finansal_tablolar')
+        if finansal_tablolar is not None and finansal_tablolar.is_partitioned:
+            df_full_raw = finansal_tablolar.full
+            indeks_kaynaklari = [df_gelir_raw, df_bilanco_raw, df_nakit_raw, finansal_tablolar.get(DIGER)]
+        else:
+            df_full_raw = df_gelir_raw
+            indeks_kaynaklari = [df_gelir_raw, df_bilanco_raw, df_nakit_raw]
         dates_asc = date_cols
 
+        # Kalem indeksi: veri yüklemesi başına bir kez kurulur, ölçek tek çarpma ile uygulanır
+        kalem_indeksi = get_kalem_index(st.session_state, indeks_kaynaklari, date_cols)
+        kalem_indeksi.set_scale_factor(scale_factor(scale_df if UTILS_AVAILABLE else None, scale, date_cols))
+
         def get_asc(k, use_scale=True): 
-            df_source = scale_df(df_full_raw, scale, date_cols) if use_scale else df_full_raw
-            row = df_source[df_source['Kalem'] == k]
-            vals = row[date_cols].values[0] if not row.empty else [0]*len(date_cols)
-            return [v if pd.notnull(v) else 0 for v in vals]
+            return kalem_indeksi.get_asc(k, use_scale)
+
+        # Türetilmiş tablolar: Veri Kontrol / Veri Onayı düzenlemesinden sonra yalnızca düzenlenen
+        # kalemleri kullanan düğümler (finansal tablo toplamları, rasyolar, Sankey, DuPont) yeniden
+        # hesaplanır; rasyolar rasyo önbelleği üzerinden
+        turetilmis_grafik = get_recompute_graph(st.session_state, is_banka, get_ratio_cache())
+        st.session_state['turetilmis'] = turetilmis_grafik.update(kalem_indeksi)
+        st.session_state['rasyo_tablosu'] = st.session_state['turetilmis']['rasyolar']
         
         # ==========================================
         # UPLOADED_FILE DEĞİŞKENİ - ESKİ SİSTEM UYUMLULUĞU
@@ -1347,206 +1576,26 @@ elif st.session_state['ekran_durumu'] == 'menu':
         # SEÇİLEN MENÜYE GÖRE İÇERİK GÖSTERİMİ
         # ==========================================
         
-        # ANA BÖLÜM SEKMELERİ
-        if selected_menu == "📄 Ham Veri":
-            show_ham_veri_section()
-        
-        elif selected_menu == "💼 Finansal Analiz Pro":
-            show_finansal_analiz_pro_section()
-        
-        elif selected_menu == "📊 Sektör":
-            show_sektor_section()
-        
-        elif selected_menu == "✅ Veri Kontrol":
-            show_veri_kontrol_section()
-        
-        elif selected_menu == "📊 Gelir Tablosu":
-            show_gelir_tablosu_section()
-        
-        elif selected_menu == "📊 Bilanço":
-            show_bilanco_section()
-        
-        elif selected_menu == "💰 Nakit Akış Tablosu":
-            show_nakit_akis_section()
-        
-        elif selected_menu == "🗃️ Büyük Veri":
-            show_buyuk_veri_section()
-        
-        elif selected_menu == "📊 Rasyo/Oran":
-            show_rasyo_oran_section()
-        
-        elif selected_menu == "📥 Rapor":
-            show_reports_section()
-        
-        elif selected_menu == "✅ Veri Onayı":
-            show_veri_onay_section()
-        
-        elif selected_menu == "🚀 İleri Finansal Analiz":
-            show_ileri_analiz_section()
-        
-        elif selected_menu == "🎯 Stratejik Analiz":
-            try:
-                from views.stratejik_analiz_menu import show_stratejik_analiz_menu_section
-                show_stratejik_analiz_menu_section()
-            except ImportError:
-                st.info("📋 Stratejik Analiz modülü yüklenemedi.")
-            except Exception as e:
-                st.error(f"❌ Stratejik Analiz yüklenirken hata oluştu: {str(e)}")
-        
-        elif selected_menu == "🤖 AI CEO/CFO Coaching":
-            try:
-                from views.ceo_cfo_coaching import show_ceo_cfo_coaching_section
-                show_ceo_cfo_coaching_section()
-            except ImportError:
-                st.info("📋 AI CEO/CFO Coaching modülü yüklenemedi.")
-            except Exception as e:
-                st.error(f"❌ AI CEO/CFO Coaching yüklenirken hata oluştu: {str(e)}")
-        
-        elif selected_menu == "🤖 AI Analiz ve Rapor":
-            try:
-                from views.ai_raporlar import show_ai_analiz_rapor_menu_section
-                show_ai_analiz_rapor_menu_section()
-            except ImportError:
-                st.info("📋 AI Analiz ve Rapor modülü yüklenemedi.")
-            except Exception as e:
-                st.error(f"❌ AI Analiz ve Rapor yüklenirken hata oluştu: {str(e)}")
-        
-        elif selected_menu == "🤖 AI Model Danışman Robotlar":
-            try:
-                from views.ai_model_robotlar import show_ai_model_robotlar_menu_section
-                show_ai_model_robotlar_menu_section()
-            except ImportError:
-                st.info("📋 AI Model Danışman Robotlar modülü yüklenemedi.")
-            except Exception as e:
-                st.error(f"❌ AI Model Danışman Robotlar yüklenirken hata oluştu: {str(e)}")
-        
-        elif selected_menu == "🤖 AI CFO Danışman Robotlar":
-            # Alt menü seçimi yapılmamışsa varsayılan olarak ilk alt menüyü göster
-            default_submenu = st.session_state.get('selected_ai_cfo_submenu', '1. Stratejik AI CFO')
-            try:
-                from views.ai_cfo_robots import show_ai_cfo_section
-                show_ai_cfo_section(default_submenu)
-            except ImportError as e:
-                st.error(f"❌ AI CFO Robotlar modülü yüklenemedi: {str(e)}")
-                import traceback
-                with st.expander("🔍 Hata Detayları"):
-                    st.code(traceback.format_exc())
-            except Exception as e:
-                st.error(f"❌ AI CFO Robotlar yüklenirken hata oluştu: {str(e)}")
-                import traceback
-                with st.expander("🔍 Hata Detayları"):
-                    st.code(traceback.format_exc())
-        
-        elif selected_menu == "1. Stratejik AI CFO":
-            try:
-                from views.ai_cfo_robots import show_ai_cfo_section
-                show_ai_cfo_section("1. Stratejik AI CFO")
-            except ImportError as e:
-                st.error(f"❌ AI CFO Robotlar modülü yüklenemedi: {str(e)}")
-                import traceback
-                with st.expander("🔍 Hata Detayları"):
-                    st.code(traceback.format_exc())
-            except Exception as e:
-                st.error(f"❌ AI CFO Robotlar yüklenirken hata oluştu: {str(e)}")
-                import traceback
-                with st.expander("🔍 Hata Detayları"):
-                    st.code(traceback.format_exc())
-        
-        elif selected_menu == "2. Teknik ve Operasyonel AI CFO":
-            try:
-                from views.ai_cfo_robots import show_ai_cfo_section
-                show_ai_cfo_section("2. Teknik ve Operasyonel AI CFO")
-            except ImportError as e:
-                st.error(f"❌ AI CFO Robotlar modülü yüklenemedi: {str(e)}")
-                import traceback
-                with st.expander("🔍 Hata Detayları"):
-                    st.code(traceback.format_exc())
-            except Exception as e:
-                st.error(f"❌ AI CFO Robotlar yüklenirken hata oluştu: {str(e)}")
-                import traceback
-                with st.expander("🔍 Hata Detayları"):
-                    st.code(traceback.format_exc())
-        
-        elif selected_menu == "Dashboard Grafik":
-            try:
-                from views.dashboard_grafik import show_dashboard_grafik_section
-                show_dashboard_grafik_section()
-            except ImportError:
-                st.info("📋 Dashboard Grafik modülü yüklenemedi.")
-            except Exception as e:
-                st.error(f"❌ Dashboard Grafik yüklenirken hata oluştu: {str(e)}")
-        
-        elif selected_menu == "Sankey":
-            try:
-                from views.sankey_grafik import show_sankey_grafik_section
-                show_sankey_grafik_section()
-            except ImportError:
-                st.info("📋 Sankey Grafik modülü yüklenemedi.")
-            except Exception as e:
-                st.error(f"❌ Sankey Grafik yüklenirken hata oluştu: {str(e)}")
-        
-        elif selected_menu == "Rasyo":
-            try:
-                from views.rasyo_analiz import show_rasyo_analiz_section
-                show_rasyo_analiz_section()
-            except ImportError:
-                st.info("📋 Rasyo Analiz modülü yüklenemedi.")
-            except Exception as e:
-                st.error(f"❌ Rasyo Analiz yüklenirken hata oluştu: {str(e)}")
-        
-        elif selected_menu == "Yatırımcı":
-            try:
-                from views.yatirimci_analiz import show_yatirimci_analiz_section
-                show_yatirimci_analiz_section()
-            except ImportError:
-                st.info("📋 Yatırımcı Analiz modülü yüklenemedi.")
-            except Exception as e:
-                st.error(f"❌ Yatırımcı Analiz yüklenirken hata oluştu: {str(e)}")
-        
-        elif selected_menu == "Dikey":
-            try:
-                from views.dikey_analiz import show_dikey_analiz_section
-                show_dikey_analiz_section()
-            except ImportError:
-                st.info("📋 Dikey Analiz modülü yüklenemedi.")
-            except Exception as e:
-                st.error(f"❌ Dikey Analiz yüklenirken hata oluştu: {str(e)}")
-        
-        elif selected_menu == "DuPont":
-            try:
-                from views.dupont_analiz import show_dupont_analiz_section
-                show_dupont_analiz_section()
-            except ImportError:
-                st.info("📋 DuPont Analizi modülü yüklenemedi.")
-            except Exception as e:
-                st.error(f"❌ DuPont Analizi yüklenirken hata oluştu: {str(e)}")
+        # Menü etiketi -> view eşlemesi view_registry.py'deki VIEW_MODULES tablosunda;
+        # modüller ilk seçimde yüklenir, çizim süreleri ve hatalar kaydedilir
+        gorunum_kaydi = get_view_registry()
+        if selected_menu in gorunum_kaydi:
+            gorunum_kaydi.render(selected_menu)
         
-        elif selected_menu == "Senaryo":
-            try:
-                from views.senaryo_analiz import show_senaryo_analiz_section
-                show_senaryo_analiz_section()
-            except ImportError:
-                st.info("📋 Senaryo Analizi modülü yüklenemedi.")
-            except Exception as e:
-                st.error(f"❌ Senaryo Analizi yüklenirken hata oluştu: {str(e)}")
-        
-        elif selected_menu == "Sektör Bilgi":
-            try:
-                from views.sektor_bilgi import show_sektor_bilgi_section
-                show_sektor_bilgi_section()
-            except ImportError:
-                st.info("📋 Sektör Bilgi modülü yüklenemedi.")
-            except Exception as e:
-                st.error(f"❌ Sektör Bilgi yüklenirken hata oluştu: {str(e)}")
-        
-        elif selected_menu == "Borsa":
-            try:
-                from views.borsa_analiz import show_borsa_analiz_section
-                show_borsa_analiz_section()
-            except ImportError:
-                st.info("📋 Borsa Analizi modülü yüklenemedi.")
-            except Exception as e:
-                st.error(f"❌ Borsa Analizi yüklenirken hata oluştu: {str(e)}")
+        with st.sidebar.expander("⏱️ Ekran Performansı", expanded=False):
+            performans = gorunum_kaydi.stats_table()
+            if performans:
+                st.dataframe(pd.DataFrame(performans), hide_index=True, use_container_width=True)
+            else:
+                st.caption("Henüz ölçüm yok.")
+            st.caption("Türetilmiş tablolar (son çalıştırma):")
+            st.dataframe(pd.DataFrame(turetilmis_grafik.timings()), hide_index=True, use_container_width=True)
+            rasyo_onbellegi = get_ratio_cache().stats()
+            st.caption(
+                f"Rasyo önbelleği: isabet {rasyo_onbellegi['isabet']}, ıskalama {rasyo_onbellegi['iskalama']} "
+                f"(%{rasyo_onbellegi['isabet_orani'] * 100:.0f}); son hesaplamada "
+                f"{len(rasyo_onbellegi['son_hesaplanan'])} rasyo yeniden hesaplandı"
+            )
     
     except Exception as e:
         st.error(f"❌ **Beklenmeyen Bir Hata Oluştu**\n\n"
@@ -1568,401 +1617,9 @@ elif st.session_state['ekran_durumu'] == 'menu':
 # HESAPLAMA_YONTEMLERI artık financial_analyzer.py'de
 # Import edildi: from financial_analyzer import HESAPLAMA_YONTEMLERI
 
-# --- BANKA ŞEMALARI ---
-SEMA_BANKA_GELIR = {
-    "Faiz Gelirleri": ["faiz gelirleri", "interest income", "kredilerden alınan faizler"],
-    "Faiz Giderleri (-)": ["faiz giderleri", "interest expenses", "mevduata verilen faizler"],
-    "Net Faiz Geliri": ["net faiz geliri", "net interest income", "net faiz gelir/gideri"],
-    "Net Ücret ve Komisyon": ["net ücret ve komisyon", "net fee and commission", "ücret ve komisyon gelirleri"],
-    "Ticari Kar/Zarar": ["ticari kar", "ticari zarar", "ticari kar/zarar (net)", "sermaye piyasası işlemleri karı"],
-    "Diğer Faaliyet Gelirleri": ["diğer faaliyet gelirleri", "other operating income"],
-    "Faaliyet Giderleri (-)": ["faaliyet giderleri", "personel giderleri", "genel yönetim giderleri", "diğer faaliyet giderleri"],
-    "Kredi Karşılık Giderleri (-)": ["kredi karşılık", "beklenen kredi zarar", "provision for loan losses", "karşılık giderleri"],
-    "Vergi Öncesi Kar": ["vergi öncesi kar", "profit before tax", "sürdürülen faaliyetler vergi öncesi"],
-    "Vergi (-)": ["vergi", "tax", "vergi karşılığı"],
-    "Net Kar/Zarar": ["net dönem karı", "net kar/zarar", "net income", "dönem net karı", "dönem karı"]
-}
-
-SEMA_BANKA_BILANCO = {
-    "Nakit Değerler ve MB": ["nakit değerler", "merkez bankası", "kasa", "cash and central bank"],
-    "Gerçeğe Uygun Değer Farkı FV": ["gerçeğe uygun değer", "finansal varlıklar", "alım satım amaçlı"],
-    "Bankalar": ["bankalar", "banks"],
-    "Krediler (Net)": ["krediler", "loans", "canlı krediler", "takipteki krediler"],
-    "Menkul Değerler": ["menkul değerler", "yatırım amaçlı menkul kıymetler", "gerçeğe uygun değeri kar/zarara"],
-    "Maddi Duran Varlıklar": ["maddi duran varlıklar", "sabit kıymetler", "demirbaşlar"],
-    "Toplam Varlıklar": ["toplam varlıklar", "toplam aktifler", "aktif toplamı", "total assets"],
-    
-    "Mevduat": ["mevduat", "deposits", "toplam mevduat", "müşteri mevduatı"],
-    "Alınan Krediler": ["alınan krediler", "funds borrowed", "kredi kuruluşlarına borçlar"],
-    "İhraç Edilen Menkul Kıymetler": ["ihraç edilen menkul", "issued securities"],
-    "Muhtelif Borçlar": ["muhtelif borçlar", "other liabilities"],
-    "Toplam Yükümlülükler": ["toplam yükümlülükler", "toplam borçlar", "toplam pasifler"],
-    
-    "Ödenmiş Sermaye": ["ödenmiş sermaye", "sermaye", "share capital"],
-    "Yedekler": ["yedekler", "kar yedekleri", "yasal yedekler"],
-    "Geçmiş Yıl Karları": ["geçmiş yıl kar", "retained earnings"],
-    "Dönem Net Karı": ["dönem net karı", "net profit for the period"],
-    "Özkaynaklar": ["özkaynaklar", "toplam özkaynaklar", "shareholders equity"]
-}
-
-# ==========================================
-# TMS / UFRS (IFRS) UYUMLULUK SİSTEMİ
-# ==========================================
-# TMS: Türkiye Muhasebe Standartları
-# UFRS: Uluslararası Finansal Raporlama Standartları (IFRS)
-# Her hesap için TMS adı, UFRS/IFRS adı ve ilgili standart numarası
-
-TMS_UFRS_ESLESTIRME = {
-    # ==========================================
-    # GELİR TABLOSU HESAPLARI
-    # ==========================================
-    "gelir_tablosu": {
-        "Satış Gelirleri": {
-            "tms_adi": "Hasılat",
-            "ufrs_adi": "Revenue",
-            "tms_standart": "TMS 18 / TFRS 15",
-            "ufrs_standart": "IAS 18 / IFRS 15",
-            "aciklama": "Hasılatın muhasebeleştirilmesi (Müşteri Sözleşmelerinden Hasılat)",
-            "hesaplama": "Brüt satışlar - Satış iadeleri - Satış iskontoları",
-            "alternatif_isimler": ["satış gelirleri", "hasılat", "net satışlar", "revenue", "sales", "net sales", "turnover"]
-        },
-        "Satışların Maliyeti (-)": {
-            "tms_adi": "Satışların Maliyeti",
-            "ufrs_adi": "Cost of Sales / Cost of Goods Sold",
-            "tms_standart": "TMS 2",
-            "ufrs_standart": "IAS 2",
-            "aciklama": "Stoklar standardına göre maliyet hesaplama",
-            "hesaplama": "Dönem başı stok + Dönem içi alımlar - Dönem sonu stok",
-            "alternatif_isimler": ["satışların maliyeti", "satış maliyeti", "cogs", "cost of goods sold", "cost of sales"]
-        },
-        "Brüt Kar/Zarar": {
-            "tms_adi": "Brüt Kar/Zarar",
-            "ufrs_adi": "Gross Profit/Loss",
-            "tms_standart": "TMS 1",
-            "ufrs_standart": "IAS 1",
-            "aciklama": "Finansal Tabloların Sunuluşu",
-            "hesaplama": "Hasılat - Satışların Maliyeti",
-            "alternatif_isimler": ["brüt kar", "brüt kar/zarar", "brüt satış karı", "gross profit", "gross margin"]
-        },
-        "Faaliyet Giderleri (-)": {
-            "tms_adi": "Faaliyet Giderleri",
-            "ufrs_adi": "Operating Expenses",
-            "tms_standart": "TMS 1",
-            "ufrs_standart": "IAS 1",
-            "aciklama": "Genel Yönetim + Pazarlama Satış + Ar-Ge Giderleri",
-            "hesaplama": "Genel Yönetim Giderleri + Pazarlama Satış Dağıtım Giderleri + Ar-Ge Giderleri",
-            "alternatif_isimler": ["faaliyet giderleri", "operating expenses", "opex", "işletme giderleri"]
-        },
-        "Faaliyet Karı/Zararı": {
-            "tms_adi": "Esas Faaliyet Karı/Zararı",
-            "ufrs_adi": "Operating Profit/Loss",
-            "tms_standart": "TMS 1",
-            "ufrs_standart": "IAS 1",
-            "aciklama": "Esas faaliyetlerden elde edilen kar veya zarar",
-            "hesaplama": "Brüt Kar - Faaliyet Giderleri + Esas Faaliyetlerden Diğer Gelirler - Esas Faaliyetlerden Diğer Giderler",
-            "alternatif_isimler": ["esas faaliyet karı", "faaliyet karı", "faaliyet karı/zararı", "operating income", "operating profit", "ebit"]
-        },
-        "Amortisman ve İtfa": {
-            "tms_adi": "Amortisman ve İtfa Giderleri",
-            "ufrs_adi": "Depreciation and Amortization",
-            "tms_standart": "TMS 16 / TMS 38",
-            "ufrs_standart": "IAS 16 / IAS 38",
-            "aciklama": "Maddi ve Maddi Olmayan Duran Varlıkların amortismanı",
-            "hesaplama": "Maddi Duran Varlık Amortismanı + Maddi Olmayan Duran Varlık İtfası + Kullanım Hakkı Varlık İtfası",
-            "alternatif_isimler": ["amortisman", "itfa", "depreciation", "amortization", "d&a"]
-        },
-        "FAVÖK (EBITDA)": {
-            "tms_adi": "Faiz, Amortisman ve Vergi Öncesi Kar",
-            "ufrs_adi": "Earnings Before Interest, Taxes, Depreciation and Amortization",
-            "tms_standart": "Standart Dışı (Yönetim Raporlaması)",
-            "ufrs_standart": "Non-GAAP Measure",
-            "aciklama": "Yönetim performans ölçütü - standart dışı",
-            "hesaplama": "Esas Faaliyet Karı + Amortisman + İtfa Giderleri",
-            "alternatif_isimler": ["favök", "ebitda", "faiz amortisman vergi öncesi kar"]
-        },
-        "Finansman Gelir/Gider (Net)": {
-            "tms_adi": "Finansman Geliri/Gideri (Net)",
-            "ufrs_adi": "Finance Income/Costs (Net)",
-            "tms_standart": "TMS 23 / TFRS 9",
-            "ufrs_standart": "IAS 23 / IFRS 9",
-            "aciklama": "Borçlanma maliyetleri ve finansal araçlar",
-            "hesaplama": "Finansman Gelirleri - Finansman Giderleri",
-            "alternatif_isimler": ["finansman gideri", "finansman geliri", "finance costs", "interest expense", "interest income"]
-        },
-        "Vergi Öncesi Kar": {
-            "tms_adi": "Sürdürülen Faaliyetler Vergi Öncesi Karı/Zararı",
-            "ufrs_adi": "Profit/Loss Before Tax from Continuing Operations",
-            "tms_standart": "TMS 1 / TMS 12",
-            "ufrs_standart": "IAS 1 / IAS 12",
-            "aciklama": "Vergi öncesi dönem karı",
-            "hesaplama": "Esas Faaliyet Karı + Finansman Gelirleri - Finansman Giderleri + Diğer Gelirler - Diğer Giderler",
-            "alternatif_isimler": ["vergi öncesi kar", "pretax income", "profit before tax", "ebt"]
-        },
-        "Vergi (-)": {
-            "tms_adi": "Dönem Vergi Gideri/Geliri",
-            "ufrs_adi": "Income Tax Expense/Income",
-            "tms_standart": "TMS 12",
-            "ufrs_standart": "IAS 12",
-            "aciklama": "Gelir Vergileri standardı",
-            "hesaplama": "Cari Dönem Vergi Gideri + Ertelenmiş Vergi Gideri/Geliri",
-            "alternatif_isimler": ["vergi", "tax", "income tax", "kurumlar vergisi", "dönem vergi gideri"]
-        },
-        "Net Kar/Zarar": {
-            "tms_adi": "Dönem Karı/Zararı",
-            "ufrs_adi": "Profit/Loss for the Period",
-            "tms_standart": "TMS 1",
-            "ufrs_standart": "IAS 1",
-            "aciklama": "Net dönem sonucu (pozitif = kar, negatif = zarar)",
-            "hesaplama": "Vergi Öncesi Kar - Vergi Gideri",
-            "alternatif_isimler": ["net kar", "net kar/zarar", "net dönem karı", "dönem karı", "net income", "net profit", "profit for the period"]
-        }
-    },
-    
-    # ==========================================
-    # BİLANÇO - VARLIKLAR
-    # ==========================================
-    "bilanco_varliklar": {
-        "Dönen Varlıklar": {
-            "tms_adi": "Dönen Varlıklar",
-            "ufrs_adi": "Current Assets",
-            "tms_standart": "TMS 1",
-            "ufrs_standart": "IAS 1",
-            "aciklama": "12 ay içinde nakde çevrilmesi beklenen varlıklar",
-            "hesaplama": "Nakit + Alacaklar + Stoklar + Diğer Dönen Varlıklar",
-            "alternatif_isimler": ["dönen varlıklar", "current assets", "cari varlıklar"]
-        },
-        "Nakit ve Benzerleri": {
-            "tms_adi": "Nakit ve Nakit Benzerleri",
-            "ufrs_adi": "Cash and Cash Equivalents",
-            "tms_standart": "TMS 7",
-            "ufrs_standart": "IAS 7",
-            "aciklama": "Nakit Akış Tablosu standardı",
-            "hesaplama": "Kasa + Banka + Vadesiz Mevduat + 3 aya kadar vadeli araçlar",
-            "alternatif_isimler": ["nakit", "cash", "nakit ve nakit benzerleri", "hazır değerler"]
-        },
-        "Ticari Alacaklar": {
-            "tms_adi": "Ticari Alacaklar",
-            "ufrs_adi": "Trade Receivables",
-            "tms_standart": "TFRS 9 / TFRS 15",
-            "ufrs_standart": "IFRS 9 / IFRS 15",
-            "aciklama": "Finansal Araçlar ve Hasılat standartları",
-            "hesaplama": "Alıcılar + Alacak Senetleri - Şüpheli Alacak Karşılığı",
-            "alternatif_isimler": ["ticari alacaklar", "alacaklar", "trade receivables", "accounts receivable"]
-        },
-        "Stoklar": {
-            "tms_adi": "Stoklar",
-            "ufrs_adi": "Inventories",
-            "tms_standart": "TMS 2",
-            "ufrs_standart": "IAS 2",
-            "aciklama": "Stoklar standardı (Maliyet veya net gerçekleşebilir değerin düşük olanı)",
-            "hesaplama": "İlk Madde + Yarı Mamul + Mamul + Ticari Mal - Stok Değer Düşüklüğü Karşılığı",
-            "alternatif_isimler": ["stoklar", "inventories", "inventory", "envanter"]
-        },
-        "Duran Varlıklar": {
-            "tms_adi": "Duran Varlıklar",
-            "ufrs_adi": "Non-Current Assets",
-            "tms_standart": "TMS 1",
-            "ufrs_standart": "IAS 1",
-            "aciklama": "12 aydan uzun vadeli varlıklar",
-            "hesaplama": "Maddi DV + Maddi Olmayan DV + Finansal Yatırımlar + Diğer Duran Varlıklar",
-            "alternatif_isimler": ["duran varlıklar", "non-current assets", "fixed assets", "uzun vadeli varlıklar"]
-        },
-        "Maddi Duran Varlıklar": {
-            "tms_adi": "Maddi Duran Varlıklar",
-            "ufrs_adi": "Property, Plant and Equipment",
-            "tms_standart": "TMS 16",
-            "ufrs_standart": "IAS 16",
-            "aciklama": "Maddi Duran Varlıklar standardı",
-            "hesaplama": "Maliyet Bedeli - Birikmiş Amortisman - Değer Düşüklüğü",
-            "alternatif_isimler": ["maddi duran varlıklar", "ppe", "property plant equipment", "sabit kıymetler"]
-        },
-        "Kullanım Hakkı Varlıkları": {
-            "tms_adi": "Kullanım Hakkı Varlıkları",
-            "ufrs_adi": "Right-of-Use Assets",
-            "tms_standart": "TFRS 16",
-            "ufrs_standart": "IFRS 16",
-            "aciklama": "Kiralamalar standardı",
-            "hesaplama": "Kiralama başlangıcındaki değer - Birikmiş İtfa - Değer Düşüklüğü",
-            "alternatif_isimler": ["kullanım hakkı varlıkları", "right of use assets", "rou assets", "kiralama varlıkları"]
-        },
-        "Maddi Olmayan Duran Varlıklar": {
-            "tms_adi": "Maddi Olmayan Duran Varlıklar",
-            "ufrs_adi": "Intangible Assets",
-            "tms_standart": "TMS 38",
-            "ufrs_standart": "IAS 38",
-            "aciklama": "Maddi Olmayan Duran Varlıklar standardı",
-            "hesaplama": "Şerefiye + Haklar + Lisanslar + Geliştirme Maliyetleri - Birikmiş İtfa",
-            "alternatif_isimler": ["maddi olmayan duran varlıklar", "intangible assets", "intangibles", "gayri maddi varlıklar"]
-        },
-        "Şerefiye": {
-            "tms_adi": "Şerefiye",
-            "ufrs_adi": "Goodwill",
-            "tms_standart": "TFRS 3",
-            "ufrs_standart": "IFRS 3",
-            "aciklama": "İşletme Birleşmeleri standardı",
-            "hesaplama": "Ödenen bedel - Edinilen net varlıkların gerçeğe uygun değeri",
-            "alternatif_isimler": ["şerefiye", "goodwill", "peştamallık"]
-        },
-        "Toplam Varlıklar": {
-            "tms_adi": "Toplam Varlıklar",
-            "ufrs_adi": "Total Assets",
-            "tms_standart": "TMS 1",
-            "ufrs_standart": "IAS 1",
-            "aciklama": "Bilançonun aktif tarafı toplamı",
-            "hesaplama": "Dönen Varlıklar + Duran Varlıklar",
-            "alternatif_isimler": ["toplam varlıklar", "total assets", "aktif toplamı", "toplam aktifler"]
-        }
-    },
-    
-    # ==========================================
-    # BİLANÇO - KAYNAKLAR
-    # ==========================================
-    "bilanco_kaynaklar": {
-        "Kısa Vadeli Yükümlülükler": {
-            "tms_adi": "Kısa Vadeli Yükümlülükler",
-            "ufrs_adi": "Current Liabilities",
-            "tms_standart": "TMS 1",
-            "ufrs_standart": "IAS 1",
-            "aciklama": "12 ay içinde ödenmesi gereken yükümlülükler",
-            "hesaplama": "Finansal Borçlar (KV) + Ticari Borçlar + Diğer KV Yükümlülükler",
-            "alternatif_isimler": ["kısa vadeli yükümlülükler", "current liabilities", "kısa vadeli borçlar"]
-        },
-        "Finansal Borçlar (KV)": {
-            "tms_adi": "Kısa Vadeli Borçlanmalar",
-            "ufrs_adi": "Short-term Borrowings",
-            "tms_standart": "TFRS 9 / TMS 32",
-            "ufrs_standart": "IFRS 9 / IAS 32",
-            "aciklama": "Finansal Araçlar standartları",
-            "hesaplama": "Banka Kredileri (KV) + Çıkarılmış Tahviller (KV kısmı) + Kiralama Yükümlülükleri (KV)",
-            "alternatif_isimler": ["finansal borçlar", "banka kredileri", "short-term borrowings", "bank loans"]
-        },
-        "Ticari Borçlar": {
-            "tms_adi": "Ticari Borçlar",
-            "ufrs_adi": "Trade Payables",
-            "tms_standart": "TFRS 9",
-            "ufrs_standart": "IFRS 9",
-            "aciklama": "Ticari faaliyetlerden kaynaklanan borçlar",
-            "hesaplama": "Satıcılar + Borç Senetleri + Alınan Avanslar",
-            "alternatif_isimler": ["ticari borçlar", "satıcılar", "trade payables", "accounts payable"]
-        },
-        "Uzun Vadeli Yükümlülükler": {
-            "tms_adi": "Uzun Vadeli Yükümlülükler",
-            "ufrs_adi": "Non-Current Liabilities",
-            "tms_standart": "TMS 1",
-            "ufrs_standart": "IAS 1",
-            "aciklama": "12 aydan uzun vadeli yükümlülükler",
-            "hesaplama": "Finansal Borçlar (UV) + Kiralama Yükümlülükleri (UV) + Kıdem Tazminatı + Ertelenmiş Vergi",
-            "alternatif_isimler": ["uzun vadeli yükümlülükler", "non-current liabilities", "uzun vadeli borçlar"]
-        },
-        "Finansal Borçlar (UV)": {
-            "tms_adi": "Uzun Vadeli Borçlanmalar",
-            "ufrs_adi": "Long-term Borrowings",
-            "tms_standart": "TFRS 9 / TMS 32",
-            "ufrs_standart": "IFRS 9 / IAS 32",
-            "aciklama": "Uzun vadeli finansal borçlar",
-            "hesaplama": "Banka Kredileri (UV) + Çıkarılmış Tahviller + Kiralama Yükümlülükleri (UV)",
-            "alternatif_isimler": ["uzun vadeli finansal borçlar", "long-term borrowings", "long-term debt"]
-        },
-        "Kıdem Tazminatı Karşılığı": {
-            "tms_adi": "Çalışanlara Sağlanan Faydalara İlişkin Karşılıklar",
-            "ufrs_adi": "Employee Benefit Obligations",
-            "tms_standart": "TMS 19",
-            "ufrs_standart": "IAS 19",
-            "aciklama": "Çalışanlara Sağlanan Faydalar standardı",
-            "hesaplama": "Aktüeryal hesaplama ile belirlenen bugünkü değer",
-            "alternatif_isimler": ["kıdem tazminatı", "employee benefits", "pension obligations", "çalışan faydaları"]
-        },
-        "Ertelenmiş Vergi Yükümlülüğü": {
-            "tms_adi": "Ertelenmiş Vergi Yükümlülüğü",
-            "ufrs_adi": "Deferred Tax Liability",
-            "tms_standart": "TMS 12",
-            "ufrs_standart": "IAS 12",
-            "aciklama": "Gelir Vergileri standardı - Geçici farklar",
-            "hesaplama": "Vergiye tabi geçici farklar x Vergi oranı",
-            "alternatif_isimler": ["ertelenmiş vergi yükümlülüğü", "deferred tax liability", "dtl"]
-        },
-        "Özkaynaklar": {
-            "tms_adi": "Özkaynaklar",
-            "ufrs_adi": "Equity",
-            "tms_standart": "TMS 1 / TMS 32",
-            "ufrs_standart": "IAS 1 / IAS 32",
-            "aciklama": "Toplam varlıklar - Toplam yükümlülükler",
-            "hesaplama": "Ödenmiş Sermaye + Sermaye Yedekleri + Kar Yedekleri + Geçmiş Yıl Karları + Dönem Karı",
-            "alternatif_isimler": ["özkaynaklar", "equity", "shareholders equity", "net varlıklar"]
-        },
-        "Ödenmiş Sermaye": {
-            "tms_adi": "Ödenmiş Sermaye",
-            "ufrs_adi": "Issued Capital / Share Capital",
-            "tms_standart": "TMS 32",
-            "ufrs_standart": "IAS 32",
-            "aciklama": "Çıkarılmış ve ödenmiş pay sermayesi",
-            "hesaplama": "Çıkarılmış pay sayısı x Pay başına nominal değer",
-            "alternatif_isimler": ["ödenmiş sermaye", "sermaye", "share capital", "issued capital"]
-        },
-        "Geçmiş Yıl Karları": {
-            "tms_adi": "Geçmiş Yıllar Karları/Zararları",
-            "ufrs_adi": "Retained Earnings",
-            "tms_standart": "TMS 1",
-            "ufrs_standart": "IAS 1",
-            "aciklama": "Birikmiş karlar ve zararlar",
-            "hesaplama": "Önceki dönem birikmiş kar/zarar + Dönem karı - Dağıtılan temettü",
-            "alternatif_isimler": ["geçmiş yıl karları", "retained earnings", "birikmiş karlar"]
-        },
-        "Toplam Kaynaklar": {
-            "tms_adi": "Toplam Kaynaklar (Yükümlülükler ve Özkaynaklar)",
-            "ufrs_adi": "Total Equity and Liabilities",
-            "tms_standart": "TMS 1",
-            "ufrs_standart": "IAS 1",
-            "aciklama": "Bilançonun pasif tarafı toplamı = Aktif toplamı",
-            "hesaplama": "Kısa Vadeli Yük. + Uzun Vadeli Yük. + Özkaynaklar",
-            "alternatif_isimler": ["toplam kaynaklar", "total liabilities and equity", "pasif toplamı"]
-        }
-    },
-    
-    # ==========================================
-    # NAKİT AKIŞ TABLOSU
-    # ==========================================
-    "nakit_akis": {
-        "İşletme Faaliyetlerinden Nakit": {
-            "tms_adi": "İşletme Faaliyetlerinden Kaynaklanan Nakit Akışları",
-            "ufrs_adi": "Cash Flows from Operating Activities",
-            "tms_standart": "TMS 7",
-            "ufrs_standart": "IAS 7",
-            "aciklama": "Nakit Akış Tabloları standardı - Doğrudan veya dolaylı yöntem",
-            "hesaplama": "Dönem Karı + Nakit Çıkışı Gerektirmeyen Giderler - İşletme Sermayesi Değişimi",
-            "alternatif_isimler": ["işletme nakit akışı", "operating cash flow", "ocf", "faaliyetlerden nakit"]
-        },
-        "Yatırım Faaliyetlerinden Nakit": {
-            "tms_adi": "Yatırım Faaliyetlerinden Kaynaklanan Nakit Akışları",
-            "ufrs_adi": "Cash Flows from Investing Activities",
-            "tms_standart": "TMS 7",
-            "ufrs_standart": "IAS 7",
-            "aciklama": "Uzun vadeli varlık alım/satımından kaynaklanan akışlar",
-            "hesaplama": "Maddi DV Alımları + Maddi Olmayan DV Alımları - Satışlar + Yatırım Gelirleri",
-            "alternatif_isimler": ["yatırım nakit akışı", "investing cash flow", "icf", "yatırımlardan nakit"]
-        },
-        "Finansman Faaliyetlerinden Nakit": {
-            "tms_adi": "Finansman Faaliyetlerinden Kaynaklanan Nakit Akışları",
-            "ufrs_adi": "Cash Flows from Financing Activities",
-            "tms_standart": "TMS 7",
-            "ufrs_standart": "IAS 7",
-            "aciklama": "Özkaynaklar ve borçlanmalardaki değişimler",
-            "hesaplama": "Kredi Kullanımları - Kredi Geri Ödemeleri - Temettü Ödemeleri - Faiz Ödemeleri",
-            "alternatif_isimler": ["finansman nakit akışı", "financing cash flow", "fcf", "finansmandan nakit"]
-        },
-        "Serbest Nakit Akışı": {
-            "tms_adi": "Serbest Nakit Akışı",
-            "ufrs_adi": "Free Cash Flow",
-            "tms_standart": "Standart Dışı (Yönetim Raporlaması)",
-            "ufrs_standart": "Non-GAAP Measure",
-            "aciklama": "İşletmenin serbest kullanabileceği nakit",
-            "hesaplama": "İşletme Faaliyetlerinden Nakit - CAPEX (Sermaye Harcamaları)",
-            "alternatif_isimler": ["serbest nakit akışı", "free cash flow", "fcf"]
-        }
-    }
-}
-
-# TMS/UFRS Kontrol fonksiyonları dosyanın başında tanımlandı (satır 144-240)
+# SEMA_BANKA_GELIR, SEMA_BANKA_BILANCO ve TMS_UFRS_ESLESTIRME artık schemas.py modülünde
+# (standartlaştırma ekranlardan önce çalıştığı için dosyanın başında import ediliyor)
+# Import edildi: from schemas import SEMA_BANKA_GELIR, SEMA_BANKA_BILANCO, TMS_UFRS_ESLESTIRME
 
 # ==========================================
 # 2. VERİ İŞLEME MOTORU
@@ -2033,4 +1690,4 @@ if st.session_state.get('ekran_durumu') != 'menu':
             * **Hibrit Rasyo Analizi:** Sektöre özel finansal oranlar.
             * **Büyük Veri Motoru:** Tüm verilerin tek havuzda toplanması.
             * **Sankey Diyagramı:** Gelir akışını görselleştirin.
-            """)
\ No newline at end of file
+            """)
@@ -0,0 +1,671 @@
+"""
+Çok firmalı toplu analiz (Streamlit olmadan).
+
+Bir oturum ``df_ham`` üzerinden tek firmayı analiz eder. Bu modül aynı
+akışı (temizleme -> eşleştirme -> tablolara ayırma -> ana tablo -> rasyolar)
+veritabanındaki tüm firmalar veya bir dizindeki yükleme dosyaları için
+süreç havuzunda çalıştırır:
+
+    - Kaynak: veritabanı (dal.demo_dal.get_companies + load_company_frame)
+      veya dizindeki .csv / .xlsx dosyaları (ingest_streaming)
+    - Her firma ayrı bir işçi süreçte işlenir (spawn; Streamlit gerekmez)
+    - Banka / ticari şema ve formül seti firma başına seçilir: firma kaydındaki
+      ``is_banka`` / sektör bilgisi, yoksa hesap adlarının hangi şema setiyle
+      daha çok eşleştiği (``--banka`` / ``--ticari`` hepsini zorlar)
+    - Sonuçlar tamamlandıkça tek bir SQLite deposuna yazılır; firma başına
+      tek işlem (transaction) olduğu için yarım kalan firma depoda görünmez
+    - Yeniden başlatmada tamamlanmış firmalar atlanır (dosya veya veritabanı
+      özeti değiştiyse yeniden işlenir); hata alan firmalar tekrar denenir
+    - Bir işçi süreç çökerse o anda havuzdaki firmalar tek tek, ayrı
+      süreçlerde yeniden denenir; çökmeye yol açan firma hatalı kaydedilir
+
+Kullanım:
+    python batch_runner.py --dir yuklemeler/ --out toplu_analiz.sqlite
+    python batch_runner.py --db --workers 4
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sqlite3
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing, contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+from alias_matcher import AliasMatcher, apply_compiled_mapping, schema_groups
+from master_table import MasterTable
+from number_parser import clean_turkish_float_series
+from ratio_engine import get_ratio_engine
+from schemas import SEMA_BANKA_BILANCO, SEMA_BANKA_GELIR, TMS_UFRS_ESLESTIRME
+from statement_partition import STATEMENT_LABELS, STATEMENT_ORDER, build_statement_lookup, partition_statements
+from streaming_ingest import STREAMING_UZANTILAR, ingest_streaming
+
+try:
+    from converters import SEMA_BILANCO, SEMA_GELIR_TABLOSU, SEMA_NAKIT_AKIS
+    CONVERTERS_AVAILABLE = True
+except ImportError:
+    CONVERTERS_AVAILABLE = False
+
+# ==========================================
+# AYARLAR
+# ==========================================
+VARSAYILAN_DEPO = 'toplu_analiz.sqlite'
+# Havuzda aynı anda bekleyen iş sayısı (işçi başına); sonuçlar bellekte birikmez
+ISCI_BASINA_IS = 2
+
+DOSYA = 'dosya'
+VERITABANI = 'veritabani'
+
+TAMAM = 'tamam'
+HATA = 'hata'
+
+_SEMA = """
+CREATE TABLE IF NOT EXISTS islem (
+    firma   TEXT PRIMARY KEY,
+    ad      TEXT,
+    kaynak  TEXT NOT NULL,
+    surum   TEXT,
+    durum   TEXT NOT NULL,
+    hata    TEXT,
+    satir   INTEGER,
+    donem   INTEGER,
+    sure    REAL,
+    zaman   REAL NOT NULL,
+    banka   INTEGER
+);
+CREATE TABLE IF NOT EXISTS ana_tablo (
+    firma TEXT NOT NULL,
+    tablo TEXT,
+    kalem TEXT,
+    donem TEXT,
+    deger REAL
+);
+CREATE INDEX IF NOT EXISTS ix_ana_tablo_firma ON ana_tablo (firma);
+CREATE TABLE IF NOT EXISTS ozet (
+    firma         TEXT NOT NULL,
+    tablo         TEXT,
+    kalem         TEXT,
+    son_deger     REAL,
+    ortalama      REAL,
+    son_buyume    REAL,
+    yillik_buyume REAL,
+    ybbo          REAL,
+    reel_ybbo     REAL,
+    z_skoru       REAL
+);
+CREATE INDEX IF NOT EXISTS ix_ozet_firma ON ozet (firma);
+CREATE TABLE IF NOT EXISTS rasyo (
+    firma TEXT NOT NULL,
+    rasyo TEXT,
+    donem TEXT,
+    deger REAL
+);
+CREATE INDEX IF NOT EXISTS ix_rasyo_firma ON rasyo (firma);
+"""
+
+# MasterTable.summary sütunu -> depo sütunu
+_OZET_SUTUNLARI = {
+    'Tablo': 'tablo',
+    'Kalem': 'kalem',
+    'Son Değer': 'son_deger',
+    'Ortalama': 'ortalama',
+    'Son Büyüme (%)': 'son_buyume',
+    'Yıllık Büyüme (%)': 'yillik_buyume',
+    'YBBO (%)': 'ybbo',
+    'Reel YBBO (%)': 'reel_ybbo',
+    'Z-Skoru (Son)': 'z_skoru',
+}
+_SONUC_TABLOLARI = ('ana_tablo', 'ozet', 'rasyo')
+
+
+# ==========================================
+# İŞLER
+# ==========================================
+@dataclass(frozen=True)
+class BatchJob:
+    """
+    Tek firmanın işi; ``surum`` değişirse (veya bilinmiyorsa) tamamlanmış firma
+    yeniden işlenir. ``is_banka`` None ise firma türü hesap adlarından bulunur.
+    """
+    firma: str
+    kaynak: str
+    konum: Any
+    ad: str = ''
+    surum: Optional[str] = None
+    is_banka: Optional[bool] = None
+
+
+@dataclass
+class BatchResult:
+    """İşçinin döndürdüğü firma sonucu (ana tablo, özet ve rasyolar uzun biçimde)"""
+    job: BatchJob
+    ana_tablo: pd.DataFrame
+    ozet: pd.DataFrame
+    rasyo: pd.DataFrame
+    satir: int = 0
+    donem: int = 0
+    sure: float = 0.0
+    is_banka: bool = False
+
+
+@dataclass
+class BatchStats:
+    """Toplu çalıştırmanın sayaçları"""
+    toplam: int = 0
+    atlanan: int = 0
+    tamamlanan: int = 0
+    hatali: int = 0
+    sure: float = 0.0
+    hatalar: Dict[str, str] = field(default_factory=dict)
+
+
+def _dosya_surumu(path: str) -> str:
+    bilgi = os.stat(path)
+    return f"{bilgi.st_size}:{bilgi.st_mtime_ns}"
+
+
+def jobs_from_directory(dizin: str, recursive: bool = False) -> List[BatchJob]:
+    """
+    Dizindeki .csv / .xlsx dosyalarından işler (firma = dizine göre dosya yolu).
+
+    Args:
+        dizin: Yükleme dosyalarının dizini
+        recursive: Alt dizinler de taransın mı
+    """
+    yollar = []
+    for kok, alt_dizinler, dosyalar in os.walk(dizin):
+        alt_dizinler.sort()
+        yollar += [os.path.join(kok, d) for d in sorted(dosyalar) if d.lower().endswith(STREAMING_UZANTILAR)]
+        if not recursive:
+            break
+    return [
+        BatchJob(
+            firma=os.path.relpath(p, dizin).replace(os.sep, '/'), kaynak=DOSYA, konum=os.path.abspath(p),
+            ad=os.path.splitext(os.path.basename(p))[0], surum=_dosya_surumu(p)
+        )
+        for p in yollar
+    ]
+
+
+def _firma_banka_mi(firma: Mapping[str, Any]) -> Optional[bool]:
+    """Firma kaydındaki is_banka alanı veya sektör adı (bilinmiyorsa None)"""
+    if firma.get('is_banka') is not None:
+        return bool(firma['is_banka'])
+    sektor = str(firma.get('sektor') or '').casefold()
+    return True if 'bank' in sektor else None
+
+
+def _veritabani_surumu(company_id: Any, summary_loader: Optional[Callable[[Any], Any]]) -> Optional[str]:
+    """Firma özetinden sürüm (son dönem, kayıt ve hesap sayısı); özet yoksa None"""
+    from db_pool import cached_company_summary
+    try:
+        ozet = cached_company_summary(company_id, summary_loader)
+    except Exception:
+        return None
+    if not ozet:
+        return None
+    return f"{ozet.get('latest_period')}:{ozet.get('total_records')}:{ozet.get('account_count')}"
+
+
+def jobs_from_database(
+    loader: Optional[Callable[[], Any]] = None,
+    summary_loader: Optional[Callable[[Any], Any]] = None
+) -> List[BatchJob]:
+    """
+    Veritabanındaki firmalardan işler (dal.demo_dal.get_companies; db_pool önbelleği üzerinden).
+
+    Sürüm firma özetinden (get_company_financial_summary) gelir: yeni dönem
+    veya kayıt eklenen firma yeniden başlatmada tekrar işlenir.
+    """
+    from db_pool import cached_companies
+    _veritabani_baslat()
+    isler = []
+    for firma in cached_companies(loader) or []:
+        ad = str(firma.get('firma_adi') or '').strip()
+        isler.append(BatchJob(
+            firma=str(firma['id']), kaynak=VERITABANI, konum=firma['id'], ad=ad or str(firma['id']),
+            surum=_veritabani_surumu(firma['id'], summary_loader), is_banka=_firma_banka_mi(firma)
+        ))
+    return isler
+
+
+# ==========================================
+# İŞÇİ (modül seviyesinde, pickle'lanabilir)
+# ==========================================
+@lru_cache(maxsize=2)
+def _eslestirici(is_banka: bool = False) -> AliasMatcher:
+    """İşçi süreç başına firma türü başına bir kez derlenen alias otomatı (app1.get_alias_matcher ile aynı şemalar)"""
+    return AliasMatcher.from_schemas(schema_groups(
+        sema_gelir=SEMA_GELIR_TABLOSU if CONVERTERS_AVAILABLE else None,
+        sema_bilanco=SEMA_BILANCO if CONVERTERS_AVAILABLE else None,
+        sema_nakit=SEMA_NAKIT_AKIS if CONVERTERS_AVAILABLE else None,
+        tms_ufrs=TMS_UFRS_ESLESTIRME,
+        banka_gelir=SEMA_BANKA_GELIR,
+        banka_bilanco=SEMA_BANKA_BILANCO,
+        is_banka=is_banka
+    ))
+
+
+def detect_is_banka(etiketler: Iterable[Any]) -> bool:
+    """
+    Hesap adları banka şemalarıyla ticari şemalardan daha çok eşleşiyor mu.
+
+    Yalnızca kesin (bulanık olmayan) eşleşmeler sayılır; eşitlikte ticari
+    kabul edilir (uygulamanın varsayılanı).
+    """
+    benzersiz = pd.Series(list(etiketler), dtype=object).dropna().unique()
+    banka = sum(_eslestirici(True).match(e, fuzzy=False) is not None for e in benzersiz)
+    ticari = sum(_eslestirici(False).match(e, fuzzy=False) is not None for e in benzersiz)
+    return banka > ticari
+
+
+@lru_cache(maxsize=1)
+def _tablo_sozlugu() -> Dict[str, str]:
+    return build_statement_lookup(
+        SEMA_GELIR_TABLOSU if CONVERTERS_AVAILABLE else None,
+        SEMA_BILANCO if CONVERTERS_AVAILABLE else None,
+        SEMA_NAKIT_AKIS if CONVERTERS_AVAILABLE else None,
+        TMS_UFRS_ESLESTIRME
+    )
+
+
+@lru_cache(maxsize=1)
+def _veritabani_baslat() -> None:
+    """.env ve db.database kurulumu (app1 ile aynı; modül yoksa yalnızca db_pool adresi kullanılır)"""
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+    try:
+        from db.database import init_database, is_database_configured
+        if is_database_configured():
+            init_database()
+    except ImportError:
+        pass
+
+
+def _dal_veri(company_id: Any) -> Optional[pd.DataFrame]:
+    from dal.data_loader_db import load_company_data_from_db
+    from db_pool import call_with_engine
+    return call_with_engine(load_company_data_from_db, company_id)
+
+
+def _yukle(job: BatchJob, user_mapping: Optional[Mapping], is_banka: Optional[bool]):
+    """
+    Firma verisi: (eşleştirilmiş çerçeve, kalem sütunu, dönem sütunları, banka mı).
+
+    Şema seti firma türü bilindikten sonra seçildiği için eşleştirme okumadan
+    sonra tüm çerçeve üzerinde bir kez yapılır.
+    """
+    if job.kaynak == DOSYA:
+        with open(job.konum, 'rb') as f:
+            sonuc = ingest_streaming(f, job.konum, keep_original=False)
+        df, item_col = sonuc.frame, sonuc.item_col
+        date_cols = list(df.columns[1:])
+    else:
+        df, item_col, date_cols = _veritabanindan_yukle(job)
+    if is_banka is None:
+        is_banka = detect_is_banka(df[item_col])
+    df = apply_compiled_mapping(df, item_col, user_mapping, _eslestirici(is_banka))
+    return df, item_col, date_cols, is_banka
+
+
+def _veritabanindan_yukle(job: BatchJob):
+    from db_pivot import load_company_frame
+    _veritabani_baslat()
+    df = load_company_frame(job.konum, fallback=_dal_veri)
+    if df is None or df.empty:
+        raise ValueError(f"Firma verisi bulunamadı: {job.firma}")
+    # Manuel yükleme ile aynı biçim: account_name -> Kalem
+    if 'account_name' in df.columns:
+        df = df.rename(columns={'account_name': 'Kalem'})
+    item_col = 'Kalem' if 'Kalem' in df.columns else df.columns[0]
+    date_cols = [c for c in df.columns if c != item_col]
+    metin = [c for c in date_cols if not pd.api.types.is_numeric_dtype(df[c])]
+    if metin:
+        df = df.copy()
+        for col in metin:
+            df[col] = clean_turkish_float_series(df[col])
+    return df, item_col, date_cols
+
+
+def process_company(
+    job: BatchJob,
+    is_banka: Optional[bool] = None,
+    user_mapping: Optional[Mapping] = None,
+    firma_bilgi: Optional[Mapping[str, Any]] = None
+) -> BatchResult:
+    """
+    Tek firmanın ana tablo ve rasyo akışı (oturumdaki menü akışının aynısı).
+
+    Args:
+        job: Firma işi
+        is_banka: Banka şema / formül seti zorlansın mı (None ise job.is_banka,
+            o da yoksa hesap adlarından tespit edilir)
+        user_mapping: Kullanıcı eşleştirmesi
+        firma_bilgi: Ana tabloya eklenecek firma üst verisi
+
+    Returns:
+        BatchResult
+    """
+    t0 = time.perf_counter()
+    df, item_col, date_cols, is_banka = _yukle(job, user_mapping, is_banka if is_banka is not None else job.is_banka)
+    if not date_cols:
+        raise ValueError(f"Sayısal dönem sütunu bulunamadı: {job.firma}")
+
+    tablolar = partition_statements(df, item_col, _tablo_sozlugu())
+    if tablolar.is_partitioned:
+        frames = {STATEMENT_LABELS[t]: tablolar.get(t) for t in STATEMENT_ORDER}
+    else:
+        frames = {STATEMENT_LABELS[STATEMENT_ORDER[-1]]: tablolar.full}
+    ana = MasterTable.from_statements(frames, date_cols, item_col=item_col, firma_bilgi=firma_bilgi)
+
+    ana_uzun = ana.to_long()[['Tablo', 'Kalem', 'Dönem', 'Değer']]
+    ana_uzun.columns = ['tablo', 'kalem', 'donem', 'deger']
+    ozet = ana.summary().rename(columns=_OZET_SUTUNLARI)
+
+    rasyolar = get_ratio_engine(is_banka).evaluate_frame(df, date_cols)
+    rasyo = rasyolar.rename_axis(columns='donem').stack(future_stack=True).rename('deger').reset_index()
+    rasyo.columns = ['rasyo', 'donem', 'deger']
+
+    return BatchResult(
+        job=job, ana_tablo=ana_uzun, ozet=ozet, rasyo=rasyo,
+        satir=len(df), donem=len(date_cols), sure=time.perf_counter() - t0, is_banka=is_banka
+    )
+
+
+# ==========================================
+# KONSOLİDE DEPO
+# ==========================================
+def _metin(seri: pd.Series) -> pd.Series:
+    """Kategorik / tarih / sayı boyut sütunlarını depoda metin olarak saklar"""
+    return seri.astype(object).map(lambda v: None if v is None or (isinstance(v, float) and np.isnan(v)) else str(v))
+
+
+class BatchStore:
+    """
+    Tüm firmaların sonuçlarını tutan SQLite deposu.
+
+    Tablolar: ``islem`` (firma durumu, yeniden başlatma için), ``ana_tablo``
+    (firma, tablo, kalem, dönem, değer), ``ozet`` (MasterTable.summary) ve
+    ``rasyo`` (firma, rasyo, dönem, değer). Yazmalar yalnızca ana süreçten
+    yapılır; işçiler depoya dokunmaz.
+    """
+
+    def __init__(self, path: str = VARSAYILAN_DEPO):
+        self.path = path
+        self._kilit = threading.Lock()
+        with self._baglan() as baglanti:
+            baglanti.execute('PRAGMA journal_mode=WAL')
+            baglanti.executescript(_SEMA)
+            # Önceki sürümle oluşturulmuş depolarda firma türü sütunu yok
+            sutunlar = {s[1] for s in baglanti.execute('PRAGMA table_info(islem)')}
+            if 'banka' not in sutunlar:
+                baglanti.execute('ALTER TABLE islem ADD COLUMN banka INTEGER')
+
+    @contextmanager
+    def _baglan(self) -> Iterator[sqlite3.Connection]:
+        """Blok sonunda işlemi onaylayan (hatada geri alan) ve bağlantıyı kapatan bağlantı"""
+        with closing(sqlite3.connect(self.path, timeout=30)) as baglanti, baglanti:
+            yield baglanti
+
+    def completed(self) -> Dict[str, Optional[str]]:
+        """Tamamlanmış firmalar: {firma: sürüm}"""
+        with self._baglan() as baglanti:
+            satirlar = baglanti.execute('SELECT firma, surum FROM islem WHERE durum = ?', (TAMAM,)).fetchall()
+        return dict(satirlar)
+
+    def pending(self, jobs: Iterable[BatchJob]) -> List[BatchJob]:
+        """Tamamlanmamış, dosyası / özeti değişmiş veya sürümü bilinmeyen işler"""
+        tamam = self.completed()
+        return [j for j in jobs if j.surum is None or j.firma not in tamam or tamam[j.firma] != j.surum]
+
+    def _islem_yaz(self, baglanti, job: BatchJob, durum: str, hata: Optional[str] = None,
+                   satir: Optional[int] = None, donem: Optional[int] = None, sure: Optional[float] = None,
+                   is_banka: Optional[bool] = None) -> None:
+        baglanti.execute(
+            'INSERT OR REPLACE INTO islem (firma, ad, kaynak, surum, durum, hata, satir, donem, sure, zaman, banka) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+            (job.firma, job.ad, job.kaynak, job.surum, durum, hata, satir, donem, sure, time.time(),
+             None if is_banka is None else int(is_banka))
+        )
+
+    def write(self, sonuc: BatchResult) -> None:
+        """Firmanın eski satırlarını siler ve yenilerini tek işlemde yazar"""
+        firma = sonuc.job.firma
+        with self._kilit, self._baglan() as baglanti:
+            for tablo in _SONUC_TABLOLARI:
+                baglanti.execute(f'DELETE FROM {tablo} WHERE firma = ?', (firma,))
+            for tablo, df in (('ana_tablo', sonuc.ana_tablo), ('ozet', sonuc.ozet), ('rasyo', sonuc.rasyo)):
+                if df.empty:
+                    continue
+                sutunlar = list(df.columns)
+                veriler = [
+                    _metin(df[c]) if not pd.api.types.is_float_dtype(df[c]) else df[c].astype(object)
+                    for c in sutunlar
+                ]
+                baglanti.executemany(
+                    f"INSERT INTO {tablo} (firma, {', '.join(sutunlar)}) VALUES (?{', ?' * len(sutunlar)})",
+                    ((firma, *satir) for satir in zip(*veriler))
+                )
+            self._islem_yaz(baglanti, sonuc.job, TAMAM, satir=sonuc.satir, donem=sonuc.donem, sure=sonuc.sure,
+                            is_banka=sonuc.is_banka)
+
+    def write_failure(self, job: BatchJob, hata: str) -> None:
+        """Hata alan firma; sonraki çalıştırmada yeniden denenir"""
+        with self._kilit, self._baglan() as baglanti:
+            self._islem_yaz(baglanti, job, HATA, hata=hata)
+
+    def read(self, tablo: str, firma: Optional[str] = None) -> pd.DataFrame:
+        """Depodaki bir tablo (firma verilirse yalnızca o firma)"""
+        if tablo not in _SONUC_TABLOLARI + ('islem',):
+            raise ValueError(f"Bilinmeyen tablo: {tablo}")
+        sorgu, parametre = f'SELECT * FROM {tablo}', ()
+        if firma is not None:
+            sorgu, parametre = sorgu + ' WHERE firma = ?', (firma,)
+        with self._baglan() as baglanti:
+            return pd.read_sql_query(sorgu, baglanti, params=parametre)
+
+    def stats(self) -> Dict[str, int]:
+        """Durum başına firma sayısı"""
+        with self._baglan() as baglanti:
+            return dict(baglanti.execute('SELECT durum, COUNT(*) FROM islem GROUP BY durum').fetchall())
+
+
+# ==========================================
+# ÇALIŞTIRMA
+# ==========================================
+def _hata_metni(hata: BaseException) -> str:
+    if isinstance(hata, BrokenProcessPool):
+        return f"İşçi süreç çöktü ({type(hata).__name__}: {hata})"
+    return ''.join(traceback.format_exception_only(type(hata), hata)).strip()
+
+
+def _spawn_havuzu(isci: int) -> ProcessPoolExecutor:
+    # Streamlit / DB bağlantıları fork ile kopyalanmasın diye spawn
+    return ProcessPoolExecutor(max_workers=isci, mp_context=multiprocessing.get_context('spawn'))
+
+
+def run_batch(
+    jobs: Iterable[BatchJob],
+    store: BatchStore,
+    workers: Optional[int] = None,
+    is_banka: Optional[bool] = None,
+    user_mapping: Optional[Mapping] = None,
+    resume: bool = True,
+    progress: Optional[Callable[[int, int, BatchJob, Optional[str]], None]] = None,
+    processor: Callable[..., BatchResult] = process_company
+) -> BatchStats:
+    """
+    Firmaları süreç havuzunda işler; her sonuç tamamlanır tamamlanmaz depoya yazılır.
+
+    Bir işçi süreç çökerse (BrokenProcessPool) havuzda o anda bekleyen firmalar
+    tek işçili ayrı havuzlarda birer birer yeniden denenir: çökmeye yol açan
+    firma hatalı kaydedilir, diğerleri tamamlanır; kalan işler yeni bir
+    havuzla devam eder.
+
+    Args:
+        jobs: İşler (jobs_from_directory / jobs_from_database)
+        store: Konsolide depo
+        workers: İşçi süreç sayısı (None ise CPU sayısı; 1 ise aynı süreçte sıralı)
+        is_banka: Tüm firmalar için banka (True) / ticari (False) şema ve formül
+            seti; None ise firma başına (BatchJob.is_banka veya hesap adlarından)
+        user_mapping: Kullanıcı eşleştirmesi
+        resume: True ise depoda tamamlanmış firmalar atlanır
+        progress: (tamamlanan, toplam, iş, hata) ile çağrılan ilerleme fonksiyonu
+        processor: Firma işleyici (modül seviyesinde, pickle'lanabilir; varsayılan process_company)
+
+    Returns:
+        BatchStats
+    """
+    t0 = time.perf_counter()
+    tum = list(jobs)
+    bekleyen = store.pending(tum) if resume else tum
+    istatistik = BatchStats(toplam=len(tum), atlanan=len(tum) - len(bekleyen))
+    isci = max(1, workers or os.cpu_count() or 1)
+
+    def bitir(job: BatchJob, sonuc: Optional[BatchResult], hata: Optional[BaseException]) -> None:
+        if hata is None:
+            store.write(sonuc)
+            istatistik.tamamlanan += 1
+            mesaj = None
+        else:
+            mesaj = _hata_metni(hata)
+            store.write_failure(job, mesaj)
+            istatistik.hatali += 1
+            istatistik.hatalar[job.firma] = mesaj
+        if progress is not None:
+            progress(istatistik.tamamlanan + istatistik.hatali, len(bekleyen), job, mesaj)
+
+    if isci == 1 or len(bekleyen) <= 1:
+        for job in bekleyen:
+            try:
+                sonuc = processor(job, is_banka, user_mapping)
+            except Exception as e:
+                bitir(job, None, e)
+            else:
+                bitir(job, sonuc, None)
+    else:
+        sira = iter(bekleyen)
+        while True:
+            supheli = _havuzda_isle(sira, isci, bitir, processor, is_banka, user_mapping)
+            if not supheli:
+                break
+            # Havuz çöktü: hangi firmanın çökerttiği bilinmez; her biri ayrı süreçte denenir
+            for job in supheli:
+                with _spawn_havuzu(1) as havuz:
+                    gelecek = havuz.submit(processor, job, is_banka, user_mapping)
+                    hata = gelecek.exception()
+                bitir(job, None if hata else gelecek.result(), hata)
+
+    istatistik.sure = time.perf_counter() - t0
+    return istatistik
+
+
+def _havuzda_isle(sira, isci: int, bitir, processor, is_banka, user_mapping) -> List[BatchJob]:
+    """
+    İşleri bir havuzda sırayla işler (bekleyen iş sayısı sınırlı).
+
+    Returns:
+        Havuz çökerse o anda havuzda olan işler (sonuçları yazılmadı), aksi halde boş liste
+    """
+    calisan: Dict[Any, BatchJob] = {}
+    gonderilemeyen: List[BatchJob] = []
+    with _spawn_havuzu(isci) as havuz:
+        def doldur():
+            while not gonderilemeyen and len(calisan) < isci * ISCI_BASINA_IS:
+                job = next(sira, None)
+                if job is None:
+                    return
+                try:
+                    calisan[havuz.submit(processor, job, is_banka, user_mapping)] = job
+                except BrokenProcessPool:
+                    # Havuz gönderim sırasında çöktü; iş hiç çalışmadı, çökeni bekleyen işler ortaya çıkarır
+                    gonderilemeyen.append(job)
+
+        doldur()
+        while calisan:
+            biten, _ = wait(calisan, return_when=FIRST_COMPLETED)
+            supheli = []
+            for gelecek in biten:
+                job = calisan.pop(gelecek)
+                hata = gelecek.exception()
+                if isinstance(hata, BrokenProcessPool):
+                    supheli.append(job)
+                else:
+                    bitir(job, None if hata else gelecek.result(), hata)
+            if supheli:
+                # Çöken havuzdaki diğer işler: çökmeden önce bitenler yazılır, gerisi yeniden denenir
+                for gelecek, job in calisan.items():
+                    hata = gelecek.exception()
+                    if isinstance(hata, BrokenProcessPool):
+                        supheli.append(job)
+                    else:
+                        bitir(job, None if hata else gelecek.result(), hata)
+                return supheli + gonderilemeyen
+            doldur()
+    return gonderilemeyen
+
+
+# ==========================================
+# KOMUT SATIRI
+# ==========================================
+def _yazdir(tamamlanan: int, toplam: int, job: BatchJob, hata: Optional[str]) -> None:
+    durum = f"HATA: {hata}" if hata else "tamam"
+    print(f"[{tamamlanan}/{toplam}] {job.ad or job.firma}: {durum}", flush=True)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Çok firmalı toplu analiz (ana tablo + rasyolar)")
+    kaynak = parser.add_mutually_exclusive_group(required=True)
+    kaynak.add_argument("--dir", help="Yükleme dosyalarının (.csv / .xlsx) dizini")
+    kaynak.add_argument("--db", action="store_true", help="Veritabanındaki tüm firmalar")
+    parser.add_argument("--recursive", action="store_true", help="Alt dizinleri de tara")
+    parser.add_argument("--out", default=VARSAYILAN_DEPO, help="Konsolide SQLite deposu")
+    parser.add_argument("--workers", type=int, default=None, help="İşçi süreç sayısı (varsayılan: CPU sayısı)")
+    firma_turu = parser.add_mutually_exclusive_group()
+    firma_turu.add_argument("--banka", action="store_true",
+                            help="Tüm firmalarda banka şema / formül setini kullan (varsayılan: firma başına tespit)")
+    firma_turu.add_argument("--ticari", action="store_true", help="Tüm firmalarda ticari şema / formül setini kullan")
+    parser.add_argument("--mapping", help="Kullanıcı eşleştirmesi (JSON dosyası)")
+    parser.add_argument("--limit", type=int, default=None, help="En fazla işlenecek firma")
+    parser.add_argument("--yeniden", action="store_true", help="Tamamlanmış firmaları da yeniden işle")
+    args = parser.parse_args(argv)
+
+    if args.dir:
+        isler = jobs_from_directory(args.dir, args.recursive)
+    else:
+        isler = jobs_from_database()
+    if args.limit is not None:
+        isler = isler[:args.limit]
+
+    user_mapping = None
+    if args.mapping:
+        with open(args.mapping, encoding='utf-8') as f:
+            user_mapping = json.load(f)
+
+    depo = BatchStore(args.out)
+    istatistik = run_batch(
+        isler, depo, workers=args.workers, is_banka=True if args.banka else (False if args.ticari else None),
+        user_mapping=user_mapping,
+        resume=not args.yeniden, progress=_yazdir
+    )
+    print(f"{istatistik.toplam} firma: {istatistik.tamamlanan} tamamlandı, {istatistik.atlanan} atlandı "
+          f"(önceden tamamlanmış), {istatistik.hatali} hatalı — {istatistik.sure:.1f} sn -> {args.out}")
+    return 1 if istatistik.hatali else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+"""
+Hesap adı eşleştirme benchmark'ı: her satır için tüm alias'ları tek tek
+arayan döngü (tam kelime ``alias in etiket``) ile derlenmiş Aho-Corasick
+eşleştiricinin karşılaştırması.
+
+Referans döngü aynı kuralları (tam kelime, en uzun alias) uygular; sonuçların
+aynı olması otomatın doğruluğunu gösterir, mapping.py ile birebir aynılığı
+değil (mapping.py bu ağaçta bulunmuyor).
+
+Kullanım:
+    python benchmarks/bench_alias_matcher.py --rows 50000
+    python benchmarks/bench_alias_matcher.py --rows 50000 --banka
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from alias_matcher import AliasMatcher, normalize_label, schema_groups  # noqa: E402
+from schemas import SEMA_BANKA_BILANCO, SEMA_BANKA_GELIR, TMS_UFRS_ESLESTIRME  # noqa: E402
+
+ONEKLER = ["", "100 ", "102.01 ", "600-", "Toplam ", "Diğer "]
+SONEKLER = ["", " (Net)", " - TL", " Hesabı", " 2024", " YP"]
+
+
+def ornek_hesap_plani(satir: int, aliaslar, seed: int = 42) -> pd.Series:
+    """Alias'lardan türetilmiş, gürültülü sentetik hesap planı üretir"""
+    rng = np.random.default_rng(seed)
+    secim = rng.integers(0, len(aliaslar), satir)
+    onek = rng.integers(0, len(ONEKLER), satir)
+    sonek = rng.integers(0, len(SONEKLER), satir)
+    buyuk = rng.random(satir) < 0.3
+    bilinmeyen = rng.random(satir) < 0.1
+    etiketler = []
+    for i in range(satir):
+        if bilinmeyen[i]:
+            etiketler.append(f"Muhtelif Kalem {i}")
+            continue
+        etiket = ONEKLER[onek[i]] + aliaslar[secim[i]] + SONEKLER[sonek[i]]
+        etiketler.append(etiket.upper() if buyuk[i] else etiket)
+    return pd.Series(etiketler, dtype=object)
+
+
+def naif_eslestir(etiketler, kayitlar):
+    """Her etiket için tüm alias'ları sırayla dener (tam kelime, en uzun eşleşme)"""
+    sonuc = []
+    for etiket in etiketler:
+        normal = f" {normalize_label(etiket)} "
+        en_iyi = None
+        for grup, standart, alias in kayitlar:
+            if f" {alias} " in normal and (en_iyi is None or len(alias) > len(en_iyi[2])):
+                en_iyi = (grup, standart, alias)
+        sonuc.append(en_iyi[1] if en_iyi else None)
+    return sonuc
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--banka", action="store_true", help="Banka şema seti")
+    args = parser.parse_args()
+
+    gruplar = schema_groups(
+        tms_ufrs=TMS_UFRS_ESLESTIRME,
+        banka_gelir=SEMA_BANKA_GELIR,
+        banka_bilanco=SEMA_BANKA_BILANCO,
+        is_banka=args.banka
+    )
+
+    t0 = time.perf_counter()
+    matcher = AliasMatcher.from_schemas(gruplar)
+    t_derleme = time.perf_counter() - t0
+    kayitlar = matcher._hedefler
+
+    etiketler = ornek_hesap_plani(args.rows, [k[2] for k in kayitlar])
+    benzersiz = etiketler.nunique()
+    print(f"Veri: {args.rows} satır ({benzersiz} benzersiz), {len(matcher)} alias, "
+          f"derleme: {t_derleme * 1000:.1f} ms")
+
+    t0 = time.perf_counter()
+    naif = naif_eslestir(etiketler, kayitlar)
+    t_naif = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    derlenmis = matcher.match_many(etiketler, fuzzy=False)
+    t_derlenmis = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    bulanik = matcher.match_many(etiketler, fuzzy=True)
+    t_bulanik = time.perf_counter() - t0
+
+    derlenmis_kalem = [s.standart_kalem if s else None for s in derlenmis]
+    farkli = sum(a != b for a, b in zip(naif, derlenmis_kalem))
+
+    def oran(sonuclar):
+        return sum(s is not None for s in sonuclar) / len(sonuclar)
+
+    print(f"naif döngü          : {t_naif:8.3f} s  ({args.rows / t_naif:12,.0f} satır/s)  "
+          f"eşleşme: {oran(naif):.1%}")
+    print(f"derlenmiş (alias)   : {t_derlenmis:8.3f} s  ({args.rows / t_derlenmis:12,.0f} satır/s)  "
+          f"eşleşme: {oran(derlenmis):.1%}")
+    print(f"derlenmiş (+bulanık): {t_bulanik:8.3f} s  ({args.rows / t_bulanik:12,.0f} satır/s)  "
+          f"eşleşme: {oran(bulanik):.1%}")
+    print(f"hızlanma: {t_naif / t_derlenmis:.1f}x, farklı sonuç: {farkli}")
+
+
+if __name__ == "__main__":
+    main()
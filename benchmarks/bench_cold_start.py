@@ -0,0 +1,114 @@
+"""
+Soğuk başlangıç import benchmark'ı.
+
+app1.py'nin modül seviyesindeki importlarını (try/except blokları dahil)
+AST'den çıkarır ve her ölçümde yeni bir Python sürecinde sırayla import
+eder. ``--eager`` ile eskiden başta import edilen view modülleri ve
+kütüphaneler (FPDF, requests, xml.etree, yfinance) de eklenerek iki
+durum karşılaştırılır. Kurulu olmayan modüller atlanır.
+
+Kullanım:
+    python benchmarks/bench_cold_start.py --repeat 5 --eager
+    python benchmarks/bench_cold_start.py --file eski_app1.py
+"""
+
+import argparse
+import ast
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Lazy yüklemeye alınmadan önce app1.py başında import edilenler
+ESKI_EAGER_MODULLER = [
+    "views.ham_veri", "views.finansal_analiz_pro", "views.sektor", "views.gelir_tablosu",
+    "views.bilanco", "views.nakit_akis", "views.buyuk_veri", "views.rasyo_oran",
+    "views.veri_onay", "views.ileri_analiz", "views.veri_kontrol",
+    "fpdf", "requests", "xml.etree.ElementTree", "yfinance",
+]
+
+_COCUK = """
+import importlib, json, sys, time
+sys.path.insert(0, {kok!r})
+sonuc = {{}}
+for modul in {moduller!r}:
+    t0 = time.perf_counter()
+    try:
+        importlib.import_module(modul)
+        sonuc[modul] = time.perf_counter() - t0
+    except Exception:
+        sonuc[modul] = None
+print(json.dumps(sonuc))
+"""
+
+
+def import_fazi_modulleri(dosya: str):
+    """Dosyanın modül seviyesindeki (fonksiyon dışı, try dahil) importları"""
+    with open(dosya, encoding="utf-8") as f:
+        agac = ast.parse(f.read())
+
+    moduller = []
+
+    def ekle(ad):
+        if ad and ad not in moduller:
+            moduller.append(ad)
+
+    def gez(govde):
+        for dugum in govde:
+            if isinstance(dugum, ast.Import):
+                for ad in dugum.names:
+                    ekle(ad.name)
+            elif isinstance(dugum, ast.ImportFrom) and dugum.level == 0:
+                ekle(dugum.module)
+            elif isinstance(dugum, ast.Try):
+                gez(dugum.body)
+
+    gez(agac.body)
+    return moduller
+
+
+def olc(moduller, tekrar: int):
+    """Her tekrar yeni süreçte; modül başına medyan süre (yüklenemeyenler None)"""
+    olcumler = []
+    for _ in range(tekrar):
+        kod = _COCUK.format(kok=KOK, moduller=moduller)
+        cikti = subprocess.run([sys.executable, "-c", kod], capture_output=True, text=True, cwd=KOK)
+        olcumler.append(json.loads(cikti.stdout.strip().splitlines()[-1]))
+    sonuc = {}
+    for modul in moduller:
+        degerler = [o[modul] for o in olcumler if o.get(modul) is not None]
+        sonuc[modul] = statistics.median(degerler) if degerler else None
+    return sonuc
+
+
+def yazdir(baslik, sonuc, ilk: int):
+    toplam = sum(v for v in sonuc.values() if v is not None)
+    eksik = [m for m, v in sonuc.items() if v is None]
+    print(f"\n{baslik}: toplam {toplam * 1000:.0f} ms ({len(sonuc) - len(eksik)} modül, {len(eksik)} yok)")
+    for modul, sure in sorted(((m, v) for m, v in sonuc.items() if v is not None), key=lambda x: -x[1])[:ilk]:
+        print(f"  {modul:40s} {sure * 1000:8.1f} ms")
+    return toplam
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--file", default=os.path.join(KOK, "app1.py"))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--eager", action="store_true", help="eski eager importlarla karşılaştır")
+    args = parser.parse_args()
+
+    moduller = import_fazi_modulleri(args.file)
+    simdi = yazdir("import fazı", olc(moduller, args.repeat), args.top)
+
+    if args.eager:
+        eski = moduller + [m for m in ESKI_EAGER_MODULLER if m not in moduller]
+        onceki = yazdir("import fazı (eski eager importlarla)", olc(eski, args.repeat), args.top)
+        print(f"\nfark: {(onceki - simdi) * 1000:.0f} ms ({onceki / simdi:.2f}x)" if simdi else "")
+
+
+if __name__ == "__main__":
+    main()
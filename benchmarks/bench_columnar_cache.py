@@ -0,0 +1,108 @@
+"""
+BIST çalışma kitabı başlangıç süresi benchmark'ı: soğuk yol (openpyxl ile
+``pd.read_excel``) ile sıcak yol (bellek eşlemeli Arrow önbelleği) karşılaştırması.
+Aynı çalışma kitabı manuel yükleme olarak da (``read_upload_cached``, bayt
+özeti anahtarlı) ölçülür.
+
+Her ölçüm yeni bir süreçte yapılır (Streamlit işçi sürecinin soğuk
+başlangıcı gibi). Varsayılan olarak BistTumSektorHissesort.xlsx benzeri
+sentetik bir çalışma kitabı üretilir; ``--file`` ile gerçek dosya verilebilir.
+
+Kullanım:
+    python benchmarks/bench_columnar_cache.py --rows 600 --repeat 5
+    python benchmarks/bench_columnar_cache.py --file BistTumSektorHissesort.xlsx
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_COCUK = """
+import json, sys, time
+sys.path.insert(0, {kok!r})
+import pandas as pd
+from columnar_cache import read_excel_cached, read_upload_cached
+t0 = time.perf_counter()
+if {yol!r} == 'excel':
+    sonuc = pd.read_excel({dosya!r}, sheet_name=None)
+elif {yol!r} == 'yukleme':
+    with open({dosya!r}, 'rb') as f:
+        sonuc = read_upload_cached(f.read(), {dosya!r}, sheet_name=None)
+else:
+    sonuc = read_excel_cached({dosya!r}, sheet_name=None)
+sure = time.perf_counter() - t0
+print(json.dumps({{'sure': sure, 'satir': sum(len(d) for d in sonuc.values())}}))
+"""
+
+
+def ornek_calisma_kitabi(dosya: str, satir: int, seed: int = 42) -> None:
+    """BIST sektör dosyası biçiminde sentetik çalışma kitabı yazar"""
+    rng = np.random.default_rng(seed)
+    sektorler = [f"Sektör {i}" for i in range(40)]
+    df = pd.DataFrame({
+        'Borsa Kodu': [f"K{i:04d}" for i in range(satir)],
+        'Hisse Adı': [f"Firma {i} A.Ş." for i in range(satir)],
+        'Sektör': rng.choice(sektorler, satir),
+        'Kapanış(TL)': rng.uniform(1, 500, satir).round(2),
+        'Piyasa Değeri(mn TL)': rng.uniform(100, 500_000, satir).round(1),
+        'Piyasa Değeri(mn $)': rng.uniform(3, 15_000, satir).round(1),
+        'Halka AçıklıkOranı (%)': rng.uniform(5, 95, satir).round(1),
+        'Sermaye(mn TL)': rng.uniform(10, 5_000, satir).round(1),
+    })
+    for col in ['F/K', 'FD/FAVÖK', 'FD/Satışlar', 'PD/DD']:
+        degerler = rng.uniform(0.5, 40, satir).round(2).astype(object)
+        degerler[rng.random(satir) < 0.15] = 'A/D'
+        df[col] = degerler
+    sektor_ort = df.groupby('Sektör', as_index=False)[['Kapanış(TL)', 'Piyasa Değeri(mn TL)']].mean()
+    with pd.ExcelWriter(dosya, engine='openpyxl') as yazici:
+        df.to_excel(yazici, sheet_name='Hisseler', index=False)
+        sektor_ort.to_excel(yazici, sheet_name='Sektör Ortalamaları', index=False)
+
+
+def olc(dosya: str, yol: str, tekrar: int, ortam):
+    sureler = []
+    for _ in range(tekrar):
+        kod = _COCUK.format(kok=KOK, yol=yol, dosya=dosya)
+        cikti = subprocess.run([sys.executable, "-c", kod], capture_output=True, text=True, env=ortam, check=True)
+        sureler.append(json.loads(cikti.stdout.strip().splitlines()[-1])['sure'])
+    return statistics.median(sureler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--file", default=None)
+    parser.add_argument("--rows", type=int, default=600)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as gecici:
+        dosya = args.file or os.path.join(gecici, "BistTumSektorHissesort.xlsx")
+        if not args.file:
+            ornek_calisma_kitabi(dosya, args.rows)
+        ortam = dict(os.environ, DIGICFO_CACHE_DIR=os.path.join(gecici, "onbellek"))
+        print(f"Dosya: {os.path.basename(dosya)} ({os.path.getsize(dosya) / 1024:.0f} KB)")
+
+        excel = olc(dosya, 'excel', args.repeat, ortam)
+        ilk = olc(dosya, 'onbellek', 1, ortam)
+        sicak = olc(dosya, 'onbellek', args.repeat, ortam)
+        olc(dosya, 'yukleme', 1, ortam)
+        yukleme = olc(dosya, 'yukleme', args.repeat, ortam)
+
+    print(f"soğuk (pd.read_excel)           : {excel * 1000:8.1f} ms")
+    print(f"ilk çağrı (Excel + önbelleğe yaz): {ilk * 1000:8.1f} ms")
+    print(f"sıcak (bellek eşlemeli Arrow)    : {sicak * 1000:8.1f} ms")
+    print(f"sıcak yükleme (bayt özeti + Arrow): {yukleme * 1000:8.1f} ms")
+    print(f"hızlanma: {excel / sicak:.1f}x (yükleme {excel / yukleme:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
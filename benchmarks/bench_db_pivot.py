@@ -0,0 +1,118 @@
+"""
+Veritabanından firma yükleme benchmark'ı: 10 bin hesap × 60 dönem.
+
+SQLite'a uzun biçimli (hesap, dönem, değer) kayıtlar yazılır ve üç yol ölçülür:
+
+    - eski: kayıtları DataFrame'e oku, ``pivot`` ile genişlet, metin dönem
+      sütunlarını ``clean_turkish_float_series`` ile temizle (uygulamadaki adım)
+    - numpy: ``load_company_matrix(strategy='numpy')``
+    - sql: ``load_company_matrix(strategy='sql')``
+
+Kullanım:
+    python benchmarks/bench_db_pivot.py --accounts 10000 --periods 60
+    python benchmarks/bench_db_pivot.py --text-values   # değerler Türkçe metin
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, text
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db_pivot import FinancialTable, load_company_matrix
+from number_parser import clean_turkish_float_series
+
+T = FinancialTable('financial_data')
+
+
+def ornek_veritabani(motor, hesap: int, donem: int, metin: bool, seed: int = 42) -> None:
+    """İki firmalı sentetik uzun tablo (ölçülen firma: 1)"""
+    rng = np.random.default_rng(seed)
+    donemler = [f"{2020 + d // 12}-{d % 12 + 1:02d}" for d in range(donem)]
+    kayitlar = []
+    for firma in (1, 2):
+        degerler = rng.uniform(-1e6, 1e6, (hesap, donem)).round(2)
+        for i in range(hesap):
+            ad = f"{100 + i % 900}.{i:05d} Hesap {i}"
+            for j, d in enumerate(donemler):
+                v = degerler[i, j]
+                if metin:
+                    v = f"{v:,.2f}".replace(',', 'X').replace('.', ',').replace('X', '.')
+                kayitlar.append({'f': firma, 'h': ad, 'd': d, 'v': v})
+    deger_tipi = 'TEXT' if metin else 'REAL'
+    with motor.begin() as b:
+        b.execute(text(
+            f"CREATE TABLE {T.tablo} ({T.firma} INTEGER, {T.hesap} TEXT, {T.donem} TEXT, {T.deger} {deger_tipi})"
+        ))
+        b.execute(text(f"CREATE INDEX ix_firma ON {T.tablo} ({T.firma})"))
+        b.execute(text(f"INSERT INTO {T.tablo} VALUES (:f, :h, :d, :v)"), kayitlar)
+
+
+def eski_yol(motor, firma: int) -> pd.DataFrame:
+    with motor.connect() as b:
+        uzun = pd.read_sql(
+            text(f"SELECT {T.hesap}, {T.donem}, {T.deger} FROM {T.tablo} WHERE {T.firma} = :f"),
+            b, params={'f': firma}
+        )
+    # DAL'ın döndürdüğü geniş tablo
+    genis = uzun.pivot(index=T.hesap, columns=T.donem, values=T.deger).reset_index()
+    genis.columns.name = None
+    for col in genis.columns[1:]:
+        if not pd.api.types.is_numeric_dtype(genis[col]):
+            genis[col] = clean_turkish_float_series(genis[col])
+    return genis
+
+
+def olc(fn, tekrar: int) -> float:
+    sureler = []
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        fn()
+        sureler.append(time.perf_counter() - t0)
+    return statistics.median(sureler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--accounts", type=int, default=10_000)
+    parser.add_argument("--periods", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--text-values", action="store_true", help="Değerleri Türkçe metin olarak sakla")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as klasor:
+        motor = create_engine(f"sqlite:///{os.path.join(klasor, 'bench.db')}")
+        t0 = time.perf_counter()
+        ornek_veritabani(motor, args.accounts, args.periods, args.text_values)
+        print(f"{args.accounts:,} hesap × {args.periods} dönem "
+              f"({'metin' if args.text_values else 'sayısal'} değer), hazırlık {time.perf_counter() - t0:.1f} sn")
+
+        referans = eski_yol(motor, 1).set_index(T.hesap).sort_index()
+        yollar = {
+            'eski (pivot + temizleme)': lambda: eski_yol(motor, 1),
+            'numpy': lambda: load_company_matrix(1, motor, T, strategy='numpy'),
+        }
+        if not args.text_values:
+            yollar['sql'] = lambda: load_company_matrix(1, motor, T, strategy='sql')
+
+        eski = None
+        print(f"{'yol':<26} {'süre (ms)':>10} {'hızlanma':>9}  float64  eşit")
+        for ad, fn in yollar.items():
+            sure = olc(fn, args.repeat)
+            eski = eski or sure
+            sonuc = fn().set_index(T.hesap).sort_index()
+            tip = all(t == 'float64' for t in sonuc.dtypes)
+            esit = np.allclose(sonuc.to_numpy(), referans.to_numpy())
+            print(f"{ad:<26} {sure * 1000:>10.0f} {eski / sure:>8.1f}x  {str(tip):>7}  {esit}")
+        motor.dispose()
+
+
+if __name__ == "__main__":
+    main()
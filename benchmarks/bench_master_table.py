@@ -0,0 +1,120 @@
+"""
+Büyük Veri ana tablosu benchmark'ı: 10 yıllık aylık veri (120 dönem).
+
+Eski yol: tablolar + firma bilgisi + makro değerler object tipli tek geniş
+çerçevede birleştirilir, istatistikler satır satır (``apply(axis=1)``)
+hesaplanır. Yeni yol: ``MasterTable`` (kategorik kalem / tablo, float64
+matris, vektörel indirgemeler).
+
+Kullanım:
+    python benchmarks/bench_master_table.py --items 300 --years 10
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from master_table import MasterTable
+
+TABLOLAR = ('Gelir Tablosu', 'Bilanço', 'Nakit Akış')
+FIRMA = {'Firma Adı': 'Örnek A.Ş.', 'Borsa Kodu': 'ORNK', 'Sektör': 'Sanayi'}
+MAKRO = {'USD': 32.5, 'EUR': 35.1, 'tufe_yillik': 45.0, 'politika_faizi': 50.0}
+
+
+def ornek_tablolar(kalem: int, donemler, seed: int = 42):
+    rng = np.random.default_rng(seed)
+    tablolar = {}
+    for t, ad in enumerate(TABLOLAR):
+        df = pd.DataFrame({'Kalem': [f"{ad} Kalem {i}" for i in range(kalem)]})
+        taban = rng.uniform(1e5, 1e7, (kalem, 1))
+        buyume = np.cumprod(1 + rng.normal(0.01, 0.05, (kalem, len(donemler))), axis=1)
+        df = pd.concat([df, pd.DataFrame((taban * buyume).round(2), columns=donemler)], axis=1)
+        tablolar[ad] = df
+    return tablolar
+
+
+def eski_ana_tablo(tablolar, donemler) -> pd.DataFrame:
+    parcalar = []
+    for ad, df in tablolar.items():
+        parca = df.astype(object)
+        parca.insert(0, 'Tablo', ad)
+        parcalar.append(parca)
+    ana = pd.concat(parcalar, ignore_index=True).astype(object)
+    for k, v in {**FIRMA, **MAKRO}.items():
+        ana[k] = v
+    return ana
+
+
+def eski_istatistikler(ana: pd.DataFrame, donemler) -> pd.DataFrame:
+    yil = (len(donemler) - 1) / 12
+
+    def satir(r):
+        seri = pd.to_numeric(r[donemler])
+        buyume = seri.pct_change()
+        yoy = seri.pct_change(12)
+        ilk, son = seri.iloc[0], seri.iloc[-1]
+        z = (seri - seri.mean()) / seri.std()
+        deflator = (1 + float(r['tufe_yillik']) / 100) ** (np.arange(len(seri)) / 12)
+        reel = seri * deflator[-1] / deflator
+        return pd.Series({
+            'Son Büyüme (%)': buyume.iloc[-1] * 100,
+            'Yıllık Büyüme (%)': yoy.iloc[-1] * 100,
+            'YBBO (%)': ((son / ilk) ** (1 / yil) - 1) * 100 if ilk > 0 and son > 0 else np.nan,
+            'Reel YBBO (%)': ((reel.iloc[-1] / reel.iloc[0]) ** (1 / yil) - 1) * 100,
+            'Z-Skoru (Son)': z.iloc[-1],
+        })
+    return ana.apply(satir, axis=1)
+
+
+def olc(fn, tekrar: int) -> float:
+    sureler = []
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        fn()
+        sureler.append(time.perf_counter() - t0)
+    return statistics.median(sureler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=300, help="Tablo başına kalem")
+    parser.add_argument("--years", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    donemler = [f"{2015 + a // 12}-{a % 12 + 1:02d}" for a in range(args.years * 12)]
+    tablolar = ornek_tablolar(args.items, donemler)
+
+    ana = eski_ana_tablo(tablolar, donemler)
+    yeni = MasterTable.from_statements(tablolar, donemler, firma_bilgi=FIRMA, makro=MAKRO)
+    eski_mb = ana.memory_usage(deep=True).sum() / 1024 ** 2
+    print(f"{len(yeni):,} kalem × {len(donemler)} dönem")
+    print(f"Bellek: object geniş çerçeve {eski_mb:8.1f} MB | sütunsal {yeni.memory_mb:6.1f} MB "
+          f"({eski_mb / yeni.memory_mb:.0f}x)")
+
+    t_eski_kur = olc(lambda: eski_ana_tablo(tablolar, donemler), args.repeat)
+    t_yeni_kur = olc(lambda: MasterTable.from_statements(tablolar, donemler, firma_bilgi=FIRMA, makro=MAKRO),
+                     args.repeat)
+    t_eski = olc(lambda: eski_istatistikler(ana, donemler), 1)
+    t_yeni = olc(yeni.summary, args.repeat)
+
+    # Sonuçlar aynı mı (YBBO yıl sayısı: eski (n-1)/12, yeni tarih farkı)
+    eski_ozet = eski_istatistikler(ana, donemler)
+    yeni_ozet = yeni.summary()
+    for sutun in ('Son Büyüme (%)', 'Yıllık Büyüme (%)', 'Z-Skoru (Son)'):
+        assert np.allclose(eski_ozet[sutun].to_numpy(float), yeni_ozet[sutun].to_numpy(), equal_nan=True), sutun
+
+    print(f"{'':22} {'eski (ms)':>10} {'sütunsal (ms)':>14} {'hızlanma':>9}")
+    print(f"{'ana tablo kurulumu':22} {t_eski_kur * 1000:>10.1f} {t_yeni_kur * 1000:>14.1f} {t_eski_kur / t_yeni_kur:>8.1f}x")
+    print(f"{'istatistikler':22} {t_eski * 1000:>10.1f} {t_yeni * 1000:>14.1f} {t_eski / t_yeni:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Türkçe sayı temizleme benchmark'ı: hücre bazlı ``clean_turkish_float``
+(``df[col].apply``) ile sütun bazlı ``clean_turkish_float_series`` karşılaştırması.
+
+Kullanım:
+    python benchmarks/bench_number_parser.py --rows 20000 --cols 36
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from number_parser import clean_turkish_float_series, parse_turkish_number  # noqa: E402
+
+try:
+    from utils import clean_turkish_float
+    REFERANS_ADI = "utils.clean_turkish_float"
+except ImportError:
+    clean_turkish_float = parse_turkish_number
+    REFERANS_ADI = "number_parser.parse_turkish_number"
+
+
+def ornek_mizan(satir: int, sutun: int, seed: int = 42) -> pd.DataFrame:
+    """Mizan benzeri, Türkçe biçimli sentetik veri üretir"""
+    rng = np.random.default_rng(seed)
+    kalemler = [f"Hesap {i}" for i in range(satir)]
+    veri = {"Kalem": kalemler}
+    for j in range(sutun):
+        tutarlar = rng.normal(0, 5_000_000, satir)
+        metinler = [f"{abs(t):,.2f}".replace(",", "X").replace(".", ",").replace("X", ".") for t in tutarlar]
+        metinler = [f"({m})" if t < 0 else m for m, t in zip(metinler, tutarlar)]
+        secim = rng.random(satir)
+        metinler = np.where(secim < 0.03, "-", metinler)
+        metinler = np.where((secim >= 0.03) & (secim < 0.04), "A/D", metinler)
+        metinler = np.where((secim >= 0.04) & (secim < 0.05), "%12,5", metinler)
+        sutun_degerleri = pd.Series(metinler, dtype=object)
+        sutun_degerleri[secim > 0.99] = np.nan
+        veri[f"2024-{j + 1:02d}"] = sutun_degerleri
+    return pd.DataFrame(veri)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--cols", type=int, default=36)
+    args = parser.parse_args()
+
+    df = ornek_mizan(args.rows, args.cols)
+    sayisal = df.columns[1:]
+    print(f"Veri: {args.rows} satır x {args.cols} sütun, referans: {REFERANS_ADI}")
+
+    df_hucre = df.copy()
+    t0 = time.perf_counter()
+    for col in sayisal:
+        df_hucre[col] = df_hucre[col].apply(clean_turkish_float)
+    sure_hucre = time.perf_counter() - t0
+
+    df_vektor = df.copy()
+    t0 = time.perf_counter()
+    for col in sayisal:
+        df_vektor[col] = clean_turkish_float_series(df_vektor[col])
+    sure_vektor = time.perf_counter() - t0
+
+    esit = np.array_equal(
+        df_hucre[sayisal].to_numpy(dtype="float64"),
+        df_vektor[sayisal].to_numpy(dtype="float64")
+    )
+    print(f"Hücre bazlı (apply): {sure_hucre:8.3f} sn")
+    print(f"Sütun bazlı        : {sure_vektor:8.3f} sn")
+    print(f"Hızlanma           : {sure_hucre / sure_vektor:8.1f}x")
+    print(f"Sonuçlar aynı      : {'EVET' if esit else 'HAYIR'}")
+    return 0 if esit else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,72 @@
+"""
+Çok sayfalı Excel okuma benchmark'ı: sayfa sayısına göre sıralı ve süreç
+havuzlu (``read_sheets_parallel``) okuma + yapı analizi süresi.
+
+Her sayfa ayrı bir dönemin mizanıdır. Paralel ölçümden önce havuz ısıtılır
+(işçi süreçlerin açılışı Streamlit sürecinde bir kez ödenir).
+
+Kullanım:
+    python benchmarks/bench_parallel_sheets.py --sheets 1 2 4 8 16 --rows 5000
+    python benchmarks/bench_parallel_sheets.py --workers 8
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from parallel_sheets import default_workers, get_pool, read_sheets_parallel, shutdown_pool
+
+
+def ornek_calisma_kitabi(dosya: str, sayfa: int, satir: int, seed: int = 42) -> None:
+    """Her sayfası bir dönem olan sentetik çalışma kitabı yazar"""
+    rng = np.random.default_rng(seed)
+    with pd.ExcelWriter(dosya, engine='openpyxl') as yazici:
+        for i in range(sayfa):
+            df = pd.DataFrame({'Hesap Adı': [f"Hesap {j}" for j in range(satir)]})
+            for ay in range(1, 13):
+                df[f"{2015 + i}-{ay:02d}"] = rng.uniform(-1e6, 1e6, satir).round(2)
+            df.to_excel(yazici, sheet_name=f"{2015 + i}", index=False)
+
+
+def olc(dosya: str, parallel: bool, isci: int, tekrar: int) -> float:
+    sureler = []
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        read_sheets_parallel(dosya, max_workers=isci, parallel=parallel)
+        sureler.append(time.perf_counter() - t0)
+    return statistics.median(sureler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sheets", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=default_workers())
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"İşçi: {args.workers} (CPU: {os.cpu_count()}), sayfa başına {args.rows:,} satır")
+    # Havuzu ısıt: işçilerin açılışı ve pandas importu ölçüme girmesin
+    list(get_pool(args.workers).map(abs, range(args.workers)))
+
+    print(f"{'sayfa':>6} {'sıralı (ms)':>12} {'paralel (ms)':>13} {'hızlanma':>9}")
+    with tempfile.TemporaryDirectory() as gecici:
+        for sayfa in args.sheets:
+            dosya = os.path.join(gecici, f"donemler_{sayfa}.xlsx")
+            ornek_calisma_kitabi(dosya, sayfa, args.rows)
+            sirali = olc(dosya, False, args.workers, args.repeat)
+            paralel = olc(dosya, True, args.workers, args.repeat)
+            print(f"{sayfa:>6} {sirali * 1000:>12.1f} {paralel * 1000:>13.1f} {sirali / paralel:>8.2f}x")
+    shutdown_pool()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Rasyo hesaplama benchmark'ı: dönem dönem skaler hesap / derlenmiş vektörel motor.
+
+Skaler yol eski ``RasyoAnalizi`` akışını taklit eder: her dönem ve her rasyo
+için kalemler ``get_asc`` ile aranır, formül Python aritmetiğiyle hesaplanır.
+Sektör ölçümünde aynı formüller firma × kalem × dönem tensörü üzerinde tek
+geçişte çalışır.
+
+Kullanım:
+    python benchmarks/bench_ratio_engine.py --periods 60 --companies 500
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from line_item_index import KalemIndex
+from ratio_engine import TICARI_FORMULLER, compile_formula, get_ratio_engine
+
+
+def ornek_tablo(kalemler, donemler, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({'Kalem': kalemler})
+    for d in donemler:
+        df[d] = rng.uniform(-1e6, 1e6, len(kalemler)).round(2)
+    # Birkaç sıfır payda
+    df.iloc[::7, 1::5] = 0.0
+    return df
+
+
+def skaler_rasyolar(indeks: KalemIndex, formuller) -> pd.DataFrame:
+    """Dönem dönem, kalem kalem hesap (payda 0 ise NaN)"""
+    derlenmis = {ad: compile_formula(f) for ad, f in formuller.items()}
+    sonuc = {}
+    for j, donem in enumerate(indeks.date_cols):
+        sutun = {}
+        for ad, formul in derlenmis.items():
+            degerler = [indeks.get_asc(k)[j] for k in formul.kalemler]
+            sutun[ad] = float(formul([np.float64(v) for v in degerler]))
+        sonuc[donem] = sutun
+    return pd.DataFrame(sonuc)
+
+
+def olc(fn, tekrar: int) -> float:
+    sureler = []
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        fn()
+        sureler.append(time.perf_counter() - t0)
+    return statistics.median(sureler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--periods", type=int, default=60)
+    parser.add_argument("--companies", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    motor = get_ratio_engine(False)
+    donemler = [f"{2015 + d // 12}-{d % 12 + 1:02d}" for d in range(args.periods)]
+    kalemler = motor.kalemler + [f"Diğer {i}" for i in range(200)]
+    df = ornek_tablo(kalemler, donemler, 0)
+    indeks = KalemIndex(df, donemler)
+
+    skaler = skaler_rasyolar(indeks, TICARI_FORMULLER)
+    vektorel = motor.evaluate_index(indeks)
+    assert np.allclose(skaler.to_numpy(), vektorel.to_numpy(), equal_nan=True)
+
+    t_skaler = olc(lambda: skaler_rasyolar(indeks, TICARI_FORMULLER), args.repeat)
+    t_vektorel = olc(lambda: motor.evaluate_index(indeks), args.repeat)
+    print(f"Tek firma: {len(motor.rasyolar)} rasyo × {args.periods} dönem")
+    print(f"  skaler (dönem dönem)  {t_skaler * 1000:9.2f} ms")
+    print(f"  vektörel              {t_vektorel * 1000:9.2f} ms  ({t_skaler / t_vektorel:.0f}x)")
+
+    firmalar = {f"F{i:04d}": ornek_tablo(kalemler, donemler, i) for i in range(args.companies)}
+    firmalar = {ad: f.rename(columns={'Kalem': 'Standart_Kalem'}) for ad, f in firmalar.items()}
+    tensor = motor.stack(firmalar, donemler)
+    t_tensor = olc(lambda: motor.evaluate(tensor), args.repeat)
+    t_dongu = olc(lambda: [motor.evaluate(tensor[i]) for i in range(len(tensor))], max(1, args.repeat // 2))
+    print(f"Sektör: {args.companies} firma, tensör {tensor.shape} ({tensor.nbytes / 1e6:.1f} MB)")
+    print(f"  firma firma (vektörel) {t_dongu * 1000:9.2f} ms")
+    print(f"  tek tensör            {t_tensor * 1000:9.2f} ms  ({t_dongu / t_tensor:.1f}x)")
+    print(f"  tahmini skaler        {t_skaler * args.companies * 1000:9.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
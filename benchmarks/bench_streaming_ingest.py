@@ -0,0 +1,89 @@
+"""
+Büyük yükleme benchmark'ı: tam okuma (``pd.read_csv`` + sütun temizleme)
+ile parça parça alımın (``ingest_streaming``) süre ve bellek tepe noktası
+karşılaştırması.
+
+Her yol yeni bir süreçte ölçülür; bellek tepe noktası tracemalloc ile
+(Python + NumPy/pandas ayırmaları) alınır; tracemalloc süreleri uzatır,
+süreler yalnızca iki yolu karşılaştırmak içindir.
+
+Kullanım:
+    python benchmarks/bench_streaming_ingest.py --rows 100000 --cols 24
+    python benchmarks/bench_streaming_ingest.py --xlsx --rows 50000
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_COCUK = """
+import json, sys, time, tracemalloc
+sys.path.insert(0, {kok!r})
+import pandas as pd
+from number_parser import clean_turkish_float_series
+from streaming_ingest import ingest_streaming
+tracemalloc.start()
+t0 = time.perf_counter()
+with open({dosya!r}, 'rb') as f:
+    if {yol!r} == 'tam':
+        df = pd.read_csv(f) if {dosya!r}.endswith('.csv') else pd.read_excel(f)
+        for col in df.columns[1:]:
+            df[col] = clean_turkish_float_series(df[col])
+    else:
+        df = ingest_streaming(f, {dosya!r}, parca_satir={parca}, keep_original=False).frame
+sure = time.perf_counter() - t0
+tepe = tracemalloc.get_traced_memory()[1]
+print(json.dumps({{'sure': sure, 'tepe_mb': tepe / 1024 ** 2, 'satir': len(df), 'toplam': float(df.iloc[:, 1:].to_numpy().sum())}}))
+"""
+
+
+def ornek_dosya(dosya: str, satir: int, sutun: int, seed: int = 42) -> None:
+    """Türkçe sayı biçimli (1.234,56) sentetik mizan dökümü yazar"""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({'Hesap Adı': [f"Hesap {i % 5000}" for i in range(satir)]})
+    for j in range(sutun):
+        degerler = rng.uniform(-1e7, 1e7, satir).round(2)
+        df[f"2020-{j + 1:02d}"] = [f"{v:,.2f}".replace(',', '_').replace('.', ',').replace('_', '.') for v in degerler]
+    if dosya.endswith('.csv'):
+        df.to_csv(dosya, index=False)
+    else:
+        df.to_excel(dosya, index=False)
+
+
+def olc(dosya: str, yol: str, parca: int) -> dict:
+    kod = _COCUK.format(kok=KOK, yol=yol, dosya=dosya, parca=parca)
+    cikti = subprocess.run([sys.executable, "-c", kod], capture_output=True, text=True, check=True)
+    return json.loads(cikti.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--cols", type=int, default=24)
+    parser.add_argument("--chunk", type=int, default=50_000)
+    parser.add_argument("--xlsx", action="store_true", help="CSV yerine xlsx dosyası kullan")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as gecici:
+        dosya = os.path.join(gecici, "mizan.xlsx" if args.xlsx else "mizan.csv")
+        ornek_dosya(dosya, args.rows, args.cols)
+        print(f"Dosya: {os.path.basename(dosya)} ({os.path.getsize(dosya) / 1024 ** 2:.1f} MB, {args.rows:,} satır)")
+        tam = olc(dosya, 'tam', args.chunk)
+        akis = olc(dosya, 'akis', args.chunk)
+
+    assert tam['satir'] == akis['satir'] and np.isclose(tam['toplam'], akis['toplam'])
+    print(f"tam okuma      : {tam['sure'] * 1000:8.1f} ms, tepe {tam['tepe_mb']:8.1f} MB")
+    print(f"parça parça    : {akis['sure'] * 1000:8.1f} ms, tepe {akis['tepe_mb']:8.1f} MB")
+    print(f"bellek tepe noktası oranı: {tam['tepe_mb'] / akis['tepe_mb']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+BIST firma ve sektör indeksi.
+
+Firma bilgileri ekranı her yeniden çalıştırmada ``df_bist`` ve
+``df_sektor_ort`` tablolarını seçilen koda / sektöre göre filtreliyor,
+'A/D' değerlerini satır satır dönüştürüyor ve sektör firma tablosunu her
+sütunda ``astype(str)`` ile yeniden oluşturuyordu. Bu modül
+``yukle_bist_sektor_verileri`` çıktısından bir kez:
+
+    - Borsa kodu -> tipli (float) firma kaydı
+    - Sektör -> ortalama çarpanlar
+    - Sektör -> gösterime hazır (Arrow) firma tablosu
+
+sözlüklerini kurar; ekrandaki tüm aramalar O(1) olur. İndeks kaynak
+dosyanın sürümü (değiştirilme zamanı + boyut) değiştiğinde yeniden kurulur.
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Varsayılan kaynak dosya (uygulama dizininde)
+BIST_DOSYASI = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'BistTumSektorHissesort.xlsx')
+
+# Firma çarpanları: anahtar -> sütun
+CARPAN_SUTUNLARI = (("fk", "F/K"), ("fd_favok", "FD/FAVÖK"), ("fd_satis", "FD/Satışlar"), ("pd_dd", "PD/DD"))
+
+# Sektör firma tablosunda gösterilen sütunlar
+GOSTERILECEK_SUTUNLAR = ['Borsa Kodu', 'Hisse Adı', 'Kapanış(TL)', 'Piyasa Değeri(mn TL)', 'F/K', 'FD/FAVÖK', 'FD/Satışlar', 'PD/DD']
+
+# Firma seçilmediğinde ekranın kullandığı değerler
+BOS_FIRMA: Dict[str, Any] = {
+    "ad": "", "sektor": "", "sermaye": 0.0, "hisse": 0, "halka_aciklik": 0.0,
+    "fiyat": 0.0, "fk": 0.0, "fd_favok": 0.0, "fd_satis": 0.0, "pd_dd": 0.0,
+    "piyasa_degeri": 0.0, "piyasa_degeri_usd": 0.0, "ozkaynaklar": 0.0, "dd_hisse": 0.0
+}
+BOS_SEKTOR_ORT: Dict[str, float] = {"fk": 0.0, "fd_favok": 0.0, "fd_satis": 0.0, "pd_dd": 0.0}
+
+
+def source_version(path: str = BIST_DOSYASI) -> Optional[Tuple[int, int]]:
+    """Kaynak dosyanın sürümü: (değiştirilme zamanı ns, boyut); dosya yoksa None"""
+    try:
+        bilgi = os.stat(path)
+    except OSError:
+        return None
+    return bilgi.st_mtime_ns, bilgi.st_size
+
+
+def _sayisal(df: pd.DataFrame, col: str) -> np.ndarray:
+    """Sütunu float64'e çevirir; 'A/D', boş ve hatalı değerler 0 olur"""
+    if col not in df.columns:
+        return np.zeros(len(df), dtype='float64')
+    return pd.to_numeric(df[col], errors='coerce').fillna(0.0).to_numpy(dtype='float64')
+
+
+def _metin(df: pd.DataFrame, col: str) -> List[str]:
+    if col not in df.columns:
+        return [''] * len(df)
+    return df[col].fillna('').astype(str).tolist()
+
+
+def _gosterim_tablosu(df: pd.DataFrame):
+    """Sektör firma tablosunu gösterime hazırlar ('A/D' ve boşlar '-', tüm sütunlar metin)"""
+    mevcut = [col for col in GOSTERILECEK_SUTUNLAR if col in df.columns]
+    tablo = df[mevcut].replace('A/D', '-').fillna('-').astype(str).reset_index(drop=True)
+    if PYARROW_AVAILABLE:
+        return pa.Table.from_pandas(tablo, preserve_index=False)
+    return tablo
+
+
+class BistIndex:
+    """
+    Firma bilgileri ekranı için önceden hesaplanmış BIST aramaları.
+
+    Örnek:
+        indeks = BistIndex.from_bist_data(yukle_bist_sektor_verileri())
+        firma = indeks.company("THYAO")          # tipli kayıt (dict) veya None
+        ort = indeks.sector_averages(firma["sektor"])
+        tablo = indeks.sector_table(firma["sektor"])
+    """
+
+    def __init__(self, df_bist: Optional[pd.DataFrame], df_sektor_ort: Optional[pd.DataFrame]):
+        self._firmalar: Dict[str, Dict[str, Any]] = {}
+        self._sektor_ort: Dict[str, Dict[str, float]] = {}
+        self._sektor_tablolari: Dict[str, Any] = {}
+        self._sektor_firma_sayisi: Dict[str, int] = {}
+
+        if df_bist is not None and not df_bist.empty and 'Borsa Kodu' in df_bist.columns:
+            self._firmalari_kur(df_bist)
+            if 'Sektör' in df_bist.columns:
+                for sektor, grup in df_bist.groupby('Sektör', sort=False):
+                    self._sektor_tablolari[str(sektor)] = _gosterim_tablosu(grup)
+                    self._sektor_firma_sayisi[str(sektor)] = len(grup)
+
+        if df_sektor_ort is not None and not df_sektor_ort.empty and 'Sektör' in df_sektor_ort.columns:
+            ilk = df_sektor_ort.drop_duplicates('Sektör', keep='first')
+            degerler = {k: _sayisal(ilk, col) for k, col in CARPAN_SUTUNLARI}
+            for i, sektor in enumerate(ilk['Sektör'].astype(str)):
+                self._sektor_ort[sektor] = {k: float(v[i]) for k, v in degerler.items()}
+
+    @classmethod
+    def from_bist_data(cls, bist_data: Optional[Dict[str, Any]]) -> 'BistIndex':
+        """yukle_bist_sektor_verileri() çıktısından indeks kurar"""
+        bist_data = bist_data or {}
+        return cls(bist_data.get("df_bist"), bist_data.get("df_sektor_ort"))
+
+    def _firmalari_kur(self, df_bist: pd.DataFrame) -> None:
+        df = df_bist.drop_duplicates('Borsa Kodu', keep='first')
+        # Sermaye ve piyasa değerleri mn olarak geliyor, TL / $'a çevrilir
+        sermaye = _sayisal(df, 'Sermaye(mn TL)') * 1_000_000
+        piyasa_degeri = _sayisal(df, 'Piyasa Değeri(mn TL)') * 1_000_000
+        piyasa_degeri_usd = _sayisal(df, 'Piyasa Değeri(mn $)') * 1_000_000
+        fiyat = _sayisal(df, 'Kapanış(TL)')
+        halka_aciklik = _sayisal(df, 'Halka AçıklıkOranı (%)')
+        carpanlar = {k: _sayisal(df, col) for k, col in CARPAN_SUTUNLARI}
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # Hisse sayısı = Piyasa Değeri / Fiyat
+            hisse = np.where(fiyat > 0, np.floor(piyasa_degeri / fiyat), 0.0)
+            # Özkaynaklar (DD) = PD / (PD/DD)
+            pd_dd = carpanlar["pd_dd"]
+            ozkaynaklar = np.where((piyasa_degeri > 0) & (pd_dd > 0), piyasa_degeri / pd_dd, 0.0)
+            # Hisse başına defter değeri = Özkaynaklar / Hisse Sayısı
+            dd_hisse = np.where((ozkaynaklar > 0) & (hisse > 0), ozkaynaklar / hisse, 0.0)
+
+        kodlar = df['Borsa Kodu'].astype(str).tolist()
+        adlar = _metin(df, 'Hisse Adı')
+        sektorler = _metin(df, 'Sektör')
+        for i, kod in enumerate(kodlar):
+            kayit = {
+                "ad": adlar[i], "sektor": sektorler[i], "sermaye": float(sermaye[i]),
+                "hisse": int(hisse[i]), "halka_aciklik": float(halka_aciklik[i]), "fiyat": float(fiyat[i]),
+                "piyasa_degeri": float(piyasa_degeri[i]), "piyasa_degeri_usd": float(piyasa_degeri_usd[i]),
+                "ozkaynaklar": float(ozkaynaklar[i]), "dd_hisse": float(dd_hisse[i]),
+            }
+            kayit.update({k: float(v[i]) for k, v in carpanlar.items()})
+            self._firmalar[kod] = kayit
+
+    def company(self, kod: str) -> Optional[Dict[str, Any]]:
+        """Firma kaydının kopyası (BOS_FIRMA ile aynı anahtarlar); yoksa None"""
+        kayit = self._firmalar.get(kod)
+        return dict(kayit) if kayit is not None else None
+
+    def sector_averages(self, sektor: str) -> Optional[Dict[str, float]]:
+        """Sektör ortalama çarpanlarının kopyası; yoksa None"""
+        ort = self._sektor_ort.get(sektor)
+        return dict(ort) if ort is not None else None
+
+    def sector_table(self, sektor: str):
+        """Sektördeki firmaların gösterime hazır tablosu (pyarrow.Table veya DataFrame); yoksa None"""
+        return self._sektor_tablolari.get(sektor)
+
+    def sector_company_count(self, sektor: str) -> int:
+        """Sektördeki firma sayısı"""
+        return self._sektor_firma_sayisi.get(sektor, 0)
+
+    def __len__(self) -> int:
+        return len(self._firmalar)
@@ -0,0 +1,24 @@
+"""
+Disk önbelleklerinin konumu.
+
+Oturumlar ve yeniden başlatmalar arasında paylaşılan önbellek dosyaları
+(eşleştirme önbelleği vb.) tek bir dizinde tutulur. Dizin
+``DIGICFO_CACHE_DIR`` ortam değişkeniyle değiştirilebilir.
+"""
+
+import os
+
+# Varsayılan önbellek dizini (uygulama dizininde, git tarafından yok sayılır)
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.digicfo_cache')
+
+
+def cache_dir() -> str:
+    """Önbellek dizinini döndürür (yoksa oluşturur)"""
+    dizin = os.environ.get('DIGICFO_CACHE_DIR') or DEFAULT_CACHE_DIR
+    os.makedirs(dizin, exist_ok=True)
+    return dizin
+
+
+def cache_path(dosya_adi: str) -> str:
+    """Önbellek dizinindeki dosyanın tam yolu"""
+    return os.path.join(cache_dir(), dosya_adi)
@@ -0,0 +1,416 @@
+"""
+Excel çalışma kitapları için sütunsal disk önbelleği.
+
+Excel dosyaları her Streamlit işçi sürecinde openpyxl ile yeniden
+ayrıştırılıyordu: ``BistTumSektorHissesort.xlsx`` gibi sabit kaynak dosyalar
+soğuk başlangıçta, manuel yüklemeler ise süreç içi yükleme önbelleği
+(``upload_cache``) başka süreçte ya da yeniden başlatmadan sonra boş
+olduğunda. Bu modül çalışma kitabını bir kez Arrow IPC (Feather v2,
+sıkıştırmasız) dosyalarına çevirir; sonraki okumalar ve diğer süreçler aynı
+dosyayı bellek eşlemeli (memory-map) olarak açar, Excel yeniden
+ayrıştırılmaz.
+
+Önbellek anahtarı:
+    - Disk dosyaları (``read_excel_cached``): değiştirilme zamanı + içerik
+      özeti. Özet, (mtime, boyut) değişmediği sürece yan kayıttan okunur;
+      dosya her açılışta yeniden özetlenmez.
+    - Yüklemeler (``read_upload_cached``): yüklenen baytların özeti
+      (``upload_cache.content_hash``); en son kullanılan
+      ``DIGICFO_SUTUNSAL_YUKLEME`` (varsayılan 16) yükleme tutulur.
+
+Tüm sayfalar istendiğinde (``sheet_name=None``) soğuk yol sayfaları
+``parallel_sheets`` süreç havuzunda ayrıştırır.
+
+Geri okunan çerçeve ``pd.read_excel`` sonucuyla birebir aynıdır: sayı ve
+metin karışık (ör. 'A/D' içeren) object sütunlar ve sütun adları hücre
+türüyle birlikte saklanır ('001' metin, 2023 tamsayı olarak döner).
+
+Örnek:
+    df = read_excel_cached("BistTumSektorHissesort.xlsx")   # pd.read_excel yerine
+    df = read_upload_cached(uploaded_file.getvalue(), uploaded_file.name)
+"""
+
+import datetime
+import hashlib
+import io
+import json
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+from cache_paths import cache_dir
+from parallel_sheets import default_workers, read_excel_multi_sheet_parallel
+from upload_cache import content_hash
+
+# Önbellek dosyalarının alt dizini
+CACHE_SUBDIR = 'sutunsal'
+
+# Diskte tutulacak en fazla yükleme (kaynak dosyalar sürüm başına bir kez tutulur)
+VARSAYILAN_YUKLEME = int(os.environ.get('DIGICFO_SUTUNSAL_YUKLEME', 16))
+
+# Yükleme önbellek dosyalarının ön eki
+YUKLEME_ONEKI = 'yukleme-'
+
+_OZET_PARCA = 1 << 20
+
+# Hücre türü kodları (object sütunlar ve sütun adları için)
+_BOS, _METIN, _TAMSAYI, _ONDALIK, _MANTIKSAL, _ZAMAN, _SAAT, _TARIH, _NAN, _PY_ZAMAN = range(10)
+
+
+class _Saklanamaz(Exception):
+    """Çerçeve önbelleğe birebir yazılamıyor (önbellek atlanır)"""
+
+
+def file_digest(path: str) -> str:
+    """Dosya içeriğinin SHA-1 özeti (ilk 16 karakter)"""
+    ozet = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for parca in iter(lambda: f.read(_OZET_PARCA), b''):
+            ozet.update(parca)
+    return ozet.hexdigest()[:16]
+
+
+def _dizin() -> str:
+    dizin = os.path.join(cache_dir(), CACHE_SUBDIR)
+    os.makedirs(dizin, exist_ok=True)
+    return dizin
+
+
+def _atomik_yaz(path: str, veri: bytes) -> None:
+    gecici = f"{path}.{os.getpid()}.tmp"
+    with open(gecici, 'wb') as f:
+        f.write(veri)
+    os.replace(gecici, path)
+
+
+def cache_key(path: str) -> str:
+    """
+    Kaynak dosyanın önbellek anahtarı: ``<mtime_ns>-<içerik özeti>``.
+
+    (mtime, boyut) önceki çağrıdakiyle aynıysa özet yan kayıttan okunur.
+    """
+    bilgi = os.stat(path)
+    ad = os.path.basename(path)
+    yan_kayit = os.path.join(_dizin(), f"{ad}.ozet.json")
+    try:
+        with open(yan_kayit, encoding='utf-8') as f:
+            kayit = json.load(f)
+        if kayit['mtime_ns'] == bilgi.st_mtime_ns and kayit['boyut'] == bilgi.st_size:
+            return f"{bilgi.st_mtime_ns}-{kayit['ozet']}"
+    except (OSError, ValueError, KeyError):
+        pass
+    ozet = file_digest(path)
+    try:
+        _atomik_yaz(yan_kayit, json.dumps(
+            {'mtime_ns': bilgi.st_mtime_ns, 'boyut': bilgi.st_size, 'ozet': ozet}
+        ).encode('utf-8'))
+    except OSError:
+        pass
+    return f"{bilgi.st_mtime_ns}-{ozet}"
+
+
+# ==========================================
+# HÜCRE TÜRLERİ
+# ==========================================
+def _kodla(deger) -> Tuple[int, Optional[str]]:
+    """Tek hücreyi (tür kodu, metin) olarak kodlar"""
+    if deger is None:
+        return _BOS, None
+    if deger is pd.NaT:
+        return _ZAMAN, None
+    if isinstance(deger, str):
+        return _METIN, deger
+    if isinstance(deger, (bool, np.bool_)):
+        return _MANTIKSAL, '1' if deger else '0'
+    if isinstance(deger, (int, np.integer)):
+        return _TAMSAYI, str(int(deger))
+    if isinstance(deger, (float, np.floating)):
+        return (_NAN, None) if np.isnan(deger) else (_ONDALIK, repr(float(deger)))
+    if isinstance(deger, pd.Timestamp):
+        return _ZAMAN, deger.isoformat()
+    if isinstance(deger, datetime.datetime):
+        return _PY_ZAMAN, deger.isoformat()
+    if isinstance(deger, datetime.date):
+        return _TARIH, deger.isoformat()
+    if isinstance(deger, datetime.time):
+        return _SAAT, deger.isoformat()
+    raise _Saklanamaz(type(deger).__name__)
+
+
+def _coz(kod: int, metin: Optional[str]):
+    """_kodla'nın tersi"""
+    if kod == _METIN:
+        return metin
+    if kod == _TAMSAYI:
+        return int(metin)
+    if kod == _ONDALIK:
+        return float(metin)
+    if kod == _MANTIKSAL:
+        return metin == '1'
+    if kod == _ZAMAN:
+        return pd.NaT if metin is None else pd.Timestamp(metin)
+    if kod == _PY_ZAMAN:
+        return datetime.datetime.fromisoformat(metin)
+    if kod == _TARIH:
+        return datetime.date.fromisoformat(metin)
+    if kod == _SAAT:
+        return datetime.time.fromisoformat(metin)
+    if kod == _NAN:
+        return np.nan
+    return None
+
+
+# ==========================================
+# ARROW DÖNÜŞÜMÜ
+# ==========================================
+def _arrow_tablosu(df: pd.DataFrame):
+    """
+    DataFrame'i Arrow tablosuna çevirir.
+
+    Sayısal, tarih ve metin dtype'lı sütunlar doğrudan yazılır. object
+    sütunlar hücre başına tür kodu (int8) ve metin olarak iki sütunda
+    saklanır. Sütun adları türleriyle birlikte şema meta verisindedir.
+    """
+    if isinstance(df.columns, pd.MultiIndex) or not isinstance(df.index, pd.RangeIndex) \
+            or df.index.start != 0 or df.index.step != 1:
+        raise _Saklanamaz('indeks')
+    diziler, adlar, kodlu = [], [], []
+    for i in range(df.shape[1]):
+        seri = df.iloc[:, i]
+        if seri.dtype == object:
+            kodlar, metinler = zip(*map(_kodla, seri.to_numpy())) if len(seri) else ((), ())
+            diziler += [pa.array(kodlar, type=pa.int8()), pa.array(metinler, type=pa.string())]
+            adlar += [f"{i}#tur", f"{i}#deger"]
+            kodlu.append(i)
+        else:
+            try:
+                diziler.append(pa.Array.from_pandas(seri))
+            except (pa.ArrowException, TypeError, ValueError) as e:
+                raise _Saklanamaz(str(e))
+            adlar.append(str(i))
+    tablo = pa.Table.from_arrays(diziler, names=adlar)
+    meta = {
+        b'digicfo_etiketler': json.dumps([_kodla(c) for c in df.columns], ensure_ascii=False).encode('utf-8'),
+        b'digicfo_kodlu': json.dumps(kodlu).encode('utf-8'),
+    }
+    return tablo.replace_schema_metadata(meta)
+
+
+def _yaz(path: str, df: pd.DataFrame) -> None:
+    tablo = _arrow_tablosu(df)
+    gecici = f"{path}.{os.getpid()}.tmp"
+    with pa.OSFile(gecici, 'wb') as hedef:
+        with pa.ipc.new_file(hedef, tablo.schema) as yazici:
+            yazici.write_table(tablo)
+    os.replace(gecici, path)
+
+
+def _oku(path: str) -> pd.DataFrame:
+    """Arrow IPC dosyasını bellek eşlemeli açar"""
+    with pa.memory_map(path, 'r') as kaynak:
+        tablo = pa.ipc.open_file(kaynak).read_all()
+    meta = tablo.schema.metadata or {}
+    etiketler = [_coz(k, m) for k, m in json.loads(meta[b'digicfo_etiketler'].decode('utf-8'))]
+    kodlu = set(json.loads(meta[b'digicfo_kodlu'].decode('utf-8')))
+
+    sutunlar = {}
+    for i in range(len(etiketler)):
+        if i in kodlu:
+            kodlar = tablo.column(f"{i}#tur").to_numpy()
+            metinler = tablo.column(f"{i}#deger").to_pylist()
+            sutunlar[i] = pd.Series([_coz(k, m) for k, m in zip(kodlar, metinler)], dtype=object)
+        else:
+            sutunlar[i] = tablo.column(str(i)).to_pandas()
+    df = pd.concat(sutunlar, axis=1) if sutunlar else pd.DataFrame(index=pd.RangeIndex(tablo.num_rows))
+    if etiketler:
+        df.columns = pd.Index(etiketler)
+    return df
+
+
+# ==========================================
+# OKUMA
+# ==========================================
+def _excel_oku(kaynak, dosya_adi: str, sheet_name, read_kwargs: Dict[str, Any]):
+    """Soğuk yol: tüm sayfalar isteniyor ve birden fazla işçi varsa sayfalar süreç havuzunda ayrıştırılır"""
+    if sheet_name is None and default_workers() > 1:
+        return read_excel_multi_sheet_parallel(kaynak, dosya_adi=dosya_adi, **read_kwargs)
+    if isinstance(kaynak, bytes):
+        kaynak = io.BytesIO(kaynak)
+    return pd.read_excel(kaynak, sheet_name=sheet_name, **read_kwargs)
+
+
+def _onbellekli_oku(
+    onek: str,
+    okuyucu: Callable[[], Union[pd.DataFrame, Dict[Any, pd.DataFrame]]],
+    sheet_name: Union[int, str, None]
+) -> Tuple[Union[pd.DataFrame, Dict[Any, pd.DataFrame]], bool]:
+    """
+    Sıcak yolda Arrow dosyalarını açar, soğuk yolda okuyucuyu çalıştırıp önbelleğe yazar.
+
+    Returns:
+        (sonuç, önbelleğe yeni yazıldı mı)
+    """
+    manifest_yolu = f"{onek}.json"
+
+    # Sıcak yol: manifest ve sayfa dosyaları mevcut
+    try:
+        with open(manifest_yolu, encoding='utf-8') as f:
+            manifest = json.load(f)
+        adlar = [_coz(k, m) for k, m in manifest['sayfalar']]
+        sayfalar = {ad: _oku(f"{onek}-{i}.arrow") for i, ad in enumerate(adlar)}
+        try:
+            os.utime(manifest_yolu)
+        except OSError:
+            pass
+        return (sayfalar if manifest['sozluk'] else sayfalar[adlar[0]]), False
+    except (OSError, ValueError, KeyError, IndexError, pa.ArrowException):
+        pass
+
+    # Soğuk yol: Excel'i bir kez oku ve önbelleğe yaz
+    sonuc = okuyucu()
+    sozluk = isinstance(sonuc, dict)
+    sayfalar = sonuc if sozluk else {sheet_name: sonuc}
+    try:
+        for i, df in enumerate(sayfalar.values()):
+            _yaz(f"{onek}-{i}.arrow", df)
+        _atomik_yaz(manifest_yolu, json.dumps(
+            {'sayfalar': [_kodla(a) for a in sayfalar], 'sozluk': sozluk}, ensure_ascii=False
+        ).encode('utf-8'))
+    except (OSError, pa.ArrowException, _Saklanamaz):
+        return sonuc, False
+    return sonuc, True
+
+
+def _parametre_ozeti(sheet_name, read_kwargs: Dict[str, Any]) -> str:
+    parametreler = json.dumps({'sheet_name': sheet_name, **read_kwargs}, sort_keys=True, default=str)
+    return hashlib.sha1(parametreler.encode('utf-8')).hexdigest()[:8]
+
+
+def read_excel_cached(
+    path: str,
+    sheet_name: Union[int, str, None] = 0,
+    **read_kwargs: Any
+) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """
+    ``pd.read_excel(path, sheet_name=...)`` ile aynı sonucu sütunsal önbellek üzerinden döndürür.
+
+    Önbellek yoksa Excel okunur ve önbelleğe yazılır; pyarrow yoksa veya
+    önbellek yazılamazsa doğrudan pd.read_excel sonucu döner.
+
+    Args:
+        path: Çalışma kitabı yolu
+        sheet_name: Sayfa adı / sırası; None ise tüm sayfalar (sözlük)
+        **read_kwargs: pd.read_excel'e iletilen diğer parametreler
+
+    Returns:
+        pd.DataFrame veya {sayfa: DataFrame}
+    """
+    if not PYARROW_AVAILABLE:
+        return pd.read_excel(path, sheet_name=sheet_name, **read_kwargs)
+
+    try:
+        anahtar = cache_key(path)
+        onek = os.path.join(_dizin(), f"{os.path.basename(path)}-{anahtar}-{_parametre_ozeti(sheet_name, read_kwargs)}")
+    except OSError:
+        return pd.read_excel(path, sheet_name=sheet_name, **read_kwargs)
+
+    sonuc, yazildi = _onbellekli_oku(
+        onek, lambda: _excel_oku(path, path, sheet_name, read_kwargs), sheet_name
+    )
+    if yazildi:
+        _eskileri_sil(path, anahtar)
+    return sonuc
+
+
+def read_upload_cached(
+    veri: bytes,
+    dosya_adi: str,
+    ozet: Optional[str] = None,
+    sheet_name: Union[int, str, None] = 0,
+    max_uploads: int = VARSAYILAN_YUKLEME,
+    **read_kwargs: Any
+) -> Union[pd.DataFrame, Dict[str, pd.DataFrame]]:
+    """
+    Yüklenen Excel baytlarını ``pd.read_excel`` ile aynı sonuçla, sütunsal önbellek üzerinden okur.
+
+    Aynı dosya başka bir işçi süreçte veya yeniden başlatmadan sonra
+    yüklendiğinde Excel ayrıştırılmaz.
+
+    Args:
+        veri: Yüklenen dosyanın baytları
+        dosya_adi: Yüklenen dosyanın adı (uzantı anahtara girer)
+        ozet: Baytların ``content_hash`` özeti (çağıran hesapladıysa)
+        sheet_name: Sayfa adı / sırası; None ise tüm sayfalar (sözlük)
+        max_uploads: Diskte tutulacak en fazla yükleme
+        **read_kwargs: pd.read_excel'e iletilen diğer parametreler
+
+    Returns:
+        pd.DataFrame veya {sayfa: DataFrame}
+    """
+    def okuyucu():
+        return _excel_oku(veri, dosya_adi, sheet_name, read_kwargs)
+
+    if not PYARROW_AVAILABLE:
+        return okuyucu()
+
+    uzanti = os.path.splitext(dosya_adi)[1].lower().lstrip('.')
+    onek = os.path.join(
+        _dizin(),
+        f"{YUKLEME_ONEKI}{ozet or content_hash(veri)}-{uzanti}-{_parametre_ozeti(sheet_name, read_kwargs)}"
+    )
+    sonuc, yazildi = _onbellekli_oku(onek, okuyucu, sheet_name)
+    if yazildi:
+        _fazla_yuklemeleri_sil(max_uploads)
+    return sonuc
+
+
+# ==========================================
+# TEMİZLİK
+# ==========================================
+def _sil(dosyalar: List[str]) -> None:
+    for dosya in dosyalar:
+        try:
+            os.remove(dosya)
+        except OSError:
+            pass
+
+
+def _eskileri_sil(path: str, anahtar: str) -> None:
+    """Kaynağın önceki sürümlerine ait önbellek dosyalarını siler"""
+    ad = os.path.basename(path)
+    _sil([
+        dosya for dosya in cached_files(path)
+        if os.path.basename(dosya).startswith(f"{ad}-")
+        and not os.path.basename(dosya)[len(ad) + 1:].startswith(anahtar)
+        and not dosya.endswith('.ozet.json')
+    ])
+
+
+def _fazla_yuklemeleri_sil(max_uploads: int) -> None:
+    """En uzun süredir kullanılmayan yüklemeleri siler (manifest zamanına göre)"""
+    dizin = _dizin()
+    manifestler = []
+    for dosya in os.listdir(dizin):
+        if dosya.startswith(YUKLEME_ONEKI) and dosya.endswith('.json'):
+            try:
+                manifestler.append((os.path.getmtime(os.path.join(dizin, dosya)), dosya[:-len('.json')]))
+            except OSError:
+                pass
+    manifestler.sort(reverse=True)
+    for _, onek in manifestler[max(max_uploads, 0):]:
+        _sil([os.path.join(dizin, f) for f in os.listdir(dizin) if f.startswith(onek)])
+
+
+def cached_files(path: Optional[str] = None) -> List[str]:
+    """Önbellekteki dosyalar (path verilirse yalnızca o kaynağa ait olanlar)"""
+    dizin = _dizin()
+    ad = os.path.basename(path) if path else ''
+    return sorted(os.path.join(dizin, f) for f in os.listdir(dizin) if f.startswith(ad))
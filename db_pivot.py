@@ -0,0 +1,320 @@
+"""
+Veritabanındaki uzun (hesap, dönem, değer) kayıtlarından geniş tablo kurulumu.
+
+``load_company_data_from_db`` hesap × dönem geniş tablosunu döndürüyor,
+app1.py ise sayısal olmayan her sütunu ``clean_turkish_float`` ile
+temizliyordu. Bu modül geniş tabloyu iki yoldan biriyle kurar ve dönem
+sütunlarını doğrudan float64 döndürür (uygulamadaki temizleme adımı atlanır):
+
+    - ``numpy``: kayıtlar parça parça okunur, hesap / dönem kodlanır ve
+      değerler önceden ayrılmış bir float64 matrise yazılır
+    - ``sql``: pivot veritabanında ``SUM(CASE WHEN dönem = ... )`` ile yapılır
+      (değer sütunu sayısal olmalı; SQLite'ta numpy yolundan yavaştır)
+
+Tablo ve sütun adları ``FinancialTable`` ile verilir. Uygulama
+``load_company_frame`` kullanır: uzun tablo (varsayılan ``financial_data``;
+``DIGICFO_DB_VERI_TABLOSU`` ve sütun adı değişkenleriyle değiştirilebilir)
+veritabanında varsa burada pivotlanır; yoksa, boşsa veya değişken boş
+bırakılmışsa DAL'daki ``load_company_data_from_db`` çağrılır ve metin
+sütunlar tek seferde çevrilir.
+
+Dönem sütunları ``master_table.period_dates`` ile tarihe çevrilip
+kronolojik sıralanır ('2023/3', '2023/12'); çevrilemeyen dönemlerde
+kayıtlardaki ilk görünme sırası korunur. Satırlar her yolda hesap adına
+göre sıralanır (veritabanı harmanlamasından bağımsız, aynı sıra).
+"""
+
+import gc
+import os
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+try:
+    from sqlalchemy import inspect, text
+    SQLALCHEMY_AVAILABLE = True
+except ImportError:
+    SQLALCHEMY_AVAILABLE = False
+
+from master_table import period_dates
+from number_parser import clean_turkish_float_series
+
+# Okuma parça boyutu (satır)
+PARCA_SATIR = 50_000
+
+
+# Uzun tablo ve sütun adlarının ortam değişkenleri (tablo adı boş bırakılırsa DAL kullanılır)
+TABLO_DEGISKENI = 'DIGICFO_DB_VERI_TABLOSU'
+VARSAYILAN_TABLO = 'financial_data'
+SUTUN_DEGISKENLERI = {
+    'firma': 'DIGICFO_DB_FIRMA_SUTUNU',
+    'hesap': 'DIGICFO_DB_HESAP_SUTUNU',
+    'donem': 'DIGICFO_DB_DONEM_SUTUNU',
+    'deger': 'DIGICFO_DB_DEGER_SUTUNU',
+}
+
+
+@dataclass(frozen=True)
+class FinancialTable:
+    """Uzun biçimli finansal veri tablosunun adı ve sütunları"""
+    tablo: str
+    firma: str = 'company_id'
+    hesap: str = 'account_name'
+    donem: str = 'period'
+    deger: str = 'value'
+
+
+def configured_table() -> Optional[FinancialTable]:
+    """
+    Ortam değişkenlerinden uzun tablo tanımı.
+
+    Returns:
+        FinancialTable (DIGICFO_DB_VERI_TABLOSU tanımlı değilse VARSAYILAN_TABLO);
+        değişken boş bırakılmışsa None (yalnızca DAL kullanılır)
+    """
+    tablo = os.environ.get(TABLO_DEGISKENI, VARSAYILAN_TABLO)
+    if not tablo:
+        return None
+    sutunlar = {alan: os.environ[d] for alan, d in SUTUN_DEGISKENLERI.items() if os.environ.get(d)}
+    return FinancialTable(tablo, **sutunlar)
+
+
+def has_financial_table(engine, tablo: FinancialTable) -> bool:
+    """Tablo ve gerekli sütunlar veritabanında var mı"""
+    try:
+        sutunlar = {s['name'] for s in inspect(engine).get_columns(tablo.tablo)}
+    except Exception:
+        return False
+    return {tablo.firma, tablo.hesap, tablo.donem, tablo.deger} <= sutunlar
+
+
+def _float64(degerler: pd.Series) -> np.ndarray:
+    """Değer sütununu float64'e çevirir; metin ise tek geçişte Türkçe sayı olarak ayrıştırır"""
+    if pd.api.types.is_numeric_dtype(degerler):
+        return degerler.to_numpy(dtype='float64', na_value=np.nan)
+    return clean_turkish_float_series(degerler).to_numpy(dtype='float64')
+
+
+def sort_accounts(df: pd.DataFrame, account_col: str) -> pd.DataFrame:
+    """Satırları hesap adına göre sıralar (kararlı; pivot ve DAL yolları aynı sırayı verir)"""
+    if account_col not in df.columns or len(df) < 2:
+        return df
+    return df.sort_values(account_col, key=lambda s: s.astype(str), kind='stable', ignore_index=True)
+
+
+def period_order(donemler: Sequence[Any]) -> np.ndarray:
+    """
+    Dönemlerin kronolojik sırası (konumlar).
+
+    Tümü tarihe çevrilebiliyorsa tarihe göre (eşitlikte verilen sıra),
+    değilse verilen sıra korunur.
+    """
+    tarihler = period_dates(donemler)
+    if tarihler is None:
+        return np.arange(len(donemler))
+    return np.argsort(tarihler.values, kind='stable')
+
+
+def pivot_long(
+    hesaplar: Iterable[Any],
+    donemler: Iterable[Any],
+    degerler: Iterable[Any],
+    account_col: str = 'account_name',
+    fill_value: float = 0.0
+) -> pd.DataFrame:
+    """
+    Uzun kayıtları hesap × dönem float64 geniş tabloya çevirir.
+
+    Hesaplar ilk görünme sırasıyla, dönemler kronolojik sırada (period_order);
+    aynı (hesap, dönem) için birden fazla kayıt toplanır, kaydı olmayan
+    hücreler fill_value olur (varsayılan 0.0: clean_turkish_float_series'in
+    boş hücre davranışı).
+    """
+    hesap_kodlari, hesap_adlari = pd.factorize(pd.Series(hesaplar), use_na_sentinel=False)
+    donem_kodlari, donem_adlari = pd.factorize(pd.Series(donemler), use_na_sentinel=False)
+    # Kodları kronolojik sıraya yeniden numarala (metin sıralaması '2023/12'yi '2023/3'ün önüne koyar)
+    sira = period_order(donem_adlari)
+    yeni_kod = np.empty(len(sira), dtype=np.int64)
+    yeni_kod[sira] = np.arange(len(sira))
+    donem_kodlari = yeni_kod[donem_kodlari]
+    donem_adlari = donem_adlari[sira]
+    deger_dizisi = _float64(pd.Series(degerler))
+
+    satir, sutun = len(hesap_adlari), len(donem_adlari)
+    duz = hesap_kodlari.astype(np.int64) * sutun + donem_kodlari
+    gecerli = ~np.isnan(deger_dizisi)
+    matris = np.bincount(duz[gecerli], weights=deger_dizisi[gecerli], minlength=satir * sutun)
+    if fill_value != 0:
+        dolu = np.bincount(duz[gecerli], minlength=satir * sutun) > 0
+        matris = np.where(dolu, matris, fill_value)
+    matris = matris.reshape(satir, sutun)
+
+    df = pd.DataFrame(matris, columns=[str(d) for d in donem_adlari], copy=False)
+    df.insert(0, account_col, list(hesap_adlari))
+    return df
+
+
+@contextmanager
+def _gc_duraklat():
+    """Yüz binlerce demet oluşturulurken döngüsel çöp toplayıcıyı durdurur (demetler döngü kurmaz)"""
+    acikti = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if acikti:
+            gc.enable()
+
+
+def _kayitlari_oku(engine, company_id: Any, tablo: FinancialTable, parca: int) -> Tuple[List, List, List]:
+    """
+    Firma kayıtlarını parça parça okur.
+
+    Havuzdan alınan DBAPI imleci doğrudan kullanılır (satır başına Row nesnesi
+    kurulmaz); her parça tek ``zip`` ile sütunlara ayrılır.
+    """
+    sorgu = (
+        f"SELECT {tablo.hesap}, {tablo.donem}, {tablo.deger} FROM {tablo.tablo} "
+        f"WHERE {tablo.firma} = "
+    )
+    yer_tutucu, parametre = _parametre(engine, company_id)
+    hesaplar, donemler, degerler = [], [], []
+    baglanti = engine.raw_connection()
+    try:
+        imlec = baglanti.cursor()
+        with _gc_duraklat():
+            imlec.execute(sorgu + yer_tutucu, parametre)
+            while True:
+                satirlar = imlec.fetchmany(parca)
+                if not satirlar:
+                    break
+                h, d, v = zip(*satirlar)
+                hesaplar.extend(h)
+                donemler.extend(d)
+                degerler.extend(v)
+        imlec.close()
+    finally:
+        baglanti.close()
+    return hesaplar, donemler, degerler
+
+
+def _parametre(engine, deger: Any) -> Tuple[str, Any]:
+    """DBAPI sürücüsünün parametre biçimi (sqlite: ?, psycopg: %s)"""
+    stil = engine.dialect.paramstyle
+    if stil == 'qmark':
+        return '?', (deger,)
+    if stil == 'numeric':
+        return ':1', (deger,)
+    if stil == 'named':
+        return ':firma', {'firma': deger}
+    if stil == 'pyformat':
+        return '%(firma)s', {'firma': deger}
+    return '%s', (deger,)
+
+
+def _sql_pivot(engine, company_id: Any, tablo: FinancialTable, fill_value: float) -> pd.DataFrame:
+    """Pivotu veritabanında yapar (dönem başına bir SUM(CASE ...) sütunu, dönemler kronolojik)"""
+    with engine.connect() as baglanti:
+        donemler = [r[0] for r in baglanti.execute(
+            text(f"SELECT DISTINCT {tablo.donem} FROM {tablo.tablo} WHERE {tablo.firma} = :firma "
+                 f"ORDER BY {tablo.donem}"),
+            {'firma': company_id}
+        )]
+        if not donemler:
+            return pd.DataFrame(columns=[tablo.hesap])
+        donemler = [donemler[i] for i in period_order(donemler)]
+        secimler = ", ".join(
+            f"SUM(CASE WHEN {tablo.donem} = :d{i} THEN {tablo.deger} END) AS c{i}"
+            for i in range(len(donemler))
+        )
+        sorgu = text(
+            f"SELECT {tablo.hesap}, {secimler} FROM {tablo.tablo} WHERE {tablo.firma} = :firma "
+            f"GROUP BY {tablo.hesap}"
+        )
+        parametreler = {'firma': company_id, **{f"d{i}": d for i, d in enumerate(donemler)}}
+        satirlar = baglanti.execute(sorgu, parametreler).fetchall()
+
+    matris = np.array([r[1:] for r in satirlar], dtype='float64').reshape(len(satirlar), len(donemler))
+    if fill_value == fill_value:
+        matris[np.isnan(matris)] = fill_value
+    df = pd.DataFrame(matris, columns=[str(d) for d in donemler], copy=False)
+    df.insert(0, tablo.hesap, [r[0] for r in satirlar])
+    return df
+
+
+def load_company_matrix(
+    company_id: Any,
+    engine,
+    tablo: FinancialTable,
+    strategy: str = 'numpy',
+    parca: int = PARCA_SATIR,
+    fill_value: float = 0.0
+) -> pd.DataFrame:
+    """
+    Firmanın hesap × dönem geniş tablosu (dönem sütunları float64).
+
+    Args:
+        company_id: Firma kimliği
+        engine: SQLAlchemy motoru (ör. db_pool.get_engine())
+        tablo: Tablo / sütun adları
+        strategy: 'numpy' (oku ve matrise yaz) veya 'sql' (veritabanında pivot;
+            değer sütunu sayısal olmalı)
+        parca: numpy yolunda okuma parça boyutu
+        fill_value: Kaydı olmayan hücrelerin değeri
+
+    Returns:
+        pd.DataFrame: account_name + dönem sütunları (hesap adına göre sıralı);
+        kayıt yoksa boş çerçeve
+    """
+    if strategy == 'sql':
+        return sort_accounts(_sql_pivot(engine, company_id, tablo, fill_value), tablo.hesap)
+    if strategy != 'numpy':
+        raise ValueError(f"Bilinmeyen strateji: {strategy}")
+    hesaplar, donemler, degerler = _kayitlari_oku(engine, company_id, tablo, parca)
+    if not hesaplar:
+        return pd.DataFrame(columns=[tablo.hesap])
+    df = pivot_long(hesaplar, donemler, degerler, account_col=tablo.hesap, fill_value=fill_value)
+    return sort_accounts(df, tablo.hesap)
+
+
+def load_company_frame(
+    company_id: Any,
+    fallback: Optional[Callable[[Any], Optional[pd.DataFrame]]] = None,
+    engine=None,
+    tablo: Optional[FinancialTable] = None
+) -> Optional[pd.DataFrame]:
+    """
+    Firma geniş tablosu: uzun tablo (configured_table, varsayılan
+    financial_data) veritabanında varsa ve firmanın kaydı varsa burada
+    pivotlanır, yoksa fallback (ör. dal.data_loader_db.load_company_data_from_db)
+    kullanılır.
+
+    Fallback'ten gelen metin dönem sütunları da tek seferde float64'e çevrilir;
+    her iki yolda da dönüş sütunları float64'tür ve satırlar hesap adına göre
+    sıralıdır.
+    """
+    tablo = tablo or configured_table()
+    if tablo is not None and engine is None:
+        from db_pool import try_get_engine
+        engine = try_get_engine()
+    if tablo is not None and engine is not None and has_financial_table(engine, tablo):
+        df = load_company_matrix(company_id, engine, tablo)
+        if not df.empty:
+            return df
+    if fallback is None:
+        return None
+    from db_pool import call_with_engine
+    df = call_with_engine(fallback, company_id, engine=engine)
+    if df is None or df.empty:
+        return df
+    hesap_sutunu = tablo.hesap if tablo is not None else 'account_name'
+    donem_sutunlari = [c for c in df.columns if c != hesap_sutunu]
+    metin = [c for c in donem_sutunlari if not pd.api.types.is_numeric_dtype(df[c])]
+    if metin:
+        df = df.copy()
+        for col in metin:
+            df[col] = clean_turkish_float_series(df[col])
+    return sort_accounts(df, hesap_sutunu)
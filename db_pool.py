@@ -0,0 +1,315 @@
+"""
+Veritabanı bağlantı havuzu ve sorgu önbelleği.
+
+"Veritabanından Seç" dalı her Streamlit çalıştırmasında ``get_companies()``
+ve ``get_company_financial_summary()`` çağırıyordu; eşzamanlı kullanıcılarda
+Postgres'e (Supabase) sürekli yeni bağlantı açılıyor ve aynı sorgular
+tekrar tekrar çalışıyordu. Bu modül:
+
+    - Süreç başına tek bir havuzlu SQLAlchemy motoru kurar (``init_engine``)
+    - Firma listesi ve firma özetleri için TTL'li, elle geçersiz kılınabilen
+      bir önbellek sağlar
+    - Havuz ve önbellek istatistiklerini izleme için döndürür (``pool_stats``)
+    - DAL fonksiyonlarına, ``engine`` parametresi alıyorlarsa, havuzlu motoru
+      iletir (``call_with_engine``)
+
+Bağlantı adresi ``SUPABASE_DB_URL`` veya ``DATABASE_URL`` ortam
+değişkeninden okunur; yerel denemeler için ``sqlite:///yerel.db`` verilebilir.
+"""
+
+import inspect
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+try:
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.pool import QueuePool
+    SQLALCHEMY_AVAILABLE = True
+except ImportError:
+    SQLALCHEMY_AVAILABLE = False
+
+# ==========================================
+# AYARLAR
+# ==========================================
+DB_URL_DEGISKENLERI = ('SUPABASE_DB_URL', 'DATABASE_URL')
+
+HAVUZ_AYARLARI: Dict[str, Any] = {
+    'pool_size': int(os.environ.get('DIGICFO_DB_POOL_SIZE', 5)),
+    'max_overflow': int(os.environ.get('DIGICFO_DB_MAX_OVERFLOW', 10)),
+    'pool_timeout': 30,
+    # Supabase / pgbouncer boşta kalan bağlantıları kapatabilir
+    'pool_recycle': 1800,
+    'pool_pre_ping': True,
+}
+
+# Önbellek süreleri (saniye)
+FIRMA_LISTESI_TTL = float(os.environ.get('DIGICFO_DB_FIRMA_TTL', 300))
+FIRMA_OZETI_TTL = float(os.environ.get('DIGICFO_DB_OZET_TTL', 120))
+
+
+def database_url() -> Optional[str]:
+    """Ortam değişkenlerinden veritabanı adresi (yoksa None)"""
+    for degisken in DB_URL_DEGISKENLERI:
+        url = os.environ.get(degisken)
+        if url:
+            return url
+    return None
+
+
+# ==========================================
+# MOTOR (HAVUZ)
+# ==========================================
+_motor = None
+_motor_url: Optional[str] = None
+_motor_kilidi = threading.Lock()
+_baglanti_sayaci = {'acilan': 0, 'odunc': 0}
+# Son init_engine hatası (izleme ekranında gösterilir; başarılı kurulumda temizlenir)
+_motor_hatasi: Optional[str] = None
+
+
+def _sayaclari_bagla(motor) -> None:
+    """Yeni fiziksel bağlantı ve havuzdan ödünç alma sayaçları"""
+    @event.listens_for(motor, 'connect')
+    def _acildi(*_):
+        _baglanti_sayaci['acilan'] += 1
+
+    @event.listens_for(motor, 'checkout')
+    def _odunc(*_):
+        _baglanti_sayaci['odunc'] += 1
+
+
+def init_engine(url: Optional[str] = None, **ayarlar: Any):
+    """
+    Süreç başına tek havuzlu motoru kurar (aynı adresle tekrar çağrılırsa mevcut motoru döndürür).
+
+    Args:
+        url: Bağlantı adresi (None ise database_url())
+        **ayarlar: HAVUZ_AYARLARI'nı geçersiz kılan create_engine parametreleri
+
+    Returns:
+        sqlalchemy.Engine
+
+    Raises:
+        RuntimeError: SQLAlchemy kurulu değilse veya adres yoksa
+        Exception: create_engine hataları (hata metni engine_error() ile okunabilir)
+    """
+    global _motor_hatasi
+    try:
+        motor = _motor_kur(url, ayarlar)
+    except Exception as e:
+        _motor_hatasi = f"{type(e).__name__}: {e}"
+        raise
+    _motor_hatasi = None
+    return motor
+
+
+def _motor_kur(url: Optional[str], ayarlar: Dict[str, Any]):
+    global _motor, _motor_url
+    if not SQLALCHEMY_AVAILABLE:
+        raise RuntimeError("SQLAlchemy kurulu değil")
+    url = url or database_url()
+    if not url:
+        raise RuntimeError("Veritabanı adresi tanımlı değil (SUPABASE_DB_URL / DATABASE_URL)")
+
+    with _motor_kilidi:
+        if _motor is not None and _motor_url == url:
+            return _motor
+        if _motor is not None:
+            _motor.dispose()
+        # SQLite (yerel deneme) kendi havuz sınıfını kullanır; boyut ayarları yalnızca QueuePool için
+        parametreler = {} if url.startswith('sqlite') else {**HAVUZ_AYARLARI, 'poolclass': QueuePool}
+        parametreler.update(ayarlar)
+        _motor = create_engine(url, **parametreler)
+        _motor_url = url
+        _sayaclari_bagla(_motor)
+        return _motor
+
+
+def get_engine():
+    """Kurulmuş motor; kurulmamışsa ve adres varsa kurar, yoksa None"""
+    if _motor is not None:
+        return _motor
+    if SQLALCHEMY_AVAILABLE and database_url():
+        return init_engine()
+    return None
+
+
+def try_get_engine():
+    """
+    get_engine() gibi, ancak kurulum hatasında None döndürür.
+
+    Hata engine_error() / pool_stats()['hata'] ile okunabilir; çağıran DAL
+    kendi bağlantısıyla devam eder.
+    """
+    try:
+        return get_engine()
+    except Exception:
+        return None
+
+
+def dispose_engine() -> None:
+    """Motoru ve havuzdaki bağlantıları kapatır"""
+    global _motor, _motor_url
+    with _motor_kilidi:
+        if _motor is not None:
+            _motor.dispose()
+        _motor, _motor_url = None, None
+
+
+def engine_error() -> Optional[str]:
+    """Son başarısız init_engine çağrısının hata metni (yoksa None)"""
+    return _motor_hatasi
+
+
+def call_with_engine(fonksiyon: Callable[..., Any], *args: Any, engine=None, **kwargs: Any) -> Any:
+    """
+    DAL fonksiyonunu çağırır; fonksiyon ``engine`` parametresi alıyorsa havuzlu motor iletilir.
+
+    Parametreyi almayan (eski) DAL fonksiyonları değiştirilmeden çağrılır ve
+    kendi bağlantılarını kullanmaya devam eder. Motor kurulamazsa fonksiyon
+    ``engine`` olmadan çağrılır.
+
+    Args:
+        fonksiyon: DAL fonksiyonu (ör. dal.demo_dal.get_companies)
+        *args: Fonksiyon argümanları
+        engine: İletilecek motor (None ise get_engine())
+        **kwargs: Fonksiyonun diğer parametreleri
+
+    Returns:
+        Fonksiyonun dönüş değeri
+    """
+    if _engine_alir_mi(fonksiyon):
+        motor = engine if engine is not None else try_get_engine()
+        if motor is not None:
+            kwargs['engine'] = motor
+    return fonksiyon(*args, **kwargs)
+
+
+def _engine_alir_mi(fonksiyon: Callable[..., Any]) -> bool:
+    try:
+        return 'engine' in inspect.signature(fonksiyon).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+# ==========================================
+# SORGU ÖNBELLEĞİ
+# ==========================================
+class TTLCache:
+    """
+    Süre sınırlı, elle geçersiz kılınabilen, thread-safe sorgu önbelleği.
+
+    Anahtarlar (ad, argümanlar) demetleridir; ``invalidate(ad)`` o addaki
+    tüm kayıtları, ``invalidate(ad, arg)`` yalnızca ilgili kaydı siler.
+    """
+
+    def __init__(self):
+        self._kayitlar: Dict[Tuple, Tuple[float, Any]] = {}
+        self._kilit = threading.Lock()
+        self.isabet = 0
+        self.iskalama = 0
+
+    def get_or_load(self, anahtar: Tuple, loader: Callable[[], Any], ttl: float) -> Any:
+        simdi = time.monotonic()
+        with self._kilit:
+            kayit = self._kayitlar.get(anahtar)
+            if kayit is not None and kayit[0] > simdi:
+                self.isabet += 1
+                return kayit[1]
+            self.iskalama += 1
+        deger = loader()
+        with self._kilit:
+            self._kayitlar[anahtar] = (time.monotonic() + ttl, deger)
+        return deger
+
+    def invalidate(self, ad: Optional[Hashable] = None, *args: Hashable) -> int:
+        """Kayıtları siler; silinen kayıt sayısını döndürür"""
+        with self._kilit:
+            if ad is None:
+                silinen = len(self._kayitlar)
+                self._kayitlar.clear()
+                return silinen
+            hedef = [k for k in self._kayitlar if k[0] == ad and (not args or k[1:] == args)]
+            for k in hedef:
+                del self._kayitlar[k]
+            return len(hedef)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._kilit:
+            kayit_sayisi = len(self._kayitlar)
+        toplam = self.isabet + self.iskalama
+        return {
+            'kayit_sayisi': kayit_sayisi,
+            'isabet': self.isabet,
+            'iskalama': self.iskalama,
+            'isabet_orani': self.isabet / toplam if toplam else 0.0,
+        }
+
+
+sorgu_onbellegi = TTLCache()
+
+
+def _dal_firmalar() -> List[Dict[str, Any]]:
+    from dal.demo_dal import get_companies
+    return call_with_engine(get_companies)
+
+
+def _dal_firma_ozeti(company_id: Any) -> Optional[Dict[str, Any]]:
+    from dal.data_loader_db import get_company_financial_summary
+    return call_with_engine(get_company_financial_summary, company_id)
+
+
+def cached_companies(loader: Optional[Callable[[], Any]] = None, ttl: float = FIRMA_LISTESI_TTL):
+    """Firma listesi (TTL süresince önbellekten)"""
+    return sorgu_onbellegi.get_or_load(('firmalar',), loader or _dal_firmalar, ttl)
+
+
+def cached_company_summary(
+    company_id: Any,
+    loader: Optional[Callable[[Any], Any]] = None,
+    ttl: float = FIRMA_OZETI_TTL
+):
+    """Firma finansal özeti (TTL süresince önbellekten)"""
+    yukleyici = loader or _dal_firma_ozeti
+    return sorgu_onbellegi.get_or_load(('firma_ozeti', company_id), lambda: yukleyici(company_id), ttl)
+
+
+def invalidate_company_cache(company_id: Any = None) -> None:
+    """
+    Firma verisi değiştiğinde çağrılır (ör. veritabanına yükleme sonrası).
+
+    company_id verilirse yalnızca o firmanın özeti, verilmezse tüm özetler
+    silinir; firma listesi her durumda yenilenir.
+    """
+    sorgu_onbellegi.invalidate('firmalar')
+    if company_id is None:
+        sorgu_onbellegi.invalidate('firma_ozeti')
+    else:
+        sorgu_onbellegi.invalidate('firma_ozeti', company_id)
+
+
+# ==========================================
+# İZLEME
+# ==========================================
+def pool_stats() -> Dict[str, Any]:
+    """Havuz durumu, açılan / ödünç alınan bağlantı sayıları ve sorgu önbelleği istatistikleri"""
+    durum: Dict[str, Any] = {
+        'motor': _motor is not None,
+        'hata': _motor_hatasi,
+        'acilan_baglanti': _baglanti_sayaci['acilan'],
+        'odunc_alma': _baglanti_sayaci['odunc'],
+        'onbellek': sorgu_onbellegi.stats(),
+    }
+    if _motor is not None:
+        havuz = _motor.pool
+        durum['havuz_sinifi'] = type(havuz).__name__
+        if isinstance(havuz, QueuePool):
+            durum.update(
+                boyut=havuz.size(),
+                bosta=havuz.checkedin(),
+                kullanimda=havuz.checkedout(),
+                tasma=havuz.overflow(),
+            )
+    return durum
@@ -0,0 +1,155 @@
+"""
+İndirilebilir HTML grafik raporu.
+
+"Tüm Grafikleri Rapor Olarak İndir" düğmesi her grafik için ayrı
+``fig.to_html(include_plotlyjs='cdn')`` çağırıyor, ``html_string += ...`` ile
+büyüyen bir metin kuruyor ve raporu kimse indirmese de her çalıştırmada
+hazırlıyordu. Bu modül:
+
+    - Raporu bir arabelleğe (BytesIO) parça parça yazar
+    - Grafikleri tek bir sıkıştırılmış JSON yükü olarak yazar; her grafikte
+      tekrar eden plotly şablonu (layout.template) yalnızca bir kez bulunur
+    - plotly.js'i CDN'den yükler veya çevrimdışı sürümde dosyaya bir kez gömer
+      (internet erişimi olmayan makinelerde açılabilir)
+
+``st.download_button(data=...)`` Streamlit 1.50 ile bir fonksiyon kabul
+ettiği için rapor yalnızca düğmeye basıldığında kurulur (bkz. lazy_report;
+requirements.txt bu sürümü en alt sınır olarak ister).
+"""
+
+import html
+import io
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import pandas as pd
+import plotly.io as pio
+import plotly.offline as po
+
+_STIL = """
+        body { font-family: Arial, sans-serif; margin: 40px; }
+        .chart-container { page-break-inside: avoid; margin-bottom: 50px; text-align: center; }
+        h1 { text-align: center; color: #333; }
+        table { width: 100%; border-collapse: collapse; margin-bottom: 20px; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+        @media print {
+            .no-print { display: none; }
+        }
+"""
+
+# Grafik yükünü çizen betik (şablonlar ve grafikler ayrı dizilerde)
+_CIZIM_BETIGI = """
+(function () {
+    var sablonlar = JSON.parse(document.getElementById('rapor-sablonlar').textContent);
+    var grafikler = JSON.parse(document.getElementById('rapor-grafikler').textContent);
+    grafikler.forEach(function (g, i) {
+        if (g.s !== null) { g.layout.template = sablonlar[g.s]; }
+        Plotly.newPlot('grafik-' + i, g.data, g.layout, {responsive: true});
+    });
+})();
+"""
+
+
+def _json(nesne: Any) -> str:
+    """plotly uyumlu sıkıştırılmış JSON (script içinde güvenli)"""
+    return pio.json.to_json_plotly(nesne, pretty=False).replace('</', '<\\/')
+
+
+def figure_payload(figures: Iterable[Any]) -> Dict[str, str]:
+    """
+    Grafiklerden paylaşımlı yük üretir.
+
+    Returns:
+        {'sablonlar': JSON dizi, 'grafikler': JSON dizi, 'adet': grafik sayısı}
+    """
+    sablon_sirasi: Dict[str, int] = {}
+    sablonlar: List[str] = []
+    grafikler: List[str] = []
+    for fig in figures:
+        veri = fig.to_plotly_json()
+        layout = dict(veri.get('layout', {}))
+        sablon = layout.pop('template', None)
+        sira = None
+        if sablon is not None:
+            metin = _json(sablon)
+            sira = sablon_sirasi.get(metin)
+            if sira is None:
+                sira = sablon_sirasi[metin] = len(sablonlar)
+                sablonlar.append(metin)
+        grafikler.append(
+            f'{{"data":{_json(veri.get("data", []))},"layout":{_json(layout)},"s":{"null" if sira is None else sira}}}'
+        )
+    return {
+        'sablonlar': '[' + ','.join(sablonlar) + ']',
+        'grafikler': '[' + ','.join(grafikler) + ']',
+        'adet': len(grafikler),
+    }
+
+
+def _plotlyjs_etiketi(offline: bool) -> str:
+    if offline:
+        return f"<script type=\"text/javascript\">{po.get_plotlyjs()}</script>"
+    return f"<script src=\"https://cdn.plot.ly/plotly-{po.get_plotlyjs_version()}.min.js\" charset=\"utf-8\"></script>"
+
+
+def build_report(
+    figures: Iterable[Any],
+    tablo: Optional[pd.DataFrame] = None,
+    grup: str = "Tümü",
+    offline: bool = False
+) -> io.BytesIO:
+    """
+    HTML raporunu bir arabelleğe yazar.
+
+    Args:
+        figures: Plotly grafikleri (rapordaki sırayla)
+        tablo: Rapora eklenecek veri tablosu
+        grup: Başlıkta gösterilecek grup
+        offline: True ise plotly.js dosyaya gömülür (CDN gerekmez)
+
+    Returns:
+        io.BytesIO: Başa sarılmış UTF-8 HTML
+    """
+    yuk = figure_payload(figures)
+    tampon = io.BytesIO()
+    yazici = io.TextIOWrapper(tampon, encoding='utf-8', write_through=True)
+    grup_metni = html.escape(str(grup))
+
+    yazici.write("<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n")
+    yazici.write(f"<title>Finansal Analiz Raporu - {grup_metni}</title>\n<style>{_STIL}</style>\n")
+    yazici.write(_plotlyjs_etiketi(offline))
+    yazici.write("\n</head>\n<body>\n<h1>Finansal Analiz Raporu</h1>\n")
+    yazici.write(f"<h3>Grup: {grup_metni}</h3>\n")
+    yazici.write(f"<p>Rapor Tarihi: {pd.Timestamp.now().strftime('%d-%m-%Y %H:%M')}</p>\n<hr>\n")
+    if tablo is not None:
+        yazici.write("<h4>Veri Tablosu</h4>\n")
+        tablo.to_html(yazici, index=False)
+        yazici.write("\n<hr>\n")
+    yazici.write("<h4>Grafikler</h4>\n")
+    for i in range(yuk['adet']):
+        yazici.write(f"<div class=\"chart-container\"><div id=\"grafik-{i}\"></div></div>\n")
+    yazici.write(f"<script type=\"application/json\" id=\"rapor-sablonlar\">{yuk['sablonlar']}</script>\n")
+    yazici.write(f"<script type=\"application/json\" id=\"rapor-grafikler\">{yuk['grafikler']}</script>\n")
+    yazici.write(f"<script type=\"text/javascript\">{_CIZIM_BETIGI}</script>\n</body>\n</html>\n")
+
+    yazici.detach()
+    tampon.seek(0)
+    return tampon
+
+
+def lazy_report(
+    figures_fn: Callable[[], Iterable[Any]],
+    tablo: Optional[pd.DataFrame] = None,
+    grup: str = "Tümü",
+    offline: bool = False
+) -> Callable[[], io.BytesIO]:
+    """
+    ``st.download_button(data=...)`` için argümansız rapor fonksiyonu.
+
+    Grafikler ve HTML yalnızca fonksiyon çağrıldığında (düğmeye basıldığında)
+    kurulur. Fonksiyon Streamlit tarafından ayrı bir thread'de çalıştırılır;
+    session_state'e erişmemelidir.
+    """
+    def _kur() -> io.BytesIO:
+        return build_report(figures_fn(), tablo, grup, offline)
+    return _kur
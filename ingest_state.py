@@ -0,0 +1,113 @@
+"""
+Manuel yükleme için "bir kez işle" durum makinesi.
+
+Streamlit her etkileşimde betiği baştan çalıştırır ve ``file_uploader``
+seçili dosyayı her çalıştırmada yeniden döndürür. Bu yüzden veri merkezi
+ekranındaki her tıklama (ör. "Grup Seçiniz" seçimi) dosyayı yeniden okuyor,
+temizliyor ve eşleştiriyordu. Bu modül yüklemenin durumunu session_state'te
+tutar; yükleme hattı yalnızca yeni bir dosya (uploader file_id + boyut) veya
+değişen eşleştirme bağlamı için çalışır, diğer çalıştırmalar yalnızca
+gösterim kodunu çalıştırır.
+
+Durumlar:
+    BOS -> ISLENIYOR -> HAZIR
+                     -> HATA   (aynı dosya için yeniden denenmez; yeniden yükleme gerekir)
+"""
+
+from typing import Any, Dict, MutableMapping, Optional, Tuple
+
+BOS = 'bos'
+ISLENIYOR = 'isleniyor'
+HAZIR = 'hazir'
+HATA = 'hata'
+
+# Durumun session_state'teki anahtarı
+STATE_KEY = '_yukleme_durumu'
+
+
+def upload_identity(uploaded_file, baglam: str = '') -> Tuple[str, int, str]:
+    """Yüklemenin kimliği: (uploader file_id, boyut, eşleştirme bağlamı)"""
+    file_id = getattr(uploaded_file, 'file_id', None) or getattr(uploaded_file, 'name', '')
+    return str(file_id), int(getattr(uploaded_file, 'size', 0) or 0), baglam
+
+
+class IngestState:
+    """
+    session_state üzerinde yükleme durum makinesi.
+
+    Örnek:
+        durum = IngestState(st.session_state)
+        kimlik = upload_identity(uploaded_file, baglam)
+        if durum.needs_ingest(kimlik):
+            durum.begin(kimlik)
+            try:
+                ...                      # oku, temizle, eşleştir, yayınla
+                durum.done({'satir': len(df)})
+            except Exception as e:
+                durum.fail(str(e))
+                raise
+    """
+
+    def __init__(self, state: MutableMapping[str, Any], key: str = STATE_KEY):
+        """
+        Args:
+            state: st.session_state veya benzeri sözlük
+            key: Durumun saklanacağı anahtar
+        """
+        self._state = state
+        self._key = key
+        if key not in state:
+            state[key] = {'durum': BOS, 'kimlik': None, 'ozet': {}, 'hata': None, 'calisma_sayisi': 0}
+
+    @property
+    def _kayit(self) -> Dict[str, Any]:
+        return self._state[self._key]
+
+    @property
+    def status(self) -> str:
+        return self._kayit['durum']
+
+    @property
+    def identity(self) -> Optional[Tuple[str, int, str]]:
+        kimlik = self._kayit['kimlik']
+        return tuple(kimlik) if kimlik is not None else None
+
+    @property
+    def summary(self) -> Dict[str, Any]:
+        """Son başarılı yüklemenin özeti (done() ile verilen)"""
+        return dict(self._kayit['ozet'])
+
+    @property
+    def error(self) -> Optional[str]:
+        return self._kayit['hata']
+
+    @property
+    def run_count(self) -> int:
+        """Bu oturumda yükleme hattının kaç kez çalıştığı"""
+        return self._kayit['calisma_sayisi']
+
+    def needs_ingest(self, kimlik: Tuple[str, int, str]) -> bool:
+        """
+        Yükleme hattı çalışmalı mı?
+
+        Aynı kimlik için HAZIR veya HATA durumundaysa False. ISLENIYOR'da
+        kalmışsa (önceki çalıştırma yarıda kesildi) True.
+        """
+        if self.identity != tuple(kimlik):
+            return True
+        return self.status not in (HAZIR, HATA)
+
+    def begin(self, kimlik: Tuple[str, int, str]) -> None:
+        kayit = self._kayit
+        kayit.update(durum=ISLENIYOR, kimlik=tuple(kimlik), ozet={}, hata=None)
+        kayit['calisma_sayisi'] += 1
+
+    def done(self, ozet: Optional[Dict[str, Any]] = None) -> None:
+        self._kayit.update(durum=HAZIR, ozet=dict(ozet or {}))
+
+    def fail(self, hata: str) -> None:
+        self._kayit.update(durum=HATA, hata=hata)
+
+    def reset(self) -> None:
+        """Dosya kaldırıldığında: durum BOS'a döner (çalışma sayacı korunur)"""
+        self._kayit.update(durum=BOS, kimlik=None, ozet={}, hata=None)
@@ -0,0 +1,163 @@
+"""
+Kalem indeksi.
+
+Menü ekranındaki ``get_asc`` yardımcı fonksiyonu her çağrıda tüm veriyi
+ölçeklendirip ``Kalem`` sütununda tarama yapıyordu. Bu modül veriyi bir kez
+``Kalem -> NumPy dizisi`` sözlüğüne çevirir; ölçek yalnızca istenen kalem
+için tek bir çarpma olarak uygulanır.
+
+İndeks veri yüklemesi başına bir kez oluşturulur; veri (sütun tamponları)
+veya tarih sütunları değiştiğinde yeniden oluşturulur. Ölçek değiştiğinde
+yalnızca ölçeklenmiş değer önbelleği temizlenir. Veri, SessionDataStore
+üzerinden yayınlandığı veya anahtar yeniden yazıldığı sürece değişiklik
+tampon parmak iziyle yakalanır.
+"""
+
+from typing import Callable, Dict, Hashable, List, MutableMapping, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from session_data_store import frame_fingerprint
+
+# İndeksin session_state'teki anahtarı
+INDEX_STATE_KEY = '_kalem_indeksi'
+# scale_factor örnek değeri (bölüp yuvarlayan ölçeklerde sıfıra inmeyecek kadar büyük)
+OLCEK_ORNEGI = 1e12
+
+
+class KalemIndex:
+    """
+    Kalem adına göre dönem değerlerini O(1) döndüren indeks.
+
+    Aynı kalem birden fazla satırda geçiyorsa ``get_asc`` ile uyumlu olarak
+    ilk satır kullanılır. Boş (NaN) değerler 0 kabul edilir.
+    """
+
+    def __init__(self, df: pd.DataFrame, date_cols: Sequence, item_col: str = 'Kalem'):
+        self.date_cols = list(date_cols)
+        self._bos = np.zeros(len(self.date_cols), dtype='float64')
+        self._satirlar: Dict[Hashable, np.ndarray] = {}
+        self._olcekli: Dict[Hashable, np.ndarray] = {}
+        self._carpan = 1.0
+
+        if df is None or df.empty or item_col not in df.columns:
+            return
+        mevcut = [c for c in self.date_cols if c in df.columns]
+        matris = np.zeros((len(df), len(self.date_cols)), dtype='float64')
+        if mevcut:
+            konumlar = [self.date_cols.index(c) for c in mevcut]
+            degerler = df[mevcut].apply(pd.to_numeric, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+            matris[:, konumlar] = np.nan_to_num(degerler, nan=0.0)
+        matris.setflags(write=False)
+
+        kalemler = df[item_col].to_numpy()
+        ilk = ~pd.Index(kalemler).duplicated(keep='first')
+        self._satirlar = {k: matris[i] for i, k in zip(np.flatnonzero(ilk), kalemler[ilk])}
+
+    def __contains__(self, kalem) -> bool:
+        return kalem in self._satirlar
+
+    def __len__(self) -> int:
+        return len(self._satirlar)
+
+    @property
+    def carpan(self) -> float:
+        """Ayarlı ölçek çarpanı"""
+        return self._carpan
+
+    def set_scale_factor(self, carpan: float) -> None:
+        """Ölçek çarpanını ayarlar; değiştiyse ölçeklenmiş önbelleği temizler"""
+        if carpan != self._carpan:
+            self._carpan = carpan
+            self._olcekli = {}
+
+    def get_array(self, kalem, use_scale: bool = True) -> np.ndarray:
+        """
+        Kalemin dönem değerlerini salt okunur NumPy dizisi olarak döndürür.
+
+        Args:
+            kalem: Kalem adı
+            use_scale: True ise ayarlı ölçek çarpanı uygulanır
+
+        Returns:
+            np.ndarray: date_cols sırasıyla değerler (kalem yoksa sıfırlar)
+        """
+        ham = self._satirlar.get(kalem)
+        if ham is None:
+            return self._bos
+        if not use_scale or self._carpan == 1.0:
+            return ham
+        olcekli = self._olcekli.get(kalem)
+        if olcekli is None:
+            olcekli = ham * self._carpan
+            olcekli.setflags(write=False)
+            self._olcekli[kalem] = olcekli
+        return olcekli
+
+    def get_asc(self, kalem, use_scale: bool = True) -> List[float]:
+        """Eski ``get_asc`` ile aynı biçimde liste döndürür"""
+        return self.get_array(kalem, use_scale).tolist()
+
+
+def scale_factor(scale_func: Optional[Callable], scale, date_cols: Sequence) -> float:
+    """
+    ``scale_df`` fonksiyonunun uyguladığı çarpanı tek satırlık örnekle bulur.
+
+    Örnek değer büyük seçilir: ``scale_df`` bölüp yuvarlıyorsa (TL -> milyon TL)
+    1.0 gibi küçük bir değer sıfıra yuvarlanır ve tüm değerler sıfırlanırdı.
+
+    Args:
+        scale_func: scale_df(df, scale, date_cols) imzalı fonksiyon
+        scale: Seçili ölçek
+        date_cols: Dönem sütunları
+
+    Returns:
+        float: Ölçeklenmiş değer / ham değer oranı (bulunamazsa 1.0)
+    """
+    if scale_func is None or not len(date_cols):
+        return 1.0
+    ornek = pd.DataFrame({c: [OLCEK_ORNEGI] for c in date_cols})
+    try:
+        sonuc = scale_func(ornek, scale, list(date_cols))
+        carpan = float(sonuc[date_cols[0]].iloc[0]) / OLCEK_ORNEGI
+    except Exception:
+        return 1.0
+    return carpan if np.isfinite(carpan) and carpan > 0 else 1.0
+
+
+def get_kalem_index(
+    state: MutableMapping,
+    frames: Sequence[pd.DataFrame],
+    date_cols: Sequence,
+    item_col: str = 'Kalem'
+) -> KalemIndex:
+    """
+    Oturumdaki kalem indeksini döndürür; veri değiştiyse yeniden oluşturur.
+
+    Args:
+        state: st.session_state veya benzeri sözlük
+        frames: İndekslenecek çerçeveler (sırası arama önceliğidir)
+        date_cols: Dönem sütunları
+        item_col: Kalem adı sütunu
+
+    Returns:
+        KalemIndex
+    """
+    izler = [frame_fingerprint(f) for f in frames]
+    anahtar = (tuple(date_cols), item_col, tuple(izler))
+    kayit = state.get(INDEX_STATE_KEY)
+    if kayit is not None and kayit[0] == anahtar:
+        return kayit[1]
+
+    # Aynı veriyi paylaşan çerçeveler (eski akıştaki üç kopya) bir kez indekslenir
+    dolu, goruldu = [], set()
+    for f, iz in zip(frames, izler):
+        if f is None or f.empty or iz in goruldu:
+            continue
+        goruldu.add(iz)
+        dolu.append(f)
+    birlesik = pd.concat(dolu, ignore_index=True) if len(dolu) > 1 else (dolu[0] if dolu else pd.DataFrame())
+    indeks = KalemIndex(birlesik, date_cols, item_col)
+    state[INDEX_STATE_KEY] = (anahtar, indeks)
+    return indeks
@@ -0,0 +1,325 @@
+"""
+Makro veri servisi (TCMB döviz kurları, TÜİK TÜFE).
+
+Firma bilgileri ekranı her çizimde ``get_tcmb_doviz_kurlari`` ve
+``get_tuik_tufe_yillik`` fonksiyonlarını çağırıyordu; her widget etkileşimi
+uzak bir HTTP isteğini bekleyebiliyordu. Bu servis verileri arka plandaki
+bir thread'de TTL başına bir kez çeker, son başarılı değeri beklemeden
+alınma zamanıyla birlikte döndürür ve soğuk başlangıç için diske yazar.
+
+Kaynak takılabilirdir: varsayılan kaynak data_loader fonksiyonlarını
+kullanır; çevrimdışı çalışma ve testler için ``StaticSource`` veya
+``LocalFileSource`` verilebilir. ``DIGICFO_MACRO_SOURCE`` ortam değişkeni
+bir JSON dosyasını gösteriyorsa varsayılan olarak o dosya kullanılır.
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from cache_paths import cache_path
+
+# ==========================================
+# VERİ SETLERİ
+# ==========================================
+TCMB_KURLAR = 'tcmb_kurlar'
+TUIK_TUFE = 'tuik_tufe'
+
+# Veri yokken döndürülen (eski fonksiyonlarla aynı biçimli) değerler
+VARSAYILAN_DEGERLER: Dict[str, Dict[str, Any]] = {
+    TCMB_KURLAR: {'USD': None, 'EUR': None, 'tarih': None},
+    TUIK_TUFE: {'tufe_yillik': None, 'donem': None},
+}
+
+# Başarılı sayılma koşulu (eski fonksiyonlar hata durumunda None değerler döndürür)
+_GECERLILIK: Dict[str, Callable[[Mapping], bool]] = {
+    TCMB_KURLAR: lambda d: bool(d.get('USD') or d.get('EUR')),
+    TUIK_TUFE: lambda d: d.get('tufe_yillik') is not None,
+}
+
+DEFAULT_TTL = 6 * 60 * 60
+# Arka plan döngüsünün iki deneme arasında en az beklediği süre (saniye)
+MIN_BEKLEME = 60.0
+DEFAULT_SNAPSHOT_NAME = 'makro_veri.json'
+
+
+# ==========================================
+# KAYNAKLAR
+# ==========================================
+class DataLoaderSource:
+    """data_loader.py fonksiyonlarından (TCMB / TÜİK) veri çeken kaynak"""
+
+    def fetch(self, veri_seti: str) -> Dict[str, Any]:
+        from data_loader import get_tcmb_doviz_kurlari, get_tuik_tufe_yillik
+        if veri_seti == TCMB_KURLAR:
+            return dict(get_tcmb_doviz_kurlari())
+        if veri_seti == TUIK_TUFE:
+            return dict(get_tuik_tufe_yillik())
+        raise KeyError(veri_seti)
+
+
+class StaticSource:
+    """Sabit değer döndüren yerel kaynak (çevrimdışı çalışma ve testler için)"""
+
+    def __init__(self, degerler: Optional[Mapping[str, Mapping[str, Any]]] = None):
+        self.degerler = {k: dict(v) for k, v in (degerler or {}).items()}
+        self.cagri_sayisi = 0
+
+    def fetch(self, veri_seti: str) -> Dict[str, Any]:
+        self.cagri_sayisi += 1
+        if veri_seti not in self.degerler:
+            raise KeyError(veri_seti)
+        return dict(self.degerler[veri_seti])
+
+
+class LocalFileSource:
+    """{veri_seti: değer} biçimli bir JSON dosyasından okuyan yerel kaynak"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def fetch(self, veri_seti: str) -> Dict[str, Any]:
+        with open(self.path, encoding='utf-8') as f:
+            return dict(json.load(f)[veri_seti])
+
+
+def default_source():
+    """DIGICFO_MACRO_SOURCE tanımlıysa dosya kaynağı, değilse data_loader kaynağı"""
+    dosya = os.environ.get('DIGICFO_MACRO_SOURCE')
+    if dosya:
+        return LocalFileSource(dosya)
+    return DataLoaderSource()
+
+
+# ==========================================
+# SERVİS
+# ==========================================
+@dataclass(frozen=True)
+class MacroSnapshot:
+    """Bir veri setinin son başarılı değeri ve durumu"""
+    deger: Dict[str, Any]
+    alinma: Optional[float]
+    hata: Optional[str] = None
+    guncelleniyor: bool = False
+
+    @property
+    def yas(self) -> Optional[float]:
+        """Son başarılı alımdan bu yana geçen süre (saniye)"""
+        return None if self.alinma is None else max(0.0, time.time() - self.alinma)
+
+    def eski_mi(self, ttl: float) -> bool:
+        """Değer yoksa veya TTL'den eskiyse True"""
+        return self.alinma is None or self.yas > ttl
+
+
+def staleness_label(snapshot: MacroSnapshot) -> str:
+    """Kullanıcıya gösterilecek güncellik metni (ör. "12 dk önce güncellendi")"""
+    if snapshot.alinma is None:
+        return "güncelleniyor..." if snapshot.guncelleniyor else "veri alınamadı"
+    yas = snapshot.yas
+    if yas < 60:
+        metin = "az önce güncellendi"
+    elif yas < 3600:
+        metin = f"{int(yas // 60)} dk önce güncellendi"
+    elif yas < 86400:
+        metin = f"{int(yas // 3600)} sa önce güncellendi"
+    else:
+        metin = f"{int(yas // 86400)} gün önce güncellendi"
+    if snapshot.hata:
+        metin += " (son deneme başarısız)"
+    return metin
+
+
+class MacroDataService:
+    """
+    Makro verileri arka planda TTL başına bir kez yenileyen paylaşımlı servis.
+
+    Örnek:
+        servis = MacroDataService(StaticSource({TCMB_KURLAR: {...}}))
+        kurlar = servis.get(TCMB_KURLAR).deger      # beklemeden döner
+    """
+
+    def __init__(
+        self,
+        source=None,
+        ttl: float = DEFAULT_TTL,
+        snapshot_path: Optional[str] = None,
+        veri_setleri=(TCMB_KURLAR, TUIK_TUFE)
+    ):
+        """
+        Args:
+            source: fetch(veri_seti) -> dict metodu olan kaynak
+            ttl: Yenileme aralığı (saniye)
+            snapshot_path: Disk anlık görüntüsü (None ise önbellek dizininde,
+                boş string ise diske yazılmaz)
+            veri_setleri: Yönetilen veri setleri
+        """
+        self.source = source if source is not None else default_source()
+        self.ttl = ttl
+        self.snapshot_path = cache_path(DEFAULT_SNAPSHOT_NAME) if snapshot_path is None else snapshot_path
+        self.veri_setleri = tuple(veri_setleri)
+        self.min_bekleme = MIN_BEKLEME
+
+        self._kilit = threading.Lock()
+        self._durdur = threading.Event()
+        self._uyandir = threading.Event()
+        self._ilk_tur = threading.Event()
+        self._zorla = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._guncelleniyor = False
+        self._hatalar: Dict[str, Optional[str]] = {}
+        self._kayitlar: Dict[str, Dict[str, Any]] = self._diskten_yukle()
+
+    # --- Disk ---
+    def _diskten_yukle(self) -> Dict[str, Dict[str, Any]]:
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return {}
+        try:
+            with open(self.snapshot_path, encoding='utf-8') as f:
+                veri = json.load(f)
+            return {k: v for k, v in veri.items() if k in self.veri_setleri and 'deger' in v}
+        except (OSError, ValueError):
+            return {}
+
+    def _diske_yaz(self) -> None:
+        if not self.snapshot_path:
+            return
+        with self._kilit:
+            veri = json.dumps(self._kayitlar, ensure_ascii=False, default=str)
+        gecici = f"{self.snapshot_path}.{os.getpid()}.tmp"
+        try:
+            with open(gecici, 'w', encoding='utf-8') as f:
+                f.write(veri)
+            os.replace(gecici, self.snapshot_path)
+        except OSError:
+            pass
+
+    # --- Yenileme ---
+    def refresh_now(self) -> None:
+        """Tüm veri setlerini çağıran thread'de yeniler (başarısız olanların son değeri korunur)"""
+        degisti = False
+        for veri_seti in self.veri_setleri:
+            try:
+                deger = self.source.fetch(veri_seti)
+                gecerli = _GECERLILIK.get(veri_seti, bool)
+                if not gecerli(deger):
+                    raise ValueError("kaynak boş değer döndürdü")
+            except Exception as e:
+                with self._kilit:
+                    self._hatalar[veri_seti] = f"{type(e).__name__}: {e}"
+                continue
+            with self._kilit:
+                self._kayitlar[veri_seti] = {'deger': deger, 'alinma': time.time()}
+                self._hatalar[veri_seti] = None
+            degisti = True
+        if degisti:
+            self._diske_yaz()
+
+    def _dongu(self) -> None:
+        while not self._durdur.is_set():
+            # Diskteki değerler taze ise ilk turda kaynağa gidilmez
+            if self._yenilenmeli():
+                with self._kilit:
+                    self._guncelleniyor = True
+                try:
+                    self.refresh_now()
+                finally:
+                    with self._kilit:
+                        self._guncelleniyor = False
+            else:
+                with self._kilit:
+                    self._guncelleniyor = False
+            self._ilk_tur.set()
+            self._uyandir.wait(self._sonraki_bekleme())
+            self._uyandir.clear()
+
+    def _yenilenmeli(self) -> bool:
+        if self._zorla.is_set():
+            self._zorla.clear()
+            return True
+        return any(self._snapshot(v).eski_mi(self.ttl) for v in self.veri_setleri)
+
+    def _sonraki_bekleme(self) -> float:
+        """En eski değerin TTL'i dolana kadar (en az min_bekleme, başarısızlıkta da)"""
+        with self._kilit:
+            zamanlar = [self._kayitlar.get(v, {}).get('alinma') for v in self.veri_setleri]
+        if any(z is None for z in zamanlar):
+            return min(self.ttl, self.min_bekleme)
+        return max(self.min_bekleme, min(zamanlar) + self.ttl - time.time())
+
+    def start(self) -> None:
+        """Arka plan thread'ini başlatır (zaten çalışıyorsa bir şey yapmaz)"""
+        with self._kilit:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._durdur.clear()
+            self._guncelleniyor = True
+            self._thread = threading.Thread(target=self._dongu, name='makro-veri', daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Arka plan thread'ini durdurur.
+
+        Args:
+            timeout: Verilirse thread'in bitmesi en fazla bu kadar beklenir
+
+        Returns:
+            bool: Thread çalışmıyorsa True
+        """
+        self._durdur.set()
+        self._uyandir.set()
+        thread = self._thread
+        if thread is None:
+            return True
+        if timeout is not None:
+            thread.join(timeout)
+        return not thread.is_alive()
+
+    def request_refresh(self) -> None:
+        """Arka plan thread'ine TTL'i beklemeden yenilemesini söyler"""
+        self._zorla.set()
+        self.start()
+        self._uyandir.set()
+
+    # --- Okuma ---
+    def _snapshot(self, veri_seti: str) -> MacroSnapshot:
+        with self._kilit:
+            kayit = self._kayitlar.get(veri_seti)
+            hata = self._hatalar.get(veri_seti)
+            guncelleniyor = self._guncelleniyor
+        if kayit is None:
+            return MacroSnapshot(dict(VARSAYILAN_DEGERLER.get(veri_seti, {})), None, hata, guncelleniyor)
+        return MacroSnapshot(dict(kayit['deger']), kayit['alinma'], hata, guncelleniyor)
+
+    def get(self, veri_seti: str, wait: float = 0.0) -> MacroSnapshot:
+        """
+        Veri setinin son başarılı değerini döndürür; gerekirse arka planda yeniler.
+
+        Args:
+            veri_seti: TCMB_KURLAR veya TUIK_TUFE
+            wait: Hiç değer yoksa ilk yenileme için beklenecek en uzun süre (saniye)
+
+        Returns:
+            MacroSnapshot
+        """
+        self.start()
+        if wait and self._snapshot(veri_seti).alinma is None:
+            self._ilk_tur.wait(wait)
+        return self._snapshot(veri_seti)
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Veri seti başına alınma zamanı, yaş ve son hata"""
+        durum = {}
+        for veri_seti in self.veri_setleri:
+            snapshot = self._snapshot(veri_seti)
+            durum[veri_seti] = {
+                'alinma': snapshot.alinma,
+                'yas_sn': snapshot.yas,
+                'eski': snapshot.eski_mi(self.ttl),
+                'hata': snapshot.hata,
+            }
+        return durum
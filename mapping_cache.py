@@ -0,0 +1,247 @@
+"""
+Kalıcı eşleştirme önbelleği.
+
+Aynı ERP'den gelen yüklemeler her ay aynı birkaç bin hesap adını tekrarlar.
+Bu modül ``hesap adı -> (Grup, Standart_Kalem)`` sonuçlarını disk üzerindeki
+bir SQLite veritabanında saklar; önbellek yeniden başlatmalardan sonra da
+kalır ve tüm oturumlar tarafından paylaşılır.
+
+Önbellek anahtarı kullanıcı eşleştirmesinin (user_mapping) özeti ile
+eşleştiricinin şema sürümünden oluşur; ikisinden biri değiştiğinde eski
+sonuçlar kullanılmaz. Kayıt sayısı ``max_entries`` değerini aşarsa en uzun
+süredir kullanılmayan (LRU) kayıtlar silinir.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from contextlib import closing, contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+import pandas as pd
+
+from alias_matcher import AliasMatcher
+from cache_paths import cache_path
+
+# Varsayılan veritabanı dosyası ve kapasite
+DEFAULT_DB_NAME = 'eslestirme_onbellegi.sqlite'
+DEFAULT_MAX_ENTRIES = 200_000
+
+# SQLite parametre sınırının altında kalan IN (...) parça boyutu
+_PARCA = 500
+
+_SEMA = """
+CREATE TABLE IF NOT EXISTS eslestirme (
+    anahtar    TEXT NOT NULL,
+    etiket     TEXT NOT NULL,
+    grup       TEXT,
+    standart   TEXT,
+    son_erisim REAL NOT NULL,
+    PRIMARY KEY (anahtar, etiket)
+);
+CREATE INDEX IF NOT EXISTS ix_eslestirme_erisim ON eslestirme (son_erisim);
+"""
+
+
+def mapping_fingerprint(user_mapping: Optional[Mapping], version: str, fuzzy: bool = True) -> str:
+    """
+    Kullanıcı eşleştirmesi, şema sürümü ve bulanık eşleşme ayarından önbellek anahtarı üretir.
+
+    Args:
+        user_mapping: Kullanıcı eşleştirmesi
+        version: AliasMatcher.version
+        fuzzy: Bulanık eşleşme açık mı (açık / kapalı sonuçlar ayrı saklanır)
+
+    Returns:
+        str: 20 karakterlik özet
+    """
+    metin = json.dumps(user_mapping or {}, sort_keys=True, ensure_ascii=False, default=str)
+    ozet = hashlib.sha1(f"{version}|{int(bool(fuzzy))}|{metin}".encode('utf-8')).hexdigest()
+    return ozet[:20]
+
+
+def _parcalar(liste: List[Any], boyut: int = _PARCA) -> Iterable[List[Any]]:
+    for i in range(0, len(liste), boyut):
+        yield liste[i:i + boyut]
+
+
+class MappingCache:
+    """
+    SQLite tabanlı, LRU tahliyeli etiket eşleştirme önbelleği.
+
+    Her işlem kendi bağlantısını açar; nesne Streamlit oturumları (thread'ler)
+    arasında güvenle paylaşılabilir.
+
+    Örnek:
+        onbellek = MappingCache()
+        anahtar = mapping_fingerprint(user_mapping, matcher.version)
+        bulunan = onbellek.lookup(anahtar, etiketler)
+    """
+
+    def __init__(self, path: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Args:
+            path: Veritabanı dosyası (None ise önbellek dizininde)
+            max_entries: Tutulacak en fazla kayıt sayısı
+        """
+        self.path = path or cache_path(DEFAULT_DB_NAME)
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._kilit = threading.Lock()
+        with self._baglan() as baglanti:
+            baglanti.execute('PRAGMA journal_mode=WAL')
+            baglanti.executescript(_SEMA)
+
+    @contextmanager
+    def _baglan(self) -> Iterator[sqlite3.Connection]:
+        """Blok sonunda işlemi onaylayan (hatada geri alan) ve bağlantıyı kapatan bağlantı"""
+        with closing(sqlite3.connect(self.path, timeout=30)) as baglanti, baglanti:
+            yield baglanti
+
+    def lookup(self, anahtar: str, etiketler: Iterable[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """
+        Önbellekteki eşleştirmeleri döndürür ve son erişim zamanlarını günceller.
+
+        Args:
+            anahtar: mapping_fingerprint çıktısı
+            etiketler: Benzersiz hesap adları
+
+        Returns:
+            dict: {etiket: (grup, standart_kalem)}; eşleşmemiş etiketlerde (None, None)
+        """
+        etiketler = list(etiketler)
+        bulunan: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+        if not etiketler:
+            return bulunan
+        with self._baglan() as baglanti:
+            for parca in _parcalar(etiketler):
+                yer = ','.join('?' * len(parca))
+                satirlar = baglanti.execute(
+                    f'SELECT etiket, grup, standart FROM eslestirme WHERE anahtar = ? AND etiket IN ({yer})',
+                    [anahtar, *parca]
+                )
+                for etiket, grup, standart in satirlar:
+                    bulunan[etiket] = (grup, standart)
+            if bulunan:
+                simdi = time.time()
+                baglanti.executemany(
+                    'UPDATE eslestirme SET son_erisim = ? WHERE anahtar = ? AND etiket = ?',
+                    [(simdi, anahtar, e) for e in bulunan]
+                )
+        with self._kilit:
+            self.hits += len(bulunan)
+            self.misses += len(etiketler) - len(bulunan)
+        return bulunan
+
+    def store(self, anahtar: str, sonuclar: Mapping[str, Tuple[Optional[str], Optional[str]]]) -> None:
+        """
+        Yeni eşleştirmeleri yazar; kapasite aşılırsa en eski kayıtları siler.
+
+        Args:
+            anahtar: mapping_fingerprint çıktısı
+            sonuclar: {etiket: (grup, standart_kalem)}
+        """
+        if not sonuclar:
+            return
+        simdi = time.time()
+        with self._baglan() as baglanti:
+            baglanti.executemany(
+                'INSERT OR REPLACE INTO eslestirme (anahtar, etiket, grup, standart, son_erisim) '
+                'VALUES (?, ?, ?, ?, ?)',
+                [(anahtar, e, g, s, simdi) for e, (g, s) in sonuclar.items()]
+            )
+            fazla = baglanti.execute('SELECT COUNT(*) FROM eslestirme').fetchone()[0] - self.max_entries
+            if fazla > 0:
+                baglanti.execute(
+                    'DELETE FROM eslestirme WHERE rowid IN '
+                    '(SELECT rowid FROM eslestirme ORDER BY son_erisim ASC LIMIT ?)',
+                    (fazla,)
+                )
+
+    def clear(self) -> None:
+        """Tüm kayıtları siler"""
+        with self._baglan() as baglanti:
+            baglanti.execute('DELETE FROM eslestirme')
+        with self._kilit:
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Kayıt sayısı ve bu süreçteki isabet istatistikleri"""
+        with self._baglan() as baglanti:
+            kayit = baglanti.execute('SELECT COUNT(*) FROM eslestirme').fetchone()[0]
+        toplam = self.hits + self.misses
+        return {
+            'kayit_sayisi': kayit,
+            'kapasite': self.max_entries,
+            'isabet': self.hits,
+            'iskalama': self.misses,
+            'isabet_orani': self.hits / toplam if toplam else 0.0,
+        }
+
+
+def apply_cached_mapping(
+    df: pd.DataFrame,
+    item_col: str,
+    user_mapping: Optional[Mapping],
+    matcher: AliasMatcher,
+    cache: Optional[MappingCache],
+    fuzzy: bool = True,
+    varsayilan_grup: str = 'Diğer'
+) -> pd.DataFrame:
+    """
+    ``apply_compiled_mapping`` ile aynı sonucu önbellek üzerinden üretir.
+
+    Yalnızca önbellekte bulunmayan benzersiz etiketler eşleştirilir ve
+    sonuçları önbelleğe yazılır. Önbellek kullanılamazsa (None veya disk
+    hatası) doğrudan eşleştirme yapılır.
+
+    Args:
+        df: Ham veri
+        item_col: Hesap adı sütunu
+        user_mapping: Kullanıcı eşleştirmesi
+        matcher: Derlenmiş eşleştirici
+        cache: Eşleştirme önbelleği
+        fuzzy: Bulanık eşleşme açık mı
+        varsayilan_grup: Eşleşmeyen satırların grubu
+
+    Returns:
+        pd.DataFrame: Grup ve Standart_Kalem eklenmiş df
+    """
+    kodlar, benzersiz = pd.factorize(df[item_col], use_na_sentinel=True)
+    benzersiz = list(benzersiz)
+    metinler = [e for e in benzersiz if isinstance(e, str)]
+
+    anahtar = mapping_fingerprint(user_mapping, matcher.version, fuzzy) if cache is not None else None
+    bulunan: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+    if cache is not None:
+        try:
+            bulunan = cache.lookup(anahtar, metinler)
+        except sqlite3.Error:
+            cache = None
+
+    yeni: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+    sonuclar: List[Tuple[Optional[str], Optional[str]]] = []
+    for etiket in benzersiz:
+        sonuc = bulunan.get(etiket) if isinstance(etiket, str) else None
+        if sonuc is None:
+            eslesme = matcher.match(etiket, user_mapping, fuzzy)
+            sonuc = (eslesme.grup, eslesme.standart_kalem) if eslesme else (None, None)
+            if isinstance(etiket, str):
+                yeni[etiket] = sonuc
+        sonuclar.append(sonuc)
+
+    if cache is not None and yeni:
+        try:
+            cache.store(anahtar, yeni)
+        except sqlite3.Error:
+            pass
+
+    gruplar = [s[0] or varsayilan_grup for s in sonuclar]
+    standartlar = [s[1] or str(e).strip() for s, e in zip(sonuclar, benzersiz)]
+    df = df.copy(deep=False)
+    df['Grup'] = [gruplar[k] if k >= 0 else varsayilan_grup for k in kodlar]
+    df['Standart_Kalem'] = [standartlar[k] if k >= 0 else '' for k in kodlar]
+    return df
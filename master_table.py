@@ -0,0 +1,420 @@
+"""
+Büyük Veri ana tablosu için tipli sütunsal depo.
+
+BuyukVeriMotoru finansal tabloları, ``firma_bilgi`` üst verisini ve makro
+verileri (TCMB kurları, TÜFE, politika faizi) object tipli geniş
+çerçevelerde birleştiriyor, istatistikleri satır satır hesaplıyordu. Bu
+modülde ana tablo şu parçalardan oluşur:
+
+    - kalem ve tablo boyutları: ``pd.Categorical``
+    - değerler: kalem × dönem float64 matrisi
+    - makro seriler: dönemlere hizalı float64 diziler
+    - firma bilgisi: sözlük
+
+Firma bilgileri formundaki ve makro veri servisindeki kur / TÜFE değerleri
+tek bir tarihin gözlemidir; geçmiş dönemlere yayılmaz, yalnızca o tarihi
+içeren döneme yazılır (diğer dönemler NaN).
+
+Büyüme, YBBO (CAGR), z-skoru, enflasyondan arındırma ve kur çevrimi matris
+üzerinde vektörel indirgemelerdir.
+
+Örnek:
+    ana = MasterTable.from_statements({'Gelir Tablosu': df_gelir, 'Bilanço': df_bilanco},
+                                      date_cols, firma_bilgi=firma_bilgi,
+                                      makro={'tufe_yillik': 45.0, 'USD': 32.5})
+    ozet = ana.summary()
+"""
+
+from typing import Any, Dict, Hashable, List, Mapping, MutableMapping, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from session_data_store import frame_fingerprint
+
+# Ana tablonun session_state anahtarı
+STATE_KEY = '_ana_tablo'
+
+# Makro seri adları
+TUFE_ENDEKSI = 'tufe'            # Dönem başına TÜFE endeksi
+TUFE_YILLIK = 'tufe_yillik'      # Yıllık TÜFE (%) - endeks yoksa sabit oranla endeks kurulur
+POLITIKA_FAIZI = 'politika_faizi'
+
+MakroDeger = Union[float, int, Sequence[float], pd.Series, None]
+
+# Firma bilgileri formundaki makro alanlar -> makro seri adı
+FIRMA_BILGI_MAKRO = {
+    "TCMB Dolar Döviz Alış Kuru": 'USD',
+    "TCMB Euru Döviz Alış Kuru": 'EUR',
+    "Yıllık TÜFE (%)": TUFE_YILLIK,
+    "Politika Faizi (TCMB Haftalık Repo)": POLITIKA_FAIZI,
+}
+
+
+def macro_from_firma_bilgi(
+    firma_bilgi: Optional[Mapping[str, Any]],
+    donemler: Sequence[Any],
+    tarih: Any = None
+) -> Dict[str, np.ndarray]:
+    """
+    Firma bilgileri formundaki kur / TÜFE / politika faizi değerleri.
+
+    Form değerleri güncel (tarih anındaki) gözlemlerdir: yalnızca tarihi
+    içeren döneme yazılır, diğer dönemler NaN kalır. Tarih hiçbir döneme
+    düşmüyorsa veya değer boş / 0 ise seri döndürülmez.
+
+    Args:
+        firma_bilgi: Firma bilgileri formu
+        donemler: Dönem sütunları
+        tarih: Gözlem tarihi (None ise bugün)
+
+    Returns:
+        {makro seri adı: dönemlere hizalı float64 dizi}
+    """
+    makro = {}
+    for alan, ad in FIRMA_BILGI_MAKRO.items():
+        deger = (firma_bilgi or {}).get(alan)
+        if isinstance(deger, (int, float)) and deger:
+            dizi = align_observation(float(deger), tarih, donemler)
+            if dizi is not None:
+                makro[ad] = dizi
+    return makro
+
+
+def macro_from_service(servis, donemler: Sequence[Any]) -> Dict[str, np.ndarray]:
+    """
+    MacroDataService'in son kur (``tarih``) ve TÜFE (``donem``) değerleri.
+
+    macro_from_firma_bilgi gibi değerler yalnızca gözlem tarihini içeren
+    döneme yazılır; tarihi olmayan veya döneme düşmeyen değerler atlanır.
+    """
+    from macro_data import TCMB_KURLAR, TUIK_TUFE
+
+    makro = {}
+    for veri_seti, tarih_alani, alanlar in (
+        (TCMB_KURLAR, 'tarih', {'USD': 'USD', 'EUR': 'EUR'}),
+        (TUIK_TUFE, 'donem', {'tufe_yillik': TUFE_YILLIK}),
+    ):
+        veri = servis.get(veri_seti).deger
+        tarih = veri.get(tarih_alani)
+        if tarih is None:
+            continue
+        for alan, ad in alanlar.items():
+            deger = veri.get(alan)
+            if isinstance(deger, (int, float)) and deger:
+                dizi = align_observation(float(deger), tarih, donemler)
+                if dizi is not None:
+                    makro[ad] = dizi
+    return makro
+
+
+def period_dates(donemler: Sequence[Any]) -> Optional[pd.DatetimeIndex]:
+    """Dönem sütunlarını tarihe çevirir ('2023', '2023-12', '2023-12-31'); çevrilemezse None"""
+    if not len(donemler):
+        return None
+    metin = pd.Index([str(d) for d in donemler])
+    tarihler = pd.to_datetime(metin, errors='coerce', format='mixed')
+    return None if tarihler.isna().any() else pd.DatetimeIndex(tarihler)
+
+
+def periods_per_year(tarihler: Optional[pd.DatetimeIndex]) -> int:
+    """Yıl başına dönem (aylık 12, çeyreklik 4, yıllık 1)"""
+    if tarihler is None or len(tarihler) < 2:
+        return 1
+    # Gün farkı birimden bağımsız alınır (pandas 3'te tarih sütunları datetime64[us])
+    gun = float(np.median(np.diff(tarihler.values).astype('timedelta64[D]').astype('int64')))
+    return 12 if gun < 45 else (4 if gun < 135 else 1)
+
+
+def period_position(tarih: Any, donemler: Sequence[Any]) -> Optional[int]:
+    """
+    Tarihi içeren dönemin konumu; yoksa None.
+
+    Dönem etiketleri ay sonu tarihleriyse ('2023-12-31') dönem o tarihte
+    biter, değilse ('2023', '2023-12') o tarihte başlar. İlk / son dönemin
+    uzunluğu periods_per_year'dan alınır.
+    """
+    tarihler = period_dates(donemler)
+    try:
+        an = pd.Timestamp(tarih if tarih is not None else pd.Timestamp.today()).tz_localize(None)
+    except (TypeError, ValueError):
+        return None
+    if tarihler is None or pd.isna(an) or not tarihler.is_monotonic_increasing:
+        return None
+    adim = pd.DateOffset(months=12 // periods_per_year(tarihler))
+    if tarihler.is_month_end.all():
+        # Dönem i: (tarih_i-1, tarih_i]
+        i = int(tarihler.searchsorted(an, side='left'))
+        if i == len(tarihler) or (i == 0 and an <= tarihler[0] - adim):
+            return None
+        return i
+    # Dönem i: [tarih_i, tarih_i+1)
+    i = int(tarihler.searchsorted(an, side='right')) - 1
+    if i < 0 or (i == len(tarihler) - 1 and an >= tarihler[-1] + adim):
+        return None
+    return i
+
+
+def align_observation(deger: float, tarih: Any, donemler: Sequence[Any]) -> Optional[np.ndarray]:
+    """Tek tarihli gözlemi dönemlere hizalar (tarihi içeren dönem dışında NaN); döneme düşmüyorsa None"""
+    konum = period_position(tarih, donemler)
+    if konum is None:
+        return None
+    dizi = np.full(len(donemler), np.nan)
+    dizi[konum] = deger
+    return dizi
+
+
+def _bol(pay: np.ndarray, payda: np.ndarray) -> np.ndarray:
+    sonuc = np.full(np.broadcast(pay, payda).shape, np.nan)
+    np.divide(pay, payda, out=sonuc, where=(payda != 0) & ~np.isnan(payda))
+    return sonuc
+
+
+class MasterTable:
+    """Kalem × dönem float64 matrisi, kategorik boyutlar ve hizalı makro seriler"""
+
+    def __init__(
+        self,
+        kalemler: pd.Categorical,
+        tablolar: pd.Categorical,
+        donemler: Sequence[Any],
+        degerler: np.ndarray,
+        makro: Optional[Mapping[str, np.ndarray]] = None,
+        firma_bilgi: Optional[Mapping[str, Any]] = None
+    ):
+        self.kalemler = kalemler
+        self.tablolar = tablolar
+        self.donemler = list(donemler)
+        self.degerler = np.asarray(degerler, dtype='float64')
+        self.degerler.setflags(write=False)
+        self.makro: Dict[str, np.ndarray] = dict(makro or {})
+        self.firma_bilgi: Dict[str, Any] = dict(firma_bilgi or {})
+        self.tarihler = period_dates(self.donemler)
+        self.anahtar: Optional[tuple] = None
+
+    # --- Kurulum ---
+    @staticmethod
+    def align_macro(deger: MakroDeger, donemler: Sequence[Any]) -> np.ndarray:
+        """Makro değeri dönemlere hizalar (sabit sayı yayılır, seri dönem adına göre eşlenir)"""
+        if deger is None:
+            return np.full(len(donemler), np.nan)
+        if isinstance(deger, pd.Series):
+            seri = deger.copy()
+            seri.index = seri.index.map(str)
+            return pd.to_numeric(seri.reindex([str(d) for d in donemler]), errors='coerce').to_numpy('float64')
+        if np.ndim(deger) == 0:
+            return np.full(len(donemler), float(deger))
+        dizi = np.asarray(deger, dtype='float64')
+        if len(dizi) != len(donemler):
+            raise ValueError(f"Makro seri uzunluğu {len(dizi)}, dönem sayısı {len(donemler)}")
+        return dizi
+
+    @classmethod
+    def from_statements(
+        cls,
+        frames: Mapping[str, pd.DataFrame],
+        date_cols: Sequence[Any],
+        item_col: str = 'Kalem',
+        firma_bilgi: Optional[Mapping[str, Any]] = None,
+        makro: Optional[Mapping[str, MakroDeger]] = None
+    ) -> 'MasterTable':
+        """
+        Finansal tablolardan ana tabloyu kurar.
+
+        Args:
+            frames: {tablo adı: çerçeve}; her çerçevede item_col ve dönem sütunları
+            date_cols: Dönem sütunları (matris sütun sırası)
+            item_col: Kalem sütunu
+            firma_bilgi: Firma üst verisi
+            makro: {ad: sabit / seri / dizi} (ör. USD, tufe_yillik, politika_faizi)
+        """
+        donemler = list(date_cols)
+        kalem_parcalari: List[np.ndarray] = []
+        tablo_parcalari: List[np.ndarray] = []
+        matrisler: List[np.ndarray] = []
+        for tablo, df in frames.items():
+            if df is None or df.empty or item_col not in df.columns:
+                continue
+            matris = np.full((len(df), len(donemler)), np.nan)
+            mevcut = [i for i, c in enumerate(donemler) if c in df.columns]
+            if mevcut:
+                degerler = df[[donemler[i] for i in mevcut]]
+                if not all(pd.api.types.is_numeric_dtype(t) for t in degerler.dtypes):
+                    degerler = degerler.apply(pd.to_numeric, errors='coerce')
+                matris[:, mevcut] = degerler.to_numpy(dtype='float64', na_value=np.nan)
+            matrisler.append(matris)
+            kalem_parcalari.append(df[item_col].astype(str).to_numpy())
+            tablo_parcalari.append(np.full(len(df), tablo, dtype=object))
+
+        if matrisler:
+            degerler = np.vstack(matrisler)
+            kalemler = pd.Categorical(np.concatenate(kalem_parcalari))
+            tablolar = pd.Categorical(np.concatenate(tablo_parcalari), categories=[t for t in frames])
+        else:
+            degerler = np.empty((0, len(donemler)))
+            kalemler = pd.Categorical([])
+            tablolar = pd.Categorical([], categories=list(frames))
+        makro_dizileri = {ad: cls.align_macro(d, donemler) for ad, d in (makro or {}).items()}
+        return cls(kalemler, tablolar, donemler, degerler, makro_dizileri, firma_bilgi)
+
+    @classmethod
+    def for_session(
+        cls,
+        state: MutableMapping[str, Any],
+        frames: Mapping[str, pd.DataFrame],
+        date_cols: Sequence[Any],
+        item_col: str = 'Kalem',
+        firma_bilgi: Optional[Mapping[str, Any]] = None,
+        makro: Optional[Mapping[str, MakroDeger]] = None,
+        key: str = STATE_KEY
+    ) -> 'MasterTable':
+        """Oturumdaki ana tablo; tablolar, dönemler, firma bilgisi veya makro değerler değiştiyse yeniden kurar"""
+        anahtar = (
+            tuple((ad, frame_fingerprint(df)) for ad, df in frames.items() if df is not None),
+            tuple(date_cols), item_col,
+            repr(sorted((firma_bilgi or {}).items())),
+            repr(sorted((ad, d if np.ndim(d) == 0 else tuple(np.asarray(d).tolist())) for ad, d in (makro or {}).items())),
+        )
+        mevcut = state.get(key)
+        if mevcut is None or mevcut.anahtar != anahtar:
+            mevcut = cls.from_statements(frames, date_cols, item_col, firma_bilgi, makro)
+            mevcut.anahtar = anahtar
+            state[key] = mevcut
+        return mevcut
+
+    # --- Özellikler ---
+    def __len__(self) -> int:
+        return len(self.kalemler)
+
+    @property
+    def memory_mb(self) -> float:
+        """Matris, kategorik boyutlar ve makro serilerin belleği (MB)"""
+        toplam = self.degerler.nbytes + sum(d.nbytes for d in self.makro.values())
+        for kategorik in (self.kalemler, self.tablolar):
+            toplam += kategorik.codes.nbytes + int(pd.Series(kategorik.categories).memory_usage(deep=True))
+        return toplam / 1024 ** 2
+
+    @property
+    def donem_sayisi_yillik(self) -> int:
+        return periods_per_year(self.tarihler)
+
+    def rows(self, tablo: Optional[Hashable] = None, kalem: Optional[Hashable] = None) -> np.ndarray:
+        """Tablo / kalem seçimine uyan satır konumları (kategori kodu karşılaştırması)"""
+        maske = np.ones(len(self), dtype=bool)
+        if tablo is not None:
+            maske &= self.tablolar.codes == self.tablolar.categories.get_loc(tablo)
+        if kalem is not None:
+            if kalem not in self.kalemler.categories:
+                return np.empty(0, dtype=np.int64)
+            maske &= self.kalemler.codes == self.kalemler.categories.get_loc(kalem)
+        return np.flatnonzero(maske)
+
+    # --- İstatistikler ---
+    def growth(self, lag: int = 1) -> np.ndarray:
+        """Dönemsel büyüme (x_t / x_{t-lag} - 1); ilk lag dönem ve sıfır taban NaN"""
+        sonuc = np.full(self.degerler.shape, np.nan)
+        if lag < len(self.donemler):
+            sonuc[:, lag:] = _bol(self.degerler[:, lag:], self.degerler[:, :-lag]) - 1
+        return sonuc
+
+    def yoy(self) -> np.ndarray:
+        """Yıllık büyüme (aylık veride 12, çeyreklikte 4 dönem önceyle)"""
+        return self.growth(self.donem_sayisi_yillik)
+
+    def years(self) -> float:
+        """İlk ve son dönem arasındaki yıl"""
+        if self.tarihler is not None and len(self.tarihler) > 1:
+            return (self.tarihler[-1] - self.tarihler[0]).days / 365.25
+        return max(len(self.donemler) - 1, 0) / self.donem_sayisi_yillik
+
+    def cagr(self, degerler: Optional[np.ndarray] = None) -> np.ndarray:
+        """İlk ve son dönem arası bileşik yıllık büyüme; değerlerden biri pozitif değilse NaN"""
+        degerler = self.degerler if degerler is None else degerler
+        yil = self.years()
+        if yil <= 0 or not len(self.donemler):
+            return np.full(len(self), np.nan)
+        ilk, son = degerler[:, 0], degerler[:, -1]
+        gecerli = (ilk > 0) & (son > 0)
+        sonuc = np.full(len(self), np.nan)
+        sonuc[gecerli] = (son[gecerli] / ilk[gecerli]) ** (1 / yil) - 1
+        return sonuc
+
+    def zscore(self) -> np.ndarray:
+        """Kalem başına dönemler üzerinden z-skoru (ddof=1, pandas std ile aynı); sabit seride NaN"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ortalama = np.nanmean(self.degerler, axis=1, keepdims=True)
+            sapma = np.nanstd(self.degerler, axis=1, ddof=1, keepdims=True)
+        return _bol(self.degerler - ortalama, sapma)
+
+    def inflation_index(self) -> np.ndarray:
+        """
+        Dönem başına TÜFE endeksi.
+
+        ``tufe`` serisi varsa o, yoksa ``tufe_yillik`` (%) oranıyla ilk
+        dönemden itibaren bileşik endeks kullanılır; ikisi de yoksa 1.
+        Tek tarihli gözlemlerde (form / makro servis) ``tufe_yillik`` yalnızca
+        bir dönemde doludur: boş dönemler en yakın gözlemle doldurulur, tek
+        gözlem tüm dönemler için sabit oran olur.
+        """
+        if TUFE_ENDEKSI in self.makro:
+            return self.makro[TUFE_ENDEKSI]
+        yillik = self.makro.get(TUFE_YILLIK)
+        if yillik is None or np.isnan(yillik).all():
+            return np.ones(len(self.donemler))
+        yillik = pd.Series(yillik, dtype='float64').ffill().bfill().to_numpy()
+        if self.tarihler is not None:
+            yil = (self.tarihler - self.tarihler[0]).days.to_numpy() / 365.25
+        else:
+            yil = np.arange(len(self.donemler)) / self.donem_sayisi_yillik
+        return np.cumprod(np.r_[1.0, (1 + yillik[1:] / 100) ** np.diff(yil)])
+
+    def real(self, baz: int = -1) -> np.ndarray:
+        """Enflasyondan arındırılmış değerler (baz dönemin fiyatlarıyla; varsayılan son dönem)"""
+        endeks = self.inflation_index()
+        return self.degerler * _bol(np.full_like(endeks, endeks[baz]), endeks)
+
+    def in_currency(self, kur: str = 'USD') -> np.ndarray:
+        """Dönem kuruyla döviz cinsinden değerler (kur yoksa NaN)"""
+        return _bol(self.degerler, self.makro.get(kur, np.full(len(self.donemler), np.nan)))
+
+    def summary(self) -> pd.DataFrame:
+        """Kalem başına özet: son değer, ortalama, büyümeler, nominal / reel YBBO, son dönemin z-skoru"""
+        if not len(self.donemler):
+            return pd.DataFrame(index=range(len(self)))
+        with np.errstate(invalid='ignore'):
+            ortalama = np.nanmean(self.degerler, axis=1) if len(self) else np.empty(0)
+        return pd.DataFrame({
+            'Tablo': self.tablolar,
+            'Kalem': self.kalemler,
+            'Son Değer': self.degerler[:, -1],
+            'Ortalama': ortalama,
+            'Son Büyüme (%)': self.growth()[:, -1] * 100,
+            'Yıllık Büyüme (%)': self.yoy()[:, -1] * 100,
+            'YBBO (%)': self.cagr() * 100,
+            'Reel YBBO (%)': self.cagr(self.real()) * 100,
+            'Z-Skoru (Son)': self.zscore()[:, -1],
+        })
+
+    # --- Dışa aktarma ---
+    def to_frame(self, degerler: Optional[np.ndarray] = None) -> pd.DataFrame:
+        """Geniş çerçeve: kategorik Tablo / Kalem ve float64 dönem sütunları"""
+        matris = self.degerler if degerler is None else degerler
+        df = pd.DataFrame(matris, columns=self.donemler, copy=False)
+        df.insert(0, 'Kalem', self.kalemler)
+        df.insert(0, 'Tablo', self.tablolar)
+        return df
+
+    def to_long(self) -> pd.DataFrame:
+        """Uzun çerçeve: Tablo, Kalem, Dönem (kategorik), Değer ve makro sütunları"""
+        satir, sutun = self.degerler.shape
+        donem = pd.Categorical.from_codes(np.tile(np.arange(sutun), satir), categories=pd.Index(self.donemler))
+        df = pd.DataFrame({
+            'Tablo': pd.Categorical.from_codes(np.repeat(self.tablolar.codes, sutun), dtype=self.tablolar.dtype),
+            'Kalem': pd.Categorical.from_codes(np.repeat(self.kalemler.codes, sutun), dtype=self.kalemler.dtype),
+            'Dönem': donem,
+            'Değer': self.degerler.ravel(),
+        })
+        for ad, dizi in self.makro.items():
+            df[ad] = np.tile(dizi, satir)
+        return df
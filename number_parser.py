@@ -0,0 +1,210 @@
+"""
+Vektörel Türkçe sayı ayrıştırıcı.
+
+Yüklenen mizan / finansal tablo dosyalarındaki sayısal sütunları hücre hücre
+``clean_turkish_float`` çağırmak yerine sütun bazında, tek seferde temizler.
+
+Desteklenen biçimler:
+    "1.234.567,89"  -> 1234567.89
+    "(1.234)"       -> -1234.0
+    "%12,5"         -> 12.5
+    "-", "A/D", ""  -> 0.0
+
+Hücre bazlı referans davranış ``parse_turkish_number`` fonksiyonundadır;
+``clean_turkish_float_series`` aynı sonucu sütun bazında üretir.
+"""
+
+import re
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+# ==========================================
+# SABİTLER
+# ==========================================
+# Sayı olarak yorumlanmayan, 0.0 kabul edilen değerler (küçük harf)
+BOS_DEGERLER = frozenset({"", "-", "--", "—", "a/d", "n/a", "na", "nan", "none", "null"})
+
+# Ayırıcılar temizlendikten sonra geçerli kabul edilen sayı deseni
+SAYI_DESENI = r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?"
+_SAYI_RE = re.compile(SAYI_DESENI)
+
+# Yüzde işareti ve boşluklar (bölünmez boşluk dahil) sayıdan önce atılır
+TEMIZLENECEK_DESEN = r"[%\s]"
+_TEMIZLE_RE = re.compile(TEMIZLENECEK_DESEN)
+
+# Sütunun İngilizce biçimde ("1,234.56") yazıldığını gösteren kanıt
+_INGILIZCE_KANIT = r"\d,\d{3}(?:,\d{3})*\.\d"
+# Sütunun Türkçe biçimde ("1.234,56") yazıldığını gösteren kanıt
+_TURKCE_KANIT = r"\d\.\d{3}(?:\.\d{3})*,\d"
+
+# Ondalık ayırıcı tespiti için incelenecek en fazla değer
+TESPIT_ORNEK_SAYISI = 2000
+
+
+def _metin_dtype() -> str:
+    """pyarrow varsa Arrow tabanlı string dtype kullan (str işlemleri C'de çalışır)"""
+    try:
+        import pyarrow  # noqa: F401
+        return "string[pyarrow]"
+    except ImportError:
+        return "string"
+
+
+# ==========================================
+# HÜCRE BAZLI REFERANS
+# ==========================================
+def parse_turkish_number(deger, decimal: str = ",") -> float:
+    """
+    Tek bir hücreyi Türkçe sayı biçiminden float'a çevirir.
+
+    Args:
+        deger: Hücre değeri (str, int, float, None)
+        decimal: Ondalık ayırıcı ("," Türkçe, "." İngilizce)
+
+    Returns:
+        float: Ayrıştırılan değer; ayrıştırılamayan hücreler için 0.0
+    """
+    if deger is None:
+        return 0.0
+    if not isinstance(deger, str):
+        try:
+            sayi = float(deger)
+        except (TypeError, ValueError):
+            return 0.0
+        return 0.0 if np.isnan(sayi) else sayi
+
+    metin = deger.strip()
+    if metin.lower() in BOS_DEGERLER:
+        return 0.0
+
+    negatif = metin.startswith("(") and metin.endswith(")")
+    if negatif:
+        metin = metin[1:-1].strip()
+
+    metin = _TEMIZLE_RE.sub("", metin)
+    if decimal == ",":
+        metin = metin.replace(".", "").replace(",", ".")
+    else:
+        metin = metin.replace(",", "")
+
+    if not _SAYI_RE.fullmatch(metin):
+        return 0.0
+    sayi = float(metin)
+    return -sayi if negatif else sayi
+
+
+# ==========================================
+# SÜTUN BAZLI (VEKTÖREL) AYRIŞTIRMA
+# ==========================================
+def detect_decimal_separator(metinler: pd.Series) -> str:
+    """
+    Bir sütunun ondalık ayırıcısını tahmin eder.
+
+    Varsayılan Türkçe biçimdir (","). Sütun yalnızca açıkça İngilizce biçimde
+    yazılmış değerler içeriyorsa ("1,234.56") "." döner; böylece Türkçe
+    sütunlar için sonuç ``clean_turkish_float`` ile birebir aynı kalır.
+
+    Args:
+        metinler: String dtype'lı, boşlukları temizlenmiş sütun
+
+    Returns:
+        str: "," veya "."
+    """
+    ornek = metinler.dropna().iloc[:TESPIT_ORNEK_SAYISI]
+    if ornek.empty:
+        return ","
+    if ornek.str.contains(_TURKCE_KANIT, regex=True).any():
+        return ","
+    if ornek.str.contains(_INGILIZCE_KANIT, regex=True).any():
+        return "."
+    return ","
+
+
+def clean_turkish_float_series(seri: pd.Series, decimal: Optional[str] = "auto") -> pd.Series:
+    """
+    Bir sütunu tek seferde Türkçe sayı biçiminden float64'e çevirir.
+
+    Türkçe biçimli sütunlarda her hücre için ``parse_turkish_number`` ile
+    aynı değeri üretir.
+
+    Args:
+        seri: Temizlenecek sütun
+        decimal: "," / "." veya sütun bazında tespit için "auto"
+
+    Returns:
+        pd.Series: float64 sütun (index korunur)
+    """
+    if pd.api.types.is_numeric_dtype(seri) and not pd.api.types.is_bool_dtype(seri):
+        return seri.astype("float64").fillna(0.0)
+
+    degerler = seri.astype(object)
+    sonuc = np.zeros(len(seri), dtype="float64")
+
+    # Metin olan ve olmayan hücreleri ayır (tamamı metinse hücre kontrolüne gerek yok)
+    tur = pd.api.types.infer_dtype(degerler, skipna=True)
+    if tur in ("string", "empty"):
+        metin_maske = degerler.notna().to_numpy()
+    else:
+        metin_maske = np.fromiter((isinstance(v, str) for v in degerler), dtype=bool, count=len(degerler))
+
+    # Metin olmayan hücreler: doğrudan sayıya çevir, NaN -> 0.0
+    if not metin_maske.all():
+        diger = pd.to_numeric(degerler[~metin_maske], errors="coerce")
+        sonuc[~metin_maske] = np.nan_to_num(diger.to_numpy(dtype="float64", na_value=np.nan), nan=0.0)
+
+    if not metin_maske.any():
+        return pd.Series(sonuc, index=seri.index, name=seri.name)
+
+    metin = degerler[metin_maske].astype(_metin_dtype()).str.strip()
+    bos = metin.str.lower().isin(BOS_DEGERLER).to_numpy(dtype=bool)
+
+    negatif = (metin.str.startswith("(") & metin.str.endswith(")")).to_numpy(dtype=bool)
+    if negatif.any():
+        metin = metin.where(~negatif, metin.str.slice(1, -1).str.strip())
+
+    metin = metin.str.replace(TEMIZLENECEK_DESEN, "", regex=True)
+
+    if decimal in (None, "auto"):
+        decimal = detect_decimal_separator(metin)
+    if decimal == ",":
+        metin = metin.str.replace(".", "", regex=False).str.replace(",", ".", regex=False)
+    else:
+        metin = metin.str.replace(",", "", regex=False)
+
+    gecerli = metin.str.fullmatch(SAYI_DESENI).to_numpy(dtype=bool, na_value=False) & ~bos
+    sayilar = np.zeros(len(metin), dtype="float64")
+    if gecerli.any():
+        sayilar[gecerli] = metin[gecerli].astype("float64").to_numpy()
+    sayilar = np.where(negatif, -sayilar, sayilar)
+
+    sonuc[metin_maske] = sayilar
+    return pd.Series(sonuc, index=seri.index, name=seri.name)
+
+
+def clean_turkish_numeric_columns(
+    df: pd.DataFrame,
+    columns: Iterable,
+    decimal: Optional[str] = "auto",
+    skip_numeric: bool = False
+) -> pd.DataFrame:
+    """
+    Verilen sütunları sütun bazında temizler (df yerinde güncellenir).
+
+    Args:
+        df: Veri çerçevesi
+        columns: Temizlenecek sütunlar
+        decimal: "," / "." veya sütun bazında tespit için "auto"
+        skip_numeric: True ise zaten sayısal olan sütunlara dokunulmaz
+
+    Returns:
+        pd.DataFrame: Güncellenmiş df
+    """
+    for col in columns:
+        if col not in df.columns:
+            continue
+        if skip_numeric and pd.api.types.is_numeric_dtype(df[col]):
+            continue
+        df[col] = clean_turkish_float_series(df[col], decimal=decimal)
+    return df
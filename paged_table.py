@@ -0,0 +1,222 @@
+"""
+Büyük tablolar için sunucu tarafı sayfalı gösterim.
+
+``st.dataframe(display_df)`` ve Ham Veri ekranı her çalıştırmada tüm
+çerçeveyi tarayıcıya gönderiyordu; 50 bin satırlık muavin dökümlerinde bu
+her etkileşimde megabaytlarca Arrow verisi demekti. Bu modül yalnızca
+görünen sayfayı gönderir. Sıralama ve filtre sunucuda, önbelleğe alınmış
+bir satır indeksi üzerinde yapılır; aynı sıralama / filtre ile sayfa
+değiştirmek yalnızca indeksten dilim almaktır.
+
+Sıralama ve filtre yalnızca adı benzersiz sütunlarda sunulur; "Tüm metin
+sütunları" filtresi sütunları konumla gezdiği için tekrar eden adlarda da
+çalışır. Sayı ve metnin karıştığı sütunlar önce sayılar, sonra metinler
+olacak şekilde sıralanır.
+
+Örnek:
+    show_paged_table(display_df, key="veri_merkezi_tablo")
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, List, MutableMapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from session_data_store import frame_fingerprint
+
+# Sayfa boyutu seçenekleri
+SAYFA_BOYUTLARI = (50, 100, 250, 500)
+
+# Bu sayıdan az satırlı tablolar doğrudan gösterilir
+SAYFALAMA_ESIGI = 1000
+
+# Tablo başına saklanan indeks (sıralama / filtre birleşimi) sayısı
+INDEKS_KAPASITESI = 4
+
+TUM_SUTUNLAR = "Tüm metin sütunları"
+SIRALAMA_YOK = "(Sıralama yok)"
+
+
+def _metin_sutunu_mu(seri: pd.Series) -> bool:
+    return pd.api.types.is_string_dtype(seri) or seri.dtype == object
+
+
+def benzersiz_sutunlar(df: pd.DataFrame) -> List[Hashable]:
+    """Adı çerçevede bir kez geçen sütunlar (sıralama / filtre seçenekleri)"""
+    tekrar = df.columns.duplicated(keep=False)
+    return [c for c, t in zip(df.columns, tekrar) if not t]
+
+
+def _sutun(df: pd.DataFrame, col: Hashable) -> pd.Series:
+    """Adı benzersiz sütunu döndürür; tekrar eden adlarda ValueError"""
+    konum = df.columns.get_loc(col)
+    if not isinstance(konum, (int, np.integer)):
+        raise ValueError(f"Sütun adı benzersiz değil: {col!r}")
+    return df.iloc[:, konum]
+
+
+def _siralama(seri: pd.Series, ascending: bool) -> np.ndarray:
+    """
+    Sütunun sıralı konumları; boş değerler sonda.
+
+    Karışık (sayı + metin) sütunlarda ``sort_values`` TypeError verir; bu
+    durumda sayıya çevrilebilen hücreler sayısal, diğerleri metin olarak
+    sıralanır ve sayılar metinlerden önce gelir (azalan sırada tersi).
+    """
+    try:
+        return seri.sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy()
+    except TypeError:
+        pass
+    sayi = pd.to_numeric(seri, errors='coerce')
+    sayisal = sayi.notna().to_numpy()
+    metin = ~sayisal & seri.notna().to_numpy()
+    konum = np.arange(len(seri))
+    sayilar = konum[sayisal][np.argsort(sayi.to_numpy()[sayisal], kind='stable')]
+    metinler = konum[metin][np.argsort(seri[metin].astype(str).to_numpy(), kind='stable')]
+    if not ascending:
+        sayilar, metinler = sayilar[::-1], metinler[::-1]
+    bos = konum[~sayisal & ~metin]
+    gruplar = (sayilar, metinler) if ascending else (metinler, sayilar)
+    return np.concatenate(gruplar + (bos,))
+
+
+class PagedTable:
+    """
+    Bir çerçevenin filtrelenmiş / sıralanmış satır indeksleri.
+
+    Örnek:
+        tablo = PagedTable(df)
+        sayfa = tablo.window(0, 100, sort_col="2023", ascending=False, filtre="kasa")
+    """
+
+    def __init__(self, df: pd.DataFrame, kapasite: int = INDEKS_KAPASITESI):
+        self.df = df
+        self.anahtar = frame_fingerprint(df)
+        self.kapasite = kapasite
+        self._indeksler: 'OrderedDict[Tuple, np.ndarray]' = OrderedDict()
+
+    @classmethod
+    def for_session(cls, state: MutableMapping[str, Any], df: pd.DataFrame, key: str) -> 'PagedTable':
+        """Oturumdaki tabloyu döndürür; çerçeve değiştiyse (parmak izi) yeniden kurar"""
+        durum_anahtari = f"_sayfali_tablo_{key}"
+        mevcut = state.get(durum_anahtari)
+        if mevcut is None or mevcut.anahtar != frame_fingerprint(df):
+            mevcut = cls(df)
+            state[durum_anahtari] = mevcut
+        return mevcut
+
+    def _filtre_maskesi(self, filtre: str, filtre_sutunu: Optional[Hashable]) -> np.ndarray:
+        if filtre_sutunu is not None:
+            seriler = [_sutun(self.df, filtre_sutunu)]
+        else:
+            # Konumla gezilir; tekrar eden sütun adları da taranır
+            seriler = [self.df.iloc[:, i] for i in range(self.df.shape[1])]
+            seriler = [seri for seri in seriler if _metin_sutunu_mu(seri)]
+        maske = np.zeros(len(self.df), dtype=bool)
+        for seri in seriler:
+            maske |= seri.astype(str).str.contains(filtre, case=False, regex=False, na=False).to_numpy()
+        return maske
+
+    def index(
+        self,
+        sort_col: Optional[Hashable] = None,
+        ascending: bool = True,
+        filtre: str = "",
+        filtre_sutunu: Optional[Hashable] = None
+    ) -> np.ndarray:
+        """Filtre ve sıralama uygulanmış satır konumları (önbellekten)"""
+        filtre = (filtre or "").strip()
+        anahtar = (sort_col, ascending, filtre, filtre_sutunu)
+        indeks = self._indeksler.get(anahtar)
+        if indeks is not None:
+            self._indeksler.move_to_end(anahtar)
+            return indeks
+
+        indeks = np.arange(len(self.df))
+        if filtre:
+            indeks = indeks[self._filtre_maskesi(filtre, filtre_sutunu)]
+        if sort_col is not None:
+            secili = _sutun(self.df, sort_col).take(indeks).reset_index(drop=True)
+            indeks = indeks[_siralama(secili, ascending)]
+
+        self._indeksler[anahtar] = indeks
+        while len(self._indeksler) > self.kapasite:
+            self._indeksler.popitem(last=False)
+        return indeks
+
+    def window(self, baslangic: int, boyut: int, **index_kwargs: Any) -> pd.DataFrame:
+        """[baslangic, baslangic + boyut) aralığındaki satırlar"""
+        indeks = self.index(**index_kwargs)
+        return self.df.take(indeks[baslangic:baslangic + boyut])
+
+
+def show_paged_table(
+    df: pd.DataFrame,
+    key: str,
+    page_sizes: Sequence[int] = SAYFA_BOYUTLARI,
+    esik: int = SAYFALAMA_ESIGI,
+    **dataframe_kwargs: Any
+) -> None:
+    """
+    Tabloyu sayfalı gösterir; yalnızca görünen sayfa tarayıcıya gönderilir.
+
+    Args:
+        df: Gösterilecek çerçeve
+        key: Widget ve önbellek anahtarı (ekran başına benzersiz)
+        page_sizes: Sayfa boyutu seçenekleri
+        esik: Bu sayıdan az satırlı tablolar sayfalanmadan gösterilir
+        **dataframe_kwargs: st.dataframe'e iletilen diğer parametreler
+    """
+    dataframe_kwargs.setdefault('use_container_width', True)
+    if len(df) < esik:
+        st.dataframe(df, **dataframe_kwargs)
+        return
+
+    tablo = PagedTable.for_session(st.session_state, df, key)
+    # Tekrar eden sütun adları seçilemez (df[ad] tek bir sütun döndürmez)
+    sutunlar = benzersiz_sutunlar(df)
+    metin_sutunlari = [c for c in sutunlar if _metin_sutunu_mu(df[c])]
+
+    c1, c2, c3, c4 = st.columns([3, 2, 2, 1])
+    with c1:
+        filtre = st.text_input("🔎 Filtre:", key=f"{key}_filtre", placeholder="Aranacak metin")
+    with c2:
+        filtre_sutunu = st.selectbox(
+            "Filtre sütunu:", [TUM_SUTUNLAR] + metin_sutunlari, key=f"{key}_filtre_sutunu",
+            format_func=str
+        )
+    with c3:
+        sort_col = st.selectbox("Sırala:", [SIRALAMA_YOK] + sutunlar, key=f"{key}_siralama", format_func=str)
+    with c4:
+        azalan = st.checkbox("Azalan", key=f"{key}_azalan")
+
+    secenekler = dict(
+        sort_col=None if sort_col == SIRALAMA_YOK else sort_col,
+        ascending=not azalan,
+        filtre=filtre,
+        filtre_sutunu=None if filtre_sutunu == TUM_SUTUNLAR else filtre_sutunu,
+    )
+    toplam = len(tablo.index(**secenekler))
+
+    s1, s2 = st.columns([1, 1])
+    with s1:
+        boyut = st.selectbox("Sayfa başına satır:", list(page_sizes), index=min(1, len(page_sizes) - 1),
+                             key=f"{key}_boyut")
+    sayfa_sayisi = max(1, -(-toplam // boyut))
+    # Filtre / sayfa boyutu değişince eski sayfa numarası aralık dışında kalabilir
+    if st.session_state.get(f"{key}_sayfa", 1) > sayfa_sayisi:
+        st.session_state[f"{key}_sayfa"] = sayfa_sayisi
+    with s2:
+        sayfa = st.number_input("Sayfa:", min_value=1, max_value=sayfa_sayisi, step=1,
+                                key=f"{key}_sayfa") if sayfa_sayisi > 1 else 1
+    baslangic = (int(sayfa) - 1) * boyut
+
+    pencere = tablo.window(baslangic, boyut, **secenekler)
+    st.dataframe(pencere, **dataframe_kwargs)
+    filtre_notu = f" (filtre sonrası; toplam {len(df):,})" if toplam != len(df) else ""
+    st.caption(
+        f"Satır {baslangic + 1 if toplam else 0:,}–{baslangic + len(pencere):,} / {toplam:,}{filtre_notu} "
+        f"· sayfa {int(sayfa)} / {sayfa_sayisi}"
+    )
@@ -0,0 +1,225 @@
+"""
+Çok sayfalı Excel çalışma kitaplarının paralel okunması.
+
+Her tablonun veya dönemin ayrı sayfada olduğu çalışma kitaplarında sayfalar
+birbirinden bağımsızdır, ancak ``pd.read_excel(sheet_name=None)`` onları
+sırayla ayrıştırır. Bu modül sayfaları bir süreç havuzunda eşzamanlı
+ayrıştırır, istenirse her sayfada bir yapı analizi çalıştırır ve sonuçları
+çalışma kitabındaki sayfa sırasıyla birleştirir; paralel ve sıralı mod aynı
+sonucu verir.
+
+Tüm sayfaları okuyan ``columnar_cache`` okumaları (``sheet_name=None``) soğuk
+yolda bu modülü kullanır. Manuel yükleme yalnızca ilk sayfayı okuduğundan
+orada paralelleştirilecek bir okuma yoktur.
+
+Örnek:
+    sonuclar = read_sheets_parallel("donemler.xlsx")
+    for ad, sonuc in sonuclar.items():
+        print(ad, sonuc.df.shape, sonuc.yapi)
+"""
+
+import atexit
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+
+# Bu sayıdan az sayfalı çalışma kitapları süreç açılış maliyeti yüzünden sırayla okunur
+PARALEL_MIN_SAYFA = 2
+
+
+@dataclass
+class SheetResult:
+    """Bir sayfanın okuma ve analiz sonucu"""
+    sayfa: str
+    sira: int
+    df: Optional[pd.DataFrame]
+    yapi: Optional[Dict[str, Any]]
+    sure: float
+    hata: Optional[str] = None
+
+
+# ==========================================
+# YAPI ANALİZİ
+# ==========================================
+def sheet_structure(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Sayfanın yapı özeti (read_sheets_parallel varsayılan analizi).
+
+    Args:
+        df: Sayfa verisi
+
+    Returns:
+        Satır / sütun sayısı, kalem sütunu ve sayısal (dönem) sütunları
+    """
+    sayisal = [c for c in df.columns if pd.api.types.is_numeric_dtype(df[c])]
+    metin = [c for c in df.columns if c not in sayisal]
+    return {
+        'satir': len(df),
+        'sutun': len(df.columns),
+        'kalem_sutunu': metin[0] if metin else None,
+        'donem_sutunlari': sayisal,
+        'bos_mu': df.empty,
+    }
+
+
+# ==========================================
+# İŞÇİ
+# ==========================================
+def _sayfa_isle(
+    path: str,
+    sayfa: str,
+    sira: int,
+    analyzer: Optional[Callable[[pd.DataFrame], Any]],
+    read_kwargs: Dict[str, Any]
+) -> SheetResult:
+    """Tek sayfayı okur ve analiz eder (süreç havuzunda çalışır, modül seviyesinde olmalı)"""
+    t0 = time.perf_counter()
+    try:
+        # pandas openpyxl'i read-only açar; yalnızca istenen sayfa ayrıştırılır
+        df = pd.read_excel(path, sheet_name=sayfa, **read_kwargs)
+        yapi = analyzer(df) if analyzer is not None else None
+    except Exception as e:
+        return SheetResult(sayfa, sira, None, None, time.perf_counter() - t0, f"{type(e).__name__}: {e}")
+    return SheetResult(sayfa, sira, df, yapi, time.perf_counter() - t0)
+
+
+# ==========================================
+# SÜREÇ HAVUZU
+# ==========================================
+_havuz: Optional[ProcessPoolExecutor] = None
+_havuz_boyutu = 0
+_havuz_kilidi = threading.Lock()
+
+
+def default_workers() -> int:
+    """Varsayılan işçi sayısı (DIGICFO_EXCEL_ISCI veya CPU sayısı)"""
+    return max(1, int(os.environ.get('DIGICFO_EXCEL_ISCI', 0)) or os.cpu_count() or 1)
+
+
+def get_pool(max_workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """
+    Süreç boyunca paylaşılan havuz; işçi sayısı değişirse yeniden kurulur.
+
+    Streamlit çok thread'li çalıştığı için fork yerine spawn kullanılır.
+    """
+    global _havuz, _havuz_boyutu
+    isci = max_workers or default_workers()
+    with _havuz_kilidi:
+        if _havuz is None or _havuz_boyutu != isci:
+            if _havuz is not None:
+                _havuz.shutdown(wait=False)
+            _havuz = ProcessPoolExecutor(max_workers=isci, mp_context=multiprocessing.get_context('spawn'))
+            _havuz_boyutu = isci
+        return _havuz
+
+
+def shutdown_pool() -> None:
+    """Paylaşılan havuzu kapatır"""
+    global _havuz, _havuz_boyutu
+    with _havuz_kilidi:
+        if _havuz is not None:
+            _havuz.shutdown(wait=True)
+        _havuz, _havuz_boyutu = None, 0
+
+
+atexit.register(shutdown_pool)
+
+
+# ==========================================
+# OKUMA
+# ==========================================
+def sheet_names(path: str) -> List[str]:
+    """Çalışma kitabındaki sayfa adları (workbook sırasıyla)"""
+    with pd.ExcelFile(path) as kitap:
+        return [str(ad) for ad in kitap.sheet_names]
+
+
+def read_sheets_parallel(
+    kaynak: Union[str, bytes, Any],
+    sheets: Optional[Sequence[str]] = None,
+    analyzer: Optional[Callable[[pd.DataFrame], Any]] = sheet_structure,
+    max_workers: Optional[int] = None,
+    parallel: Optional[bool] = None,
+    dosya_adi: Optional[str] = None,
+    **read_kwargs: Any
+) -> Dict[str, SheetResult]:
+    """
+    Çalışma kitabının sayfalarını eşzamanlı okur ve analiz eder.
+
+    Args:
+        kaynak: Dosya yolu, bayt dizisi veya dosya benzeri nesne (UploadedFile)
+        sheets: Okunacak sayfalar (None ise tümü)
+        analyzer: Her sayfada çalışan analiz fonksiyonu (modül seviyesinde, pickle'lanabilir);
+            None ise yalnızca okunur
+        max_workers: İşçi süreç sayısı (None ise default_workers())
+        parallel: None ise sayfa ve işçi sayısına göre otomatik; False ise sıralı
+        dosya_adi: Bellekteki içeriğin dosya adı (geçici dosyanın uzantısı için;
+            None ise UploadedFile.name, o da yoksa .xlsx)
+        **read_kwargs: pd.read_excel'e iletilen diğer parametreler
+
+    Returns:
+        {sayfa_adı: SheetResult}, çalışma kitabındaki sayfa sırasıyla
+    """
+    gecici = None
+    if isinstance(kaynak, (str, os.PathLike)):
+        path = os.fspath(kaynak)
+    else:
+        # İşçiler dosyayı kendileri açar; bellekteki içerik bir kez diske yazılır
+        veri = kaynak if isinstance(kaynak, bytes) else kaynak.getvalue()
+        # Uzantı motor seçimini belirler (.xls xlrd, .xlsx / .xlsm openpyxl)
+        uzanti = os.path.splitext(dosya_adi or getattr(kaynak, 'name', '') or '')[1] or '.xlsx'
+        with tempfile.NamedTemporaryFile(suffix=uzanti, delete=False) as f:
+            f.write(veri)
+            gecici = path = f.name
+
+    try:
+        tum_sayfalar = sheet_names(path)
+        istenen = None if sheets is None else set(map(str, sheets))
+        hedef = [s for s in tum_sayfalar if istenen is None or s in istenen]
+        isci = max_workers or default_workers()
+        if parallel is None:
+            parallel = isci > 1 and len(hedef) >= PARALEL_MIN_SAYFA
+
+        if parallel:
+            havuz = get_pool(isci)
+            isler = [havuz.submit(_sayfa_isle, path, s, i, analyzer, read_kwargs) for i, s in enumerate(hedef)]
+            sonuclar = [i.result() for i in isler]
+        else:
+            sonuclar = [_sayfa_isle(path, s, i, analyzer, read_kwargs) for i, s in enumerate(hedef)]
+    finally:
+        if gecici is not None:
+            try:
+                os.remove(gecici)
+            except OSError:
+                pass
+
+    # Tamamlanma sırası ne olursa olsun çalışma kitabı sırasıyla birleştirilir
+    return {s.sayfa: s for s in sorted(sonuclar, key=lambda s: s.sira)}
+
+
+def read_excel_multi_sheet_parallel(
+    kaynak: Union[str, bytes, Any],
+    sheets: Optional[Sequence[str]] = None,
+    max_workers: Optional[int] = None,
+    dosya_adi: Optional[str] = None,
+    **read_kwargs: Any
+) -> Dict[str, pd.DataFrame]:
+    """
+    ``pd.read_excel(sheet_name=None)`` biçiminde {sayfa: DataFrame} döndürür (analiz yapılmaz).
+
+    Okunamayan sayfa varsa ilk hata ValueError olarak yükseltilir.
+    """
+    sonuclar = read_sheets_parallel(
+        kaynak, sheets, analyzer=None, max_workers=max_workers, dosya_adi=dosya_adi, **read_kwargs
+    )
+    for sonuc in sonuclar.values():
+        if sonuc.hata:
+            raise ValueError(f"'{sonuc.sayfa}' sayfası okunamadı: {sonuc.hata}")
+    return {ad: sonuc.df for ad, sonuc in sonuclar.items()}
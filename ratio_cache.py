@@ -0,0 +1,144 @@
+"""
+Rasyo düzeyinde içerik adresli önbellek.
+
+``hesapla_rasyolar_cached`` önbellek anahtarı için tüm DataFrame'leri
+özetliyordu; ölçek seçicisi değişince veya Veri Onayı'nda tek bir hücre
+onaylanınca bütün rasyolar yeniden hesaplanıyordu. Bu modülde her rasyonun
+anahtarı şunlardan oluşur:
+
+    - formül seti sürümü (RatioEngine.surum)
+    - rasyonun kullandığı kalemlerin değer özetleri (kalem başına ucuz özet)
+    - dönem sütunları
+
+Böylece tek hücre değişince yalnızca o kalemi kullanan rasyolar yeniden
+hesaplanır. Homojen formüllerde (ör. a / b, a / b * 100) sonuç ölçeksiz veri
+üzerinden saklanır ve ölçek ``çarpan ** derece`` ile uygulanır; ölçek
+değişikliği yeniden hesaplama gerektirmez.
+
+Örnek:
+    tablo = get_ratio_cache().compute(get_ratio_engine(is_banka), kalem_indeksi)
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ratio_engine import RatioEngine
+
+# Saklanacak en fazla rasyo satırı (firma × rasyo × veri sürümü)
+VARSAYILAN_KAYIT = 20_000
+
+
+def item_digest(degerler: np.ndarray) -> bytes:
+    """Kalemin dönem değerlerinin özeti (16 bayt)"""
+    return hashlib.blake2b(np.ascontiguousarray(degerler, dtype='float64').tobytes(), digest_size=16).digest()
+
+
+class RatioCache:
+    """
+    Rasyo satırlarının süreç içi (LRU) önbelleği.
+
+    İstatistikler: isabet / iskalama (rasyo başına) ve son hesaplamada
+    yeniden hesaplanan rasyolar.
+    """
+
+    def __init__(self, max_entries: int = VARSAYILAN_KAYIT):
+        self.max_entries = max_entries
+        self._kayitlar: 'OrderedDict[Tuple, np.ndarray]' = OrderedDict()
+        self._kilit = threading.Lock()
+        self.isabet = 0
+        self.iskalama = 0
+        self.son_hesaplanan: List[str] = []
+
+    @staticmethod
+    def _olcek_anahtari(derece: Optional[int], carpan: float) -> Optional[float]:
+        """Homojen formüllerde ölçek anahtara girmez (sonuç çarpanla ölçeklenir)"""
+        return None if derece is not None and carpan > 0 else carpan
+
+    def compute(self, engine: RatioEngine, kalem_indeksi, use_scale: bool = True) -> pd.DataFrame:
+        """
+        Rasyo tablosu; yalnızca girdisi değişen rasyolar hesaplanır.
+
+        Args:
+            engine: Formül setinin motoru (get_ratio_engine)
+            kalem_indeksi: KalemIndex (get_asc ile aynı veri)
+            use_scale: True ise kalem indeksinin ölçek çarpanı uygulanır
+
+        Returns:
+            pd.DataFrame: satır rasyo, sütun dönem (RatioEngine.evaluate_index ile aynı)
+        """
+        donemler = tuple(kalem_indeksi.date_cols)
+        carpan = float(kalem_indeksi.carpan) if use_scale else 1.0
+        ham = {k: kalem_indeksi.get_array(k, use_scale=False) for k in engine.kalemler}
+        ozetler = {k: item_digest(v) for k, v in ham.items()}
+
+        anahtarlar = []
+        for ad, formul in zip(engine.rasyolar, engine.formulas):
+            anahtarlar.append((
+                engine.surum, ad, donemler, tuple(ozetler[k] for k in formul.kalemler),
+                self._olcek_anahtari(formul.derece, carpan)
+            ))
+
+        satirlar: Dict[int, np.ndarray] = {}
+        eksik: List[int] = []
+        with self._kilit:
+            for i, anahtar in enumerate(anahtarlar):
+                satir = self._kayitlar.get(anahtar)
+                if satir is None:
+                    eksik.append(i)
+                else:
+                    self._kayitlar.move_to_end(anahtar)
+                    satirlar[i] = satir
+            self.isabet += len(satirlar)
+            self.iskalama += len(eksik)
+
+        if eksik:
+            matris = np.vstack([ham[k] for k in engine.kalemler]) if engine.kalemler \
+                else np.zeros((0, len(donemler)))
+            # Homojen olmayan formüller ölçekli veriyle, diğerleri ham veriyle hesaplanır
+            homojen = [i for i in eksik if anahtarlar[i][-1] is None]
+            olcekli = [i for i in eksik if anahtarlar[i][-1] is not None]
+            for grup, girdi in ((homojen, matris), (olcekli, matris * carpan)):
+                if not grup:
+                    continue
+                for i, satir in zip(grup, engine.evaluate_rows(girdi, grup)):
+                    satir.setflags(write=False)
+                    satirlar[i] = satir
+            with self._kilit:
+                for i in eksik:
+                    self._kayitlar[anahtarlar[i]] = satirlar[i]
+                while len(self._kayitlar) > self.max_entries:
+                    self._kayitlar.popitem(last=False)
+        self.son_hesaplanan = [engine.rasyolar[i] for i in eksik]
+
+        sonuc = np.empty((len(engine.rasyolar), len(donemler)), dtype='float64')
+        for i, formul in enumerate(engine.formulas):
+            sonuc[i] = satirlar[i]
+            if anahtarlar[i][-1] is None and formul.derece and carpan != 1.0:
+                sonuc[i] *= carpan ** formul.derece
+        return pd.DataFrame(sonuc, index=pd.Index(engine.rasyolar, name='Rasyo'), columns=list(donemler))
+
+    @staticmethod
+    def dependents(engine: RatioEngine, kalem: str) -> List[str]:
+        """Kalemi kullanan rasyolar"""
+        return [ad for ad, f in zip(engine.rasyolar, engine.formulas) if kalem in f.kalemler]
+
+    def clear(self) -> None:
+        with self._kilit:
+            self._kayitlar.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._kilit:
+            kayit_sayisi = len(self._kayitlar)
+        toplam = self.isabet + self.iskalama
+        return {
+            'kayit_sayisi': kayit_sayisi,
+            'isabet': self.isabet,
+            'iskalama': self.iskalama,
+            'isabet_orani': self.isabet / toplam if toplam else 0.0,
+            'son_hesaplanan': list(self.son_hesaplanan),
+        }
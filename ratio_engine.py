@@ -0,0 +1,370 @@
+"""
+Vektörel rasyo motoru.
+
+``RasyoAnalizi`` / ``hesapla_rasyolar_cached`` rasyoları dönem dönem, her
+kalem için skaler ``get_asc`` aramasıyla hesaplıyordu. Bu modül her formülü
+bir kez derler ve hizalanmış NumPy dizileri üzerinde çalışan tek bir ifadeye
+çevirir:
+
+    - kalemler × dönemler matrisinde tüm rasyolar tüm dönemler için tek geçişte
+    - firmalar × kalemler × dönemler tensöründe bütün sektör tek geçişte
+
+Formül söz dizimi: kalemler köşeli parantez içinde Standart_Kalem adıyla
+yazılır; ``+ - * /``, parantez, sayılar ve ``abs``, ``min``, ``max``,
+``ort`` (dönem ile önceki dönemin ortalaması) kullanılabilir::
+
+    "[Dönen Varlıklar] / [Kısa Vadeli Yükümlülükler]"
+    "[Net Kar/Zarar] / ort([Özkaynaklar]) * 100"
+
+Anlamsal kurallar skaler hesapla aynıdır: veride olmayan kalem ve boş (NaN)
+değer 0 kabul edilir (KalemIndex), payda 0 ise sonuç NaN'dır.
+
+Örnek:
+    motor = get_ratio_engine(is_banka)
+    tablo = motor.evaluate_frame(df, date_cols)          # rasyo × dönem
+    sektor = motor.evaluate_companies(firma_tablolari, date_cols)
+"""
+
+import ast
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+# ==========================================
+# VARSAYILAN FORMÜL SETLERİ
+# ==========================================
+# Kalem adları schemas.py (TMS_UFRS_ESLESTIRME, SEMA_BANKA_*) ile aynıdır
+TICARI_FORMULLER: Dict[str, str] = {
+    "Cari Oran": "[Dönen Varlıklar] / [Kısa Vadeli Yükümlülükler]",
+    "Asit-Test Oranı": "([Dönen Varlıklar] - [Stoklar]) / [Kısa Vadeli Yükümlülükler]",
+    "Nakit Oranı": "[Nakit ve Benzerleri] / [Kısa Vadeli Yükümlülükler]",
+    "Kaldıraç Oranı (%)": "([Kısa Vadeli Yükümlülükler] + [Uzun Vadeli Yükümlülükler]) / [Toplam Varlıklar] * 100",
+    "Borç / Özkaynak": "([Kısa Vadeli Yükümlülükler] + [Uzun Vadeli Yükümlülükler]) / [Özkaynaklar]",
+    "Net Borç / FAVÖK": "([Finansal Borçlar (KV)] + [Finansal Borçlar (UV)] - [Nakit ve Benzerleri]) / [FAVÖK (EBITDA)]",
+    "Brüt Kar Marjı (%)": "[Brüt Kar/Zarar] / [Satış Gelirleri] * 100",
+    "Faaliyet Kar Marjı (%)": "[Faaliyet Karı/Zararı] / [Satış Gelirleri] * 100",
+    "FAVÖK Marjı (%)": "[FAVÖK (EBITDA)] / [Satış Gelirleri] * 100",
+    "Net Kar Marjı (%)": "[Net Kar/Zarar] / [Satış Gelirleri] * 100",
+    "Aktif Karlılığı (ROA, %)": "[Net Kar/Zarar] / [Toplam Varlıklar] * 100",
+    "Özkaynak Karlılığı (ROE, %)": "[Net Kar/Zarar] / [Özkaynaklar] * 100",
+    "Aktif Devir Hızı": "[Satış Gelirleri] / [Toplam Varlıklar]",
+    "Stok Devir Hızı": "abs([Satışların Maliyeti (-)]) / [Stoklar]",
+    "Alacak Devir Hızı": "[Satış Gelirleri] / [Ticari Alacaklar]",
+}
+
+BANKA_FORMULLER: Dict[str, str] = {
+    "Kredi / Mevduat (%)": "[Krediler (Net)] / [Mevduat] * 100",
+    "Sermaye Yeterliliği (Özkaynak / Aktif, %)": "[Özkaynaklar] / [Toplam Varlıklar] * 100",
+    "Kaldıraç (Yükümlülük / Özkaynak)": "[Toplam Yükümlülükler] / [Özkaynaklar]",
+    "Likit Aktif Oranı (%)": "([Nakit Değerler ve MB] + [Bankalar]) / [Toplam Varlıklar] * 100",
+    "Net Faiz Marjı (%)": "[Net Faiz Geliri] / [Toplam Varlıklar] * 100",
+    "Aktif Karlılığı (ROA, %)": "[Net Kar/Zarar] / [Toplam Varlıklar] * 100",
+    "Özkaynak Karlılığı (ROE, %)": "[Net Kar/Zarar] / [Özkaynaklar] * 100",
+    "Maliyet / Gelir (%)": "abs([Faaliyet Giderleri (-)]) / ([Net Faiz Geliri] + [Net Ücret ve Komisyon]) * 100",
+    "Karşılık / Net Faiz Geliri (%)": "abs([Kredi Karşılık Giderleri (-)]) / [Net Faiz Geliri] * 100",
+}
+
+
+# ==========================================
+# DERLEYİCİ
+# ==========================================
+_KALEM_DESENI = re.compile(r"\[([^\[\]]+)\]")
+
+_IKILI = (ast.Add, ast.Sub, ast.Mult, ast.Div)
+_TEKLI = (ast.UAdd, ast.USub)
+
+
+class FormulHatasi(ValueError):
+    """Formül ayrıştırılamadı veya izin verilmeyen bir ifade içeriyor"""
+
+
+def _bol(pay: np.ndarray, payda: np.ndarray) -> np.ndarray:
+    """Bölme; payda 0 olan hücreler NaN (skaler ``if payda != 0`` kontrolü)"""
+    pay, payda = np.broadcast_arrays(np.asarray(pay, dtype='float64'), np.asarray(payda, dtype='float64'))
+    sonuc = np.full(pay.shape, np.nan)
+    np.divide(pay, payda, out=sonuc, where=payda != 0)
+    return sonuc
+
+
+def _ort(x: np.ndarray) -> np.ndarray:
+    """Dönem ile önceki dönemin ortalaması (ilk dönemde kendisi); son eksen dönemdir"""
+    x = np.asarray(x, dtype='float64')
+    onceki = np.concatenate([x[..., :1], x[..., :-1]], axis=-1)
+    return (x + onceki) / 2
+
+
+_FONKSIYONLAR: Dict[str, Callable] = {
+    'abs': np.abs,
+    'min': np.minimum,
+    'max': np.maximum,
+    'ort': _ort,
+}
+
+
+class _BolmeDonusturucu(ast.NodeTransformer):
+    """``a / b`` düğümlerini ``_bol(a, b)`` çağrısına çevirir"""
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        if isinstance(node.op, ast.Div):
+            return ast.copy_location(
+                ast.Call(func=ast.Name(id='_bol', ctx=ast.Load()), args=[node.left, node.right], keywords=[]),
+                node
+            )
+        return node
+
+
+def _dogrula(agac: ast.AST, ifade: str) -> None:
+    for dugum in ast.walk(agac):
+        if isinstance(dugum, (ast.Expression, ast.Load)):
+            continue
+        if isinstance(dugum, ast.BinOp) and isinstance(dugum.op, _IKILI):
+            continue
+        if isinstance(dugum, ast.UnaryOp) and isinstance(dugum.op, _TEKLI):
+            continue
+        if isinstance(dugum, _IKILI + _TEKLI):
+            continue
+        if isinstance(dugum, ast.Constant) and isinstance(dugum.value, (int, float)):
+            continue
+        if isinstance(dugum, ast.Name) and (dugum.id.startswith('_k') or dugum.id in _FONKSIYONLAR):
+            continue
+        if isinstance(dugum, ast.Call) and isinstance(dugum.func, ast.Name) and dugum.func.id in _FONKSIYONLAR \
+                and not dugum.keywords:
+            continue
+        raise FormulHatasi(f"İzin verilmeyen ifade ({type(dugum).__name__}): {ifade}")
+
+
+def _derece(dugum: ast.AST) -> Optional[int]:
+    """
+    Formülün kalemlere göre homojenlik derecesi.
+
+    Tüm kalemler s ile çarpılınca sonuç s**derece ile çarpılır (ör. a / b: 0,
+    a * b: 2). ``a + 1`` gibi homojen olmayan formüllerde None.
+    """
+    if isinstance(dugum, ast.Expression):
+        return _derece(dugum.body)
+    if isinstance(dugum, ast.Constant):
+        return 0
+    if isinstance(dugum, ast.Name):
+        return 1
+    if isinstance(dugum, ast.UnaryOp):
+        return _derece(dugum.operand)
+    if isinstance(dugum, ast.BinOp):
+        sol, sag = _derece(dugum.left), _derece(dugum.right)
+        if sol is None or sag is None:
+            return None
+        if isinstance(dugum.op, ast.Mult):
+            return sol + sag
+        if isinstance(dugum.op, ast.Div):
+            return sol - sag
+        return sol if sol == sag else None
+    if isinstance(dugum, ast.Call):
+        dereceler = {_derece(a) for a in dugum.args}
+        return dereceler.pop() if len(dereceler) == 1 else None
+    return None
+
+
+@dataclass(frozen=True)
+class DerlenmisFormul:
+    """Derlenmiş rasyo formülü: kullandığı kalemler, homojenlik derecesi ve NumPy ifadesi"""
+    ifade: str
+    kalemler: Tuple[str, ...]
+    kod: Any
+    derece: Optional[int] = None
+
+    def __call__(self, degerler: Sequence[np.ndarray]) -> np.ndarray:
+        yerel = {f"_k{i}": d for i, d in enumerate(degerler)}
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            return np.asarray(eval(self.kod, _ORTAM, yerel), dtype='float64')
+
+
+_ORTAM = {'__builtins__': {}, '_bol': _bol, **_FONKSIYONLAR}
+
+
+@lru_cache(maxsize=1024)
+def compile_formula(ifade: str) -> DerlenmisFormul:
+    """
+    Formülü derler (aynı metin bir kez derlenir).
+
+    Raises:
+        FormulHatasi: Söz dizimi hatası veya izin verilmeyen ifade
+    """
+    kalemler: List[str] = []
+
+    def _yer_tutucu(eslesme: 're.Match') -> str:
+        ad = eslesme.group(1).strip()
+        if ad not in kalemler:
+            kalemler.append(ad)
+        return f"_k{kalemler.index(ad)}"
+
+    kaynak = _KALEM_DESENI.sub(_yer_tutucu, ifade)
+    try:
+        agac = ast.parse(kaynak.strip(), mode='eval')
+    except SyntaxError as e:
+        raise FormulHatasi(f"Formül ayrıştırılamadı: {ifade}") from e
+    _dogrula(agac, ifade)
+    derece = _derece(agac)
+    agac = ast.fix_missing_locations(_BolmeDonusturucu().visit(agac))
+    return DerlenmisFormul(ifade, tuple(kalemler), compile(agac, f"<rasyo: {ifade}>", 'eval'), derece)
+
+
+# ==========================================
+# MOTOR
+# ==========================================
+class RatioEngine:
+    """
+    Bir formül setinin derlenmiş hâli.
+
+    Girdi tensörünün son iki ekseni kalem × dönemdir; önündeki eksenler
+    (ör. firma) olduğu gibi korunur. Çıktı ``(..., rasyo, dönem)`` olur.
+    """
+
+    def __init__(self, formuller: Mapping[str, str]):
+        self.formuller = dict(formuller)
+        self.rasyolar: List[str] = list(self.formuller)
+        self._derlenmis = [compile_formula(f) for f in self.formuller.values()]
+        kalemler: List[str] = []
+        for d in self._derlenmis:
+            kalemler.extend(k for k in d.kalemler if k not in kalemler)
+        self.kalemler: List[str] = kalemler
+        self._konum = {k: i for i, k in enumerate(kalemler)}
+        # Formül seti sürümü: formüllerden biri değişince önbellek anahtarları da değişir
+        self.surum = hashlib.blake2b(
+            json.dumps(list(self.formuller.items()), ensure_ascii=False).encode('utf-8'), digest_size=8
+        ).hexdigest()
+
+    @property
+    def formulas(self) -> List[DerlenmisFormul]:
+        """Derlenmiş formüller (self.rasyolar sırasıyla)"""
+        return list(self._derlenmis)
+
+    def evaluate_rows(self, tensor: np.ndarray, rasyo_sirasi: Sequence[int]) -> np.ndarray:
+        """Yalnızca verilen rasyoları hesaplar; çıktı (..., len(rasyo_sirasi), dönem)"""
+        tensor = np.nan_to_num(np.asarray(tensor, dtype='float64'), nan=0.0)
+        sonuc = np.empty(tensor.shape[:-2] + (len(rasyo_sirasi), tensor.shape[-1]), dtype='float64')
+        for j, i in enumerate(rasyo_sirasi):
+            formul = self._derlenmis[i]
+            sonuc[..., j, :] = formul([tensor[..., self._konum[k], :] for k in formul.kalemler])
+        return sonuc
+
+    def evaluate(self, tensor: np.ndarray) -> np.ndarray:
+        """
+        Tüm rasyoları tek geçişte hesaplar.
+
+        Args:
+            tensor: (..., len(self.kalemler), dönem) float dizi; kalem ekseni
+                self.kalemler sırasındadır (bkz. align)
+
+        Returns:
+            np.ndarray: (..., len(self.rasyolar), dönem) float64
+        """
+        if np.shape(tensor)[-2] != len(self.kalemler):
+            raise ValueError(f"Kalem ekseni {len(self.kalemler)} olmalı, {np.shape(tensor)[-2]} verildi")
+        return self.evaluate_rows(tensor, range(len(self.rasyolar)))
+
+    def align(
+        self,
+        df: pd.DataFrame,
+        date_cols: Sequence[Any],
+        item_col: str = 'Standart_Kalem'
+    ) -> np.ndarray:
+        """
+        Çerçeveyi motorun kalem sırasına hizalı (kalem, dönem) matrise çevirir.
+
+        Aynı kalem birden fazla satırda geçiyorsa ilk satır kullanılır
+        (KalemIndex ile aynı); olmayan kalemler ve dönemler 0'dır.
+        """
+        matris = np.zeros((len(self.kalemler), len(date_cols)), dtype='float64')
+        if df is None or df.empty or item_col not in df.columns:
+            return matris
+        ilk = df.loc[~df[item_col].duplicated(keep='first')]
+        satirlar = pd.Index(ilk[item_col]).get_indexer(self.kalemler)
+        bulunan = satirlar >= 0
+        mevcut = [i for i, c in enumerate(date_cols) if c in df.columns]
+        if bulunan.any() and mevcut:
+            degerler = ilk[[date_cols[i] for i in mevcut]].apply(pd.to_numeric, errors='coerce')
+            matris[np.ix_(np.flatnonzero(bulunan), mevcut)] = np.nan_to_num(
+                degerler.to_numpy(dtype='float64', na_value=np.nan)[satirlar[bulunan]], nan=0.0
+            )
+        return matris
+
+    def evaluate_frame(
+        self,
+        df: pd.DataFrame,
+        date_cols: Sequence[Any],
+        item_col: str = 'Standart_Kalem',
+        scale: float = 1.0
+    ) -> pd.DataFrame:
+        """Tek firmanın rasyo tablosu (satır: rasyo, sütun: dönem)"""
+        sonuc = self.evaluate(self.align(df, date_cols, item_col) * scale)
+        return pd.DataFrame(sonuc, index=pd.Index(self.rasyolar, name='Rasyo'), columns=list(date_cols))
+
+    def evaluate_index(self, kalem_indeksi, use_scale: bool = True) -> pd.DataFrame:
+        """KalemIndex'ten (get_asc ile aynı veri ve ölçek) rasyo tablosu"""
+        matris = np.vstack([kalem_indeksi.get_array(k, use_scale) for k in self.kalemler]) \
+            if self.kalemler else np.zeros((0, len(kalem_indeksi.date_cols)))
+        return pd.DataFrame(
+            self.evaluate(matris), index=pd.Index(self.rasyolar, name='Rasyo'), columns=list(kalem_indeksi.date_cols)
+        )
+
+    def stack(
+        self,
+        frames: Mapping[Any, pd.DataFrame],
+        date_cols: Sequence[Any],
+        item_col: str = 'Standart_Kalem'
+    ) -> np.ndarray:
+        """Firma çerçevelerini (firma, kalem, dönem) tensörüne dizer"""
+        tensor = np.zeros((len(frames), len(self.kalemler), len(date_cols)), dtype='float64')
+        for i, df in enumerate(frames.values()):
+            tensor[i] = self.align(df, date_cols, item_col)
+        return tensor
+
+    def evaluate_companies(
+        self,
+        frames: Mapping[Any, pd.DataFrame],
+        date_cols: Sequence[Any],
+        item_col: str = 'Standart_Kalem'
+    ) -> pd.DataFrame:
+        """
+        Birden fazla firmanın rasyoları tek geçişte.
+
+        Returns:
+            pd.DataFrame: (Firma, Rasyo) çok düzeyli indeks, dönem sütunları
+        """
+        sonuc = self.evaluate(self.stack(frames, date_cols, item_col))
+        indeks = pd.MultiIndex.from_product([list(frames), self.rasyolar], names=['Firma', 'Rasyo'])
+        return pd.DataFrame(sonuc.reshape(-1, len(date_cols)), index=indeks, columns=list(date_cols))
+
+
+@lru_cache(maxsize=8)
+def _motor(formuller: Tuple[Tuple[str, str], ...]) -> RatioEngine:
+    return RatioEngine(dict(formuller))
+
+
+def get_ratio_engine(is_banka: bool = False, formuller: Optional[Mapping[str, str]] = None) -> RatioEngine:
+    """
+    Ticari veya banka formül setinin motoru (formül seti başına bir kez derlenir).
+
+    Args:
+        is_banka: True ise BANKA_FORMULLER, değilse TICARI_FORMULLER
+        formuller: Varsayılan seti geçersiz kılan {rasyo: formül} eşlemesi
+    """
+    secili = formuller if formuller is not None else (BANKA_FORMULLER if is_banka else TICARI_FORMULLER)
+    return _motor(tuple(secili.items()))
+
+
+def hesapla_rasyolar_vektorel(
+    df: pd.DataFrame,
+    date_cols: Sequence[Any],
+    is_banka: bool = False,
+    item_col: str = 'Standart_Kalem',
+    scale: float = 1.0
+) -> pd.DataFrame:
+    """Tüm dönemler için rasyo tablosu (hesapla_rasyolar_cached'in vektörel karşılığı)"""
+    return get_ratio_engine(is_banka).evaluate_frame(df, date_cols, item_col, scale)
@@ -0,0 +1,398 @@
+"""
+Türetilmiş tablolar için artımsal yeniden hesaplama grafiği.
+
+Veri Kontrol veya Veri Onayı'nda tek bir değerin düzenlenmesi, ondan
+türetilen her şeyi (üç finansal tablo, rasyolar, Büyük Veri ana tablosu,
+DuPont, Senaryo) geçersiz kılıyordu. Bu modülde her türetilmiş çıktı bir
+düğümdür ve girdi kalemlerini ve bağlı olduğu diğer düğümleri bildirir:
+
+    - ``update(kalem_indeksi)`` kalemlerin değer özetlerini önceki
+      çalıştırmayla karşılaştırır; yalnızca değişen kalemleri kullanan
+      düğümler ve onlara bağlı düğümler yeniden hesaplanır
+    - Yeniden hesaplanan bir düğümün sonucu değişmediyse ona bağlı düğümler
+      hesaplanmaz
+    - Her düğüm için son / toplam süre, hesaplama ve atlanma sayıları tutulur
+      (``timings``)
+
+Düğümler eklenme sırasıyla çalışır; bir düğüm yalnızca kendinden önce
+eklenmiş düğümlere bağlanabilir (grafik her zaman döngüsüzdür). Kalem
+özetleri yalnızca tüm düğümler başarıyla çalıştıktan sonra kaydedilir; bir
+düğüm hata verirse sonraki ``update`` aynı kalemleri yine değişmiş sayar ve
+o çalıştırmada sonucu değişen düğümlerin bağımlıları da yeniden hesaplanır.
+
+Örnek:
+    graf = RecomputeGraph()
+    fn, kalemler = formula_node({"Toplam Varlıklar": "[Dönen Varlıklar] + [Duran Varlıklar]"})
+    graf.add('bilanco', fn, kalemler)
+    sonuclar = graf.update(kalem_indeksi)
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ratio_cache import item_digest
+from ratio_engine import RatioEngine, get_ratio_engine
+
+# Grafiğin session_state anahtarı
+STATE_KEY = '_turetilmis_grafik'
+
+# Düğüm durumları
+HESAPLANDI = 'hesaplandı'
+DEGISMEDI = 'değişmedi'   # Yeniden hesaplandı ama sonuç aynı (bağlı düğümler atlandı)
+GUNCEL = 'güncel'
+HATA = 'hata'             # Düğüm fonksiyonu hata verdi (özetler kaydedilmedi)
+
+
+@dataclass
+class DugumGirdisi:
+    """Düğüm fonksiyonuna verilen girdiler"""
+    kalemler: Dict[str, np.ndarray]
+    sonuclar: Dict[str, Any]
+    donemler: List[Any]
+    kaynak: Any = None
+
+
+@dataclass
+class Dugum:
+    """Grafikteki türetilmiş çıktı"""
+    ad: str
+    fn: Callable[[DugumGirdisi], Any]
+    kalemler: Tuple[str, ...] = ()
+    bagimliliklar: Tuple[str, ...] = ()
+    # İstatistikler
+    son_sure: float = 0.0
+    toplam_sure: float = 0.0
+    hesaplama: int = 0
+    atlama: int = 0
+    son_durum: str = GUNCEL
+
+
+def _esit(eski: Any, yeni: Any) -> bool:
+    """İki düğüm sonucu aynı mı (DataFrame / dizi / diğer)"""
+    if eski is None or type(eski) is not type(yeni):
+        return False
+    if isinstance(yeni, (pd.DataFrame, pd.Series)):
+        return eski.equals(yeni)
+    if isinstance(yeni, np.ndarray):
+        return eski.shape == yeni.shape and np.array_equal(eski, yeni, equal_nan=True)
+    try:
+        return bool(eski == yeni)
+    except Exception:
+        return False
+
+
+class RecomputeGraph:
+    """Kalem düzeyinde bağımlılık izleyen artımsal hesaplama grafiği"""
+
+    def __init__(self):
+        self._dugumler: Dict[str, Dugum] = {}
+        self._sonuclar: Dict[str, Any] = {}
+        self._ozetler: Dict[str, bytes] = {}
+        self._donemler: Optional[Tuple] = None
+        # Yarıda kalan çalıştırmalarda sonucu değişen düğümler (bağımlıları henüz hesaplanmadı)
+        self._bekleyen_kirli: set = set()
+        self.son_hesaplanan: List[str] = []
+
+    # --- Kurulum ---
+    def add(
+        self,
+        ad: str,
+        fn: Callable[[DugumGirdisi], Any],
+        kalemler: Iterable[str] = (),
+        bagimliliklar: Iterable[str] = ()
+    ) -> 'RecomputeGraph':
+        """
+        Düğüm ekler.
+
+        Args:
+            ad: Düğüm adı (benzersiz)
+            fn: DugumGirdisi alan ve sonucu döndüren fonksiyon
+            kalemler: Düğümün okuduğu kalemler (Standart_Kalem adları)
+            bagimliliklar: Sonucunu kullandığı, daha önce eklenmiş düğümler
+
+        Raises:
+            ValueError: Ad kullanılmışsa veya bağımlılık henüz eklenmemişse
+        """
+        if ad in self._dugumler:
+            raise ValueError(f"Düğüm zaten var: {ad}")
+        bagimliliklar = tuple(bagimliliklar)
+        eksik = [b for b in bagimliliklar if b not in self._dugumler]
+        if eksik:
+            raise ValueError(f"{ad} için bilinmeyen bağımlılık: {', '.join(eksik)}")
+        self._dugumler[ad] = Dugum(ad, fn, tuple(dict.fromkeys(kalemler)), bagimliliklar)
+        return self
+
+    @property
+    def kalemler(self) -> List[str]:
+        """Grafiğin okuduğu tüm kalemler"""
+        return list(dict.fromkeys(k for d in self._dugumler.values() for k in d.kalemler))
+
+    def dependents(self, kalemler: Iterable[str]) -> List[str]:
+        """Kalemlerden etkilenen düğümler (doğrudan ve dolaylı, çalışma sırasıyla)"""
+        degisen = set(kalemler)
+        etkilenen: List[str] = []
+        for ad, dugum in self._dugumler.items():
+            if degisen.intersection(dugum.kalemler) or any(b in etkilenen for b in dugum.bagimliliklar):
+                etkilenen.append(ad)
+        return etkilenen
+
+    # --- Çalıştırma ---
+    def _kalem_degerleri(self, kaynak: Any, donemler: Sequence[Any]) -> Dict[str, np.ndarray]:
+        if hasattr(kaynak, 'get_array'):
+            return {k: kaynak.get_array(k) for k in self.kalemler}
+        bos = np.zeros(len(donemler), dtype='float64')
+        return {
+            k: np.nan_to_num(np.asarray(kaynak[k], dtype='float64'), nan=0.0) if k in kaynak else bos
+            for k in self.kalemler
+        }
+
+    def update(
+        self,
+        kaynak: Any,
+        donemler: Optional[Sequence[Any]] = None,
+        zorla: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Değişen kalemlerden etkilenen düğümleri yeniden hesaplar.
+
+        Args:
+            kaynak: KalemIndex (get_array, date_cols) veya {kalem: dizi} eşlemesi
+            donemler: Dönem sütunları (KalemIndex için date_cols kullanılır)
+            zorla: True ise tüm düğümler hesaplanır
+
+        Returns:
+            dict: düğüm adı -> sonuç
+
+        Raises:
+            Exception: Düğüm fonksiyonunun hatası (kalem özetleri ve dönemler
+                önceki çalıştırmadaki gibi kalır)
+        """
+        donemler = list(getattr(kaynak, 'date_cols', donemler or []))
+        degerler = self._kalem_degerleri(kaynak, donemler)
+        ozetler = {k: item_digest(v) for k, v in degerler.items()}
+
+        if zorla or self._donemler != tuple(donemler):
+            degisen = set(ozetler)
+            zorla = True
+        else:
+            degisen = {k for k, o in ozetler.items() if self._ozetler.get(k) != o}
+
+        kirli: set = set(self._bekleyen_kirli)
+        self.son_hesaplanan = []
+        try:
+            self._calistir(kaynak, donemler, degerler, degisen, kirli, zorla)
+        except Exception:
+            self._bekleyen_kirli = kirli
+            raise
+        # Özetler yalnızca tüm düğümler çalıştıktan sonra kaydedilir
+        self._ozetler = ozetler
+        self._donemler = tuple(donemler)
+        self._bekleyen_kirli = set()
+        return dict(self._sonuclar)
+
+    def _calistir(
+        self,
+        kaynak: Any,
+        donemler: List[Any],
+        degerler: Dict[str, np.ndarray],
+        degisen: set,
+        kirli: set,
+        zorla: bool
+    ) -> None:
+        """Gerekli düğümleri sırayla çalıştırır; sonucu değişen düğümler ``kirli`` kümesine eklenir"""
+        for ad, dugum in self._dugumler.items():
+            gerekli = (
+                zorla or ad not in self._sonuclar
+                or degisen.intersection(dugum.kalemler)
+                or kirli.intersection(dugum.bagimliliklar)
+            )
+            if not gerekli:
+                dugum.atlama += 1
+                dugum.son_durum = GUNCEL
+                continue
+            girdi = DugumGirdisi(
+                kalemler={k: degerler[k] for k in dugum.kalemler},
+                sonuclar={b: self._sonuclar.get(b) for b in dugum.bagimliliklar},
+                donemler=donemler,
+                kaynak=kaynak,
+            )
+            t0 = time.perf_counter()
+            try:
+                sonuc = dugum.fn(girdi)
+            except Exception:
+                dugum.son_sure = time.perf_counter() - t0
+                dugum.son_durum = HATA
+                raise
+            dugum.son_sure = time.perf_counter() - t0
+            dugum.toplam_sure += dugum.son_sure
+            dugum.hesaplama += 1
+            self.son_hesaplanan.append(ad)
+            if not zorla and _esit(self._sonuclar.get(ad), sonuc):
+                dugum.son_durum = DEGISMEDI
+            else:
+                dugum.son_durum = HESAPLANDI
+                kirli.add(ad)
+            self._sonuclar[ad] = sonuc
+
+    def __getitem__(self, ad: str) -> Any:
+        return self._sonuclar[ad]
+
+    def __contains__(self, ad: str) -> bool:
+        return ad in self._sonuclar
+
+    @property
+    def results(self) -> Dict[str, Any]:
+        return dict(self._sonuclar)
+
+    def timings(self) -> List[Dict[str, Any]]:
+        """Düğüm başına süre istatistikleri (profil için)"""
+        return [
+            {
+                'Düğüm': d.ad,
+                'Durum': d.son_durum,
+                'Son (ms)': round(d.son_sure * 1000, 2),
+                'Toplam (ms)': round(d.toplam_sure * 1000, 1),
+                'Hesaplama': d.hesaplama,
+                'Atlama': d.atlama,
+                'Kalem': len(d.kalemler),
+            }
+            for d in self._dugumler.values()
+        ]
+
+
+# ==========================================
+# HAZIR DÜĞÜMLER
+# ==========================================
+def formula_node(formuller: Mapping[str, str]) -> Tuple[Callable[[DugumGirdisi], pd.DataFrame], List[str]]:
+    """
+    Formül setinden düğüm fonksiyonu (ratio_engine söz dizimi).
+
+    Returns:
+        (fn, kalemler): fn satırları formül adı, sütunları dönem olan tablo döndürür
+    """
+    motor = RatioEngine(formuller)
+
+    def _hesapla(girdi: DugumGirdisi) -> pd.DataFrame:
+        matris = np.vstack([girdi.kalemler[k] for k in motor.kalemler]) if motor.kalemler \
+            else np.zeros((0, len(girdi.donemler)))
+        return pd.DataFrame(motor.evaluate(matris), index=motor.rasyolar, columns=girdi.donemler)
+
+    return _hesapla, list(motor.kalemler)
+
+
+def ratio_node(motor: RatioEngine, onbellek=None) -> Callable[[DugumGirdisi], pd.DataFrame]:
+    """Rasyo tablosu düğümü; kaynak KalemIndex ise rasyo önbelleği kullanılır"""
+    def _hesapla(girdi: DugumGirdisi) -> pd.DataFrame:
+        if onbellek is not None and hasattr(girdi.kaynak, 'carpan'):
+            return onbellek.compute(motor, girdi.kaynak)
+        matris = np.vstack([girdi.kalemler[k] for k in motor.kalemler])
+        return pd.DataFrame(
+            motor.evaluate(matris), index=pd.Index(motor.rasyolar, name='Rasyo'), columns=girdi.donemler
+        )
+    return _hesapla
+
+
+def _sankey_akislari(girdi: DugumGirdisi) -> pd.DataFrame:
+    """Gelir tablosu akışları: (kaynak, hedef) satırları, dönem sütunları"""
+    gelir = girdi.sonuclar['gelir_tablosu']
+    k = girdi.kalemler
+    akislar = [
+        ("Satış Gelirleri", "Satışların Maliyeti", np.abs(k["Satışların Maliyeti (-)"])),
+        ("Satış Gelirleri", "Brüt Kar", gelir.loc["Brüt Kar"].to_numpy()),
+        ("Brüt Kar", "Faaliyet Giderleri", np.abs(k["Faaliyet Giderleri (-)"])),
+        ("Brüt Kar", "Faaliyet Karı", gelir.loc["Faaliyet Karı"].to_numpy()),
+        ("Faaliyet Karı", "Vergi", np.abs(k["Vergi (-)"])),
+        ("Faaliyet Karı", "Net Kar", k["Net Kar/Zarar"]),
+    ]
+    indeks = pd.MultiIndex.from_tuples([(a, b) for a, b, _ in akislar], names=['Kaynak', 'Hedef'])
+    return pd.DataFrame(np.vstack([np.clip(d, 0, None) for *_, d in akislar]), index=indeks, columns=girdi.donemler)
+
+
+# Finansal tablo toplamları (ticari)
+TICARI_TOPLAMLAR: Dict[str, Dict[str, str]] = {
+    'gelir_tablosu': {
+        "Brüt Kar": "[Satış Gelirleri] - abs([Satışların Maliyeti (-)])",
+        "Faaliyet Karı": "[Satış Gelirleri] - abs([Satışların Maliyeti (-)]) - abs([Faaliyet Giderleri (-)])",
+        "FAVÖK": "[Faaliyet Karı/Zararı] + abs([Amortisman ve İtfa])",
+        "Net Kar": "[Net Kar/Zarar]",
+    },
+    'bilanco': {
+        "Toplam Varlıklar": "[Dönen Varlıklar] + [Duran Varlıklar]",
+        "Toplam Kaynaklar": "[Kısa Vadeli Yükümlülükler] + [Uzun Vadeli Yükümlülükler] + [Özkaynaklar]",
+        "Denklik Farkı": "[Dönen Varlıklar] + [Duran Varlıklar] - [Kısa Vadeli Yükümlülükler] "
+                         "- [Uzun Vadeli Yükümlülükler] - [Özkaynaklar]",
+    },
+    'nakit_akis': {
+        "Net Nakit Değişimi": "[İşletme Faaliyetlerinden Nakit] + [Yatırım Faaliyetlerinden Nakit] "
+                              "+ [Finansman Faaliyetlerinden Nakit]",
+        "Serbest Nakit Akışı": "[İşletme Faaliyetlerinden Nakit] + [Yatırım Faaliyetlerinden Nakit]",
+    },
+}
+
+# Finansal tablo toplamları (banka)
+BANKA_TOPLAMLAR: Dict[str, Dict[str, str]] = {
+    'gelir_tablosu': {
+        "Net Faiz Geliri": "[Faiz Gelirleri] - abs([Faiz Giderleri (-)])",
+        "Faaliyet Geliri": "[Net Faiz Geliri] + [Net Ücret ve Komisyon] + [Ticari Kar/Zarar] "
+                           "+ [Diğer Faaliyet Gelirleri]",
+        "Net Kar": "[Net Kar/Zarar]",
+    },
+    'bilanco': {
+        "Toplam Varlıklar": "[Toplam Varlıklar]",
+        "Toplam Kaynaklar": "[Toplam Yükümlülükler] + [Özkaynaklar]",
+        "Denklik Farkı": "[Toplam Varlıklar] - [Toplam Yükümlülükler] - [Özkaynaklar]",
+    },
+}
+
+# DuPont ayrıştırması: ROE = net kar marjı × aktif devir hızı × finansal kaldıraç
+DUPONT_FORMULLERI: Dict[str, str] = {
+    "Net Kar Marjı": "[Net Kar/Zarar] / [Satış Gelirleri]",
+    "Aktif Devir Hızı": "[Satış Gelirleri] / [Toplam Varlıklar]",
+    "Finansal Kaldıraç": "[Toplam Varlıklar] / [Özkaynaklar]",
+    "ROE": "[Net Kar/Zarar] / [Satış Gelirleri] * ([Satış Gelirleri] / [Toplam Varlıklar]) "
+           "* ([Toplam Varlıklar] / [Özkaynaklar])",
+}
+
+
+def build_default_graph(is_banka: bool = False, ratio_cache=None) -> RecomputeGraph:
+    """
+    Uygulamanın türetilmiş tabloları: finansal tablo toplamları, rasyolar,
+    Sankey akışları (ticari) ve DuPont.
+
+    Büyük Veri ana tablosu gibi diğer çıktılar ``graf.add(...)`` ile eklenir.
+    """
+    graf = RecomputeGraph()
+    for ad, formuller in (BANKA_TOPLAMLAR if is_banka else TICARI_TOPLAMLAR).items():
+        fn, kalemler = formula_node(formuller)
+        graf.add(ad, fn, kalemler)
+
+    motor = get_ratio_engine(is_banka)
+    graf.add('rasyolar', ratio_node(motor, ratio_cache), motor.kalemler)
+
+    if not is_banka:
+        graf.add(
+            'sankey', _sankey_akislari,
+            ["Satışların Maliyeti (-)", "Faaliyet Giderleri (-)", "Vergi (-)", "Net Kar/Zarar"],
+            ['gelir_tablosu']
+        )
+        fn, kalemler = formula_node(DUPONT_FORMULLERI)
+        graf.add('dupont', fn, kalemler)
+    return graf
+
+
+def get_recompute_graph(
+    state: MutableMapping[str, Any],
+    is_banka: bool = False,
+    ratio_cache=None,
+    key: str = STATE_KEY
+) -> RecomputeGraph:
+    """Oturumdaki grafik (ticari / banka değişince yeniden kurulur)"""
+    kayit = state.get(key)
+    if kayit is None or kayit[0] != is_banka:
+        kayit = (is_banka, build_default_graph(is_banka, ratio_cache))
+        state[key] = kayit
+    return kayit[1]
@@ -0,0 +1,410 @@
+"""
+Banka şemaları ve TMS/UFRS hesap eşleştirme tablosu.
+
+Standartlaştırma sırasında ham hesap adları bu şemalardaki alias listeleri
+ile eşleştirilir (bkz. alias_matcher.py).
+"""
+
+# --- BANKA ŞEMALARI ---
+SEMA_BANKA_GELIR = {
+    "Faiz Gelirleri": ["faiz gelirleri", "interest income", "kredilerden alınan faizler"],
+    "Faiz Giderleri (-)": ["faiz giderleri", "interest expenses", "mevduata verilen faizler"],
+    "Net Faiz Geliri": ["net faiz geliri", "net interest income", "net faiz gelir/gideri"],
+    "Net Ücret ve Komisyon": ["net ücret ve komisyon", "net fee and commission", "ücret ve komisyon gelirleri"],
+    "Ticari Kar/Zarar": ["ticari kar", "ticari zarar", "ticari kar/zarar (net)", "sermaye piyasası işlemleri karı"],
+    "Diğer Faaliyet Gelirleri": ["diğer faaliyet gelirleri", "other operating income"],
+    "Faaliyet Giderleri (-)": ["faaliyet giderleri", "personel giderleri", "genel yönetim giderleri", "diğer faaliyet giderleri"],
+    "Kredi Karşılık Giderleri (-)": ["kredi karşılık", "beklenen kredi zarar", "provision for loan losses", "karşılık giderleri"],
+    "Vergi Öncesi Kar": ["vergi öncesi kar", "profit before tax", "sürdürülen faaliyetler vergi öncesi"],
+    "Vergi (-)": ["vergi", "tax", "vergi karşılığı"],
+    "Net Kar/Zarar": ["net dönem karı", "net kar/zarar", "net income", "dönem net karı", "dönem karı"]
+}
+
+SEMA_BANKA_BILANCO = {
+    "Nakit Değerler ve MB": ["nakit değerler", "merkez bankası", "kasa", "cash and central bank"],
+    "Gerçeğe Uygun Değer Farkı FV": ["gerçeğe uygun değer", "finansal varlıklar", "alım satım amaçlı"],
+    "Bankalar": ["bankalar", "banks"],
+    "Krediler (Net)": ["krediler", "loans", "canlı krediler", "takipteki krediler"],
+    "Menkul Değerler": ["menkul değerler", "yatırım amaçlı menkul kıymetler", "gerçeğe uygun değeri kar/zarara"],
+    "Maddi Duran Varlıklar": ["maddi duran varlıklar", "sabit kıymetler", "demirbaşlar"],
+    "Ertelenmiş Vergi Varlığı": ["ertelenmiş vergi varlığı", "deferred tax asset"],
+    "Toplam Varlıklar": ["toplam varlıklar", "toplam aktifler", "aktif toplamı", "total assets"],
+    
+    "Mevduat": ["mevduat", "deposits", "toplam mevduat", "müşteri mevduatı"],
+    "Alınan Krediler": ["alınan krediler", "funds borrowed", "kredi kuruluşlarına borçlar"],
+    "İhraç Edilen Menkul Kıymetler": ["ihraç edilen menkul", "issued securities"],
+    "Muhtelif Borçlar": ["muhtelif borçlar", "other liabilities"],
+    "Toplam Yükümlülükler": ["toplam yükümlülükler", "toplam borçlar", "toplam pasifler"],
+    
+    "Ödenmiş Sermaye": ["ödenmiş sermaye", "sermaye", "share capital"],
+    "Yedekler": ["yedekler", "kar yedekleri", "yasal yedekler"],
+    "Geçmiş Yıl Karları": ["geçmiş yıl kar", "retained earnings"],
+    "Dönem Net Karı": ["dönem net karı", "net profit for the period"],
+    "Özkaynaklar": ["özkaynaklar", "toplam özkaynaklar", "shareholders equity"]
+}
+
+# ==========================================
+# TMS / UFRS (IFRS) UYUMLULUK SİSTEMİ
+# ==========================================
+# TMS: Türkiye Muhasebe Standartları
+# UFRS: Uluslararası Finansal Raporlama Standartları (IFRS)
+# Her hesap için TMS adı, UFRS/IFRS adı ve ilgili standart numarası
+
+TMS_UFRS_ESLESTIRME = {
+    # ==========================================
+    # GELİR TABLOSU HESAPLARI
+    # ==========================================
+    "gelir_tablosu": {
+        "Satış Gelirleri": {
+            "tms_adi": "Hasılat",
+            "ufrs_adi": "Revenue",
+            "tms_standart": "TMS 18 / TFRS 15",
+            "ufrs_standart": "IAS 18 / IFRS 15",
+            "aciklama": "Hasılatın muhasebeleştirilmesi (Müşteri Sözleşmelerinden Hasılat)",
+            "hesaplama": "Brüt satışlar - Satış iadeleri - Satış iskontoları",
+            "alternatif_isimler": ["satış gelirleri", "hasılat", "net satışlar", "revenue", "sales", "net sales", "turnover"]
+        },
+        "Satışların Maliyeti (-)": {
+            "tms_adi": "Satışların Maliyeti",
+            "ufrs_adi": "Cost of Sales / Cost of Goods Sold",
+            "tms_standart": "TMS 2",
+            "ufrs_standart": "IAS 2",
+            "aciklama": "Stoklar standardına göre maliyet hesaplama",
+            "hesaplama": "Dönem başı stok + Dönem içi alımlar - Dönem sonu stok",
+            "alternatif_isimler": ["satışların maliyeti", "satış maliyeti", "cogs", "cost of goods sold", "cost of sales"]
+        },
+        "Brüt Kar/Zarar": {
+            "tms_adi": "Brüt Kar/Zarar",
+            "ufrs_adi": "Gross Profit/Loss",
+            "tms_standart": "TMS 1",
+            "ufrs_standart": "IAS 1",
+            "aciklama": "Finansal Tabloların Sunuluşu",
+            "hesaplama": "Hasılat - Satışların Maliyeti",
+            "alternatif_isimler": ["brüt kar", "brüt kar/zarar", "brüt satış karı", "gross profit", "gross margin"]
+        },
+        "Faaliyet Giderleri (-)": {
+            "tms_adi": "Faaliyet Giderleri",
+            "ufrs_adi": "Operating Expenses",
+            "tms_standart": "TMS 1",
+            "ufrs_standart": "IAS 1",
+            "aciklama": "Genel Yönetim + Pazarlama Satış + Ar-Ge Giderleri",
+            "hesaplama": "Genel Yönetim Giderleri + Pazarlama Satış Dağıtım Giderleri + Ar-Ge Giderleri",
+            "alternatif_isimler": ["faaliyet giderleri", "operating expenses", "opex", "işletme giderleri"]
+        },
+        "Faaliyet Karı/Zararı": {
+            "tms_adi": "Esas Faaliyet Karı/Zararı",
+            "ufrs_adi": "Operating Profit/Loss",
+            "tms_standart": "TMS 1",
+            "ufrs_standart": "IAS 1",
+            "aciklama": "Esas faaliyetlerden elde edilen kar veya zarar",
+            "hesaplama": "Brüt Kar - Faaliyet Giderleri + Esas Faaliyetlerden Diğer Gelirler - Esas Faaliyetlerden Diğer Giderler",
+            "alternatif_isimler": ["esas faaliyet karı", "faaliyet karı", "faaliyet karı/zararı", "operating income", "operating profit", "ebit"]
+        },
+        "Amortisman ve İtfa": {
+            "tms_adi": "Amortisman ve İtfa Giderleri",
+            "ufrs_adi": "Depreciation and Amortization",
+            "tms_standart": "TMS 16 / TMS 38",
+            "ufrs_standart": "IAS 16 / IAS 38",
+            "aciklama": "Maddi ve Maddi Olmayan Duran Varlıkların amortismanı",
+            "hesaplama": "Maddi Duran Varlık Amortismanı + Maddi Olmayan Duran Varlık İtfası + Kullanım Hakkı Varlık İtfası",
+            "alternatif_isimler": ["amortisman", "itfa", "depreciation", "amortization", "d&a"]
+        },
+        "FAVÖK (EBITDA)": {
+            "tms_adi": "Faiz, Amortisman ve Vergi Öncesi Kar",
+            "ufrs_adi": "Earnings Before Interest, Taxes, Depreciation and Amortization",
+            "tms_standart": "Standart Dışı (Yönetim Raporlaması)",
+            "ufrs_standart": "Non-GAAP Measure",
+            "aciklama": "Yönetim performans ölçütü - standart dışı",
+            "hesaplama": "Esas Faaliyet Karı + Amortisman + İtfa Giderleri",
+            "alternatif_isimler": ["favök", "ebitda", "faiz amortisman vergi öncesi kar"]
+        },
+        "Finansman Gelir/Gider (Net)": {
+            "tms_adi": "Finansman Geliri/Gideri (Net)",
+            "ufrs_adi": "Finance Income/Costs (Net)",
+            "tms_standart": "TMS 23 / TFRS 9",
+            "ufrs_standart": "IAS 23 / IFRS 9",
+            "aciklama": "Borçlanma maliyetleri ve finansal araçlar",
+            "hesaplama": "Finansman Gelirleri - Finansman Giderleri",
+            "alternatif_isimler": ["finansman gideri", "finansman geliri", "finance costs", "interest expense", "interest income"]
+        },
+        "Vergi Öncesi Kar": {
+            "tms_adi": "Sürdürülen Faaliyetler Vergi Öncesi Karı/Zararı",
+            "ufrs_adi": "Profit/Loss Before Tax from Continuing Operations",
+            "tms_standart": "TMS 1 / TMS 12",
+            "ufrs_standart": "IAS 1 / IAS 12",
+            "aciklama": "Vergi öncesi dönem karı",
+            "hesaplama": "Esas Faaliyet Karı + Finansman Gelirleri - Finansman Giderleri + Diğer Gelirler - Diğer Giderler",
+            "alternatif_isimler": ["vergi öncesi kar", "pretax income", "profit before tax", "ebt"]
+        },
+        "Vergi (-)": {
+            "tms_adi": "Dönem Vergi Gideri/Geliri",
+            "ufrs_adi": "Income Tax Expense/Income",
+            "tms_standart": "TMS 12",
+            "ufrs_standart": "IAS 12",
+            "aciklama": "Gelir Vergileri standardı",
+            "hesaplama": "Cari Dönem Vergi Gideri + Ertelenmiş Vergi Gideri/Geliri",
+            "alternatif_isimler": ["vergi", "tax", "income tax", "kurumlar vergisi", "dönem vergi gideri"]
+        },
+        "Net Kar/Zarar": {
+            "tms_adi": "Dönem Karı/Zararı",
+            "ufrs_adi": "Profit/Loss for the Period",
+            "tms_standart": "TMS 1",
+            "ufrs_standart": "IAS 1",
+            "aciklama": "Net dönem sonucu (pozitif = kar, negatif = zarar)",
+            "hesaplama": "Vergi Öncesi Kar - Vergi Gideri",
+            "alternatif_isimler": ["net kar", "net kar/zarar", "net dönem karı", "dönem karı", "net income", "net profit", "profit for the period"]
+        }
+    },
+    
+    # ==========================================
+    # BİLANÇO - VARLIKLAR
+    # ==========================================
+    "bilanco_varliklar": {
+        "Dönen Varlıklar": {
+            "tms_adi": "Dönen Varlıklar",
+            "ufrs_adi": "Current Assets",
+            "tms_standart": "TMS 1",
+            "ufrs_standart": "IAS 1",
+            "aciklama": "12 ay içinde nakde çevrilmesi beklenen varlıklar",
+            "hesaplama": "Nakit + Alacaklar + Stoklar + Diğer Dönen Varlıklar",
+            "alternatif_isimler": ["dönen varlıklar", "current assets", "cari varlıklar"]
+        },
+        "Nakit ve Benzerleri": {
+            "tms_adi": "Nakit ve Nakit Benzerleri",
+            "ufrs_adi": "Cash and Cash Equivalents",
+            "tms_standart": "TMS 7",
+            "ufrs_standart": "IAS 7",
+            "aciklama": "Nakit Akış Tablosu standardı",
+            "hesaplama": "Kasa + Banka + Vadesiz Mevduat + 3 aya kadar vadeli araçlar",
+            "alternatif_isimler": ["nakit", "cash", "nakit ve nakit benzerleri", "hazır değerler", "kasa"]
+        },
+        "Ticari Alacaklar": {
+            "tms_adi": "Ticari Alacaklar",
+            "ufrs_adi": "Trade Receivables",
+            "tms_standart": "TFRS 9 / TFRS 15",
+            "ufrs_standart": "IFRS 9 / IFRS 15",
+            "aciklama": "Finansal Araçlar ve Hasılat standartları",
+            "hesaplama": "Alıcılar + Alacak Senetleri - Şüpheli Alacak Karşılığı",
+            "alternatif_isimler": ["ticari alacaklar", "alacaklar", "trade receivables", "accounts receivable"]
+        },
+        "Stoklar": {
+            "tms_adi": "Stoklar",
+            "ufrs_adi": "Inventories",
+            "tms_standart": "TMS 2",
+            "ufrs_standart": "IAS 2",
+            "aciklama": "Stoklar standardı (Maliyet veya net gerçekleşebilir değerin düşük olanı)",
+            "hesaplama": "İlk Madde + Yarı Mamul + Mamul + Ticari Mal - Stok Değer Düşüklüğü Karşılığı",
+            "alternatif_isimler": ["stoklar", "inventories", "inventory", "envanter"]
+        },
+        "Duran Varlıklar": {
+            "tms_adi": "Duran Varlıklar",
+            "ufrs_adi": "Non-Current Assets",
+            "tms_standart": "TMS 1",
+            "ufrs_standart": "IAS 1",
+            "aciklama": "12 aydan uzun vadeli varlıklar",
+            "hesaplama": "Maddi DV + Maddi Olmayan DV + Finansal Yatırımlar + Diğer Duran Varlıklar",
+            "alternatif_isimler": ["duran varlıklar", "non-current assets", "fixed assets", "uzun vadeli varlıklar"]
+        },
+        "Maddi Duran Varlıklar": {
+            "tms_adi": "Maddi Duran Varlıklar",
+            "ufrs_adi": "Property, Plant and Equipment",
+            "tms_standart": "TMS 16",
+            "ufrs_standart": "IAS 16",
+            "aciklama": "Maddi Duran Varlıklar standardı",
+            "hesaplama": "Maliyet Bedeli - Birikmiş Amortisman - Değer Düşüklüğü",
+            "alternatif_isimler": ["maddi duran varlıklar", "ppe", "property plant equipment", "sabit kıymetler"]
+        },
+        "Kullanım Hakkı Varlıkları": {
+            "tms_adi": "Kullanım Hakkı Varlıkları",
+            "ufrs_adi": "Right-of-Use Assets",
+            "tms_standart": "TFRS 16",
+            "ufrs_standart": "IFRS 16",
+            "aciklama": "Kiralamalar standardı",
+            "hesaplama": "Kiralama başlangıcındaki değer - Birikmiş İtfa - Değer Düşüklüğü",
+            "alternatif_isimler": ["kullanım hakkı varlıkları", "right of use assets", "rou assets", "kiralama varlıkları"]
+        },
+        "Maddi Olmayan Duran Varlıklar": {
+            "tms_adi": "Maddi Olmayan Duran Varlıklar",
+            "ufrs_adi": "Intangible Assets",
+            "tms_standart": "TMS 38",
+            "ufrs_standart": "IAS 38",
+            "aciklama": "Maddi Olmayan Duran Varlıklar standardı",
+            "hesaplama": "Şerefiye + Haklar + Lisanslar + Geliştirme Maliyetleri - Birikmiş İtfa",
+            "alternatif_isimler": ["maddi olmayan duran varlıklar", "intangible assets", "intangibles", "gayri maddi varlıklar"]
+        },
+        "Şerefiye": {
+            "tms_adi": "Şerefiye",
+            "ufrs_adi": "Goodwill",
+            "tms_standart": "TFRS 3",
+            "ufrs_standart": "IFRS 3",
+            "aciklama": "İşletme Birleşmeleri standardı",
+            "hesaplama": "Ödenen bedel - Edinilen net varlıkların gerçeğe uygun değeri",
+            "alternatif_isimler": ["şerefiye", "goodwill", "peştamallık"]
+        },
+        "Ertelenmiş Vergi Varlığı": {
+            "tms_adi": "Ertelenmiş Vergi Varlığı",
+            "ufrs_adi": "Deferred Tax Asset",
+            "tms_standart": "TMS 12",
+            "ufrs_standart": "IAS 12",
+            "aciklama": "Gelir Vergileri standardı - İndirilebilir geçici farklar",
+            "hesaplama": "İndirilebilir geçici farklar x Vergi oranı",
+            "alternatif_isimler": ["ertelenmiş vergi varlığı", "ertelenmiş vergi varlıkları", "deferred tax asset", "deferred tax assets"]
+        },
+        "Toplam Varlıklar": {
+            "tms_adi": "Toplam Varlıklar",
+            "ufrs_adi": "Total Assets",
+            "tms_standart": "TMS 1",
+            "ufrs_standart": "IAS 1",
+            "aciklama": "Bilançonun aktif tarafı toplamı",
+            "hesaplama": "Dönen Varlıklar + Duran Varlıklar",
+            "alternatif_isimler": ["toplam varlıklar", "total assets", "aktif toplamı", "toplam aktifler"]
+        }
+    },
+    
+    # ==========================================
+    # BİLANÇO - KAYNAKLAR
+    # ==========================================
+    "bilanco_kaynaklar": {
+        "Kısa Vadeli Yükümlülükler": {
+            "tms_adi": "Kısa Vadeli Yükümlülükler",
+            "ufrs_adi": "Current Liabilities",
+            "tms_standart": "TMS 1",
+            "ufrs_standart": "IAS 1",
+            "aciklama": "12 ay içinde ödenmesi gereken yükümlülükler",
+            "hesaplama": "Finansal Borçlar (KV) + Ticari Borçlar + Diğer KV Yükümlülükler",
+            "alternatif_isimler": ["kısa vadeli yükümlülükler", "current liabilities", "kısa vadeli borçlar"]
+        },
+        "Finansal Borçlar (KV)": {
+            "tms_adi": "Kısa Vadeli Borçlanmalar",
+            "ufrs_adi": "Short-term Borrowings",
+            "tms_standart": "TFRS 9 / TMS 32",
+            "ufrs_standart": "IFRS 9 / IAS 32",
+            "aciklama": "Finansal Araçlar standartları",
+            "hesaplama": "Banka Kredileri (KV) + Çıkarılmış Tahviller (KV kısmı) + Kiralama Yükümlülükleri (KV)",
+            "alternatif_isimler": ["finansal borçlar", "banka kredileri", "short-term borrowings", "bank loans"]
+        },
+        "Ticari Borçlar": {
+            "tms_adi": "Ticari Borçlar",
+            "ufrs_adi": "Trade Payables",
+            "tms_standart": "TFRS 9",
+            "ufrs_standart": "IFRS 9",
+            "aciklama": "Ticari faaliyetlerden kaynaklanan borçlar",
+            "hesaplama": "Satıcılar + Borç Senetleri + Alınan Avanslar",
+            "alternatif_isimler": ["ticari borçlar", "satıcılar", "trade payables", "accounts payable"]
+        },
+        "Uzun Vadeli Yükümlülükler": {
+            "tms_adi": "Uzun Vadeli Yükümlülükler",
+            "ufrs_adi": "Non-Current Liabilities",
+            "tms_standart": "TMS 1",
+            "ufrs_standart": "IAS 1",
+            "aciklama": "12 aydan uzun vadeli yükümlülükler",
+            "hesaplama": "Finansal Borçlar (UV) + Kiralama Yükümlülükleri (UV) + Kıdem Tazminatı + Ertelenmiş Vergi",
+            "alternatif_isimler": ["uzun vadeli yükümlülükler", "non-current liabilities", "uzun vadeli borçlar"]
+        },
+        "Finansal Borçlar (UV)": {
+            "tms_adi": "Uzun Vadeli Borçlanmalar",
+            "ufrs_adi": "Long-term Borrowings",
+            "tms_standart": "TFRS 9 / TMS 32",
+            "ufrs_standart": "IFRS 9 / IAS 32",
+            "aciklama": "Uzun vadeli finansal borçlar",
+            "hesaplama": "Banka Kredileri (UV) + Çıkarılmış Tahviller + Kiralama Yükümlülükleri (UV)",
+            "alternatif_isimler": ["uzun vadeli finansal borçlar", "long-term borrowings", "long-term debt"]
+        },
+        "Kıdem Tazminatı Karşılığı": {
+            "tms_adi": "Çalışanlara Sağlanan Faydalara İlişkin Karşılıklar",
+            "ufrs_adi": "Employee Benefit Obligations",
+            "tms_standart": "TMS 19",
+            "ufrs_standart": "IAS 19",
+            "aciklama": "Çalışanlara Sağlanan Faydalar standardı",
+            "hesaplama": "Aktüeryal hesaplama ile belirlenen bugünkü değer",
+            "alternatif_isimler": ["kıdem tazminatı", "employee benefits", "pension obligations", "çalışan faydaları"]
+        },
+        "Ertelenmiş Vergi Yükümlülüğü": {
+            "tms_adi": "Ertelenmiş Vergi Yükümlülüğü",
+            "ufrs_adi": "Deferred Tax Liability",
+            "tms_standart": "TMS 12",
+            "ufrs_standart": "IAS 12",
+            "aciklama": "Gelir Vergileri standardı - Geçici farklar",
+            "hesaplama": "Vergiye tabi geçici farklar x Vergi oranı",
+            "alternatif_isimler": ["ertelenmiş vergi yükümlülüğü", "deferred tax liability", "dtl"]
+        },
+        "Özkaynaklar": {
+            "tms_adi": "Özkaynaklar",
+            "ufrs_adi": "Equity",
+            "tms_standart": "TMS 1 / TMS 32",
+            "ufrs_standart": "IAS 1 / IAS 32",
+            "aciklama": "Toplam varlıklar - Toplam yükümlülükler",
+            "hesaplama": "Ödenmiş Sermaye + Sermaye Yedekleri + Kar Yedekleri + Geçmiş Yıl Karları + Dönem Karı",
+            "alternatif_isimler": ["özkaynaklar", "equity", "shareholders equity", "net varlıklar"]
+        },
+        "Ödenmiş Sermaye": {
+            "tms_adi": "Ödenmiş Sermaye",
+            "ufrs_adi": "Issued Capital / Share Capital",
+            "tms_standart": "TMS 32",
+            "ufrs_standart": "IAS 32",
+            "aciklama": "Çıkarılmış ve ödenmiş pay sermayesi",
+            "hesaplama": "Çıkarılmış pay sayısı x Pay başına nominal değer",
+            "alternatif_isimler": ["ödenmiş sermaye", "sermaye", "share capital", "issued capital"]
+        },
+        "Geçmiş Yıl Karları": {
+            "tms_adi": "Geçmiş Yıllar Karları/Zararları",
+            "ufrs_adi": "Retained Earnings",
+            "tms_standart": "TMS 1",
+            "ufrs_standart": "IAS 1",
+            "aciklama": "Birikmiş karlar ve zararlar",
+            "hesaplama": "Önceki dönem birikmiş kar/zarar + Dönem karı - Dağıtılan temettü",
+            "alternatif_isimler": ["geçmiş yıl karları", "retained earnings", "birikmiş karlar"]
+        },
+        "Toplam Kaynaklar": {
+            "tms_adi": "Toplam Kaynaklar (Yükümlülükler ve Özkaynaklar)",
+            "ufrs_adi": "Total Equity and Liabilities",
+            "tms_standart": "TMS 1",
+            "ufrs_standart": "IAS 1",
+            "aciklama": "Bilançonun pasif tarafı toplamı = Aktif toplamı",
+            "hesaplama": "Kısa Vadeli Yük. + Uzun Vadeli Yük. + Özkaynaklar",
+            "alternatif_isimler": ["toplam kaynaklar", "total liabilities and equity", "pasif toplamı"]
+        }
+    },
+    
+    # ==========================================
+    # NAKİT AKIŞ TABLOSU
+    # ==========================================
+    "nakit_akis": {
+        "İşletme Faaliyetlerinden Nakit": {
+            "tms_adi": "İşletme Faaliyetlerinden Kaynaklanan Nakit Akışları",
+            "ufrs_adi": "Cash Flows from Operating Activities",
+            "tms_standart": "TMS 7",
+            "ufrs_standart": "IAS 7",
+            "aciklama": "Nakit Akış Tabloları standardı - Doğrudan veya dolaylı yöntem",
+            "hesaplama": "Dönem Karı + Nakit Çıkışı Gerektirmeyen Giderler - İşletme Sermayesi Değişimi",
+            "alternatif_isimler": ["işletme nakit akışı", "operating cash flow", "ocf", "faaliyetlerden nakit"]
+        },
+        "Yatırım Faaliyetlerinden Nakit": {
+            "tms_adi": "Yatırım Faaliyetlerinden Kaynaklanan Nakit Akışları",
+            "ufrs_adi": "Cash Flows from Investing Activities",
+            "tms_standart": "TMS 7",
+            "ufrs_standart": "IAS 7",
+            "aciklama": "Uzun vadeli varlık alım/satımından kaynaklanan akışlar",
+            "hesaplama": "Maddi DV Alımları + Maddi Olmayan DV Alımları - Satışlar + Yatırım Gelirleri",
+            "alternatif_isimler": ["yatırım nakit akışı", "investing cash flow", "icf", "yatırımlardan nakit"]
+        },
+        "Finansman Faaliyetlerinden Nakit": {
+            "tms_adi": "Finansman Faaliyetlerinden Kaynaklanan Nakit Akışları",
+            "ufrs_adi": "Cash Flows from Financing Activities",
+            "tms_standart": "TMS 7",
+            "ufrs_standart": "IAS 7",
+            "aciklama": "Özkaynaklar ve borçlanmalardaki değişimler",
+            "hesaplama": "Kredi Kullanımları - Kredi Geri Ödemeleri - Temettü Ödemeleri - Faiz Ödemeleri",
+            "alternatif_isimler": ["finansman nakit akışı", "financing cash flow", "fcf", "finansmandan nakit"]
+        },
+        "Serbest Nakit Akışı": {
+            "tms_adi": "Serbest Nakit Akışı",
+            "ufrs_adi": "Free Cash Flow",
+            "tms_standart": "Standart Dışı (Yönetim Raporlaması)",
+            "ufrs_standart": "Non-GAAP Measure",
+            "aciklama": "İşletmenin serbest kullanabileceği nakit",
+            "hesaplama": "İşletme Faaliyetlerinden Nakit - CAPEX (Sermaye Harcamaları)",
+            "alternatif_isimler": ["serbest nakit akışı", "free cash flow", "fcf"]
+        }
+    }
+}
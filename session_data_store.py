@@ -0,0 +1,298 @@
+"""
+Oturum veri deposu.
+
+Yüklenen veri, session_state'te tek bir kanonik DataFrame olarak tutulur.
+Eski modüllerin kullandığı anahtarlara (df_ham, df_gelir_raw, df_veri_merkezi
+vb.) derin kopya yerine bu çerçeveyi paylaşan copy-on-write tutamaçlar
+yazılır. Böylece her anahtar için verinin ayrı bir kopyası saklanmaz; bir
+modül kendi tutamacını değiştirirse yalnızca değişen sütun kopyalanır.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Mapping, MutableMapping, Optional, Tuple
+
+import pandas as pd
+
+# ==========================================
+# ANAHTARLAR
+# ==========================================
+# Yükleme sonrası aynı veriyi gösteren eski anahtarlar
+LEGACY_FRAME_KEYS: Tuple[str, ...] = (
+    'df_ham',
+    'df_gelir_raw',
+    'df_bilanco_raw',
+    'df_nakit_raw',
+    'df_gelir_ham_veri',
+    'df_bilanco_ham_veri',
+    'df_nakit_ham_veri',
+    'df_veri_merkezi',
+)
+
+# Menü ekranının finansal tablo olarak okuduğu anahtarlar
+STATEMENT_FRAME_KEYS: Tuple[str, ...] = ('df_gelir_raw', 'df_bilanco_raw', 'df_nakit_raw')
+
+# Her zaman tüm veriyi gösteren anahtarlar
+CANONICAL_FRAME_KEYS: Tuple[str, ...] = ('df_ham', 'df_veri_merkezi')
+
+# İşlenmemiş (ham) yükleme
+ORIGINAL_FRAME_KEY = 'df_orijinal_yuklenen'
+
+# Depo meta verisinin session_state'teki anahtarı
+STORE_STATE_KEY = '_veri_deposu'
+
+
+def _pandas_3() -> bool:
+    try:
+        return int(pd.__version__.split('.')[0]) >= 3
+    except ValueError:
+        return False
+
+
+def copy_on_write_enabled() -> bool:
+    """pandas copy-on-write modu etkin mi (pandas 3'te her zaman; 2.x'te yalnızca açıkça açıldıysa)"""
+    if _pandas_3():
+        return True
+    try:
+        return bool(pd.get_option('mode.copy_on_write'))
+    except Exception:
+        return False
+
+
+def enable_copy_on_write() -> bool:
+    """
+    pandas 2.x'te copy-on-write modunu açar (süreç geneli ayar).
+
+    Modül import edilirken çağrılmaz: zincirleme atamaya güvenen modüllerin
+    davranışını değiştirdiği için yalnızca uygulama açıkça isterse
+    (app1: DIGICFO_COPY_ON_WRITE=1) kullanılır. Kapalıyken tutamaçlar derin
+    kopyadır.
+
+    Returns:
+        bool: Copy-on-write etkinse True
+    """
+    if _pandas_3():
+        return True
+    try:
+        pd.set_option('mode.copy_on_write', True)
+    except Exception:
+        return False
+    return copy_on_write_enabled()
+
+
+def _handle(df: pd.DataFrame) -> pd.DataFrame:
+    """Kanonik çerçeveyi paylaşan yeni bir tutamaç (copy-on-write kapalıysa bağımsız kopya)"""
+    return df.copy(deep=not copy_on_write_enabled())
+
+
+# ==========================================
+# BELLEK ÖLÇÜMÜ
+# ==========================================
+def _column_buffers(seri: pd.Series):
+    """Sütunun bellek tamponlarını (adres, bayt) olarak döndürür"""
+    dizi = seri.array
+    if hasattr(dizi, '__arrow_array__'):
+        try:
+            arrow = dizi.__arrow_array__()
+            parcalar = getattr(arrow, 'chunks', [arrow])
+            for parca in parcalar:
+                for tampon in parca.buffers():
+                    if tampon is not None:
+                        yield tampon.address, tampon.size
+            return
+        except Exception:
+            pass
+    try:
+        numpy_dizi = seri.to_numpy(copy=False)
+        yield numpy_dizi.__array_interface__['data'][0], numpy_dizi.nbytes
+    except Exception:
+        yield id(dizi), int(seri.memory_usage(index=False, deep=False))
+
+
+def frame_memory_report(state: MutableMapping) -> Dict[str, Any]:
+    """
+    Bir oturumdaki DataFrame'lerin bellek kullanımını raporlar.
+
+    Aynı tamponu paylaşan sütunlar yalnızca bir kez sayılır; nominal değer
+    her anahtarın ayrı kopya olduğu durumdaki kullanımı gösterir.
+
+    Args:
+        state: st.session_state veya benzeri sözlük
+
+    Returns:
+        dict: anahtar_sayisi, nominal_mb, gercek_mb, tasarruf_orani
+    """
+    goruldu = {}
+    nominal = 0
+    anahtar_sayisi = 0
+    for anahtar in list(state.keys()):
+        deger = state[anahtar]
+        if not isinstance(deger, pd.DataFrame):
+            continue
+        anahtar_sayisi += 1
+        for col in deger.columns:
+            seri = deger[col]
+            if isinstance(seri, pd.DataFrame):
+                continue
+            for adres, boyut in _column_buffers(seri):
+                nominal += boyut
+                goruldu[adres] = max(boyut, goruldu.get(adres, 0))
+    gercek = sum(goruldu.values())
+    return {
+        'anahtar_sayisi': anahtar_sayisi,
+        'nominal_mb': nominal / 1024 ** 2,
+        'gercek_mb': gercek / 1024 ** 2,
+        'tasarruf_orani': (1 - gercek / nominal) if nominal else 0.0,
+    }
+
+
+def _buffer_fingerprint(df: pd.DataFrame) -> Tuple:
+    return tuple(tuple(_column_buffers(df.iloc[:, i])) for i in range(df.shape[1]))
+
+
+def content_digest(df: pd.DataFrame) -> Optional[int]:
+    """Çerçevenin içerik özeti (index dahil); hashlenemeyen hücrelerde None"""
+    try:
+        return int(pd.util.hash_pandas_object(df, index=True).sum())
+    except (TypeError, ValueError):
+        return None
+
+
+def frame_fingerprint(df: Optional[pd.DataFrame]) -> Tuple:
+    """
+    Çerçevenin ucuz bir parmak izini üretir.
+
+    Copy-on-write altında sütun tamponlarından üretilir: yerinde yapılan her
+    değişiklik yeni bir tampon oluşturduğundan parmak izi veri değiştiğinde de
+    değişir. Copy-on-write kapalıyken tutamaçlar her çalıştırmada yeni
+    kopyalar olduğundan içerik özeti kullanılır.
+    """
+    if df is None:
+        return ()
+    if not copy_on_write_enabled():
+        ozet = content_digest(df)
+        if ozet is not None:
+            return (df.shape, tuple(df.columns), tuple(map(str, df.dtypes)), ozet)
+    return (df.shape, tuple(df.columns), _buffer_fingerprint(df))
+
+
+def _same_data(a: Optional[pd.DataFrame], b: Optional[pd.DataFrame]) -> bool:
+    """İki çerçeve aynı sütun tamponlarını paylaşıyor veya aynı içeriği taşıyorsa True"""
+    if a is None or b is None:
+        return False
+    if a is b:
+        return True
+    if a.shape != b.shape or not a.columns.equals(b.columns) or not a.index.equals(b.index):
+        return False
+    if _buffer_fingerprint(a) == _buffer_fingerprint(b):
+        return True
+    # Farklı tamponlar (derin kopya veya yeniden kurulmuş çerçeve): içerik karşılaştırılır
+    return a.equals(b)
+
+
+# ==========================================
+# DEPO
+# ==========================================
+class SessionDataStore:
+    """
+    Tek kanonik çerçeve tutan oturum veri deposu.
+
+    Örnek:
+        deposu = SessionDataStore(st.session_state)
+        deposu.publish(df)                 # tüm eski anahtarlara tutamaç yazar
+        df = deposu.handle('df_ham')       # değiştirilebilir tutamaç
+    """
+
+    def __init__(self, state: MutableMapping):
+        self._state = state
+        if STORE_STATE_KEY not in state:
+            state[STORE_STATE_KEY] = {'frame': None, 'version': 0, 'derived': {}}
+        self._meta = state[STORE_STATE_KEY]
+
+    @property
+    def frame(self) -> Optional[pd.DataFrame]:
+        """Kanonik çerçeve (doğrudan değiştirilmemelidir)"""
+        return self._meta['frame']
+
+    @property
+    def version(self) -> int:
+        """Her yeni veri yayınında artan sürüm numarası"""
+        return self._meta['version']
+
+    def publish(self, df: pd.DataFrame, keys: Iterable[str] = LEGACY_FRAME_KEYS) -> int:
+        """
+        df'yi kanonik çerçeve yapar ve verilen anahtarlara tutamaç yazar.
+
+        Veri değişmemişse (aynı tamponlar veya aynı içerik) sürüm artmaz;
+        yalnızca kanonik çerçeveden farklılaşmış anahtarlar yeniden yazılır.
+
+        Args:
+            df: Yayınlanacak çerçeve
+            keys: Tutamaç yazılacak session_state anahtarları
+
+        Returns:
+            int: Güncel veri sürümü
+        """
+        if not _same_data(df, self.frame):
+            self._meta['frame'] = _handle(df)
+            self._meta['version'] += 1
+            self._meta['derived'] = {}
+
+        for anahtar in keys:
+            if not _same_data(self._state.get(anahtar), self.frame):
+                self._state[anahtar] = _handle(self.frame)
+        return self.version
+
+    def publish_views(self, views: Mapping[str, pd.DataFrame]) -> None:
+        """
+        Kanonik çerçeveden türetilmiş görünümleri (ör. tablo dilimleri) yazar.
+
+        Args:
+            views: {session_state anahtarı: çerçeve}
+        """
+        for anahtar, gorunum in views.items():
+            if not _same_data(self._state.get(anahtar), gorunum):
+                self._state[anahtar] = _handle(gorunum)
+
+    def derived(self, name: str, builder: Callable[[pd.DataFrame], Any]) -> Any:
+        """
+        Kanonik çerçeveden türetilen bir nesneyi veri sürümü başına bir kez kurar.
+
+        Args:
+            name: Türetilmiş nesnenin adı
+            builder: Kanonik çerçeveyi alıp nesneyi döndüren fonksiyon
+
+        Returns:
+            Önbellekteki veya yeni kurulan nesne
+        """
+        onbellek = self._meta.setdefault('derived', {})
+        if name not in onbellek:
+            onbellek[name] = builder(self.frame)
+        return onbellek[name]
+
+    def get_derived(self, name: str, default: Any = None) -> Any:
+        """Önceden kurulmuş türetilmiş nesneyi döndürür"""
+        return self._meta.get('derived', {}).get(name, default)
+
+    def publish_original(self, df: pd.DataFrame, key: str = ORIGINAL_FRAME_KEY) -> None:
+        """İşlenmemiş yüklemeyi kopyalamadan saklar"""
+        self._state[key] = _handle(df)
+
+    def handle(self, key: str = 'df_ham') -> Optional[pd.DataFrame]:
+        """
+        Anahtardaki çerçeve için değiştirilebilir bir tutamaç döndürür.
+
+        Args:
+            key: session_state anahtarı
+
+        Returns:
+            pd.DataFrame veya None
+        """
+        df = self._state.get(key)
+        if df is None:
+            df = self.frame
+        return _handle(df) if isinstance(df, pd.DataFrame) else df
+
+    def memory_report(self) -> Dict[str, Any]:
+        """Bu oturumun DataFrame bellek raporu"""
+        rapor = frame_memory_report(self._state)
+        rapor['surum'] = self.version
+        return rapor
@@ -0,0 +1,249 @@
+"""
+Finansal tablo ayrıştırma.
+
+Yüklenen veri önceden gelir tablosu, bilanço ve nakit akış anahtarlarına üç
+ayrı kopya olarak yazılıyordu; ``df_full_raw`` bu kopyaları birleştirdiği
+için her kalem üç kez görünüyordu. Bu modül her satırı tek bir tabloya
+(gelir / bilanço / nakit akış / diğer) atar, veriyi tabloya göre bir kez
+sıralar ve her tabloyu bu sıralı çerçevenin ardışık bir dilimi olarak sunar.
+Dilimler kopyalanmaz; birleşik görünüm sıralı çerçevenin kendisidir.
+
+Sınıflandırma sırası:
+    1. ``Grup`` sütunu (mapping'in atadığı grup adı)
+    2. ``Standart_Kalem`` şema anahtarlarında / alternatif isimlerde
+    3. Ham kalem adı şema anahtarlarında / alternatif isimlerde
+"""
+
+import re
+from typing import Dict, Iterable, Mapping, Optional
+
+import numpy as np
+import pandas as pd
+
+# ==========================================
+# TABLO KODLARI
+# ==========================================
+GELIR = 'gelir'
+BILANCO = 'bilanco'
+NAKIT = 'nakit'
+DIGER = 'diger'
+
+STATEMENT_ORDER = (GELIR, BILANCO, NAKIT, DIGER)
+
+STATEMENT_LABELS = {
+    GELIR: 'Gelir Tablosu',
+    BILANCO: 'Bilanço',
+    NAKIT: 'Nakit Akış Tablosu',
+    DIGER: 'Diğer',
+}
+
+# Tablo -> session_state anahtarları (eski modüllerin okuduğu anahtarlar)
+STATEMENT_STATE_KEYS = {
+    GELIR: ('df_gelir_raw', 'df_gelir_ham_veri'),
+    BILANCO: ('df_bilanco_raw', 'df_bilanco_ham_veri'),
+    NAKIT: ('df_nakit_raw', 'df_nakit_ham_veri'),
+}
+
+# TMS_UFRS_ESLESTIRME kategorileri -> tablo
+TMS_KATEGORI_TABLO = {
+    'gelir_tablosu': GELIR,
+    'bilanco_varliklar': BILANCO,
+    'bilanco_kaynaklar': BILANCO,
+    'nakit_akis': NAKIT,
+}
+
+# Grup adı ipuçları (sırayla denenir: "nakit akış" bilançodaki "nakit"ten önce;
+# adında gelir / gider / kar geçen bilanço kalemleri gelir tablosu ipuçlarından önce)
+GRUP_IPUCLARI = (
+    (NAKIT, re.compile(r'\bnakit ak|\bcash flow|faaliyetlerinden\b')),
+    (BILANCO, re.compile(
+        r'\b(?:gelecek (?:ay|yıl)lara ait|peşin ödenmiş|geçmiş yıl(?:lar)?|birikmiş|dağıtılmamış)\b'
+        r'|\b(?:gelir|gider) tahakkuk|\bkarşılık'
+    )),
+    (BILANCO, re.compile(
+        r'\b(?:bilan|varlık|yükümlülük|özkaynak|kaynak|aktif|pasif|balance|asset|liabilit|equity)'
+    )),
+    (GELIR, re.compile(
+        r'\b(?:gelir|gider|hasılat|satış|kar|kâr|zarar)(?:ı|i|lar|ler|ları|leri|ların|lerin)?\b'
+        r'|\b(?:income|revenue|expense|profit)'
+    )),
+)
+
+
+def _normalize(metin) -> str:
+    """Türkçe büyük/küçük harf uyumlu, boşlukları sadeleştirilmiş anahtar"""
+    if not isinstance(metin, str):
+        return ''
+    metin = metin.replace('İ', 'i').replace('I', 'ı').lower()
+    return ' '.join(metin.split())
+
+
+def _schema_names(sema: Mapping) -> Iterable[str]:
+    """Şema anahtarlarını ve alternatif isimlerini döndürür"""
+    for anahtar, deger in sema.items():
+        yield anahtar
+        if isinstance(deger, Mapping):
+            deger = deger.get('alternatif_isimler', [])
+        if isinstance(deger, str):
+            yield deger
+        elif isinstance(deger, (list, tuple, set)):
+            for isim in deger:
+                if isinstance(isim, str):
+                    yield isim
+
+
+def build_statement_lookup(
+    sema_gelir: Optional[Mapping] = None,
+    sema_bilanco: Optional[Mapping] = None,
+    sema_nakit: Optional[Mapping] = None,
+    tms_ufrs: Optional[Mapping] = None
+) -> Dict[str, str]:
+    """
+    Normalize edilmiş kalem adı -> tablo kodu sözlüğü kurar.
+
+    Aynı isim birden fazla şemada geçiyorsa ilk şema (gelir, bilanço, nakit)
+    kazanır.
+
+    Args:
+        sema_gelir: SEMA_GELIR_TABLOSU
+        sema_bilanco: SEMA_BILANCO
+        sema_nakit: SEMA_NAKIT_AKIS
+        tms_ufrs: TMS_UFRS_ESLESTIRME (kategori -> kalem -> bilgi)
+
+    Returns:
+        dict: {normalize_isim: tablo_kodu}
+    """
+    sozluk: Dict[str, str] = {}
+    for tablo, sema in ((GELIR, sema_gelir), (BILANCO, sema_bilanco), (NAKIT, sema_nakit)):
+        if not sema:
+            continue
+        for isim in _schema_names(sema):
+            sozluk.setdefault(_normalize(isim), tablo)
+    if tms_ufrs:
+        for kategori, kalemler in tms_ufrs.items():
+            tablo = TMS_KATEGORI_TABLO.get(kategori)
+            if tablo and isinstance(kalemler, Mapping):
+                for isim in _schema_names(kalemler):
+                    sozluk.setdefault(_normalize(isim), tablo)
+    sozluk.pop('', None)
+    return sozluk
+
+
+def _grup_tablosu(grup: str) -> str:
+    """Grup adından tablo kodu tahmini (bulunamazsa boş)"""
+    for tablo, desen in GRUP_IPUCLARI:
+        if desen.search(grup):
+            return tablo
+    return ''
+
+
+def classify_rows(
+    df: pd.DataFrame,
+    item_col: str,
+    lookup: Mapping[str, str],
+    grup_col: str = 'Grup',
+    standart_col: str = 'Standart_Kalem'
+) -> np.ndarray:
+    """
+    Her satırın ait olduğu tablo kodunu döndürür.
+
+    Args:
+        df: Standartlaştırılmış veri
+        item_col: Ham kalem adı sütunu
+        lookup: build_statement_lookup çıktısı
+        grup_col: Grup sütunu
+        standart_col: Standart kalem sütunu
+
+    Returns:
+        np.ndarray: Satır başına tablo kodu (object)
+    """
+    sonuc = pd.Series('', index=df.index, dtype=object)
+
+    if grup_col in df.columns:
+        gruplar = df[grup_col].map(_normalize)
+        benzersiz = {g: _grup_tablosu(g) for g in gruplar.unique()}
+        sonuc = gruplar.map(benzersiz).astype(object)
+
+    for col in (standart_col, item_col):
+        if col not in df.columns:
+            continue
+        bos = sonuc == ''
+        if not bos.any():
+            break
+        eslesen = df.loc[bos, col].map(_normalize).map(lookup)
+        sonuc.loc[bos] = eslesen.fillna('').astype(object)
+
+    sonuc[sonuc == ''] = DIGER
+    return sonuc.to_numpy(dtype=object)
+
+
+# ==========================================
+# TABLO KÜMESİ
+# ==========================================
+class StatementSet:
+    """
+    Tabloya göre sıralanmış tek çerçeve ve her tablonun dilimi.
+
+    ``full`` birleşik görünümdür (her satır bir kez); ``get`` ile alınan
+    tablolar bu çerçevenin kopyalanmamış dilimleridir.
+    """
+
+    def __init__(self, frame: pd.DataFrame, slices: Dict[str, slice]):
+        self.frame = frame
+        self.slices = slices
+
+    @property
+    def full(self) -> pd.DataFrame:
+        """Tüm tabloların birleşimi (kopyasız)"""
+        return self.frame
+
+    @property
+    def is_partitioned(self) -> bool:
+        """En az bir satır gelir / bilanço / nakit akışa atanabildiyse True"""
+        return any(self.counts().get(t, 0) for t in (GELIR, BILANCO, NAKIT))
+
+    def get(self, tablo: str) -> pd.DataFrame:
+        """Tablonun satırları (sıralı çerçevenin dilimi)"""
+        return self.frame.iloc[self.slices.get(tablo, slice(0, 0))]
+
+    def counts(self) -> Dict[str, int]:
+        """Tablo başına satır sayısı"""
+        return {t: s.stop - s.start for t, s in self.slices.items()}
+
+
+def partition_statements(
+    df: pd.DataFrame,
+    item_col: str,
+    lookup: Mapping[str, str],
+    statement_col: Optional[str] = None
+) -> StatementSet:
+    """
+    Veriyi gelir tablosu, bilanço, nakit akış ve diğer olarak ayırır.
+
+    Veri bir kez (kararlı) sıralanır; tablo içi satır sırası korunur.
+
+    Args:
+        df: Standartlaştırılmış veri
+        item_col: Ham kalem adı sütunu
+        lookup: build_statement_lookup çıktısı
+        statement_col: Tablo adının kategorik olarak yazılacağı sütun
+            (None ise eklenmez; eski modüllerin sütun listesi değişmez)
+
+    Returns:
+        StatementSet
+    """
+    kodlar = classify_rows(df, item_col, lookup)
+    sira = {t: i for i, t in enumerate(STATEMENT_ORDER)}
+    sayisal = np.fromiter((sira[k] for k in kodlar), dtype=np.int8, count=len(kodlar))
+    dizilim = np.argsort(sayisal, kind='stable')
+
+    sirali = df.iloc[dizilim].reset_index(drop=True)
+    if statement_col:
+        etiketler = pd.Categorical.from_codes(
+            sayisal[dizilim], categories=[STATEMENT_LABELS[t] for t in STATEMENT_ORDER]
+        )
+        sirali[statement_col] = etiketler
+
+    sinirlar = np.searchsorted(sayisal[dizilim], np.arange(len(STATEMENT_ORDER) + 1))
+    dilimler = {t: slice(int(sinirlar[i]), int(sinirlar[i + 1])) for i, t in enumerate(STATEMENT_ORDER)}
+    return StatementSet(sirali, dilimler)
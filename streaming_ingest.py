@@ -0,0 +1,340 @@
+"""
+Büyük CSV / Excel yüklemeleri için parça parça (streaming) veri alımı.
+
+Manuel yükleme dosyanın tamamını ``pd.read_csv`` / ``pd.read_excel`` ile
+okuyup sonra temizliyor ve eşleştiriyordu; yüz MB'larca büyüklükteki çok
+yıllık muhasebe dökümlerinde bellek sıçrıyor ve oturum donuyordu. Bu modül
+büyük dosyaları parçalar halinde okur; her parça okunur okunmaz sayısal
+sütunları temizlenir ve hesap adları eşleştirilir:
+
+    - CSV: ``pd.read_csv(chunksize=...)``, tüm sütunlar metin olarak
+    - xlsx: openpyxl read-only satır yineleyicisi
+
+CSV sütunları pandas'ın tür tahminine bırakılmaz: tahmin her parçada ayrı
+yapıldığından "1.200" bir parçada metin (1200), diğerinde float (1.2)
+olarak okunabiliyordu. Sayı çözümlemesi tamamen
+``clean_turkish_float_series`` ile yapılır. Ondalık ayırıcı her sütun için
+ilk metin parçasında bir kez tespit edilir ve sonraki parçalarda aynen
+kullanılır. Küçük dosyalar da aynı okuma ayarlarıyla okunur
+(``read_upload_frame``); sonuç dosya boyutu eşiğine göre değişmez.
+
+Parçalar sonda ``pd.concat`` ile birleştirilmez (birleştirme anında veri iki
+kez bellekte olurdu): her parça, ilk parçadaki ilerleme oranından tahmin
+edilen satır sayısına göre önceden ayrılmış sütun dizilerine yazılır. Bellek
+sınırı bu dizilerin boş kapasitesi dahil uygulanır; işlenmiş veri sınırı
+aşarsa alım durdurulur, ham (orijinal) parçalar ise yalnızca sınır izin
+verdiği sürece saklanır.
+"""
+
+import io
+import math
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from number_parser import clean_turkish_float_series, detect_decimal_separator
+
+# ==========================================
+# AYARLAR
+# ==========================================
+# Bu boyuttan büyük dosyalar parça parça işlenir (MB)
+STREAMING_ESIK_MB = float(os.environ.get('DIGICFO_STREAMING_ESIK_MB', 50))
+# İşlenmiş verinin bellekte kaplayabileceği en fazla boyut (MB)
+BELLEK_SINIRI_MB = float(os.environ.get('DIGICFO_UPLOAD_BELLEK_MB', 2048))
+# Parça başına satır sayısı
+PARCA_SATIR = int(os.environ.get('DIGICFO_PARCA_SATIR', 50_000))
+
+STREAMING_UZANTILAR = ('.csv', '.xlsx')
+
+# CSV okuma ayarları (parça parça ve tek seferde aynı): tüm sütunlar metin, boş hücreler NaN
+CSV_OKUMA = {'dtype': str, 'keep_default_na': True}
+# Excel okuma ayarları: hücreler openpyxl'in döndürdüğü türde kalır, pandas metinleri sayıya çevirmez
+EXCEL_OKUMA = {'dtype': object}
+
+# Tahmini satır sayısına eklenen pay ve kapasite yetmezse büyüme oranı
+_KAPASITE_PAYI = 1.05
+_BUYUME = 1.5
+
+
+class BellekSiniriAsildi(MemoryError):
+    """İşlenmiş veri yapılandırılan bellek sınırını aştığında"""
+
+
+@dataclass
+class IngestResult:
+    """Parça parça alımın sonucu"""
+    frame: pd.DataFrame
+    original: Optional[pd.DataFrame]
+    item_col: Any
+    satir: int = 0
+    parca: int = 0
+    bellek_mb: float = 0.0
+    ondalik: Dict[Any, str] = field(default_factory=dict)
+
+
+def streaming_uygun(dosya_adi: str, boyut: int, esik_mb: float = None) -> bool:
+    """Dosya parça parça işlenecek kadar büyük ve desteklenen biçimdeyse True"""
+    esik = STREAMING_ESIK_MB if esik_mb is None else esik_mb
+    return dosya_adi.lower().endswith(STREAMING_UZANTILAR) and boyut >= esik * 1024 ** 2
+
+
+def _boyut(dosya) -> int:
+    boyut = getattr(dosya, 'size', None)
+    if boyut is None:
+        konum = dosya.tell()
+        dosya.seek(0, io.SEEK_END)
+        boyut = dosya.tell()
+        dosya.seek(konum)
+    return boyut
+
+
+# ==========================================
+# OKUYUCULAR
+# ==========================================
+def _basliklar(ham: Sequence[Any]) -> List[Any]:
+    """pd.read_excel ile aynı başlık adları (boş -> 'Unnamed: i', tekrar -> 'ad.1')"""
+    basliklar, sayac = [], {}
+    for i, ad in enumerate(ham):
+        ad = f"Unnamed: {i}" if ad is None or (isinstance(ad, str) and not ad.strip()) else ad
+        if ad in sayac:
+            sayac[ad] += 1
+            ad = f"{ad}.{sayac[ad]}"
+        else:
+            sayac[ad] = 0
+        basliklar.append(ad)
+    return basliklar
+
+
+def _xlsx_parcalari(dosya, parca_satir: int) -> Iterator[tuple]:
+    """(parça, ilerleme oranı) üretir; openpyxl read-only satır yineleyicisi"""
+    from openpyxl import load_workbook
+
+    kitap = load_workbook(dosya, read_only=True, data_only=True)
+    try:
+        sayfa = kitap.worksheets[0]
+        toplam = max((sayfa.max_row or 0) - 1, 1)
+        satirlar = sayfa.iter_rows(values_only=True)
+        basliklar = _basliklar(next(satirlar, ()))
+        okunan, tampon = 0, []
+        for satir in satirlar:
+            if satir is None or all(v is None for v in satir):
+                continue
+            tampon.append(satir[:len(basliklar)])
+            if len(tampon) >= parca_satir:
+                okunan += len(tampon)
+                yield pd.DataFrame(tampon, columns=basliklar), min(okunan / toplam, 1.0)
+                tampon = []
+        if tampon:
+            okunan += len(tampon)
+            yield pd.DataFrame(tampon, columns=basliklar), 1.0
+    finally:
+        kitap.close()
+
+
+def _csv_parcalari(dosya, parca_satir: int) -> Iterator[tuple]:
+    """(parça, ilerleme oranı) üretir; tüm sütunlar metin olarak okunur (boş hücreler NaN)"""
+    boyut = max(_boyut(dosya), 1)
+    dosya.seek(0)
+    for parca in pd.read_csv(dosya, chunksize=parca_satir, **CSV_OKUMA):
+        yield parca, min(dosya.tell() / boyut, 1.0)
+
+
+def read_upload_frame(dosya, dosya_adi: str, excel_reader: Optional[Callable[..., pd.DataFrame]] = None) -> pd.DataFrame:
+    """
+    Eşiğin altındaki yüklemeyi parça parça alımla aynı ayarlarla tek seferde okur.
+
+    Sayılar pandas'ın tür tahminiyle değil, sonradan ``clean_turkish_float_series``
+    ile çözülür: CSV tamamen metin, Excel hücreleri kendi türünde okunur
+    ("1.200" metin hücresi 1.2 değil 1200 olur).
+
+    Args:
+        dosya: Dosya benzeri nesne
+        dosya_adi: Biçimi belirlemek için dosya adı
+        excel_reader: (dosya, **ayarlar) -> DataFrame (None ise pd.read_excel;
+            ör. app1 ``columnar_cache.read_upload_cached`` kullanır)
+
+    Returns:
+        pd.DataFrame
+    """
+    if dosya_adi.lower().endswith('.csv'):
+        return pd.read_csv(dosya, **CSV_OKUMA)
+    return (excel_reader or pd.read_excel)(dosya, **EXCEL_OKUMA)
+
+
+# ==========================================
+# ALIM
+# ==========================================
+def _parca_temizle(parca: pd.DataFrame, ondalik: Dict[Any, str]) -> pd.DataFrame:
+    """İlk sütun hariç tüm sütunları float64'e çevirir (ondalık ayırıcı sütun başına sabit)"""
+    parca = parca.copy(deep=False)
+    for col in parca.columns[1:]:
+        seri = parca[col]
+        if col not in ondalik and not pd.api.types.is_numeric_dtype(seri):
+            metinler = seri[seri.map(lambda v: isinstance(v, str))]
+            if len(metinler):
+                ondalik[col] = detect_decimal_separator(metinler)
+        parca[col] = clean_turkish_float_series(seri, ondalik.get(col, 'auto'))
+    return parca
+
+
+def _mb(df: pd.DataFrame) -> float:
+    return df.memory_usage(index=True, deep=True).sum() / 1024 ** 2
+
+
+def _dizi_tipi(tip) -> np.dtype:
+    """Sütunun biriktirileceği NumPy tipi (sayı / tarih dışındakiler object)"""
+    if isinstance(tip, np.dtype) and tip.kind in 'biufcmM':
+        return tip
+    return np.dtype(object)
+
+
+class _SutunBiriktirici:
+    """
+    Parçaları sütun başına önceden ayrılmış dizilere yazar.
+
+    Kapasite yetmezse diziler sırayla (aynı anda tek sütun) büyütülür; sonda
+    boş kapasite kırpılırken de sütunlar tek tek kopyalanır. Böylece bellek
+    tepe noktası verinin iki katı değil, veri + bir sütundur.
+    """
+
+    def __init__(self, ilk: pd.DataFrame, tahmini_satir: int):
+        self.sutunlar = ilk.columns
+        self.tipler = list(ilk.dtypes)
+        self.kapasite = max(int(tahmini_satir), len(ilk), 1)
+        self.satir = 0
+        self.veri_mb = 0.0
+        self._diziler: List[Optional[np.ndarray]] = [
+            np.empty(self.kapasite, dtype=_dizi_tipi(t)) for t in self.tipler
+        ]
+
+    @property
+    def mb(self) -> float:
+        """Parçaların bellek kullanımı + ayrılmış ama boş kapasite"""
+        bos = (self.kapasite - self.satir) * sum(d.itemsize for d in self._diziler)
+        return self.veri_mb + bos / 1024 ** 2
+
+    def _buyut(self, gereken: int) -> None:
+        self.kapasite = max(gereken, int(self.kapasite * _BUYUME))
+        for i, dizi in enumerate(self._diziler):
+            yeni = np.empty(self.kapasite, dtype=dizi.dtype)
+            yeni[:self.satir] = dizi[:self.satir]
+            self._diziler[i] = yeni
+
+    def add(self, parca: pd.DataFrame) -> None:
+        if not parca.columns.equals(self.sutunlar):
+            raise ValueError("Parçaların sütunları birbirinden farklı.")
+        n = len(parca)
+        if self.satir + n > self.kapasite:
+            self._buyut(self.satir + n)
+        for i in range(parca.shape[1]):
+            degerler = parca.iloc[:, i].to_numpy()
+            dizi = self._diziler[i]
+            if degerler.dtype != dizi.dtype and not np.can_cast(degerler.dtype, dizi.dtype, casting='safe'):
+                # Parçada daha geniş tip (ör. int -> float): yalnızca bu sütun yükseltilir
+                hedef = np.result_type(dizi.dtype, degerler.dtype) \
+                    if dizi.dtype != object and degerler.dtype != object else np.dtype(object)
+                self._diziler[i] = dizi = dizi.astype(hedef)
+            dizi[self.satir:self.satir + n] = degerler
+        self.satir += n
+        self.veri_mb += _mb(parca)
+
+    def frame(self) -> pd.DataFrame:
+        """Biriktirilen veriyi çerçeve olarak döndürür (diziler tek tek devredilir)"""
+        kirp = self.kapasite > self.satir
+        seriler = {}
+        for i, tip in enumerate(self.tipler):
+            dizi = self._diziler[i][:self.satir]
+            if kirp:
+                dizi = dizi.copy()
+            self._diziler[i] = None
+            hedef = dizi.dtype if isinstance(tip, np.dtype) and tip.kind in 'biufcmM' else tip
+            seriler[i] = pd.Series(dizi, dtype=hedef, copy=False)
+        df = pd.DataFrame(seriler, copy=False)
+        df.columns = self.sutunlar
+        return df
+
+
+def ingest_streaming(
+    dosya,
+    dosya_adi: str,
+    map_func: Optional[Callable[[pd.DataFrame, Any], pd.DataFrame]] = None,
+    parca_satir: int = None,
+    bellek_siniri_mb: float = None,
+    progress: Optional[Callable[[float, str], None]] = None,
+    keep_original: bool = True
+) -> IngestResult:
+    """
+    Dosyayı parça parça okur, temizler ve eşleştirir.
+
+    Args:
+        dosya: Dosya benzeri nesne (Streamlit UploadedFile vb.)
+        dosya_adi: Biçimi belirlemek için dosya adı (.csv / .xlsx)
+        map_func: (parça, kalem_sutunu) -> Grup / Standart_Kalem eklenmiş parça
+        parca_satir: Parça başına satır (None ise PARCA_SATIR)
+        bellek_siniri_mb: İşlenmiş veri için bellek sınırı (None ise BELLEK_SINIRI_MB)
+        progress: (oran, mesaj) ile çağrılan ilerleme fonksiyonu
+        keep_original: Ham parçalar bellek sınırı içinde kaldıkça saklansın mı
+
+    Returns:
+        IngestResult
+
+    Raises:
+        BellekSiniriAsildi: İşlenmiş veri bellek sınırını aşarsa
+        ValueError: Desteklenmeyen dosya biçimi veya boş dosya
+    """
+    parca_satir = parca_satir or PARCA_SATIR
+    sinir = BELLEK_SINIRI_MB if bellek_siniri_mb is None else bellek_siniri_mb
+    ad = dosya_adi.lower()
+    if ad.endswith('.csv'):
+        parcalar = _csv_parcalari(dosya, parca_satir)
+    elif ad.endswith('.xlsx'):
+        parcalar = _xlsx_parcalari(dosya, parca_satir)
+    else:
+        raise ValueError(f"Parça parça okuma desteklenmiyor: {dosya_adi}")
+
+    islenmis: Optional[_SutunBiriktirici] = None
+    ham: Optional[_SutunBiriktirici] = None
+    ondalik: Dict[Any, str] = {}
+    parca_sayisi = 0
+    item_col = None
+
+    for parca, oran in parcalar:
+        temiz = _parca_temizle(parca, ondalik)
+        if map_func is not None:
+            temiz = map_func(temiz, parca.columns[0])
+
+        if islenmis is None:
+            # Toplam satır ilk parçanın ilerleme oranından tahmin edilir
+            tahmin = math.ceil(len(parca) / oran * _KAPASITE_PAYI) if oran > 0 else len(parca)
+            item_col = parca.columns[0]
+            islenmis = _SutunBiriktirici(temiz, tahmin)
+            if keep_original:
+                ham = _SutunBiriktirici(parca, tahmin)
+        islenmis.add(temiz)
+        if ham is not None:
+            ham.add(parca)
+        parca_sayisi += 1
+
+        if islenmis.mb > sinir:
+            raise BellekSiniriAsildi(
+                f"İşlenen veri {islenmis.mb:,.0f} MB ile bellek sınırını ({sinir:,.0f} MB) aştı "
+                f"({islenmis.satir:,} satırda durduruldu)."
+            )
+        # Ham kopya sınırı zorlarsa bırakılır; işlenmiş veri önceliklidir
+        if ham is not None and islenmis.mb + ham.mb > sinir:
+            ham = None
+
+        if progress is not None:
+            progress(oran, f"📥 {islenmis.satir:,} satır işlendi ({islenmis.mb:,.0f} MB)")
+
+    if islenmis is None or not islenmis.satir:
+        raise ValueError("Dosyada veri satırı bulunamadı.")
+
+    satir, bellek_mb = islenmis.satir, islenmis.veri_mb
+    return IngestResult(
+        frame=islenmis.frame(), original=ham.frame() if ham is not None else None, item_col=item_col,
+        satir=satir, parca=parca_sayisi, bellek_mb=bellek_mb, ondalik=ondalik
+    )
@@ -0,0 +1,6 @@
+"""Testler depo kökündeki düz modülleri import eder (pytest hangi dizinden çalıştırılırsa çalıştırılsın)."""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
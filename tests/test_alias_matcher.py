@@ -0,0 +1,67 @@
+import pandas as pd
+import pytest
+
+from alias_matcher import AliasMatcher, apply_compiled_mapping, schema_groups
+from schemas import SEMA_BANKA_BILANCO, SEMA_BANKA_GELIR, TMS_UFRS_ESLESTIRME
+
+
+def _eslestirici(is_banka: bool) -> AliasMatcher:
+    return AliasMatcher.from_schemas(schema_groups(
+        tms_ufrs=TMS_UFRS_ESLESTIRME,
+        banka_gelir=SEMA_BANKA_GELIR,
+        banka_bilanco=SEMA_BANKA_BILANCO,
+        is_banka=is_banka
+    ))
+
+
+@pytest.fixture(scope='module')
+def ticari():
+    return _eslestirici(False)
+
+
+@pytest.fixture(scope='module')
+def banka():
+    return _eslestirici(True)
+
+
+def _kalem(eslestirici, etiket):
+    sonuc = eslestirici.match(etiket)
+    return sonuc.standart_kalem if sonuc else None
+
+
+def test_alias_kelime_icinde_eslesmez(ticari):
+    # "ebt" alias'ı "net debt" içinde geçer ama tam kelime değildir
+    assert _kalem(ticari, 'Net Debt') != 'Vergi Öncesi Kar'
+    assert _kalem(ticari, 'EBT') == 'Vergi Öncesi Kar'
+
+
+def test_en_uzun_tam_kelime_alias_secilir(ticari):
+    assert _kalem(ticari, 'Ertelenmiş Vergi Varlığı') == 'Ertelenmiş Vergi Varlığı'
+    assert _kalem(ticari, 'Ertelenmiş Vergi Yükümlülüğü') == 'Ertelenmiş Vergi Yükümlülüğü'
+    assert _kalem(ticari, 'Sürdürülen Faaliyetler Vergi Öncesi Kar') == 'Vergi Öncesi Kar'
+    assert _kalem(ticari, 'Kurumlar Vergisi') == 'Vergi (-)'
+
+
+def test_ticari_firma_banka_semasina_eslenmez(ticari, banka):
+    kasa = ticari.match('100 Kasa')
+    assert kasa.standart_kalem == 'Nakit ve Benzerleri'
+    assert not kasa.grup.startswith('Banka')
+    assert banka.match('Kasa').standart_kalem == 'Nakit Değerler ve MB'
+    assert _kalem(banka, 'Net Satışlar') is None
+
+
+def test_noktalama_ve_turkce_buyuk_harf(ticari):
+    assert _kalem(ticari, 'NET SATIŞLAR') == 'Satış Gelirleri'
+    assert _kalem(ticari, 'Stoklar (Net)') == 'Stoklar'
+
+
+def test_kullanici_eslestirmesi_oncelikli(ticari):
+    sonuc = ticari.match('Kasa', user_mapping={'Kasa': 'Dönen Varlıklar'})
+    assert (sonuc.standart_kalem, sonuc.yontem) == ('Dönen Varlıklar', 'kullanici')
+
+
+def test_apply_compiled_mapping_eslesmeyen_etiketi_korur(ticari):
+    df = pd.DataFrame({'Hesap': ['Kasa', 'Net Debt', None], '2024': [1.0, 2.0, 3.0]})
+    sonuc = apply_compiled_mapping(df, 'Hesap', None, ticari, fuzzy=False)
+    assert sonuc['Standart_Kalem'].tolist() == ['Nakit ve Benzerleri', 'Net Debt', '']
+    assert sonuc['Grup'].tolist()[1:] == ['Diğer', 'Diğer']
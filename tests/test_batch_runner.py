@@ -0,0 +1,111 @@
+"""batch_runner: firma başına şema seçimi, veritabanı sürümü ve çöken işçiler"""
+
+import os
+import sqlite3
+
+import pandas as pd
+
+from batch_runner import (
+    VERITABANI, BatchJob, BatchResult, BatchStore, _eslestirici, detect_is_banka, jobs_from_database,
+    jobs_from_directory, run_batch
+)
+from db_pool import invalidate_company_cache
+
+BANKA_CSV = "Hesap,2022,2023\nKrediler,100,120\nMevduat,150,170\nÖzkaynaklar,20,25\nToplam Varlıklar,200,230\n"
+TICARI_CSV = (
+    "Hesap,2022,2023\nStoklar,30,40\nDönen Varlıklar,100,120\n"
+    "Kısa Vadeli Yükümlülükler,50,60\nSatış Gelirleri,500,650\n"
+)
+
+
+def test_firma_turu_hesap_adlarindan_bulunur():
+    assert detect_is_banka(['Krediler', 'Mevduat', 'Bankalar', 'Toplam Varlıklar'])
+    assert not detect_is_banka(['Stoklar', 'Ticari Alacaklar', 'Toplam Varlıklar'])
+    assert _eslestirici(True).match('Kasa').standart_kalem == 'Nakit Değerler ve MB'
+    assert _eslestirici(False).match('Kasa').standart_kalem == 'Nakit ve Benzerleri'
+
+
+def test_karisik_dizinde_her_firma_kendi_formul_setiyle_islenir(tmp_path):
+    dizin = tmp_path / 'yuklemeler'
+    dizin.mkdir()
+    (dizin / 'banka.csv').write_text(BANKA_CSV, encoding='utf-8')
+    (dizin / 'ticari.csv').write_text(TICARI_CSV, encoding='utf-8')
+    depo = BatchStore(str(tmp_path / 'depo.sqlite'))
+
+    istatistik = run_batch(jobs_from_directory(str(dizin)), depo, workers=1)
+
+    assert istatistik.tamamlanan == 2, istatistik.hatalar
+    banka = depo.read('islem').set_index('firma')['banka'].to_dict()
+    assert banka == {'banka.csv': 1, 'ticari.csv': 0}
+    rasyolar = depo.read('rasyo').groupby('firma')['rasyo'].apply(set)
+    assert 'Kredi / Mevduat (%)' in rasyolar['banka.csv']
+    assert 'Cari Oran' in rasyolar['ticari.csv']
+
+    zorla = run_batch(jobs_from_directory(str(dizin)), depo, workers=1, is_banka=False, resume=False)
+    assert zorla.tamamlanan == 2
+    assert set(depo.read('islem')['banka']) == {0}
+
+
+def test_veritabani_isleri_ozetten_surum_ve_sektorden_tur_alir(tmp_path):
+    invalidate_company_cache()
+    firmalar = [
+        {'id': 1, 'firma_adi': 'Örnek Bankası', 'sektor': 'Bankacılık'},
+        {'id': 2, 'firma_adi': 'Örnek Sanayi', 'sektor': 'Sanayi'},
+        {'id': 3, 'firma_adi': 'Özetsiz'},
+    ]
+    ozetler = {
+        1: {'latest_period': '2023/12', 'total_records': 40, 'account_count': 10},
+        2: {'latest_period': '2023/12', 'total_records': 80, 'account_count': 20},
+    }
+
+    isler = jobs_from_database(lambda: firmalar, ozetler.get)
+    invalidate_company_cache()
+
+    assert [j.surum for j in isler] == ['2023/12:40:10', '2023/12:80:20', None]
+    assert [j.is_banka for j in isler] == [True, None, None]
+    assert all(j.kaynak == VERITABANI for j in isler)
+
+    # Sürümü bilinmeyen firma tamamlanmış olsa da yeniden işlenir
+    depo = BatchStore(str(tmp_path / 'depo.sqlite'))
+    for job in isler:
+        depo.write(_bos_sonuc(job))
+    assert [j.firma for j in depo.pending(isler)] == ['3']
+
+
+def _bos_sonuc(job):
+    bos = pd.DataFrame()
+    return BatchResult(job=job, ana_tablo=bos, ozet=bos, rasyo=bos)
+
+
+def _cokertici(job, is_banka, user_mapping):
+    """'cokert' firmasında işçi süreci sonlandırır (modül seviyesinde: spawn ile pickle'lanır)"""
+    if job.firma == 'cokert':
+        os._exit(1)
+    return _bos_sonuc(job)
+
+
+def test_coken_isci_firmasi_hatali_digerleri_tamamlanir(tmp_path):
+    isler = [BatchJob(firma=ad, kaynak='test', konum=ad, surum='1') for ad in ('a', 'cokert', 'b', 'c', 'd')]
+    depo = BatchStore(str(tmp_path / 'depo.sqlite'))
+
+    istatistik = run_batch(isler, depo, workers=2, processor=_cokertici)
+
+    assert istatistik.tamamlanan == 4
+    assert list(istatistik.hatalar) == ['cokert']
+    assert 'çöktü' in istatistik.hatalar['cokert']
+    durum = depo.read('islem').set_index('firma')['durum'].to_dict()
+    assert durum == {'a': 'tamam', 'b': 'tamam', 'c': 'tamam', 'd': 'tamam', 'cokert': 'hata'}
+
+
+def test_eski_depoya_banka_sutunu_eklenir(tmp_path):
+    yol = str(tmp_path / 'eski.sqlite')
+    with sqlite3.connect(yol) as baglanti:
+        baglanti.execute(
+            'CREATE TABLE islem (firma TEXT PRIMARY KEY, ad TEXT, kaynak TEXT NOT NULL, surum TEXT, '
+            'durum TEXT NOT NULL, hata TEXT, satir INTEGER, donem INTEGER, sure REAL, zaman REAL NOT NULL)'
+        )
+
+    BatchStore(yol)
+
+    with sqlite3.connect(yol) as baglanti:
+        assert 'banka' in {s[1] for s in baglanti.execute('PRAGMA table_info(islem)')}
@@ -0,0 +1,94 @@
+"""columnar_cache: Arrow önbelleğinden geri okunan çerçeve pd.read_excel ile birebir aynı"""
+
+import datetime
+import io
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('pyarrow')
+pytest.importorskip('openpyxl')
+
+import columnar_cache  # noqa: E402
+from columnar_cache import cached_files, read_excel_cached, read_upload_cached  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def onbellek_dizini(tmp_path, monkeypatch):
+    monkeypatch.setenv('DIGICFO_CACHE_DIR', str(tmp_path / 'onbellek'))
+
+
+def _calisma_kitabi(oran=1.5):
+    df = pd.DataFrame({
+        'Hesap Kodu': ['001', '102', None],
+        'F/K': [12, 'A/D', 7.25],
+        2023: [oran, np.nan, 3.0],
+        datetime.datetime(2024, 12, 31): [1, 2, 3],
+        'Tarih': pd.to_datetime(['2024-01-31', None, '2024-03-31']),
+    })
+    tampon = io.BytesIO()
+    with pd.ExcelWriter(tampon, engine='openpyxl') as yazici:
+        df.to_excel(yazici, sheet_name='Hisseler', index=False)
+        df.head(1).to_excel(yazici, sheet_name='Özet', index=False)
+    return tampon.getvalue()
+
+
+def _ayni(beklenen, sonuc):
+    pd.testing.assert_frame_equal(beklenen, sonuc)
+    assert [type(c) for c in beklenen.columns] == [type(c) for c in sonuc.columns]
+    for i in range(beklenen.shape[1]):
+        assert [type(v) for v in beklenen.iloc[:, i]] == [type(v) for v in sonuc.iloc[:, i]]
+
+
+def test_yukleme_sicak_yolda_excel_ayristirilmadan_ayni_cerceve_doner(monkeypatch):
+    veri = _calisma_kitabi()
+    beklenen = pd.read_excel(io.BytesIO(veri))
+    _ayni(beklenen, read_upload_cached(veri, 'mizan.xlsx'))
+
+    def ayristirma(*args, **kwargs):
+        raise AssertionError('Excel yeniden ayrıştırıldı')
+
+    monkeypatch.setattr(columnar_cache.pd, 'read_excel', ayristirma)
+    sonuc = read_upload_cached(veri, 'mizan.xlsx')
+
+    _ayni(beklenen, sonuc)
+    assert sonuc['F/K'].tolist() == [12, 'A/D', 7.25]
+
+
+def test_tum_sayfalar_sirasiyla_doner():
+    veri = _calisma_kitabi()
+    beklenen = pd.read_excel(io.BytesIO(veri), sheet_name=None)
+
+    read_upload_cached(veri, 'mizan.xlsx', sheet_name=None)
+    sonuc = read_upload_cached(veri, 'mizan.xlsx', sheet_name=None)
+
+    assert list(sonuc) == ['Hisseler', 'Özet']
+    for ad in beklenen:
+        _ayni(beklenen[ad], sonuc[ad])
+
+
+def test_en_uzun_suredir_kullanilmayan_yukleme_silinir():
+    for i in range(3):
+        read_upload_cached(_calisma_kitabi(oran=float(i)), 'mizan.xlsx', max_uploads=2)
+
+    manifestler = [f for f in cached_files('yukleme-') if f.endswith('.json')]
+    assert len(manifestler) == 2
+
+
+def test_kaynak_dosya_degisince_eski_surum_silinir(tmp_path):
+    yol = str(tmp_path / 'BistTumSektorHissesort.xlsx')
+    with open(yol, 'wb') as f:
+        f.write(_calisma_kitabi())
+    ilk = read_excel_cached(yol)
+
+    with open(yol, 'wb') as f:
+        f.write(_calisma_kitabi(oran=9.0))
+    os.utime(yol, ns=(0, os.stat(yol).st_mtime_ns + 10 ** 9))
+    ikinci = read_excel_cached(yol)
+
+    assert ilk[2023].iloc[0] == 1.5
+    assert ikinci[2023].iloc[0] == 9.0
+    assert len([f for f in cached_files(yol) if f.endswith('.arrow')]) == 1
+    _ayni(pd.read_excel(yol), read_excel_cached(yol))
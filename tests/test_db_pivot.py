@@ -0,0 +1,101 @@
+"""db_pivot: dönem sırası ve yapılandırılmış uzun tablo"""
+
+import pandas as pd
+import pytest
+
+from db_pivot import FinancialTable, configured_table, load_company_frame, load_company_matrix, pivot_long
+
+sqlalchemy = pytest.importorskip('sqlalchemy')
+
+
+def test_donemler_kronolojik_siralanir():
+    df = pivot_long(['Kasa', 'Kasa', 'Banka'], ['2023/12', '2023/3', '2023/3'], [1.0, 2.0, '3,5'])
+
+    assert list(df.columns) == ['account_name', '2023/3', '2023/12']
+    assert df['2023/3'].tolist() == [2.0, 3.5]
+    assert df['2023/12'].tolist() == [1.0, 0.0]
+
+
+def test_tarihe_cevrilemeyen_donemlerde_kayit_sirasi_korunur():
+    df = pivot_long(['A', 'A'], ['2023Ç4', '2023Ç1'], [1.0, 2.0])
+
+    assert list(df.columns) == ['account_name', '2023Ç4', '2023Ç1']
+
+
+def test_varsayilan_tablo_pivotlanir_yoksa_dal_kullanilir(monkeypatch, tmp_path):
+    monkeypatch.delenv('DIGICFO_DB_VERI_TABLOSU', raising=False)
+    motor = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'a.db'}")
+    dal = pd.DataFrame({'account_name': ['Kasa', 'Banka'], '2023': ['1.000,5', '2']})
+
+    assert configured_table() == FinancialTable('financial_data')
+    # Tablo henüz yok: DAL
+    dal_ile = load_company_frame(1, fallback=lambda _: dal, engine=motor)
+    assert dal_ile['account_name'].tolist() == ['Banka', 'Kasa']
+    assert dal_ile['2023'].tolist() == [2.0, 1000.5]
+
+    with motor.begin() as b:
+        b.execute(sqlalchemy.text(
+            "CREATE TABLE financial_data (company_id INTEGER, account_name TEXT, period TEXT, value REAL)"
+        ))
+        b.execute(sqlalchemy.text(
+            "INSERT INTO financial_data VALUES (1, 'Kasa', '2023/12', 5), (1, 'Kasa', '2023/3', 4), "
+            "(1, 'Banka', '2023/3', 1)"
+        ))
+    tablodan = load_company_frame(1, fallback=lambda _: dal, engine=motor)
+    assert list(tablodan.columns) == ['account_name', '2023/3', '2023/12']
+    assert tablodan['account_name'].tolist() == ['Banka', 'Kasa']
+    assert tablodan.iloc[1, 1:].tolist() == [4.0, 5.0]
+
+    # Firmanın kaydı yoksa DAL
+    assert load_company_frame(2, fallback=lambda _: dal, engine=motor)['2023'].tolist() == [2.0, 1000.5]
+    motor.dispose()
+
+
+def test_bos_tablo_degiskeni_yalnizca_dal_kullanir(monkeypatch, tmp_path):
+    monkeypatch.setenv('DIGICFO_DB_VERI_TABLOSU', '')
+    motor = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'a.db'}")
+    with motor.begin() as b:
+        b.execute(sqlalchemy.text(
+            "CREATE TABLE financial_data (company_id INTEGER, account_name TEXT, period TEXT, value REAL)"
+        ))
+        b.execute(sqlalchemy.text("INSERT INTO financial_data VALUES (1, 'Kasa', '2023/12', 5)"))
+    dal = pd.DataFrame({'account_name': ['Kasa'], '2023': ['1.000,5']})
+
+    assert configured_table() is None
+    assert load_company_frame(1, fallback=lambda _: dal, engine=motor)['2023'].tolist() == [1000.5]
+    motor.dispose()
+
+
+def test_ozel_tablo_ve_sutun_adlari(monkeypatch, tmp_path):
+    motor = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'a.db'}")
+    with motor.begin() as b:
+        b.execute(sqlalchemy.text("CREATE TABLE kayitlar (firma INTEGER, account_name TEXT, period TEXT, value REAL)"))
+        b.execute(sqlalchemy.text("INSERT INTO kayitlar VALUES (1, 'Kasa', '2023/12', 5), (1, 'Kasa', '2023/3', 4)"))
+    dal = pd.DataFrame({'account_name': ['Kasa'], '2023': ['1.000,5']})
+
+    monkeypatch.setenv('DIGICFO_DB_VERI_TABLOSU', 'kayitlar')
+    monkeypatch.setenv('DIGICFO_DB_FIRMA_SUTUNU', 'firma')
+    assert configured_table() == FinancialTable('kayitlar', firma='firma')
+    tablodan = load_company_frame(1, fallback=lambda _: dal, engine=motor)
+    assert list(tablodan.columns) == ['account_name', '2023/3', '2023/12']
+    assert tablodan.iloc[0, 1:].tolist() == [4.0, 5.0]
+    motor.dispose()
+
+
+def test_numpy_ve_sql_stratejileri_ayni_siradadir(tmp_path):
+    motor = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'a.db'}")
+    tablo = FinancialTable('financial_data')
+    with motor.begin() as b:
+        b.execute(sqlalchemy.text(
+            "CREATE TABLE financial_data (company_id INTEGER, account_name TEXT, period TEXT, value REAL)"
+        ))
+        b.execute(sqlalchemy.text(
+            "INSERT INTO financial_data VALUES (1, 'kasa', '2023', 1), (1, 'Banka', '2023', 2), "
+            "(1, 'Alacak', '2023', 3)"
+        ))
+
+    numpy_yolu = load_company_matrix(1, motor, tablo, strategy='numpy')
+    sql_yolu = load_company_matrix(1, motor, tablo, strategy='sql')
+    pd.testing.assert_frame_equal(numpy_yolu, sql_yolu)
+    assert numpy_yolu['account_name'].tolist() == ['Alacak', 'Banka', 'kasa']
+    motor.dispose()
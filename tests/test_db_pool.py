@@ -0,0 +1,110 @@
+"""db_pool: TTL önbelleği, motor yeniden kullanımı ve havuz istatistikleri"""
+
+import pytest
+
+import db_pool
+from db_pool import TTLCache, call_with_engine, dispose_engine, engine_error, init_engine, pool_stats
+
+pytest.importorskip('sqlalchemy')
+
+
+@pytest.fixture(autouse=True)
+def _motoru_kapat():
+    dispose_engine()
+    yield
+    dispose_engine()
+
+
+class _Saat:
+    def __init__(self):
+        self.simdi = 1000.0
+
+    def __call__(self):
+        return self.simdi
+
+
+def test_ttl_suresi_dolunca_yeniden_yukler(monkeypatch):
+    saat = _Saat()
+    monkeypatch.setattr(db_pool.time, 'monotonic', saat)
+    onbellek = TTLCache()
+    cagrilar = []
+
+    def yukle():
+        cagrilar.append(1)
+        return len(cagrilar)
+
+    assert onbellek.get_or_load(('firmalar',), yukle, ttl=10) == 1
+    saat.simdi += 9
+    assert onbellek.get_or_load(('firmalar',), yukle, ttl=10) == 1
+    saat.simdi += 2
+    assert onbellek.get_or_load(('firmalar',), yukle, ttl=10) == 2
+    assert onbellek.stats()['isabet'] == 1
+    assert onbellek.stats()['iskalama'] == 2
+
+
+def test_gecersiz_kilma_ada_ve_argumana_gore():
+    onbellek = TTLCache()
+    for anahtar in [('firmalar',), ('firma_ozeti', 1), ('firma_ozeti', 2)]:
+        onbellek.get_or_load(anahtar, lambda: 'x', ttl=60)
+
+    assert onbellek.invalidate('firma_ozeti', 1) == 1
+    assert onbellek.invalidate('firma_ozeti') == 1
+    assert onbellek.invalidate() == 1
+    assert onbellek.stats()['kayit_sayisi'] == 0
+
+
+def test_ayni_adres_ayni_motoru_dondurur(tmp_path):
+    url = f"sqlite:///{tmp_path / 'a.db'}"
+    motor = init_engine(url)
+
+    assert init_engine(url) is motor
+    assert init_engine(f"sqlite:///{tmp_path / 'b.db'}") is not motor
+
+
+def test_sqlite_havuz_istatistikleri(tmp_path):
+    motor = init_engine(f"sqlite:///{tmp_path / 'a.db'}")
+    with motor.connect():
+        pass
+
+    durum = pool_stats()
+    assert durum['motor'] is True
+    assert durum['hata'] is None
+    assert durum['odunc_alma'] >= 1
+    assert durum['onbellek']['kayit_sayisi'] >= 0
+    # Dosya tabanlı SQLite'ta SQLAlchemy 2 QueuePool kullanır; bağlantı kapanınca boşa düşer
+    if durum['havuz_sinifi'] == 'QueuePool':
+        assert durum['kullanimda'] == 0
+        assert durum['bosta'] >= 1
+
+
+def test_kurulum_hatasi_saklanir(monkeypatch):
+    for degisken in db_pool.DB_URL_DEGISKENLERI:
+        monkeypatch.delenv(degisken, raising=False)
+
+    with pytest.raises(RuntimeError):
+        init_engine()
+    assert 'RuntimeError' in engine_error()
+    assert pool_stats()['hata'] == engine_error()
+
+
+def test_motor_yalnizca_engine_parametresi_alan_fonksiyona_iletilir(tmp_path):
+    motor = init_engine(f"sqlite:///{tmp_path / 'a.db'}")
+
+    def yeni_dal(company_id, engine=None):
+        return company_id, engine
+
+    def eski_dal(company_id):
+        return company_id
+
+    assert call_with_engine(yeni_dal, 7) == (7, motor)
+    assert call_with_engine(eski_dal, 7) == 7
+
+
+def test_motor_kurulamazsa_dal_engine_olmadan_cagrilir(monkeypatch):
+    monkeypatch.setenv('DATABASE_URL', 'bilinmeyen+surucu://adres')
+
+    def yeni_dal(company_id, engine=None):
+        return company_id, engine
+
+    assert call_with_engine(yeni_dal, 7) == (7, None)
+    assert engine_error() is not None
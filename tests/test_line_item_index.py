@@ -0,0 +1,42 @@
+"""line_item_index: oturum başına kalem indeksi ve ölçek çarpanı"""
+
+import pandas as pd
+
+from line_item_index import INDEX_STATE_KEY, get_kalem_index, scale_factor
+
+DONEMLER = ['2023', '2024']
+
+
+def _tablo(kalemler, degerler):
+    return pd.DataFrame({'Kalem': kalemler, '2023': degerler, '2024': [d * 2 for d in degerler]})
+
+
+def test_indeks_veri_degismedikce_yeniden_kurulmaz():
+    state = {}
+    gelir = _tablo(['Satışlar', 'Kasa'], [10.0, 1.0])
+    bilanco = _tablo(['Kasa', 'Stoklar'], [99.0, 3.0])
+
+    indeks = get_kalem_index(state, [gelir, bilanco, gelir], DONEMLER)
+
+    assert get_kalem_index(state, [gelir, bilanco, gelir], DONEMLER) is indeks
+    assert indeks.get_asc('Kasa') == [1.0, 2.0]
+    assert indeks.get_asc('Stoklar') == [3.0, 6.0]
+    assert indeks.get_asc('Yok') == [0.0, 0.0]
+
+    yeni = gelir.copy()
+    yeni.loc[0, '2023'] = 20.0
+    yenilenen = get_kalem_index(state, [yeni, bilanco], DONEMLER)
+    assert yenilenen is not indeks
+    assert state[INDEX_STATE_KEY][1] is yenilenen
+    assert yenilenen.get_asc('Satışlar') == [20.0, 20.0]
+
+
+def test_yuvarlayan_olcek_carpani_sifira_inmez():
+    def scale_df(df, scale, date_cols):
+        sonuc = df.copy()
+        sonuc[date_cols] = (sonuc[date_cols] / {'TL': 1, 'Milyon TL': 1e6}[scale]).round(2)
+        return sonuc
+
+    assert scale_factor(scale_df, 'Milyon TL', DONEMLER) == 1e-6
+    assert scale_factor(scale_df, 'TL', DONEMLER) == 1.0
+    assert scale_factor(None, 'TL', DONEMLER) == 1.0
@@ -0,0 +1,135 @@
+import json
+import time
+
+import pytest
+
+from macro_data import (
+    TCMB_KURLAR, TUIK_TUFE, LocalFileSource, MacroDataService, StaticSource, staleness_label
+)
+
+KURLAR = {'USD': 32.5, 'EUR': 35.1, 'tarih': '2024-06-28'}
+TUFE = {'tufe_yillik': 71.6, 'donem': '2024-06'}
+
+
+class _BozukKaynak:
+    """Her çağrıda hata veren kaynak"""
+
+    def __init__(self):
+        self.cagri_sayisi = 0
+
+    def fetch(self, veri_seti):
+        self.cagri_sayisi += 1
+        raise ConnectionError("ağ yok")
+
+
+def _bekle(kosul, sure=3.0):
+    bitis = time.monotonic() + sure
+    while time.monotonic() < bitis:
+        if kosul():
+            return True
+        time.sleep(0.01)
+    return kosul()
+
+
+@pytest.fixture
+def kaynak():
+    return StaticSource({TCMB_KURLAR: KURLAR, TUIK_TUFE: TUFE})
+
+
+def test_ilk_deger_arka_planda_alinir(kaynak):
+    servis = MacroDataService(kaynak, snapshot_path='')
+    try:
+        snapshot = servis.get(TCMB_KURLAR, wait=3)
+        assert snapshot.deger == KURLAR
+        assert snapshot.alinma is not None and snapshot.hata is None
+        assert servis.get(TUIK_TUFE).deger == TUFE
+    finally:
+        assert servis.stop(timeout=3)
+
+
+def test_ttl_dolmadan_kaynaga_gidilmez(kaynak):
+    servis = MacroDataService(kaynak, ttl=3600, snapshot_path='')
+    servis.min_bekleme = 0.02
+    try:
+        servis.get(TCMB_KURLAR, wait=3)
+        assert _bekle(lambda: kaynak.cagri_sayisi == 2)
+        time.sleep(0.2)
+        assert kaynak.cagri_sayisi == 2
+    finally:
+        servis.stop(timeout=3)
+
+
+def test_ttl_dolunca_yenilenir(kaynak):
+    servis = MacroDataService(kaynak, ttl=0.05, snapshot_path='')
+    servis.min_bekleme = 0.02
+    try:
+        ilk = servis.get(TCMB_KURLAR, wait=3).alinma
+        kaynak.degerler[TCMB_KURLAR] = dict(KURLAR, USD=33.0)
+        assert _bekle(lambda: servis.get(TCMB_KURLAR).deger['USD'] == 33.0)
+        assert servis.get(TCMB_KURLAR).alinma > ilk
+        assert kaynak.cagri_sayisi > 2
+    finally:
+        servis.stop(timeout=3)
+
+
+def test_kaynak_hatasinda_son_deger_korunur(kaynak):
+    servis = MacroDataService(kaynak, snapshot_path='')
+    servis.refresh_now()
+    alinma = servis.get(TCMB_KURLAR).alinma
+
+    servis.source = _BozukKaynak()
+    servis.refresh_now()
+    snapshot = servis._snapshot(TCMB_KURLAR)
+    assert snapshot.deger == KURLAR
+    assert snapshot.alinma == alinma
+    assert 'ConnectionError' in snapshot.hata
+    assert staleness_label(snapshot).endswith("(son deneme başarısız)")
+    servis.stop(timeout=3)
+
+
+def test_kaynak_hatasinda_diskteki_goruntu_kullanilir(tmp_path, kaynak):
+    yol = str(tmp_path / 'makro.json')
+    ilk = MacroDataService(kaynak, snapshot_path=yol)
+    ilk.refresh_now()
+
+    bozuk = _BozukKaynak()
+    servis = MacroDataService(bozuk, snapshot_path=yol)
+    try:
+        snapshot = servis.get(TUIK_TUFE)
+        assert snapshot.deger == TUFE
+        assert snapshot.alinma is not None
+        # Diskteki değer taze olduğu için kaynağa hiç gidilmez
+        assert _bekle(lambda: servis._ilk_tur.is_set())
+        assert bozuk.cagri_sayisi == 0
+    finally:
+        servis.stop(timeout=3)
+
+
+def test_bos_deger_basarili_sayilmaz():
+    servis = MacroDataService(StaticSource({TCMB_KURLAR: {'USD': None, 'EUR': None}, TUIK_TUFE: TUFE}),
+                              snapshot_path='')
+    servis.refresh_now()
+    assert servis._snapshot(TCMB_KURLAR).alinma is None
+    assert 'boş değer' in servis._snapshot(TCMB_KURLAR).hata
+    assert servis._snapshot(TUIK_TUFE).deger == TUFE
+
+
+def test_yerel_dosya_kaynagi(tmp_path):
+    dosya = tmp_path / 'kaynak.json'
+    dosya.write_text(json.dumps({TCMB_KURLAR: KURLAR, TUIK_TUFE: TUFE}), encoding='utf-8')
+    servis = MacroDataService(LocalFileSource(str(dosya)), snapshot_path='')
+    servis.refresh_now()
+    assert servis._snapshot(TCMB_KURLAR).deger == KURLAR
+    assert servis._snapshot(TUIK_TUFE).deger == TUFE
+
+
+def test_stop_thread_i_bitirir(kaynak):
+    servis = MacroDataService(kaynak, snapshot_path='')
+    servis.get(TCMB_KURLAR, wait=3)
+    assert servis._thread.is_alive()
+    assert servis.stop(timeout=3)
+    assert not servis._thread.is_alive()
+    # Durdurulan servis yeniden başlatılabilir
+    servis.request_refresh()
+    assert _bekle(lambda: servis._thread.is_alive() or kaynak.cagri_sayisi >= 4)
+    assert servis.stop(timeout=3)
@@ -0,0 +1,48 @@
+import sqlite3
+
+import pandas as pd
+
+import mapping_cache
+
+from alias_matcher import AliasMatcher, schema_groups
+from mapping_cache import MappingCache, apply_cached_mapping, mapping_fingerprint
+from schemas import TMS_UFRS_ESLESTIRME
+
+
+def test_bulanik_ayari_anahtari_degistirir():
+    assert mapping_fingerprint({}, 'v1', fuzzy=True) != mapping_fingerprint({}, 'v1', fuzzy=False)
+    assert mapping_fingerprint(None, 'v1') == mapping_fingerprint({}, 'v1', fuzzy=True)
+
+
+def test_bulanik_ve_kesin_sonuclar_ayri_saklanir(tmp_path):
+    eslestirici = AliasMatcher.from_schemas(schema_groups(tms_ufrs=TMS_UFRS_ESLESTIRME))
+    onbellek = MappingCache(str(tmp_path / 'eslestirme.sqlite'))
+    df = pd.DataFrame({'Hesap': ['Stoklarımız']})
+
+    bulanik = apply_cached_mapping(df, 'Hesap', None, eslestirici, onbellek, fuzzy=True)
+    kesin = apply_cached_mapping(df, 'Hesap', None, eslestirici, onbellek, fuzzy=False)
+
+    assert bulanik['Standart_Kalem'].tolist() == ['Stoklar']
+    assert kesin['Standart_Kalem'].tolist() == ['Stoklarımız']
+    assert onbellek.stats()['kayit_sayisi'] == 2
+
+
+def test_her_islemden_sonra_baglanti_kapatilir(tmp_path, monkeypatch):
+    acilan, gercek = [], sqlite3.connect
+
+    def baglan(*args, **kwargs):
+        acilan.append(gercek(*args, **kwargs))
+        return acilan[-1]
+
+    monkeypatch.setattr(mapping_cache.sqlite3, 'connect', baglan)
+    onbellek = MappingCache(str(tmp_path / 'eslestirme.sqlite'))
+    onbellek.store('k', {'Kasa': ('Nakit ve Benzerleri', 'Dönen Varlıklar')})
+
+    assert onbellek.lookup('k', ['Kasa']) == {'Kasa': ('Nakit ve Benzerleri', 'Dönen Varlıklar')}
+    assert len(acilan) == 3
+    for baglanti in acilan:
+        try:
+            baglanti.execute('SELECT 1')
+        except sqlite3.ProgrammingError:
+            continue
+        raise AssertionError('bağlantı açık kaldı')
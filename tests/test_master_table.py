@@ -0,0 +1,84 @@
+"""master_table: dönem sıklığı ve tek tarihli makro gözlemlerin hizalanması"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from macro_data import TCMB_KURLAR, TUIK_TUFE, MacroSnapshot
+from master_table import (
+    MasterTable, macro_from_firma_bilgi, macro_from_service, period_dates, period_position, periods_per_year
+)
+
+
+@pytest.mark.parametrize('donemler, beklenen', [
+    (['2023-01', '2023-02', '2023-03', '2023-04'], 12),
+    (['2023-03-31', '2023-06-30', '2023-09-30'], 4),
+    (['2021', '2022', '2023'], 1),
+    (['2023'], 1),
+])
+def test_yil_basina_donem(donemler, beklenen):
+    tarihler = period_dates(donemler)
+    assert periods_per_year(tarihler) == beklenen
+
+
+def test_donem_konumu_baslangic_ve_bitis_etiketleri():
+    yillik = ['2022', '2023']
+    assert period_position('2023-05-01', yillik) == 1
+    assert period_position('2024-01-01', yillik) is None
+    assert period_position('2021-06-30', yillik) is None
+
+    ceyrek_sonu = ['2023-03-31', '2023-06-30', '2023-09-30']
+    assert period_position('2023-01-15', ceyrek_sonu) == 0
+    assert period_position('2023-06-30', ceyrek_sonu) == 1
+    assert period_position('2023-10-01', ceyrek_sonu) is None
+    assert period_position('2023-01-01', ['Q1', 'Q2']) is None
+
+
+def test_form_degerleri_gecmise_yayilmaz():
+    firma_bilgi = {'TCMB Dolar Döviz Alış Kuru': 32.0, 'Yıllık TÜFE (%)': 0, 'TCMB Euru Döviz Alış Kuru': None}
+    donemler = ['2021', '2022', '2023']
+
+    assert macro_from_firma_bilgi(firma_bilgi, donemler, tarih='2019-01-01') == {}
+    makro = macro_from_firma_bilgi(firma_bilgi, donemler, tarih='2023-08-15')
+    assert list(makro) == ['USD']
+    np.testing.assert_array_equal(makro['USD'], [np.nan, np.nan, 32.0])
+
+    df = pd.DataFrame({'Kalem': ['Satışlar'], '2021': [64.0], '2022': [96.0], '2023': [128.0]})
+    ana = MasterTable.from_statements({'Gelir Tablosu': df}, donemler, makro=makro)
+    np.testing.assert_array_equal(ana.in_currency('USD')[0], [np.nan, np.nan, 4.0])
+
+
+class _Servis:
+    def __init__(self, veriler):
+        self.veriler = veriler
+
+    def get(self, veri_seti):
+        return MacroSnapshot(self.veriler[veri_seti], alinma=0.0)
+
+
+def test_servis_degerleri_gozlem_tarihine_yazilir():
+    servis = _Servis({
+        TCMB_KURLAR: {'USD': 30.0, 'EUR': 33.0, 'tarih': '2023-02-10'},
+        TUIK_TUFE: {'tufe_yillik': 60.0, 'donem': None},
+    })
+
+    makro = macro_from_service(servis, ['2023-01', '2023-02', '2023-03'])
+
+    assert sorted(makro) == ['EUR', 'USD']
+    np.testing.assert_array_equal(makro['USD'], [np.nan, 30.0, np.nan])
+
+
+def test_tek_tarihli_tufe_sabit_oran_olarak_kullanilir():
+    donemler = ['2022-12-31', '2023-12-31', '2024-12-31']
+    makro = macro_from_firma_bilgi({'Yıllık TÜFE (%)': 50.0}, donemler, tarih='2024-06-30')
+    np.testing.assert_array_equal(makro['tufe_yillik'], [np.nan, np.nan, 50.0])
+
+    df = pd.DataFrame({'Kalem': ['Satışlar'], '2022-12-31': [100.0], '2023-12-31': [150.0], '2024-12-31': [225.0]})
+    ana = MasterTable.from_statements({'Gelir Tablosu': df}, donemler, makro=makro)
+
+    endeks = ana.inflation_index()
+    assert np.isfinite(endeks).all()
+    np.testing.assert_allclose(endeks, [1.0, 1.5, 2.25], rtol=1e-2)
+    ozet = ana.summary()
+    assert np.isfinite(ozet['Reel YBBO (%)']).all()
+    assert ozet['Reel YBBO (%)'].iloc[0] == pytest.approx(0.0, abs=1.0)
@@ -0,0 +1,65 @@
+"""number_parser: Türkçe biçimli hücrelerin sütun bazında çözümlenmesi"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from number_parser import clean_turkish_float_series, parse_turkish_number
+
+ORNEKLER = [
+    ("1.234,56", 1234.56),
+    ("1.234.567,89", 1234567.89),
+    ("(1.234)", -1234.0),
+    ("(1.234,5)", -1234.5),
+    ("-1.234,5", -1234.5),
+    ("-", 0.0),
+    ("A/D", 0.0),
+    ("%12,5", 12.5),
+    ("12,5 %", 12.5),
+    ("", 0.0),
+    ("   ", 0.0),
+    (None, 0.0),
+    (np.nan, 0.0),
+    (42, 42.0),
+    (3.5, 3.5),
+    ("metin", 0.0),
+]
+
+
+@pytest.mark.parametrize("deger, beklenen", ORNEKLER)
+def test_hucre_bazli_referans(deger, beklenen):
+    assert parse_turkish_number(deger) == beklenen
+
+
+def test_sutun_bazli_sonuc_hucre_bazli_ile_ayni():
+    seri = pd.Series([d for d, _ in ORNEKLER], dtype=object, index=range(10, 10 + len(ORNEKLER)), name='2024')
+
+    sonuc = clean_turkish_float_series(seri)
+
+    assert sonuc.dtype == 'float64'
+    assert sonuc.name == '2024'
+    assert sonuc.index.tolist() == seri.index.tolist()
+    assert sonuc.tolist() == [b for _, b in ORNEKLER]
+
+
+def test_tamami_metin_ve_bos_sutun():
+    seri = pd.Series(["1.234,56", "(1.234)", "-", "%12,5", "", np.nan], dtype=object)
+
+    assert clean_turkish_float_series(seri).tolist() == [1234.56, -1234.0, 0.0, 12.5, 0.0, 0.0]
+    assert clean_turkish_float_series(pd.Series([np.nan, np.nan])).tolist() == [0.0, 0.0]
+
+
+def test_ingilizce_bicimli_sutun_otomatik_tespit_edilir():
+    seri = pd.Series(["1,234.56", "(2,000.5)", "-"], dtype=object)
+
+    assert clean_turkish_float_series(seri).tolist() == [1234.56, -2000.5, 0.0]
+    assert clean_turkish_float_series(seri, decimal=",").tolist() == [1.23456, -2.0005, 0.0]
+
+
+def test_utils_clean_turkish_float_ile_ayni():
+    utils = pytest.importorskip("utils")
+    seri = pd.Series([d for d, _ in ORNEKLER], dtype=object)
+
+    beklenen = seri.apply(utils.clean_turkish_float).astype('float64')
+
+    assert clean_turkish_float_series(seri).tolist() == beklenen.tolist()
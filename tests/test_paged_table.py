@@ -0,0 +1,37 @@
+"""paged_table: karışık tipli sıralama ve tekrar eden sütun adları"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from paged_table import PagedTable, benzersiz_sutunlar
+
+
+def test_karisik_sutun_once_sayilar_sonra_metinler_siralanir():
+    df = pd.DataFrame({'Kalem': list('abcdef'), 'Not': [10, 'b', np.nan, 2.5, 'a', 1]})
+    tablo = PagedTable(df)
+
+    artan = tablo.window(0, 10, sort_col='Not')['Kalem'].tolist()
+    azalan = tablo.window(0, 10, sort_col='Not', ascending=False)['Kalem'].tolist()
+
+    assert artan == ['f', 'd', 'a', 'e', 'b', 'c']
+    assert azalan == ['b', 'e', 'a', 'd', 'f', 'c']
+
+
+def test_siralama_ve_filtre_filtre_sonrasi_konumlarla_calisir():
+    df = pd.DataFrame({'Kalem': ['Kasa', 'Banka', 'Kasa 2', 'Stok'], '2023': [3.0, 1.0, 2.0, 4.0]})
+    tablo = PagedTable(df)
+
+    assert tablo.index(sort_col='2023', filtre='kasa').tolist() == [2, 0]
+
+
+def test_tekrar_eden_sutun_adlari():
+    df = pd.DataFrame([['Kasa', 1.0, 'x'], ['Banka', 2.0, 'kasa notu']], columns=['Kalem', '2023', 'Kalem'])
+    tablo = PagedTable(df)
+
+    assert benzersiz_sutunlar(df) == ['2023']
+    assert tablo.index(sort_col='2023', ascending=False).tolist() == [1, 0]
+    # "Tüm metin sütunları" filtresi tekrar eden adlı sütunları da tarar
+    assert tablo.index(filtre='kasa').tolist() == [0, 1]
+    with pytest.raises(ValueError):
+        tablo.index(sort_col='Kalem')
@@ -0,0 +1,63 @@
+"""parallel_sheets: süreç havuzunda okunan sayfalar pd.read_excel ile aynı ve çalışma kitabı sırasında"""
+
+import io
+
+import pandas as pd
+import pytest
+
+pytest.importorskip('openpyxl')
+
+import columnar_cache  # noqa: E402
+from parallel_sheets import read_excel_multi_sheet_parallel, read_sheets_parallel, shutdown_pool  # noqa: E402
+
+
+@pytest.fixture(scope='module', autouse=True)
+def havuzu_kapat():
+    yield
+    shutdown_pool()
+
+
+def _calisma_kitabi():
+    tampon = io.BytesIO()
+    with pd.ExcelWriter(tampon, engine='openpyxl') as yazici:
+        for i, ad in enumerate(['2024', 'Gelir', '2023']):
+            pd.DataFrame({
+                'Hesap Adı': [f"Hesap {j}" for j in range(5)],
+                'Tutar': [float(i * 10 + j) for j in range(5)],
+            }).to_excel(yazici, sheet_name=ad, index=False)
+    return tampon.getvalue()
+
+
+def test_paralel_ve_sirali_okuma_ayni_sonucu_verir():
+    veri = _calisma_kitabi()
+    beklenen = pd.read_excel(io.BytesIO(veri), sheet_name=None)
+
+    paralel = read_excel_multi_sheet_parallel(veri, max_workers=2, dosya_adi='donemler.xlsx')
+    sirali = read_sheets_parallel(veri, parallel=False)
+
+    assert list(paralel) == ['2024', 'Gelir', '2023']
+    for ad, df in beklenen.items():
+        pd.testing.assert_frame_equal(paralel[ad], df)
+        pd.testing.assert_frame_equal(sirali[ad].df, df)
+    assert sirali['Gelir'].yapi['kalem_sutunu'] == 'Hesap Adı'
+    assert sirali['Gelir'].yapi['donem_sutunlari'] == ['Tutar']
+
+
+def test_tum_sayfa_onbellek_okumasi_havuzu_kullanir(tmp_path, monkeypatch):
+    pytest.importorskip('pyarrow')
+    monkeypatch.setenv('DIGICFO_CACHE_DIR', str(tmp_path))
+    monkeypatch.setattr(columnar_cache, 'default_workers', lambda: 2)
+    cagrilar = []
+
+    def paralel(*args, **kwargs):
+        cagrilar.append(kwargs.get('dosya_adi'))
+        return read_excel_multi_sheet_parallel(*args, max_workers=2, **kwargs)
+
+    monkeypatch.setattr(columnar_cache, 'read_excel_multi_sheet_parallel', paralel)
+    veri = _calisma_kitabi()
+
+    sonuc = columnar_cache.read_upload_cached(veri, 'donemler.xlsx', sheet_name=None)
+
+    assert cagrilar == ['donemler.xlsx']
+    assert list(sonuc) == ['2024', 'Gelir', '2023']
+    pd.testing.assert_frame_equal(sonuc['2023'], pd.read_excel(io.BytesIO(veri), sheet_name='2023'))
@@ -0,0 +1,79 @@
+"""ratio_cache: ölçek değişiminde isabet, tek kalem düzenlemesinde kısmi hesap ve LRU"""
+
+import numpy as np
+import pandas as pd
+
+from line_item_index import KalemIndex
+from ratio_cache import RatioCache
+from ratio_engine import RatioEngine
+
+DONEMLER = ['2022', '2023']
+
+FORMULLER = {
+    "Cari Oran": "[Dönen Varlıklar] / [Kısa Vadeli Yükümlülükler]",
+    "Net Kar Marjı (%)": "[Net Kar] / [Satışlar] * 100",
+    "Özkaynak": "[Dönen Varlıklar] - [Kısa Vadeli Yükümlülükler]",
+    "Artı Bir": "[Satışlar] + 1",
+}
+
+
+def _indeks(degisiklik=None):
+    satirlar = {
+        'Dönen Varlıklar': [200.0, 300.0],
+        'Kısa Vadeli Yükümlülükler': [100.0, 150.0],
+        'Net Kar': [10.0, 30.0],
+        'Satışlar': [100.0, 200.0],
+    }
+    satirlar.update(degisiklik or {})
+    df = pd.DataFrame([{'Kalem': k, **dict(zip(DONEMLER, v))} for k, v in satirlar.items()])
+    return KalemIndex(df, DONEMLER)
+
+
+def test_olcek_degisiminde_isabet_ve_dogru_olcekleme():
+    motor = RatioEngine(FORMULLER)
+    onbellek = RatioCache()
+    indeks = _indeks()
+    onbellek.compute(motor, indeks)
+    assert onbellek.iskalama == len(FORMULLER)
+
+    indeks.set_scale_factor(0.001)
+    tablo = onbellek.compute(motor, indeks)
+
+    # Homojen formüller ölçekten bağımsız saklanır; yalnızca sabit içeren formül yeniden hesaplanır
+    assert onbellek.son_hesaplanan == ["Artı Bir"]
+    assert onbellek.isabet == 3
+    beklenen = motor.evaluate_index(indeks)
+    pd.testing.assert_frame_equal(tablo, beklenen)
+    np.testing.assert_allclose(tablo.loc["Cari Oran"], [2.0, 2.0])
+    np.testing.assert_allclose(tablo.loc["Özkaynak"], [0.1, 0.15])
+    np.testing.assert_allclose(tablo.loc["Artı Bir"], [1.1, 1.2])
+
+
+def test_tek_kalem_duzenlemesinde_yalnizca_bagimli_rasyolar_hesaplanir():
+    motor = RatioEngine(FORMULLER)
+    onbellek = RatioCache()
+    onbellek.compute(motor, _indeks())
+
+    duzenlenmis = _indeks({'Net Kar': [10.0, 40.0]})
+    tablo = onbellek.compute(motor, duzenlenmis)
+
+    assert onbellek.son_hesaplanan == RatioCache.dependents(motor, 'Net Kar') == ["Net Kar Marjı (%)"]
+    np.testing.assert_allclose(tablo.loc["Net Kar Marjı (%)"], [10.0, 20.0])
+    pd.testing.assert_frame_equal(tablo, motor.evaluate_index(duzenlenmis))
+
+
+def test_lru_tahliyesi():
+    motor = RatioEngine({"Cari Oran": FORMULLER["Cari Oran"]})
+    onbellek = RatioCache(max_entries=2)
+    a, b, c = _indeks(), _indeks({'Dönen Varlıklar': [1.0, 1.0]}), _indeks({'Dönen Varlıklar': [2.0, 2.0]})
+
+    onbellek.compute(motor, a)
+    onbellek.compute(motor, b)
+    onbellek.compute(motor, a)          # a en son kullanılan olur
+    onbellek.compute(motor, c)          # b tahliye edilir
+    assert onbellek.stats()['kayit_sayisi'] == 2
+
+    onbellek.compute(motor, a)
+    assert onbellek.son_hesaplanan == []
+    onbellek.compute(motor, b)
+    assert onbellek.son_hesaplanan == ["Cari Oran"]
@@ -0,0 +1,104 @@
+"""ratio_engine: vektörel sonuçların dönem dönem skaler hesapla karşılaştırılması"""
+
+import math
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ratio_engine import BANKA_FORMULLER, TICARI_FORMULLER, get_ratio_engine
+
+DONEMLER = ['2021', '2022', '2023']
+
+
+class _Skaler:
+    """Eski skaler hesabın bölme kuralı: payda 0 ise sonuç NaN"""
+
+    def __init__(self, deger):
+        self.deger = float(deger)
+
+    @staticmethod
+    def _d(x):
+        return x.deger if isinstance(x, _Skaler) else float(x)
+
+    def __add__(self, o): return _Skaler(self.deger + self._d(o))
+    def __radd__(self, o): return _Skaler(self._d(o) + self.deger)
+    def __sub__(self, o): return _Skaler(self.deger - self._d(o))
+    def __rsub__(self, o): return _Skaler(self._d(o) - self.deger)
+    def __mul__(self, o): return _Skaler(self.deger * self._d(o))
+    def __rmul__(self, o): return _Skaler(self._d(o) * self.deger)
+    def __neg__(self): return _Skaler(-self.deger)
+    def __abs__(self): return _Skaler(abs(self.deger))
+
+    def __truediv__(self, o):
+        payda = self._d(o)
+        return _Skaler(self.deger / payda if payda != 0 else math.nan)
+
+
+def _get_asc(df, kalem):
+    """Eski get_asc: kalemin ilk satırı, boş değer ve olmayan kalem 0"""
+    satirlar = df[df['Standart_Kalem'] == kalem]
+    if satirlar.empty:
+        return [0.0] * len(DONEMLER)
+    return [0.0 if pd.isna(v) else float(v) for v in pd.to_numeric(satirlar.iloc[0][DONEMLER], errors='coerce')]
+
+
+def _skaler_rasyolar(df, formuller):
+    sonuc = {}
+    for ad, formul in formuller.items():
+        ifade = re.sub(r"\[([^\[\]]+)\]", lambda m: f"d({m.group(1)!r})", formul)
+        satir = []
+        for j in range(len(DONEMLER)):
+            d = lambda kalem: _Skaler(_get_asc(df, kalem)[j])
+            satir.append(eval(ifade, {'d': d, 'abs': abs}).deger)
+        sonuc[ad] = satir
+    return pd.DataFrame.from_dict(sonuc, orient='index', columns=DONEMLER)
+
+
+@pytest.fixture
+def ticari_df():
+    # Stoklar eksik, Kısa Vadeli Yükümlülükler 2022'de 0, Özkaynaklar 2023'te boş,
+    # Dönen Varlıklar iki kez geçiyor (ilk satır kullanılır)
+    return pd.DataFrame({
+        'Standart_Kalem': [
+            'Dönen Varlıklar', 'Dönen Varlıklar', 'Kısa Vadeli Yükümlülükler', 'Uzun Vadeli Yükümlülükler',
+            'Toplam Varlıklar', 'Özkaynaklar', 'Nakit ve Benzerleri', 'Satış Gelirleri',
+            'Satışların Maliyeti (-)', 'Brüt Kar/Zarar', 'Net Kar/Zarar', 'FAVÖK (EBITDA)',
+        ],
+        '2021': [100.0, 999.0, 50.0, 30.0, 300.0, 120.0, 10.0, 500.0, -300.0, 200.0, 40.0, 0.0],
+        '2022': [120.0, 999.0, 0.0, 35.0, 320.0, 0.0, 15.0, 0.0, -320.0, 180.0, -5.0, 60.0],
+        '2023': [150.0, 999.0, 70.0, 40.0, 360.0, np.nan, 20.0, 650.0, -400.0, 250.0, 55.0, 90.0],
+    })
+
+
+@pytest.mark.parametrize('is_banka, formuller', [(False, TICARI_FORMULLER), (True, BANKA_FORMULLER)])
+def test_vektorel_sonuc_skaler_hesapla_ayni(ticari_df, is_banka, formuller):
+    motor = get_ratio_engine(is_banka)
+
+    vektorel = motor.evaluate_frame(ticari_df, DONEMLER)
+    skaler = _skaler_rasyolar(ticari_df, formuller)
+
+    assert list(vektorel.index) == list(formuller)
+    np.testing.assert_allclose(vektorel.to_numpy(), skaler.to_numpy(), equal_nan=True)
+
+
+def test_sifir_payda_nan_eksik_kalem_sifir(ticari_df):
+    tablo = get_ratio_engine().evaluate_frame(ticari_df, DONEMLER)
+
+    assert np.isnan(tablo.loc['Cari Oran', '2022'])
+    assert tablo.loc['Cari Oran', '2021'] == pytest.approx(2.0)
+    # Stoklar yok: asit-test cari orana eşit, stok devir hızı her dönem NaN
+    assert tablo.loc['Asit-Test Oranı', '2023'] == pytest.approx(150 / 70)
+    assert np.isnan(tablo.loc['Stok Devir Hızı']).all()
+    # Boş Özkaynaklar 0 sayılır
+    assert np.isnan(tablo.loc['Özkaynak Karlılığı (ROE, %)', '2023'])
+
+
+def test_ort_onceki_donemle_ortalama(ticari_df):
+    motor = get_ratio_engine(formuller={'ROE (ort)': '[Net Kar/Zarar] / ort([Özkaynaklar]) * 100'})
+
+    tablo = motor.evaluate_frame(ticari_df, DONEMLER)
+
+    assert tablo.loc['ROE (ort)'].tolist()[:2] == pytest.approx([40 / 120 * 100, -5 / 60 * 100])
+    assert np.isnan(tablo.loc['ROE (ort)', '2023'])
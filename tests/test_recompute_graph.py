@@ -0,0 +1,96 @@
+"""recompute_graph: atlama / yeniden hesaplama ve yarıda kalan çalıştırmalar"""
+
+import numpy as np
+import pytest
+
+from recompute_graph import DEGISMEDI, GUNCEL, HATA, HESAPLANDI, RecomputeGraph
+
+DONEMLER = ['2022', '2023']
+
+
+def _graf(cagrilar, hata=None):
+    """toplam (a + b) -> iki_kat (toplam * 2); c yalnızca ayri düğümünde"""
+    def toplam(g):
+        cagrilar.append('toplam')
+        return g.kalemler['a'] + g.kalemler['b']
+
+    def ayri(g):
+        cagrilar.append('ayri')
+        if hata and hata[0]:
+            raise RuntimeError("ayri hesaplanamadı")
+        return g.kalemler['c'] * 10
+
+    def iki_kat(g):
+        cagrilar.append('iki_kat')
+        return g.sonuclar['toplam'] * 2
+
+    graf = RecomputeGraph()
+    graf.add('toplam', toplam, ['a', 'b'])
+    graf.add('ayri', ayri, ['c'])
+    graf.add('iki_kat', iki_kat, bagimliliklar=['toplam'])
+    return graf
+
+
+def _kalemler(a=1.0, b=2.0, c=3.0):
+    return {'a': np.array([a, a]), 'b': np.array([b, b]), 'c': np.array([c, c])}
+
+
+def test_yalnizca_degisen_kalemin_dugumleri_hesaplanir():
+    cagrilar = []
+    graf = _graf(cagrilar)
+    graf.update(_kalemler(), DONEMLER)
+    assert cagrilar == ['toplam', 'ayri', 'iki_kat']
+
+    cagrilar.clear()
+    graf.update(_kalemler(), DONEMLER)
+    assert cagrilar == []
+
+    cagrilar.clear()
+    sonuc = graf.update(_kalemler(c=4.0), DONEMLER)
+    assert cagrilar == ['ayri']
+    assert sonuc['ayri'].tolist() == [40.0, 40.0]
+
+    cagrilar.clear()
+    sonuc = graf.update(_kalemler(a=5.0, c=4.0), DONEMLER)
+    assert cagrilar == ['toplam', 'iki_kat']
+    assert sonuc['iki_kat'].tolist() == [14.0, 14.0]
+
+
+def test_sonucu_degismeyen_dugumun_bagimlilari_atlanir():
+    cagrilar = []
+    graf = _graf(cagrilar)
+    graf.update(_kalemler(), DONEMLER)
+
+    cagrilar.clear()
+    graf.update(_kalemler(a=2.0, b=1.0), DONEMLER)
+
+    assert cagrilar == ['toplam']
+    durum = {s['Düğüm']: s['Durum'] for s in graf.timings()}
+    assert durum == {'toplam': DEGISMEDI, 'ayri': GUNCEL, 'iki_kat': GUNCEL}
+
+
+def test_hata_sonrasi_degisen_kalemler_kaybolmaz():
+    cagrilar, hata = [], [False]
+    graf = _graf(cagrilar, hata)
+    graf.update(_kalemler(), DONEMLER)
+
+    # a ve c değişir; toplam hesaplanır, ayri hata verir, iki_kat hiç çalışmaz
+    hata[0] = True
+    cagrilar.clear()
+    with pytest.raises(RuntimeError):
+        graf.update(_kalemler(a=5.0, c=4.0), DONEMLER)
+    assert cagrilar == ['toplam', 'ayri']
+    assert {s['Düğüm']: s['Durum'] for s in graf.timings()}['ayri'] == HATA
+
+    # Aynı veriyle tekrar: c hâlâ değişmiş sayılır, toplam değişmese de iki_kat hesaplanır
+    hata[0] = False
+    cagrilar.clear()
+    sonuc = graf.update(_kalemler(a=5.0, c=4.0), DONEMLER)
+    assert cagrilar == ['toplam', 'ayri', 'iki_kat']
+    assert sonuc['ayri'].tolist() == [40.0, 40.0]
+    assert sonuc['iki_kat'].tolist() == [14.0, 14.0]
+
+    cagrilar.clear()
+    graf.update(_kalemler(a=5.0, c=4.0), DONEMLER)
+    assert cagrilar == []
+    assert all(s['Durum'] in (GUNCEL, HESAPLANDI) for s in graf.timings())
@@ -0,0 +1,43 @@
+"""session_data_store: sürüm yalnızca içerik değişince artar"""
+
+import pandas as pd
+
+import session_data_store
+from session_data_store import SessionDataStore, frame_fingerprint
+
+
+def _ornek():
+    return pd.DataFrame({'Kalem': ['Kasa', 'Stoklar'], '2023': [1.0, 2.0], '2024': [3.0, 4.0]})
+
+
+def test_ayni_icerik_yeniden_yayinlaninca_surum_artmaz():
+    state = {}
+    depo = SessionDataStore(state)
+    assert depo.publish(_ornek()) == 1
+    depo.derived('toplam', lambda df: df['2024'].sum())
+
+    # Her çalıştırmada yeniden kurulan çerçeve: farklı tamponlar, aynı içerik
+    assert depo.publish(_ornek()) == 1
+    assert depo.get_derived('toplam') == 7.0
+
+    degisen = _ornek()
+    degisen.loc[0, '2024'] = 5.0
+    assert depo.publish(degisen) == 2
+    assert depo.get_derived('toplam') is None
+    assert state['df_ham'].loc[0, '2024'] == 5.0
+
+
+def test_copy_on_write_kapaliyken_derin_kopyalar_ayni_surumu_korur(monkeypatch):
+    monkeypatch.setattr(session_data_store, 'copy_on_write_enabled', lambda: False)
+    state = {}
+    depo = SessionDataStore(state)
+    depo.publish(_ornek())
+    tutamac = depo.handle('df_ham')
+
+    assert tutamac is not depo.frame
+    assert frame_fingerprint(tutamac) == frame_fingerprint(depo.frame)
+    assert depo.publish(tutamac) == 1
+
+    tutamac.loc[1, '2023'] = 9.0
+    assert frame_fingerprint(tutamac) != frame_fingerprint(depo.frame)
+    assert depo.publish(tutamac) == 2
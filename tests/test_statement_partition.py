@@ -0,0 +1,37 @@
+"""statement_partition: satırların tablolara ayrılması"""
+
+import pandas as pd
+
+from statement_partition import BILANCO, DIGER, GELIR, NAKIT, build_statement_lookup, partition_statements
+
+
+def test_grup_adinda_gider_veya_kar_gecen_bilanco_kalemleri_bilancoda_kalir():
+    df = pd.DataFrame({
+        'Kalem': ['Peşin Giderler', 'Satışlar', 'Birikmiş Kar', 'Faaliyet Giderleri', 'Kıdem', 'Tahsilat', 'Not'],
+        'Grup': [
+            'Gelecek Aylara Ait Giderler', 'Hasılat', 'Geçmiş Yıllar Karları', 'Faaliyet Giderleri',
+            'Borç ve Gider Karşılıkları', 'İşletme Faaliyetlerinden Nakit Akışları', 'Açıklama',
+        ],
+        '2024': [1.0, 2.0, 3.0, 4.0, 5.0, 6.0, 7.0],
+    })
+
+    tablolar = partition_statements(df, 'Kalem', {})
+
+    assert tablolar.get(GELIR)['Kalem'].tolist() == ['Satışlar', 'Faaliyet Giderleri']
+    assert tablolar.get(BILANCO)['Kalem'].tolist() == ['Peşin Giderler', 'Birikmiş Kar', 'Kıdem']
+    assert tablolar.get(NAKIT)['Kalem'].tolist() == ['Tahsilat']
+    assert tablolar.get(DIGER)['Kalem'].tolist() == ['Not']
+    assert len(tablolar.full) == len(df)
+
+
+def test_grup_yoksa_sema_isimleriyle_siniflandirilir():
+    lookup = build_statement_lookup(
+        sema_gelir={'Hasılat': {'alternatif_isimler': ['Net Satışlar']}},
+        sema_bilanco={'Stoklar': ['Ticari Mallar']},
+    )
+    df = pd.DataFrame({'Kalem': ['ticari mallar', 'NET SATIŞLAR', 'Bilinmeyen'], '2024': [1.0, 2.0, 3.0]})
+
+    tablolar = partition_statements(df, 'Kalem', lookup, statement_col='Tablo')
+
+    assert tablolar.counts() == {GELIR: 1, BILANCO: 1, NAKIT: 0, DIGER: 1}
+    assert tablolar.full['Tablo'].tolist() == ['Gelir Tablosu', 'Bilanço', 'Diğer']
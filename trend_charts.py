@@ -0,0 +1,173 @@
+"""
+Trend Analizi sekmesi için toplu (vektörel) grafik hazırlığı ve sayfalama.
+
+"📈 Grafikler" sekmesi her yeniden çalıştırmada her ``Standart_Kalem`` için
+ayrı bir boolean filtre, ``melt``, ``px.bar`` ve ``plotly_chart``
+çalıştırıyordu; 300 kalemde her etkileşim 300 grafik demekti. Bu modül:
+
+    - Tüm tabloyu bir kez float64 matrise çevirir ve kalem / grup
+      indekslerini kurar (kalem başına filtre ve melt yok)
+    - Yalnızca görünen sayfadaki grafikleri, px yerine doğrudan
+      ``go.Bar`` ile kurar
+    - Kurulan grafikleri (grup, kalem) başına saklar; tablo veya dönem
+      sütunları değişince (parmak izi) yeniden kurulur
+
+Örnek:
+    grafikler = TrendCharts.for_session(st.session_state, df, numeric_cols)
+    kalemler = grafikler.items(selected_group)
+    for fig in grafikler.figures(selected_group, 0, 20):
+        st.plotly_chart(fig)
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, MutableMapping, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from session_data_store import frame_fingerprint
+
+# Tüm gruplar
+TUMU = "Tümü"
+
+# Sayfa başına grafik seçenekleri (2'li ızgara)
+SAYFA_BOYUTLARI = (10, 20, 50)
+
+# Bellekte tutulacak en fazla grafik
+VARSAYILAN_GRAFIK_KAPASITESI = 600
+
+# Grafiklerin session_state anahtarı
+STATE_KEY = '_trend_grafikleri'
+
+# px.bar'ın ilk renk (plotly varsayılan paleti)
+_RENK = '#636efa'
+
+
+class TrendCharts:
+    """Bir veri sürümünün trend grafikleri (kalem başına bar grafiği)"""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        numeric_cols: Sequence[Any],
+        item_col: Optional[Any] = None,
+        kapasite: int = VARSAYILAN_GRAFIK_KAPASITESI
+    ):
+        """
+        Args:
+            df: Standartlaştırılmış veri (Grup / Standart_Kalem sütunlarıyla)
+            numeric_cols: Dönem sütunları (x ekseni sırası)
+            item_col: Grafik başına kalem sütunu (None ise Standart_Kalem, yoksa ilk sütun)
+            kapasite: Saklanacak en fazla grafik sayısı
+        """
+        self.anahtar = self.key_for(df, numeric_cols)
+        self.item_col = item_col if item_col is not None else (
+            'Standart_Kalem' if 'Standart_Kalem' in df.columns else df.columns[0]
+        )
+        self.donemler = list(numeric_cols)
+        self.kapasite = kapasite
+
+        # Tek seferlik dönüşüm: kalem kodları, grup dizisi ve değer matrisi
+        self._kodlar, self._kalemler = pd.factorize(df[self.item_col], use_na_sentinel=False)
+        self._gruplar = df['Grup'].to_numpy() if 'Grup' in df.columns else None
+        self._degerler = (
+            df[self.donemler].apply(pd.to_numeric, errors='coerce').to_numpy(dtype='float64')
+            if self.donemler else np.empty((len(df), 0))
+        )
+
+        self._grup_kalemleri: Dict[Hashable, List[int]] = {}
+        self._grafikler: 'OrderedDict[Tuple[Hashable, int], go.Figure]' = OrderedDict()
+        self._kilit = threading.Lock()
+
+    @staticmethod
+    def key_for(df: pd.DataFrame, numeric_cols: Sequence[Any]) -> Tuple:
+        """Veri parmak izi + dönem sütunları"""
+        return frame_fingerprint(df), tuple(numeric_cols)
+
+    @classmethod
+    def for_session(
+        cls,
+        state: MutableMapping[str, Any],
+        df: pd.DataFrame,
+        numeric_cols: Sequence[Any],
+        key: str = STATE_KEY
+    ) -> 'TrendCharts':
+        """Oturumdaki grafikleri döndürür; veri veya dönemler değiştiyse yeniden kurar"""
+        mevcut = state.get(key)
+        if mevcut is None or mevcut.anahtar != cls.key_for(df, numeric_cols):
+            mevcut = cls(df, numeric_cols)
+            state[key] = mevcut
+        return mevcut
+
+    # --- İndeks ---
+    def _satir_maskesi(self, grup: Hashable) -> Optional[np.ndarray]:
+        if grup == TUMU or self._gruplar is None:
+            return None
+        return self._gruplar == grup
+
+    def _kalem_kodlari(self, grup: Hashable) -> List[int]:
+        """Gruptaki kalem kodları (tablodaki ilk görünme sırasıyla)"""
+        if grup not in self._grup_kalemleri:
+            maske = self._satir_maskesi(grup)
+            kodlar = self._kodlar if maske is None else self._kodlar[maske]
+            _, ilk = np.unique(kodlar, return_index=True)
+            self._grup_kalemleri[grup] = [int(k) for k in kodlar[np.sort(ilk)]]
+        return self._grup_kalemleri[grup]
+
+    def items(self, grup: Hashable = TUMU) -> List[Any]:
+        """Grupta grafiği çizilecek kalemler (sırasıyla)"""
+        return [self._kalemler[k] for k in self._kalem_kodlari(grup)]
+
+    def page_count(self, grup: Hashable, sayfa_boyutu: int) -> int:
+        return max(1, -(-len(self._kalem_kodlari(grup)) // sayfa_boyutu))
+
+    # --- Grafikler ---
+    def _grafik_kur(self, grup: Hashable, kod: int) -> go.Figure:
+        satirlar = self._kodlar == kod
+        maske = self._satir_maskesi(grup)
+        if maske is not None:
+            satirlar &= maske
+        degerler = self._degerler[satirlar]
+        kalem = self._kalemler[kod]
+        ad = str(kalem)
+
+        # melt ile aynı sıra: dönem dönem, her dönemde tüm satırlar
+        x = np.repeat(np.asarray(self.donemler, dtype=object), len(degerler))
+        y = degerler.T.ravel()
+        fig = go.Figure(go.Bar(
+            x=x, y=y, name=ad, legendgroup=ad, showlegend=True, marker_color=_RENK,
+            hovertemplate=f"{self.item_col}={ad}<br>Dönem=%{{x}}<br>Değer=%{{y}}<extra></extra>"
+        ))
+        fig.update_layout(
+            title=ad, barmode='relative', legend_title_text=str(self.item_col),
+            xaxis_title='Dönem', yaxis_title='Değer'
+        )
+        return fig
+
+    def figure(self, grup: Hashable, kalem_sirasi: int) -> go.Figure:
+        """Gruptaki kalem_sirasi'ncı kalemin grafiği (saklanmışsa yeniden kurulmaz)"""
+        kod = self._kalem_kodlari(grup)[kalem_sirasi]
+        anahtar = (grup, kod)
+        with self._kilit:
+            fig = self._grafikler.get(anahtar)
+            if fig is not None:
+                self._grafikler.move_to_end(anahtar)
+                return fig
+        fig = self._grafik_kur(grup, kod)
+        with self._kilit:
+            self._grafikler[anahtar] = fig
+            while len(self._grafikler) > self.kapasite:
+                self._grafikler.popitem(last=False)
+        return fig
+
+    def figures(self, grup: Hashable = TUMU, baslangic: int = 0, bitis: Optional[int] = None) -> List[go.Figure]:
+        """[baslangic, bitis) aralığındaki kalemlerin grafikleri (yalnızca bunlar kurulur)"""
+        toplam = len(self._kalem_kodlari(grup))
+        bitis = toplam if bitis is None else min(bitis, toplam)
+        return [self.figure(grup, i) for i in range(baslangic, bitis)]
+
+    def stats(self) -> Dict[str, int]:
+        with self._kilit:
+            return {'kalem': len(self._kalemler), 'saklanan_grafik': len(self._grafikler)}
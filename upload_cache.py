@@ -0,0 +1,218 @@
+"""
+Yüklenen dosyalar için içerik özeti tabanlı sonuç önbelleği.
+
+Kullanıcılar çoğu zaman aynı dosyayı ya da yalnızca son dönemi eklenmiş
+halini yeniden yüklüyor; yükleme dalı ise her seferinde dosyayı baştan
+okuyor, temizliyor ve eşleştiriyordu. Bu modül:
+
+    - Yüklenen baytların özeti (ve eşleştirme bağlamı) aynıysa işlenmiş
+      çerçeveyi sınırlı (LRU) önbellekten döndürür
+    - Kalem sütunu ve mevcut dönem sütunları önbellekteki bir yüklemeyle
+      birebir aynı olup yalnızca yeni dönem sütunları eklenmişse, sadece
+      eklenen sütunları temizler ve önbellekteki sonuca ekler
+
+Eşleştirme yalnızca kalem sütununa bağlı olduğu için (Grup / Standart_Kalem)
+artımsal durumda yeniden eşleştirme yapılmaz.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+# Önbellekte tutulacak en fazla yükleme ve toplam bellek (MB)
+VARSAYILAN_KAYIT = int(os.environ.get('DIGICFO_YUKLEME_ONBELLEK', 8))
+VARSAYILAN_BELLEK_MB = float(os.environ.get('DIGICFO_YUKLEME_ONBELLEK_MB', 1024))
+
+# process_upload sonuç durumları
+ARTIMSAL = 'artimsal'
+TAM = 'tam'
+
+
+def content_hash(veri: bytes) -> str:
+    """Yüklenen baytların özeti (32 karakter)"""
+    return hashlib.blake2b(veri, digest_size=16).hexdigest()
+
+
+def upload_key(ozet: str, dosya_adi: str, baglam: str) -> str:
+    """Önbellek anahtarı: içerik özeti + dosya uzantısı + eşleştirme bağlamı"""
+    uzanti = os.path.splitext(dosya_adi)[1].lower()
+    return f"{ozet}{uzanti}|{baglam}"
+
+
+def column_digest(seri: pd.Series) -> str:
+    """Sütun değerlerinin (indeks hariç) özeti"""
+    degerler = pd.util.hash_pandas_object(seri, index=False).to_numpy()
+    return hashlib.blake2b(degerler.tobytes(), digest_size=16).hexdigest()
+
+
+def _mb(df: Optional[pd.DataFrame]) -> float:
+    if df is None:
+        return 0.0
+    return float(df.memory_usage(index=True, deep=True).sum()) / 1024 ** 2
+
+
+@dataclass
+class ProcessedUpload:
+    """
+    Temizlenmiş ve eşleştirilmiş yükleme.
+
+    satir_ozeti / sutun_ozetleri ham verinin kalem sütunu ve dönem sütunları
+    özetleridir; None ise kayıt artımsal işlem için taban olarak kullanılmaz
+    (ör. parça parça alınan büyük dosyalar).
+    """
+    frame: pd.DataFrame
+    original: Optional[pd.DataFrame]
+    item_col: Any
+    baglam: str
+    satir_ozeti: Optional[str] = None
+    sutun_ozetleri: Optional[Dict[Any, str]] = None
+    bellek_mb: float = 0.0
+
+    def __post_init__(self):
+        if not self.bellek_mb:
+            self.bellek_mb = _mb(self.frame) + _mb(self.original)
+
+
+class UploadCache:
+    """
+    İşlenmiş yüklemelerin süreç içi, sınırlı (LRU) önbelleği.
+
+    Örnek:
+        onbellek = UploadCache(max_entries=8)
+        kayit = onbellek.get(anahtar)
+        if kayit is None:
+            kayit, durum, yeni = process_upload(ham, temizle, eslestir, onbellek, baglam)
+            onbellek.put(anahtar, kayit)
+    """
+
+    def __init__(self, max_entries: int = VARSAYILAN_KAYIT, max_mb: float = VARSAYILAN_BELLEK_MB):
+        self.max_entries = max_entries
+        self.max_mb = max_mb
+        self._kayitlar: 'OrderedDict[str, ProcessedUpload]' = OrderedDict()
+        self._kilit = threading.Lock()
+        self.isabet = 0
+        self.artimsal = 0
+        self.iskalama = 0
+
+    def get(self, anahtar: str) -> Optional[ProcessedUpload]:
+        """Kaydı döndürür ve en yeni olarak işaretler; yoksa None"""
+        with self._kilit:
+            kayit = self._kayitlar.get(anahtar)
+            if kayit is None:
+                self.iskalama += 1
+                return None
+            self._kayitlar.move_to_end(anahtar)
+            self.isabet += 1
+            return kayit
+
+    def put(self, anahtar: str, kayit: ProcessedUpload) -> None:
+        """Kaydı ekler; kayıt sayısı veya bellek sınırı aşılırsa en eskiler çıkarılır"""
+        if kayit.bellek_mb > self.max_mb:
+            return
+        with self._kilit:
+            self._kayitlar[anahtar] = kayit
+            self._kayitlar.move_to_end(anahtar)
+            while len(self._kayitlar) > self.max_entries or self._toplam_mb() > self.max_mb:
+                self._kayitlar.popitem(last=False)
+
+    def _toplam_mb(self) -> float:
+        return sum(k.bellek_mb for k in self._kayitlar.values())
+
+    def find_base(
+        self,
+        item_col: Any,
+        satir_ozeti: str,
+        sutun_ozetleri: Dict[Any, str],
+        baglam: str
+    ) -> Optional[ProcessedUpload]:
+        """
+        Yeni yüklemenin artımsal işlenebileceği en yeni kaydı bulur.
+
+        Taban kayıt: aynı eşleştirme bağlamı ve kalem sütunu, tüm dönem
+        sütunları yeni yüklemede aynı adla ve aynı değerlerle mevcut.
+        """
+        with self._kilit:
+            adaylar = list(reversed(self._kayitlar.items()))
+        for anahtar, kayit in adaylar:
+            if (kayit.sutun_ozetleri is None or kayit.baglam != baglam
+                    or kayit.item_col != item_col or kayit.satir_ozeti != satir_ozeti):
+                continue
+            if all(sutun_ozetleri.get(col) == ozet for col, ozet in kayit.sutun_ozetleri.items()):
+                with self._kilit:
+                    if anahtar in self._kayitlar:
+                        self._kayitlar.move_to_end(anahtar)
+                return kayit
+        return None
+
+    def clear(self) -> None:
+        with self._kilit:
+            self._kayitlar.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Kayıt sayısı, bellek ve isabet sayaçları"""
+        with self._kilit:
+            kayit_sayisi = len(self._kayitlar)
+            bellek_mb = self._toplam_mb()
+        return {
+            'kayit_sayisi': kayit_sayisi,
+            'bellek_mb': bellek_mb,
+            'isabet': self.isabet,
+            'artimsal': self.artimsal,
+            'iskalama': self.iskalama,
+        }
+
+
+def process_upload(
+    ham: pd.DataFrame,
+    clean_column: Callable[[pd.Series], pd.Series],
+    map_frame: Callable[[pd.DataFrame, Any], pd.DataFrame],
+    cache: Optional[UploadCache],
+    baglam: str
+) -> Tuple[ProcessedUpload, str, List[Any]]:
+    """
+    Ham yüklemeyi temizler ve eşleştirir; mümkünse önbellekteki sonucu genişletir.
+
+    Args:
+        ham: Okunmuş, işlenmemiş veri (ilk sütun kalem adı)
+        clean_column: Dönem sütunu temizleyici (ör. clean_turkish_float_series)
+        map_frame: (df, kalem_sutunu) -> Grup / Standart_Kalem eklenmiş df
+        cache: Taban aranacak önbellek (None ise her zaman tam işlenir)
+        baglam: Eşleştirme bağlamı (kullanıcı eşleştirmesi + şema sürümü özeti)
+
+    Returns:
+        (kayıt, durum, işlenen yeni sütunlar); durum ARTIMSAL veya TAM
+    """
+    item_col = ham.columns[0]
+    donem_sutunlari = list(ham.columns[1:])
+    satir_ozeti = column_digest(ham[item_col])
+    sutun_ozetleri = {col: column_digest(ham[col]) for col in donem_sutunlari}
+
+    taban = cache.find_base(item_col, satir_ozeti, sutun_ozetleri, baglam) if cache is not None else None
+    if taban is not None:
+        yeni = [col for col in donem_sutunlari if col not in taban.sutun_ozetleri]
+        df = taban.frame.copy(deep=False)
+        for col in yeni:
+            df[col] = clean_column(ham[col])
+        # Ham sütun sırası korunur, eşleştirme sütunları sonda kalır
+        ek_sutunlar = [col for col in taban.frame.columns if col not in ham.columns]
+        df = df[list(ham.columns) + ek_sutunlar]
+        cache.artimsal += 1
+        durum = ARTIMSAL
+    else:
+        df = ham.copy(deep=False)
+        for col in donem_sutunlari:
+            df[col] = clean_column(df[col])
+        df = map_frame(df, item_col)
+        yeni = donem_sutunlari
+        durum = TAM
+
+    kayit = ProcessedUpload(
+        frame=df, original=ham, item_col=item_col, baglam=baglam,
+        satir_ozeti=satir_ozeti, sutun_ozetleri=sutun_ozetleri
+    )
+    return kayit, durum, yeni
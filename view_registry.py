@@ -0,0 +1,250 @@
+"""
+View modülü kayıt defteri ve menü yönlendiricisi.
+
+Menü etiketleri (``selected_menu``) ile view modülleri arasındaki eşleme
+``VIEW_MODULES`` tablosunda tutulur; yeni bir ekran eklemek tek satırdır.
+Modüller script başında değil, ilgili menü ilk kez seçildiğinde import
+edilir. Her ekran için import süresi, çizim (render) süresi ve hatalar
+kaydedilir; böylece yeniden çalıştırmaları yavaşlatan bölüm görülebilir.
+"""
+
+import importlib
+import threading
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import streamlit as st
+
+# Hata gösterim biçimleri
+HATA_YUKSELT = 'raise'   # Hata üst seviyedeki genel hata ekranına iletilir
+HATA_BILGI = 'info'      # "modülü yüklenemedi" bilgisi / kısa hata mesajı
+HATA_DETAY = 'detay'     # Hata mesajı + traceback açılır kutusu
+
+
+@dataclass(frozen=True)
+class StateArg:
+    """Çizim anında session_state'ten okunan view argümanı"""
+    key: str
+    default: Any = None
+
+
+@dataclass(frozen=True)
+class ViewSpec:
+    """Bir menü etiketinin view modülü, fonksiyonu ve argümanları"""
+    module: str
+    function: str
+    args: Tuple[Any, ...] = ()
+    title: Optional[str] = None
+    on_error: str = HATA_YUKSELT
+
+
+# Menü etiketi -> view
+VIEW_MODULES: Dict[str, ViewSpec] = {
+    # Ana bölüm sekmeleri
+    "📄 Ham Veri": ViewSpec("views.ham_veri", "show_ham_veri_section"),
+    "💼 Finansal Analiz Pro": ViewSpec("views.finansal_analiz_pro", "show_finansal_analiz_pro_section"),
+    "📊 Sektör": ViewSpec("views.sektor", "show_sektor_section"),
+    "✅ Veri Kontrol": ViewSpec("views.veri_kontrol", "show_veri_kontrol_section"),
+    "📊 Gelir Tablosu": ViewSpec("views.gelir_tablosu", "show_gelir_tablosu_section"),
+    "📊 Bilanço": ViewSpec("views.bilanco", "show_bilanco_section"),
+    "💰 Nakit Akış Tablosu": ViewSpec("views.nakit_akis", "show_nakit_akis_section"),
+    "🗃️ Büyük Veri": ViewSpec("views.buyuk_veri", "show_buyuk_veri_section"),
+    "📊 Rasyo/Oran": ViewSpec("views.rasyo_oran", "show_rasyo_oran_section"),
+    "📥 Rapor": ViewSpec("views", "show_reports_section"),
+    "✅ Veri Onayı": ViewSpec("views.veri_onay", "show_veri_onay_section"),
+    "🚀 İleri Finansal Analiz": ViewSpec("views.ileri_analiz", "show_ileri_analiz_section"),
+    # Menü grupları
+    "🎯 Stratejik Analiz": ViewSpec("views.stratejik_analiz_menu", "show_stratejik_analiz_menu_section", title="Stratejik Analiz", on_error=HATA_BILGI),
+    "🤖 AI CEO/CFO Coaching": ViewSpec("views.ceo_cfo_coaching", "show_ceo_cfo_coaching_section", title="AI CEO/CFO Coaching", on_error=HATA_BILGI),
+    "🤖 AI Analiz ve Rapor": ViewSpec("views.ai_raporlar", "show_ai_analiz_rapor_menu_section", title="AI Analiz ve Rapor", on_error=HATA_BILGI),
+    "🤖 AI Model Danışman Robotlar": ViewSpec("views.ai_model_robotlar", "show_ai_model_robotlar_menu_section", title="AI Model Danışman Robotlar", on_error=HATA_BILGI),
+    # AI CFO robotları (alt menü seçilmemişse ilk alt menü)
+    "🤖 AI CFO Danışman Robotlar": ViewSpec("views.ai_cfo_robots", "show_ai_cfo_section", (StateArg('selected_ai_cfo_submenu', '1. Stratejik AI CFO'),), "AI CFO Robotlar", HATA_DETAY),
+    "1. Stratejik AI CFO": ViewSpec("views.ai_cfo_robots", "show_ai_cfo_section", ("1. Stratejik AI CFO",), "AI CFO Robotlar", HATA_DETAY),
+    "2. Teknik ve Operasyonel AI CFO": ViewSpec("views.ai_cfo_robots", "show_ai_cfo_section", ("2. Teknik ve Operasyonel AI CFO",), "AI CFO Robotlar", HATA_DETAY),
+    # İleri analiz alt ekranları
+    "Dashboard Grafik": ViewSpec("views.dashboard_grafik", "show_dashboard_grafik_section", title="Dashboard Grafik", on_error=HATA_BILGI),
+    "Sankey": ViewSpec("views.sankey_grafik", "show_sankey_grafik_section", title="Sankey Grafik", on_error=HATA_BILGI),
+    "Rasyo": ViewSpec("views.rasyo_analiz", "show_rasyo_analiz_section", title="Rasyo Analiz", on_error=HATA_BILGI),
+    "Yatırımcı": ViewSpec("views.yatirimci_analiz", "show_yatirimci_analiz_section", title="Yatırımcı Analiz", on_error=HATA_BILGI),
+    "Dikey": ViewSpec("views.dikey_analiz", "show_dikey_analiz_section", title="Dikey Analiz", on_error=HATA_BILGI),
+    "DuPont": ViewSpec("views.dupont_analiz", "show_dupont_analiz_section", title="DuPont Analizi", on_error=HATA_BILGI),
+    "Senaryo": ViewSpec("views.senaryo_analiz", "show_senaryo_analiz_section", title="Senaryo Analizi", on_error=HATA_BILGI),
+    "Sektör Bilgi": ViewSpec("views.sektor_bilgi", "show_sektor_bilgi_section", title="Sektör Bilgi", on_error=HATA_BILGI),
+    "Borsa": ViewSpec("views.borsa_analiz", "show_borsa_analiz_section", title="Borsa Analizi", on_error=HATA_BILGI),
+}
+
+
+@dataclass
+class ViewStats:
+    """Bir ekranın çizim istatistikleri"""
+    cagri: int = 0
+    toplam_sure: float = 0.0
+    son_sure: float = 0.0
+    en_uzun_sure: float = 0.0
+    hata: int = 0
+    son_hata: Optional[str] = None
+    son_hatalar: List[str] = field(default_factory=list)
+
+
+class ViewRegistry:
+    """
+    Menü etiketlerini view fonksiyonlarına ilk kullanımda çözen yönlendirici.
+
+    Örnek:
+        kayit = ViewRegistry()
+        kayit.render("📄 Ham Veri")
+        kayit.import_times()       # {"views.ham_veri": 0.183, ...}
+        kayit.stats_table()        # ekran başına çizim süreleri ve hatalar
+    """
+
+    def __init__(self, kayitlar: Optional[Dict[str, ViewSpec]] = None):
+        self._kayitlar: Dict[str, ViewSpec] = dict(VIEW_MODULES if kayitlar is None else kayitlar)
+        self._fonksiyonlar: Dict[str, Callable] = {}
+        self._import_sureleri: Dict[str, float] = {}
+        self._istatistik: Dict[str, ViewStats] = {}
+        self._kilit = threading.Lock()
+
+    def register(self, label: str, module: str, function: str, *args,
+                 title: Optional[str] = None, on_error: str = HATA_YUKSELT) -> None:
+        """Menü etiketine view modülü, fonksiyonu ve argümanlarını atar"""
+        self._kayitlar[label] = ViewSpec(module, function, tuple(args), title, on_error)
+        self._fonksiyonlar.pop(label, None)
+
+    def __contains__(self, label: str) -> bool:
+        return label in self._kayitlar
+
+    def labels(self):
+        """Kayıtlı menü etiketleri"""
+        return list(self._kayitlar)
+
+    def is_loaded(self, label: str) -> bool:
+        """Etiketin view fonksiyonu çözülmüşse True"""
+        return label in self._fonksiyonlar
+
+    def get(self, label: str) -> Callable:
+        """
+        Etiketin view fonksiyonunu döndürür; modül gerekirse import edilir.
+
+        Args:
+            label: Menü etiketi
+
+        Returns:
+            Callable: View fonksiyonu
+
+        Raises:
+            KeyError: Etiket kayıtlı değilse
+            ImportError: Modül veya fonksiyon yüklenemezse
+        """
+        fonksiyon = self._fonksiyonlar.get(label)
+        if fonksiyon is not None:
+            return fonksiyon
+
+        ozellik = self._kayitlar[label]
+        baslangic = time.perf_counter()
+        modul = importlib.import_module(ozellik.module)
+        self._import_sureleri.setdefault(ozellik.module, time.perf_counter() - baslangic)
+        try:
+            fonksiyon = getattr(modul, ozellik.function)
+        except AttributeError as e:
+            raise ImportError(f"{ozellik.module}.{ozellik.function} bulunamadı") from e
+        self._fonksiyonlar[label] = fonksiyon
+        return fonksiyon
+
+    def import_times(self) -> Dict[str, float]:
+        """Bu süreçte import edilen view modüllerinin ilk import süreleri (saniye)"""
+        return dict(self._import_sureleri)
+
+    def _kaydet(self, label: str, sure: Optional[float], hata: Optional[BaseException] = None) -> None:
+        with self._kilit:
+            ist = self._istatistik.setdefault(label, ViewStats())
+            if sure is not None:
+                ist.cagri += 1
+                ist.toplam_sure += sure
+                ist.son_sure = sure
+                ist.en_uzun_sure = max(ist.en_uzun_sure, sure)
+            if hata is not None:
+                ist.hata += 1
+                ist.son_hata = f"{type(hata).__name__}: {hata}"
+                ist.son_hatalar = (ist.son_hatalar + [ist.son_hata])[-5:]
+
+    def render(self, label: str) -> None:
+        """
+        Etiketin ekranını çizer; import ve çizim süresini, hataları kaydeder.
+
+        Hata gösterimi kaydın ``on_error`` alanına göre yapılır; HATA_YUKSELT
+        ise hata çağırana iletilir.
+
+        Args:
+            label: Menü etiketi
+        """
+        ozellik = self._kayitlar[label]
+        baslik = ozellik.title or label
+        try:
+            fonksiyon = self.get(label)
+        except ImportError as e:
+            self._kaydet(label, None, e)
+            if ozellik.on_error == HATA_YUKSELT:
+                raise
+            if ozellik.on_error == HATA_DETAY:
+                st.error(f"❌ {baslik} modülü yüklenemedi: {str(e)}")
+                with st.expander("🔍 Hata Detayları"):
+                    st.code(traceback.format_exc())
+            else:
+                st.info(f"📋 {baslik} modülü yüklenemedi.")
+            return
+        except Exception as e:
+            self._kaydet(label, None, e)
+            self._hata_goster(ozellik, baslik, e)
+            return
+
+        args = [st.session_state.get(a.key, a.default) if isinstance(a, StateArg) else a
+                for a in ozellik.args]
+        baslangic = time.perf_counter()
+        try:
+            fonksiyon(*args)
+        except Exception as e:
+            self._kaydet(label, time.perf_counter() - baslangic, e)
+            self._hata_goster(ozellik, baslik, e)
+            return
+        self._kaydet(label, time.perf_counter() - baslangic)
+
+    @staticmethod
+    def _hata_goster(ozellik: ViewSpec, baslik: str, hata: Exception) -> None:
+        """Çizim hatasını kaydın hata biçimine göre gösterir (HATA_YUKSELT ise iletir)"""
+        if ozellik.on_error == HATA_YUKSELT:
+            raise hata
+        st.error(f"❌ {baslik} yüklenirken hata oluştu: {str(hata)}")
+        if ozellik.on_error == HATA_DETAY:
+            with st.expander("🔍 Hata Detayları"):
+                st.code(traceback.format_exc())
+
+    def stats(self) -> Dict[str, ViewStats]:
+        """Ekran başına çizim istatistikleri"""
+        with self._kilit:
+            return {k: ViewStats(**vars(v)) for k, v in self._istatistik.items()}
+
+    def stats_table(self) -> List[Dict[str, Any]]:
+        """
+        İstatistikleri ortalama çizim süresine göre azalan tablo satırları olarak döndürür.
+
+        Returns:
+            list: [{'Ekran', 'Çağrı', 'Ort. (ms)', 'Son (ms)', 'En uzun (ms)', 'Import (ms)', 'Hata', 'Son hata'}]
+        """
+        satirlar = []
+        for label, ist in self.stats().items():
+            modul = self._kayitlar[label].module if label in self._kayitlar else None
+            import_suresi = self._import_sureleri.get(modul)
+            satirlar.append({
+                'Ekran': label,
+                'Çağrı': ist.cagri,
+                'Ort. (ms)': round(ist.toplam_sure / ist.cagri * 1000, 1) if ist.cagri else None,
+                'Son (ms)': round(ist.son_sure * 1000, 1) if ist.cagri else None,
+                'En uzun (ms)': round(ist.en_uzun_sure * 1000, 1) if ist.cagri else None,
+                'Import (ms)': round(import_suresi * 1000, 1) if import_suresi is not None else None,
+                'Hata': ist.hata,
+                'Son hata': ist.son_hata or '',
+            })
+        return sorted(satirlar, key=lambda s: -(s['Ort. (ms)'] or 0))